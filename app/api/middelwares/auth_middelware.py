@@ -3,51 +3,71 @@ AuthMiddleware:
 Verifica la autenticidad del token JWT en los headers Authorization.
 Excluye rutas específicas (login y docs) y pasa la información
 del usuario autenticado al request.
+
+Es un middleware ASGI puro: no usa BaseHTTPMiddleware, así que no agrega tareas ni
+colas de streaming por petición, y responde 401 directamente en lugar de lanzar
+HTTPException (que desde un middleware terminaba en un 500).
+
+El usuario autenticado queda en scope["state"], visible como request.state.user.
+
+Los tokens ya verificados se recuerdan hasta su `exp` (ver security.cache_tokens),
+así que la firma HMAC solo se valida la primera vez que llega cada token.
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import HTTPException, Request, status
-from app.core.security import decode_access_token
-from jose import JWTError
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from app.core.security import verificar_token
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, secret_key, algorithm):
+RUTAS_EXCLUIDAS = ("/users/login", "/docs", "/openapi.json")
+
+
+class AuthMiddleware:
+    def __init__(self, app, secret_key, algorithm, rutas_excluidas=RUTAS_EXCLUIDAS):
         """
-        Inicializa el middleware con la clave secreta y el algoritmo de decodificación.
+        Inicializa el middleware con la clave secreta, el algoritmo de decodificación
+        y los prefijos de ruta que no requieren token.
         """
-        super().__init__(app)
+        self.app = app
         self.secret_key = secret_key
         self.algorithm = algorithm
+        # str.startswith con una tupla compara todos los prefijos en una sola llamada
+        self.rutas_excluidas = tuple(rutas_excluidas)
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope, receive, send):
         """
         Procesa cada solicitud HTTP para verificar el token de autenticación.
         Excluye rutas específicas y pasa la información del usuario autenticado al request.
         """
-        rutas_excluidas = ["/users/login", "/docs", "/openapi.json"]
-        if request.method == "OPTIONS" or any(request.url.path.startswith(ruta) for ruta in rutas_excluidas):
-            return await call_next(request)
-
-        token = request.headers.get("Authorization")
-        
-        if not token or not token.startswith("Bearer "):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="No autorizado",
-                headers={"WWW-Authenticate": "Bearer"}
-            )
-
-        token = token.split(" ")[1]
-        
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or scope["path"].startswith(self.rutas_excluidas):
+            await self.app(scope, receive, send)
+            return
+
+        autorizacion = None
+        for nombre, valor in scope["headers"]:
+            if nombre == b"authorization":
+                autorizacion = valor.decode("latin-1")
+                break
+
+        if not autorizacion or not autorizacion.startswith("Bearer "):
+            await _no_autorizado(scope, receive, send, "No autorizado")
+            return
+
+        token = autorizacion.split(" ")[1]
+
         try:
-            payload = decode_access_token(token)
-            request.state.user = payload.get("sub")
-        except JWTError:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token inválido o expirado",
-                headers={"WWW-Authenticate": "Bearer"}
-            )
-
-        response = await call_next(request)
-        return response
+            payload = verificar_token(token)
+        except HTTPException:
+            await _no_autorizado(scope, receive, send, "Token inválido o expirado")
+            return
+
+        scope.setdefault("state", {})["user"] = payload.get("sub")
+        await self.app(scope, receive, send)
+
+
+async def _no_autorizado(scope, receive, send, detalle: str):
+    respuesta = JSONResponse(
+        {"detail": detalle},
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    await respuesta(scope, receive, send)
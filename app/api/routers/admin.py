@@ -0,0 +1,63 @@
+"""
+Este módulo define las rutas de administración y diagnóstico.
+
+Incluye endpoints para:
+- Consultar el perfil activo del motor de base de datos.
+- Consultar y vaciar la caché de respuestas GET.
+- Consultar la caché de tokens verificados.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.schemas.admin_schema import PerfilBaseDatos, EstadisticasCache, EstadisticasCacheTokens
+from app.core.config import get_db
+from app.services import admin_service as service
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+)
+
+
+@router.get("/db-profile", response_model=PerfilBaseDatos)
+def obtener_perfil_base_datos(db: Session = Depends(get_db)):
+    """
+    Obtener el perfil activo del motor de base de datos.
+
+    Retorna:
+    - PerfilBaseDatos: URL, configuración de pool y PRAGMAs efectivos de la conexión.
+    """
+    return service.obtener_perfil_base_datos(db)
+
+
+@router.get("/cache", response_model=EstadisticasCache)
+def obtener_estadisticas_cache():
+    """
+    Obtener las estadísticas de la caché de respuestas.
+
+    Retorna:
+    - EstadisticasCache: Tamaño, aciertos, fallos, desalojos y versiones por entidad.
+    """
+    return service.obtener_estadisticas_cache()
+
+
+@router.delete("/cache", response_model=EstadisticasCache)
+def limpiar_cache():
+    """
+    Vaciar la caché de respuestas.
+
+    Retorna:
+    - EstadisticasCache: Estado de la caché después de vaciarla.
+    """
+    return service.limpiar_cache()
+
+
+@router.get("/tokens", response_model=EstadisticasCacheTokens)
+def obtener_estadisticas_tokens():
+    """
+    Obtener las estadísticas de la caché de tokens verificados del AuthMiddleware.
+
+    Retorna:
+    - EstadisticasCacheTokens: Tamaño, aciertos, fallos, desalojos y expiraciones.
+    """
+    return service.obtener_estadisticas_tokens()
@@ -0,0 +1,117 @@
+"""
+Rutas asíncronas (async def + AsyncSession) para la gestión de almacenes.
+
+Mismos endpoints que app.api.routers.almacenes; se montan cuando DB_ASYNC está activo.
+"""
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.schemas import almacenamiento_schema as schemas
+from app.schemas.lote_schema import ResultadoLote
+from app.core.config import get_async_db
+from app.core.cache import ruta_cacheada
+from app.core.etag import ruta_con_etag
+from app.core.lotes import DESCRIPCION_IDS, parsear_ids
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.services.aio.almacenamiento_service import AlmacenamientoService
+
+router = APIRouter(
+    prefix="/almacenes",
+    tags=["almacenes"],
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("almacenes", base=ruta_cacheada("almacenes")),
+)
+
+
+def get_almacen_service(db: AsyncSession = Depends(get_async_db)):
+    """
+    Dependencia para obtener una instancia asíncrona de AlmacenamientoService.
+    """
+    return AlmacenamientoService(db)
+
+
+@router.get("/", response_model=List[schemas.Almacen])
+async def obtener_almacenes(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
+    cursor: Optional[str] = None,
+    almacen_service: AlmacenamientoService = Depends(get_almacen_service)
+):
+    """
+    Obtener todos los almacenes con paginación.
+    """
+    pagina = await almacen_service.obtener_todos(skip, limit, cursor)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    return pagina.items
+
+
+@router.get("/batch", response_model=ResultadoLote[schemas.Almacen])
+async def obtener_almacenes_lote(
+    ids: str = Query(..., description=DESCRIPCION_IDS),
+    almacen_service: AlmacenamientoService = Depends(get_almacen_service)
+):
+    """
+    Obtener varios almacenes por ID, en el orden pedido, con los inexistentes en `faltantes`.
+    """
+    return await almacen_service.obtener_por_ids(parsear_ids(ids))
+
+
+@router.get("/{storage_id}", response_model=schemas.Almacen)
+async def obtener_almacen(
+    storage_id: int,
+    almacen_service: AlmacenamientoService = Depends(get_almacen_service)
+):
+    """
+    Obtener un almacén por su ID.
+    """
+    return await almacen_service.obtener_por_id(storage_id)
+
+
+@router.post("/", response_model=schemas.Almacen)
+async def crear_almacen(
+    almacen: schemas.CrearAlmacen,
+    almacen_service: AlmacenamientoService = Depends(get_almacen_service)
+):
+    """
+    Crear un nuevo almacén.
+    """
+    return await almacen_service.crear(almacen)
+
+
+@router.put("/{storage_id}", response_model=schemas.Almacen)
+async def actualizar_almacen(
+    storage_id: int,
+    almacen: schemas.CrearAlmacen,
+    almacen_service: AlmacenamientoService = Depends(get_almacen_service)
+):
+    """
+    Actualizar un almacén existente.
+    """
+    return await almacen_service.actualizar(storage_id, almacen)
+
+
+@router.patch("/{storage_id}", response_model=schemas.Almacen)
+async def modificar_almacen(
+    storage_id: int,
+    cambios: schemas.ActualizarAlmacen,
+    almacen_service: AlmacenamientoService = Depends(get_almacen_service)
+):
+    """
+    Modificar solo los campos enviados de un almacén.
+    """
+    return await almacen_service.modificar(storage_id, cambios)
+
+
+@router.delete("/{storage_id}")
+async def eliminar_almacen(
+    storage_id: int,
+    almacen_service: AlmacenamientoService = Depends(get_almacen_service)
+):
+    """
+    Eliminar un almacén por su ID.
+    """
+    await almacen_service.eliminar(storage_id)
+    return {"mensaje": "Almacén eliminado exitosamente"}
@@ -0,0 +1,118 @@
+"""
+Rutas asíncronas (async def + AsyncSession) para la gestión de categorías.
+
+Mismos endpoints que app.api.routers.categorias; se montan cuando DB_ASYNC está activo.
+"""
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.schemas.categorias_schema import ActualizarCategoria, Categoria, CrearCategoria, TipoCategoria
+from app.schemas.lote_schema import ResultadoLote
+from app.core.config import get_async_db
+from app.core.cache import ruta_cacheada
+from app.core.etag import ruta_con_etag
+from app.core.lotes import DESCRIPCION_IDS, parsear_ids
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.services.aio.categorias_service import CategoriaService
+
+router = APIRouter(
+    prefix="/categorias",
+    tags=["categorías"],
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("categorias", base=ruta_cacheada("categorias")),
+)
+
+
+def get_categoria_service(db: AsyncSession = Depends(get_async_db)):
+    """
+    Dependencia para obtener una instancia asíncrona de CategoriaService.
+    """
+    return CategoriaService(db)
+
+
+@router.get("/", response_model=List[Categoria])
+async def obtener_categorias(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
+    tipo: TipoCategoria = None,
+    cursor: Optional[str] = None,
+    categoria_service: CategoriaService = Depends(get_categoria_service)
+):
+    """
+    Obtener todas las categorías con paginación y filtro opcional por tipo.
+    """
+    pagina = await categoria_service.obtener_todas(skip, limit, tipo, cursor)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    return pagina.items
+
+
+@router.get("/batch", response_model=ResultadoLote[Categoria])
+async def obtener_categorias_lote(
+    ids: str = Query(..., description=DESCRIPCION_IDS),
+    categoria_service: CategoriaService = Depends(get_categoria_service)
+):
+    """
+    Obtener varias categorías por ID, en el orden pedido, con las inexistentes en `faltantes`.
+    """
+    return await categoria_service.obtener_por_ids(parsear_ids(ids))
+
+
+@router.get("/{categoria_id}", response_model=Categoria)
+async def obtener_categoria(
+    categoria_id: int,
+    categoria_service: CategoriaService = Depends(get_categoria_service)
+):
+    """
+    Obtener una categoría por su ID.
+    """
+    return await categoria_service.obtener_por_id(categoria_id)
+
+
+@router.post("/", response_model=Categoria)
+async def crear_categoria(
+    categoria: CrearCategoria,
+    categoria_service: CategoriaService = Depends(get_categoria_service)
+):
+    """
+    Crear una nueva categoría.
+    """
+    return await categoria_service.crear(categoria)
+
+
+@router.put("/{categoria_id}", response_model=Categoria)
+async def actualizar_categoria(
+    categoria_id: int,
+    categoria: CrearCategoria,
+    categoria_service: CategoriaService = Depends(get_categoria_service)
+):
+    """
+    Actualizar una categoría existente.
+    """
+    return await categoria_service.actualizar(categoria_id, categoria)
+
+
+@router.patch("/{categoria_id}", response_model=Categoria)
+async def modificar_categoria(
+    categoria_id: int,
+    cambios: ActualizarCategoria,
+    categoria_service: CategoriaService = Depends(get_categoria_service)
+):
+    """
+    Modificar solo los campos enviados de una categoría.
+    """
+    return await categoria_service.modificar(categoria_id, cambios)
+
+
+@router.delete("/{categoria_id}")
+async def eliminar_categoria(
+    categoria_id: int,
+    categoria_service: CategoriaService = Depends(get_categoria_service)
+):
+    """
+    Eliminar una categoría por su ID.
+    """
+    await categoria_service.eliminar(categoria_id)
+    return {"mensaje": "Categoría eliminada exitosamente"}
@@ -0,0 +1,96 @@
+"""
+Rutas asíncronas (async def + AsyncSession) para gestionar los conteos de inventario.
+
+Mismos endpoints que app.api.routers.conteos_inventario; se montan cuando DB_ASYNC está activo.
+"""
+
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.schemas import conteo_schema as schemas
+from app.core.config import get_async_db
+from app.core.etag import ruta_con_etag
+from app.core.idempotencia import DESCRIPCION_CLAVE
+from app.core.exportacion import FormatoExportacion, respuesta_exportacion
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.core.proyeccion import DESCRIPCION_FIELDS, parsear_fields, respuesta_parcial
+from app.core.serializacion import respuesta_lista
+from app.services.aio import conteos_inventario as service
+from app.services import conteos_inventario as sync_service
+
+router = APIRouter(
+    prefix="/conteos_inventario",
+    tags=["conteos_inventario"],
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("conteos_inventario"),
+)
+
+
+@router.get("/", response_model=List[schemas.ConteoInventario])
+async def obtener_conteos_inventario(request: Request, response: Response, skip: int = 0,
+                                     limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
+                                    cursor: Optional[str] = None,
+                                    fields: Optional[str] = Query(None, description=DESCRIPCION_FIELDS),
+                                    db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtener todos los conteos de inventario (con `fields`, solo esos campos).
+    """
+    campos = parsear_fields(fields, schemas.ConteoInventario)
+    pagina = await service.obtener_conteos(db, skip, limit, cursor, campos)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    if campos:
+        return respuesta_parcial(schemas.ConteoInventario, pagina.items, campos, response)
+    return respuesta_lista(schemas.ConteoInventario, pagina.items, response)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def exportar_conteos_inventario(formato: FormatoExportacion = FormatoExportacion.CSV, gzip: bool = False,
+                                      producto_id: Optional[int] = None, almacen_id: Optional[int] = None,
+                                      desde: Optional[datetime] = None, hasta: Optional[datetime] = None):
+    """
+    Exportar los conteos de inventario filtrados en CSV o NDJSON (streaming, sin paginar).
+    """
+    trozos = sync_service.exportar_conteos(formato, producto_id, almacen_id, desde, hasta)
+    return respuesta_exportacion(trozos, "conteos_inventario", formato, gzip)
+
+
+@router.get("/{count_id}", response_model=schemas.ConteoInventario)
+async def obtener_conteo_inventario(count_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtener un conteo de inventario por su ID.
+    """
+    conteo = await service.obtener_conteo_por_id(db, count_id)
+    if conteo is None:
+        raise HTTPException(status_code=404, detail="Conteo de inventario no encontrado")
+    return conteo
+
+
+@router.post("/", response_model=schemas.ConteoInventario)
+async def crear_conteo_inventario(conteo: schemas.CrearConteoInventario, db: AsyncSession = Depends(get_async_db),
+                                  idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", description=DESCRIPCION_CLAVE)):
+    """
+    Crear un nuevo conteo de inventario (con Idempotency-Key, los reintentos repiten la respuesta original).
+    """
+    return await service.crear_conteo(db, conteo, idempotency_key)
+
+
+@router.put("/{count_id}", response_model=schemas.ConteoInventario)
+async def actualizar_conteo_inventario(
+    count_id: int,
+    conteo: schemas.CrearConteoInventario,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Actualizar un conteo de inventario existente.
+    """
+    return await service.actualizar_conteo(db, count_id, conteo)
+
+
+@router.delete("/{count_id}")
+async def eliminar_conteo_inventario(count_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Eliminar un conteo de inventario por su ID.
+    """
+    return await service.eliminar_conteo(db, count_id)
@@ -0,0 +1,21 @@
+"""
+Ruta asíncrona para obtener información resumida para la página de inicio.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.home import HomeInfo
+from app.core.config import get_async_db
+from app.services.aio.home import obtener_estadisticas_home
+
+router = APIRouter(
+    prefix="/home",
+    tags=["home"],
+)
+
+@router.get("/", response_model=HomeInfo)
+async def obtener_info_home(db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtener estadísticas para la página de inicio.
+    """
+    return await obtener_estadisticas_home(db)
@@ -0,0 +1,94 @@
+"""
+Router MovimientoInventario (asíncrono):
+Mismas rutas que app.api.routers.movimientos_inventario con async def y AsyncSession.
+"""
+
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.schemas.movimiento_schema import MovimientoInventario, CrearMovimientoInventario, ResultadoCargaMovimientos
+from app.core.config import get_async_db
+from app.core.etag import ruta_con_etag
+from app.core.idempotencia import DESCRIPCION_CLAVE
+from app.core.exportacion import FormatoExportacion, respuesta_exportacion
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.core.proyeccion import DESCRIPCION_FIELDS, parsear_fields, respuesta_parcial
+from app.core.serializacion import respuesta_lista
+from app.services.aio import movimiento_inventario_service as service
+from app.services import movimiento_inventario_service as sync_service
+from app.api.routers.movimientos_inventario import CUERPO_CARGA_MASIVA
+
+router = APIRouter(
+    prefix="/movimientos_inventario",
+    tags=["Movimientos de Inventario"],
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("movimientos_inventario"),
+)
+
+@router.get("/", response_model=List[MovimientoInventario])
+async def obtener_movimientos_inventario(request: Request, response: Response, skip: int = 0,
+                                         limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
+                                         cursor: Optional[str] = None,
+                                         fields: Optional[str] = Query(None, description=DESCRIPCION_FIELDS),
+                                         db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtiene todos los movimientos de inventario con paginación (con `fields`, solo esos campos).
+    """
+    campos = parsear_fields(fields, MovimientoInventario)
+    pagina = await service.obtener_movimientos_inventario(skip, limit, db, cursor, campos)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    if campos:
+        return respuesta_parcial(MovimientoInventario, pagina.items, campos, response)
+    return respuesta_lista(MovimientoInventario, pagina.items, response)
+
+@router.post("/bulk", response_model=ResultadoCargaMovimientos, openapi_extra=CUERPO_CARGA_MASIVA)
+async def cargar_movimientos(request: Request, atomic: bool = False, db: AsyncSession = Depends(get_async_db)):
+    """
+    Inserta un lote de movimientos (arreglo JSON o NDJSON) con un único executemany.
+    """
+    cuerpo = await request.body()
+    ndjson = "ndjson" in request.headers.get("content-type", "")
+    return await db.run_sync(lambda sesion: sync_service.cargar_movimientos(cuerpo, ndjson, atomic, sesion))
+
+@router.get("/export", response_class=StreamingResponse)
+async def exportar_movimientos(formato: FormatoExportacion = FormatoExportacion.CSV, gzip: bool = False,
+                               producto_id: Optional[int] = None, desde: Optional[datetime] = None,
+                               hasta: Optional[datetime] = None):
+    """
+    Exporta los movimientos filtrados en CSV o NDJSON (streaming, sin paginar).
+    El generador es síncrono y usa su propia conexión; Starlette lo recorre en el threadpool.
+    """
+    trozos = sync_service.exportar_movimientos(formato, producto_id, desde, hasta)
+    return respuesta_exportacion(trozos, "movimientos_inventario", formato, gzip)
+
+@router.get("/{movement_id}", response_model=MovimientoInventario)
+async def obtener_movimiento(movement_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtiene un movimiento de inventario específico por su ID.
+    """
+    return await service.obtener_movimiento_por_id(movement_id, db)
+
+@router.post("/", response_model=MovimientoInventario)
+async def crear_movimiento(movimiento: CrearMovimientoInventario, db: AsyncSession = Depends(get_async_db),
+                           idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", description=DESCRIPCION_CLAVE)):
+    """
+    Crea un nuevo movimiento de inventario.
+    Con Idempotency-Key, los reintentos repiten la respuesta original sin crear otro movimiento.
+    """
+    return await service.crear_movimiento(movimiento, db, idempotency_key)
+
+@router.put("/{movement_id}", response_model=MovimientoInventario)
+async def actualizar_movimiento(movement_id: int, movimiento: CrearMovimientoInventario, db: AsyncSession = Depends(get_async_db)):
+    """
+    Actualiza un movimiento de inventario existente.
+    """
+    return await service.actualizar_movimiento(movement_id, movimiento, db)
+
+@router.delete("/{movement_id}")
+async def eliminar_movimiento(movement_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Elimina un movimiento de inventario por su ID.
+    """
+    return await service.eliminar_movimiento(movement_id, db)
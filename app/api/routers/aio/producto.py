@@ -0,0 +1,173 @@
+"""
+Rutas asíncronas (async def + AsyncSession) para gestionar productos.
+
+Mismos endpoints que app.api.routers.producto; se montan cuando DB_ASYNC está activo.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.schemas.producto_schemas import Producto, CrearProducto, ActualizarProducto, TipoPerecedero, SugerenciaProducto
+from app.schemas.importacion_schema import ResultadoImportacion
+from app.schemas.precios_schema import AjustePrecios, DestinoPrecio, FilaPrecio, ResultadoPrecios
+from app.schemas.lote_schema import ResultadoLote
+from app.schemas.relaciones_schema import ProductoConRelaciones, RELACIONES_PRODUCTO
+from app.core.config import get_async_db
+from app.core.cache import ruta_cacheada
+from app.core.etag import ruta_con_etag
+from app.core.lotes import DESCRIPCION_IDS, parsear_ids
+from app.core.exportacion import FormatoExportacion, respuesta_exportacion
+from app.core.importacion import cuerpo_csv, leer_csv, recibir_csv
+from app.core.inclusion import DESCRIPCION_INCLUDE, parsear_include, respuesta_con_relaciones
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.core.proyeccion import DESCRIPCION_FIELDS, parsear_fields, respuesta_parcial
+from app.core.serializacion import respuesta_lista
+from app.services.aio import productos as service
+from app.services import productos as sync_service
+
+router = APIRouter(
+    prefix="/productos",
+    tags=["productos"],
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("productos", base=ruta_cacheada("productos", relaciones=RELACIONES_PRODUCTO),
+                              relaciones=RELACIONES_PRODUCTO),
+)
+
+@router.get("/", response_model=List[Producto])
+async def obtener_productos(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
+    categoria_id: int = None,
+    tipo_perecedero: TipoPerecedero = None,
+    activo: bool = None,
+    cursor: Optional[str] = None,
+    include: Optional[str] = Query(None, description=DESCRIPCION_INCLUDE),
+    fields: Optional[str] = Query(None, description=DESCRIPCION_FIELDS),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Obtener una lista de productos con filtros opcionales (y las relaciones de `include`
+    o solo los campos de `fields`).
+    """
+    incluir = parsear_include(include, RELACIONES_PRODUCTO)
+    campos = parsear_fields(fields, Producto)
+    if incluir and campos:
+        raise HTTPException(status_code=400, detail="fields e include no se pueden combinar")
+    pagina = await service.obtener_todos_los_productos(db, skip, limit, categoria_id, tipo_perecedero, activo, cursor,
+                                                       incluir, campos)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    if incluir:
+        return respuesta_con_relaciones(ProductoConRelaciones, pagina.items, incluir, response)
+    if campos:
+        return respuesta_parcial(Producto, pagina.items, campos, response)
+    return respuesta_lista(Producto, pagina.items, response)
+
+async def autocompletar_productos(q: str = Query(..., min_length=1, max_length=100),
+                                  limit: int = Query(10, ge=1, le=50)):
+    """
+    Sugerencias de productos activos por prefijo, desde el índice en memoria.
+    """
+    return sync_service.autocompletar_productos(q, limit)
+
+# Ruta simple (sin ETag ni caché, que leerían versiones_tabla en cada tecla)
+router.add_api_route("/autocomplete", autocompletar_productos, methods=["GET"],
+                     response_model=List[SugerenciaProducto], route_class_override=APIRoute)
+
+@router.get("/search", response_model=List[Producto])
+async def buscar_productos(response: Response, q: str = Query(..., min_length=1, max_length=200),
+                           limit: int = Query(20, ge=1, le=100), activo: Optional[bool] = None,
+                           db: AsyncSession = Depends(get_async_db)):
+    """
+    Buscar productos por nombre o descripción (prefijos, sin tildes), ordenados por relevancia.
+    """
+    return respuesta_lista(Producto, await service.buscar_productos(db, q, limit, activo), response)
+
+@router.get("/export", response_class=StreamingResponse)
+async def exportar_productos(formato: FormatoExportacion = FormatoExportacion.CSV, gzip: bool = False,
+                             categoria_id: Optional[int] = None, activo: Optional[bool] = None):
+    """
+    Exporta el catálogo de productos filtrado en CSV o NDJSON (streaming, sin paginar).
+    """
+    trozos = sync_service.exportar_productos(formato, categoria_id, activo)
+    return respuesta_exportacion(trozos, "productos", formato, gzip)
+
+@router.post("/import", response_model=ResultadoImportacion,
+             openapi_extra=cuerpo_csv(CrearProducto, sync_service.CLAVE_IMPORTACION))
+async def importar_productos(request: Request, atomic: bool = False, db: AsyncSession = Depends(get_async_db)):
+    """
+    Importar un catálogo CSV (upsert por nombre en una sola transacción).
+    """
+    with await recibir_csv(request) as archivo:
+        return await db.run_sync(lambda sesion: sync_service.importar_productos(sesion, leer_csv(archivo), atomic))
+
+@router.post("/precios", response_model=ResultadoPrecios)
+async def ajustar_precios(ajuste: AjustePrecios, dry_run: bool = False, db: AsyncSession = Depends(get_async_db)):
+    """
+    Ajustar por porcentaje o por monto todos los precios que cumplen el filtro (un único UPDATE).
+    """
+    return await db.run_sync(sync_service.ajustar_precios, ajuste, dry_run)
+
+@router.post("/precios/import", response_model=ResultadoPrecios,
+             openapi_extra=cuerpo_csv(FilaPrecio, ("producto_id", "proveedor_id")))
+async def importar_precios(request: Request, destino: DestinoPrecio = DestinoPrecio.PRODUCTO,
+                           categoria_id: Optional[int] = None, proveedor_id: Optional[int] = None,
+                           tipo_perecible: Optional[TipoPerecedero] = None, dry_run: bool = False,
+                           atomic: bool = False, db: AsyncSession = Depends(get_async_db)):
+    """
+    Aplicar los precios de un CSV (producto_id[, proveedor_id], precio) a las filas del filtro.
+    """
+    with await recibir_csv(request) as archivo:
+        return await db.run_sync(lambda sesion: sync_service.importar_precios(
+            sesion, leer_csv(archivo), destino, categoria_id, proveedor_id, tipo_perecible, dry_run, atomic))
+
+@router.get("/batch", response_model=ResultadoLote[Producto])
+async def obtener_productos_lote(ids: str = Query(..., description=DESCRIPCION_IDS),
+                                 db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtener varios productos por ID, en el orden pedido, con los ids inexistentes en `faltantes`.
+    """
+    return await service.obtener_productos_por_ids(db, parsear_ids(ids))
+
+@router.get("/{producto_id}", response_model=Producto)
+async def obtener_producto(producto_id: int, include: Optional[str] = Query(None, description=DESCRIPCION_INCLUDE),
+                           db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtener un producto por su ID (y las relaciones de `include`).
+    """
+    incluir = parsear_include(include, RELACIONES_PRODUCTO)
+    producto = await service.obtener_producto_por_id(db, producto_id, incluir)
+    if incluir:
+        return respuesta_con_relaciones(ProductoConRelaciones, producto, incluir)
+    return producto
+
+@router.post("/", response_model=Producto)
+async def crear_producto(producto: CrearProducto, db: AsyncSession = Depends(get_async_db)):
+    """
+    Crear un nuevo producto.
+    """
+    return await service.crear_nuevo_producto(db, producto)
+
+@router.put("/{producto_id}", response_model=Producto)
+async def actualizar_producto(producto_id: int, producto: CrearProducto, db: AsyncSession = Depends(get_async_db)):
+    """
+    Actualizar un producto existente.
+    """
+    return await service.actualizar_producto_existente(db, producto_id, producto)
+
+@router.patch("/{producto_id}", response_model=Producto)
+async def modificar_producto(producto_id: int, cambios: ActualizarProducto, db: AsyncSession = Depends(get_async_db)):
+    """
+    Modificar solo los campos enviados de un producto (los omitidos no se tocan).
+    """
+    return await service.modificar_producto(db, producto_id, cambios)
+
+@router.delete("/{producto_id}")
+async def eliminar_producto(producto_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Eliminar un producto por su ID.
+    """
+    return await service.eliminar_producto(db, producto_id)
@@ -0,0 +1,76 @@
+"""
+Router ProductoProveedor (asíncrono):
+Mismas rutas que app.api.routers.producto_proveedor con async def y AsyncSession.
+"""
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.schemas.producto_proveedor_schema import ProductoProveedor, CrearProductoProveedor
+from app.schemas.importacion_schema import ResultadoImportacion
+from app.schemas.lote_schema import ResultadoLote
+from app.schemas.relaciones_schema import ProductoProveedorConRelaciones, RELACIONES_PRODUCTO_PROVEEDOR
+from app.core.config import get_async_db
+from app.core.etag import ruta_con_etag
+from app.core.lotes import DESCRIPCION_IDS, parsear_ids
+from app.core.importacion import cuerpo_csv, leer_csv, recibir_csv
+from app.core.inclusion import DESCRIPCION_INCLUDE, parsear_include, respuesta_con_relaciones
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.services.aio import producto_proveedor_service as service
+from app.services import producto_proveedor_service as sync_service
+
+router = APIRouter(
+    prefix="/productos_proveedor",
+    tags=["Productos de Proveedor"],
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("proveedor_productos", relaciones=RELACIONES_PRODUCTO_PROVEEDOR),
+)
+
+@router.get("/", response_model=List[ProductoProveedor])
+async def obtener_productos_proveedor(request: Request, response: Response, skip: int = 0,
+                                      limit: int = Query(10, ge=1, le=LIMITE_MAXIMO),
+                                      cursor: Optional[str] = None,
+                                      include: Optional[str] = Query(None, description=DESCRIPCION_INCLUDE),
+                                      db: AsyncSession = Depends(get_async_db)):
+    incluir = parsear_include(include, RELACIONES_PRODUCTO_PROVEEDOR)
+    pagina = await service.obtener_productos_proveedor(skip, limit, db, cursor, incluir)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    if incluir:
+        return respuesta_con_relaciones(ProductoProveedorConRelaciones, pagina.items, incluir, response)
+    return pagina.items
+
+@router.post("/import", response_model=ResultadoImportacion,
+             openapi_extra=cuerpo_csv(CrearProductoProveedor, sync_service.CLAVE_IMPORTACION))
+async def importar_productos_proveedor(request: Request, atomic: bool = False, db: AsyncSession = Depends(get_async_db)):
+    """
+    Importa un CSV de precios de proveedor (upsert por proveedor y producto).
+    """
+    with await recibir_csv(request) as archivo:
+        return await db.run_sync(lambda sesion: sync_service.importar_productos_proveedor(leer_csv(archivo), atomic, sesion))
+
+@router.get("/batch", response_model=ResultadoLote[ProductoProveedor])
+async def obtener_productos_proveedor_lote(ids: str = Query(..., description=DESCRIPCION_IDS),
+                                           db: AsyncSession = Depends(get_async_db)):
+    return await service.obtener_productos_proveedor_por_ids(parsear_ids(ids), db)
+
+@router.get("/{producto_proveedor_id}", response_model=ProductoProveedor)
+async def obtener_producto_proveedor(producto_proveedor_id: int,
+                                     include: Optional[str] = Query(None, description=DESCRIPCION_INCLUDE),
+                                     db: AsyncSession = Depends(get_async_db)):
+    incluir = parsear_include(include, RELACIONES_PRODUCTO_PROVEEDOR)
+    producto_proveedor = await service.obtener_producto_proveedor_por_id(producto_proveedor_id, db, incluir)
+    if incluir:
+        return respuesta_con_relaciones(ProductoProveedorConRelaciones, producto_proveedor, incluir)
+    return producto_proveedor
+
+@router.post("/", response_model=ProductoProveedor)
+async def crear_producto_proveedor(producto_proveedor: CrearProductoProveedor, db: AsyncSession = Depends(get_async_db)):
+    return await service.crear_producto_proveedor(producto_proveedor, db)
+
+@router.put("/{producto_proveedor_id}", response_model=ProductoProveedor)
+async def actualizar_producto_proveedor(producto_proveedor_id: int, producto_proveedor: CrearProductoProveedor, db: AsyncSession = Depends(get_async_db)):
+    return await service.actualizar_producto_proveedor(producto_proveedor_id, producto_proveedor, db)
+
+@router.delete("/{producto_proveedor_id}")
+async def eliminar_producto_proveedor(producto_proveedor_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await service.eliminar_producto_proveedor(producto_proveedor_id, db)
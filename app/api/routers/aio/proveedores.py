@@ -0,0 +1,82 @@
+"""
+Router Proveedor (asíncrono):
+Mismas rutas que app.api.routers.proveedores con async def y AsyncSession.
+"""
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.schemas.proveedor_schema import Proveedor, CrearProveedor, ActualizarProveedor
+from app.schemas.lote_schema import ResultadoLote
+from app.core.config import get_async_db
+from app.core.cache import ruta_cacheada
+from app.core.etag import ruta_con_etag
+from app.core.lotes import DESCRIPCION_IDS, parsear_ids
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.services.aio import proveedor_service as service
+
+router = APIRouter(
+    prefix="/proveedores",
+    tags=["Proveedores"],
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("proveedores", base=ruta_cacheada("proveedores")),
+)
+
+@router.get("/", response_model=List[Proveedor])
+async def obtener_proveedores(request: Request, response: Response, skip: int = 0,
+                              limit: int = Query(10, ge=1, le=LIMITE_MAXIMO),
+                              cursor: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtiene todos los proveedores con paginación.
+    """
+    pagina = await service.obtener_proveedores(skip, limit, db, cursor)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    return pagina.items
+
+@router.get("/search", response_model=List[Proveedor])
+async def buscar_proveedores(q: str = Query(..., min_length=1, max_length=200), limit: int = Query(20, ge=1, le=100),
+                             db: AsyncSession = Depends(get_async_db)):
+    """
+    Busca proveedores por nombre o persona de contacto, ordenados por relevancia.
+    """
+    return await service.buscar_proveedores(q, limit, db)
+
+@router.get("/batch", response_model=ResultadoLote[Proveedor])
+async def obtener_proveedores_lote(ids: str = Query(..., description=DESCRIPCION_IDS),
+                                   db: AsyncSession = Depends(get_async_db)):
+    return await service.obtener_proveedores_por_ids(parsear_ids(ids), db)
+
+@router.get("/{proveedor_id}", response_model=Proveedor)
+async def obtener_proveedor(proveedor_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtiene un proveedor específico por su ID.
+    """
+    return await service.obtener_proveedor_por_id(proveedor_id, db)
+
+@router.post("/", response_model=Proveedor)
+async def crear_proveedor(proveedor: CrearProveedor, db: AsyncSession = Depends(get_async_db)):
+    """
+    Crea un nuevo proveedor.
+    """
+    return await service.crear_proveedor(proveedor, db)
+
+@router.put("/{proveedor_id}", response_model=Proveedor)
+async def actualizar_proveedor(proveedor_id: int, proveedor: CrearProveedor, db: AsyncSession = Depends(get_async_db)):
+    """
+    Actualiza un proveedor existente.
+    """
+    return await service.actualizar_proveedor(proveedor_id, proveedor, db)
+
+@router.patch("/{proveedor_id}", response_model=Proveedor)
+async def modificar_proveedor(proveedor_id: int, cambios: ActualizarProveedor, db: AsyncSession = Depends(get_async_db)):
+    """
+    Modifica solo los campos enviados de un proveedor (los omitidos no se tocan).
+    """
+    return await service.modificar_proveedor(proveedor_id, cambios, db)
+
+@router.delete("/{proveedor_id}")
+async def eliminar_proveedor(proveedor_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Elimina un proveedor por su ID.
+    """
+    return await service.eliminar_proveedor(proveedor_id, db)
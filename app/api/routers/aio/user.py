@@ -0,0 +1,68 @@
+"""
+Router Usuario (asíncrono):
+Mismas rutas que app.api.routers.user con async def y AsyncSession.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.security import OAuth2PasswordBearer
+from fastapi.responses import JSONResponse
+from app.schemas.user_schemas import UserCreate, UserUpdate, UserOut, LoginUser
+from app.core.config import get_async_db
+from app.core.security import decode_access_token
+from app.services.aio import user_service as service
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+
+router = APIRouter(
+    prefix="/users",
+    tags=["Users"],
+    responses={404: {"description": "No encontrado"}}
+)
+
+@router.get("/user-info", response_model=UserOut)
+async def get_user_info(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtiene la información del usuario autenticado.
+    """
+    payload = decode_access_token(token)
+    return await service.obtener_usuario_por_username(payload.get("sub"), db)
+
+@router.get('/{user_id}', response_model=UserOut)
+async def get_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Obtiene información de un usuario por ID.
+    """
+    return await service.obtener_usuario_por_id(user_id, db)
+
+@router.post('/', response_model=UserOut)
+async def add_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Crea un nuevo usuario (registro).
+    """
+    return await service.crear_usuario(user, db)
+
+@router.put('/{user_id}', response_model=UserOut)
+@router.patch('/{user_id}', response_model=UserOut)
+async def update_user(user_id: int, user_update: UserUpdate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Actualiza la información de un usuario (solo los campos enviados, con PUT o PATCH).
+    """
+    return await service.actualizar_usuario(user_id, user_update, db)
+
+@router.delete('/{user_id}')
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Elimina un usuario por su ID.
+    """
+    return await service.eliminar_usuario(user_id, db)
+
+@router.post("/login", response_model=dict)
+async def login(user: LoginUser, db: AsyncSession = Depends(get_async_db)):
+    """
+    Inicia sesión y obtiene tokens de acceso y refresco.
+    """
+    tokens = await service.autenticar_usuario(user, db)
+    response = JSONResponse(content=tokens)
+    response.set_cookie(key="refresh_token", value=tokens['refresh_token'], httponly=True, secure=True)
+    return response
@@ -6,17 +6,23 @@ incluyendo operaciones CRUD: obtener, crear, actualizar y eliminar almacenes.
 Delegando la lógica de negocio al servicio correspondiente.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.schemas import almacenamiento_schema as schemas
+from app.schemas.lote_schema import ResultadoLote
 from app.core.config import get_db
+from app.core.cache import ruta_cacheada
+from app.core.etag import ruta_con_etag
+from app.core.lotes import DESCRIPCION_IDS, parsear_ids
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
 from app.services.almacenamiento_service import AlmacenamientoService
 
 router = APIRouter(
     prefix="/almacenes",
     tags=["almacenes"],
-    responses={404: {"description": "No encontrado"}}
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("almacenes", base=ruta_cacheada("almacenes")),
 )
 
 
@@ -35,22 +41,46 @@ def get_almacen_service(db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[schemas.Almacen])
 def obtener_almacenes(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
+    cursor: Optional[str] = None,
     almacen_service: AlmacenamientoService = Depends(get_almacen_service)
 ):
     """
     Obtener todos los almacenes con paginación.
 
     Args:
-        skip (int): Número de registros a omitir (paginación).
+        skip (int): Número de registros a omitir (compatibilidad; preferir cursor).
         limit (int): Límite de registros a obtener.
+        cursor (str): Cursor opaco de la página siguiente (cabeceras Link / X-Next-Cursor).
         almacen_service (AlmacenamientoService): Servicio de almacenes inyectado.
 
     Returns:
         List[schemas.Almacen]: Lista de almacenes.
     """
-    return almacen_service.obtener_todos(skip, limit)
+    pagina = almacen_service.obtener_todos(skip, limit, cursor)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    return pagina.items
+
+
+@router.get("/batch", response_model=ResultadoLote[schemas.Almacen])
+def obtener_almacenes_lote(
+    ids: str = Query(..., description=DESCRIPCION_IDS),
+    almacen_service: AlmacenamientoService = Depends(get_almacen_service)
+):
+    """
+    Obtener varios almacenes por ID en una sola petición.
+
+    Args:
+        ids (str): IDs separados por comas (por ejemplo 3,1,2).
+        almacen_service (AlmacenamientoService): Servicio de almacenes inyectado.
+
+    Returns:
+        ResultadoLote[schemas.Almacen]: Almacenes en el orden pedido e IDs inexistentes.
+    """
+    return almacen_service.obtener_por_ids(parsear_ids(ids))
 
 
 @router.get("/{storage_id}", response_model=schemas.Almacen)
@@ -115,6 +145,26 @@ def actualizar_almacen(
     return almacen_service.actualizar(storage_id, almacen)
 
 
+@router.patch("/{storage_id}", response_model=schemas.Almacen)
+def modificar_almacen(
+    storage_id: int,
+    cambios: schemas.ActualizarAlmacen,
+    almacen_service: AlmacenamientoService = Depends(get_almacen_service)
+):
+    """
+    Modificar solo los campos enviados de un almacén.
+
+    Args:
+        storage_id (int): ID del almacén a modificar.
+        cambios (schemas.ActualizarAlmacen): Campos a cambiar (los omitidos no se tocan).
+        almacen_service (AlmacenamientoService): Servicio de almacenes inyectado.
+
+    Returns:
+        schemas.Almacen: Almacén actualizado.
+    """
+    return almacen_service.modificar(storage_id, cambios)
+
+
 @router.delete("/{storage_id}")
 def eliminar_almacen(
     storage_id: int,
@@ -6,17 +6,23 @@ incluyendo operaciones CRUD: obtener, crear, actualizar y eliminar categorías.
 Delegando la lógica de negocio al servicio correspondiente.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import List
-from app.schemas.categorias_schema import Categoria, CrearCategoria, TipoCategoria
+from typing import List, Optional
+from app.schemas.categorias_schema import ActualizarCategoria, Categoria, CrearCategoria, TipoCategoria
+from app.schemas.lote_schema import ResultadoLote
 from app.core.config import get_db
+from app.core.cache import ruta_cacheada
+from app.core.etag import ruta_con_etag
+from app.core.lotes import DESCRIPCION_IDS, parsear_ids
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
 from app.services.categorias_service import CategoriaService
 
 router = APIRouter(
     prefix="/categorias",
     tags=["categorías"],
-    responses={404: {"description": "No encontrado"}}
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("categorias", base=ruta_cacheada("categorias")),
 )
 
 
@@ -35,24 +41,48 @@ def get_categoria_service(db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[Categoria])
 def obtener_categorias(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
     tipo: TipoCategoria = None,
+    cursor: Optional[str] = None,
     categoria_service: CategoriaService = Depends(get_categoria_service)
 ):
     """
     Obtener todas las categorías con paginación y filtro opcional por tipo.
 
     Args:
-        skip (int): Número de registros a omitir (paginación).
+        skip (int): Número de registros a omitir (compatibilidad; preferir cursor).
         limit (int): Límite de registros a obtener.
         tipo (schemas.TipoCategoria): Filtro opcional por tipo de categoría.
+        cursor (str): Cursor opaco de la página siguiente (cabeceras Link / X-Next-Cursor).
         categoria_service (CategoriaService): Servicio de categorías inyectado.
 
     Returns:
         List[schemas.Categoria]: Lista de categorías.
     """
-    return categoria_service.obtener_todas(skip, limit, tipo)
+    pagina = categoria_service.obtener_todas(skip, limit, tipo, cursor)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    return pagina.items
+
+
+@router.get("/batch", response_model=ResultadoLote[Categoria])
+def obtener_categorias_lote(
+    ids: str = Query(..., description=DESCRIPCION_IDS),
+    categoria_service: CategoriaService = Depends(get_categoria_service)
+):
+    """
+    Obtener varias categorías por ID en una sola petición.
+
+    Args:
+        ids (str): IDs separados por comas (por ejemplo 3,1,2).
+        categoria_service (CategoriaService): Servicio de categorías inyectado.
+
+    Returns:
+        ResultadoLote[schemas.Categoria]: Categorías en el orden pedido e IDs inexistentes.
+    """
+    return categoria_service.obtener_por_ids(parsear_ids(ids))
 
 
 @router.get("/{categoria_id}", response_model=Categoria)
@@ -117,6 +147,26 @@ def actualizar_categoria(
     return categoria_service.actualizar(categoria_id, categoria)
 
 
+@router.patch("/{categoria_id}", response_model=Categoria)
+def modificar_categoria(
+    categoria_id: int,
+    cambios: ActualizarCategoria,
+    categoria_service: CategoriaService = Depends(get_categoria_service)
+):
+    """
+    Modificar solo los campos enviados de una categoría.
+
+    Args:
+        categoria_id (int): ID de la categoría a modificar.
+        cambios (ActualizarCategoria): Campos a cambiar (los omitidos no se tocan).
+        categoria_service (CategoriaService): Servicio de categorías inyectado.
+
+    Returns:
+        schemas.Categoria: Categoría actualizada.
+    """
+    return categoria_service.modificar(categoria_id, cambios)
+
+
 @router.delete("/{categoria_id}")
 def eliminar_categoria(
     categoria_id: int,
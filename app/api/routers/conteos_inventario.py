@@ -9,44 +9,91 @@ Incluye endpoints para:
 - Eliminar un conteo de inventario.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.schemas import conteo_schema as schemas
 from app.core.config import get_db
+from app.core.etag import ruta_con_etag
+from app.core.idempotencia import DESCRIPCION_CLAVE
+from app.core.exportacion import FormatoExportacion, respuesta_exportacion
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.core.proyeccion import DESCRIPCION_FIELDS, parsear_fields, respuesta_parcial
+from app.core.serializacion import respuesta_lista
 from app.services.conteos_inventario import (
     obtener_conteos,
     obtener_conteo_por_id,
     crear_conteo,
     actualizar_conteo,
-    eliminar_conteo
+    eliminar_conteo,
+    exportar_conteos
 )
 
 router = APIRouter(
     prefix="/conteos_inventario",
     tags=["conteos_inventario"],
-    responses={404: {"description": "No encontrado"}}
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("conteos_inventario"),
 )
 
 
 @router.get("/", response_model=List[schemas.ConteoInventario])
 def obtener_conteos_inventario(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description=DESCRIPCION_FIELDS),
     db: Session = Depends(get_db)
 ):
     """
     Obtener todos los conteos de inventario.
 
     Parámetros:
-    - skip (int): Número de registros a omitir (paginación).
+    - skip (int): Número de registros a omitir (compatibilidad; preferir cursor).
     - limit (int): Número máximo de registros a devolver.
+    - cursor (str): Cursor opaco de la página siguiente (cabeceras Link / X-Next-Cursor).
+    - fields (str): Campos a devolver (por ejemplo id,producto_id,cantidad); solo se leen esas columnas.
     - db (Session): Sesión de base de datos inyectada con Depends.
 
     Retorna:
     - List[schemas.ConteoInventario]: Lista de conteos de inventario.
     """
-    return obtener_conteos(db, skip, limit)
+    campos = parsear_fields(fields, schemas.ConteoInventario)
+    pagina = obtener_conteos(db, skip, limit, cursor, campos)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    if campos:
+        return respuesta_parcial(schemas.ConteoInventario, pagina.items, campos, response)
+    return respuesta_lista(schemas.ConteoInventario, pagina.items, response)
+
+
+@router.get("/export", response_class=StreamingResponse)
+def exportar_conteos_inventario(
+    formato: FormatoExportacion = FormatoExportacion.CSV,
+    gzip: bool = False,
+    producto_id: Optional[int] = None,
+    almacen_id: Optional[int] = None,
+    desde: Optional[datetime] = None,
+    hasta: Optional[datetime] = None,
+):
+    """
+    Exportar los conteos de inventario que cumplen los filtros, sin paginar.
+
+    Parámetros:
+    - formato (FormatoExportacion): csv (con encabezado) o ndjson (un objeto por línea).
+    - gzip (bool): Comprimir la salida (archivo .gz).
+    - producto_id (int): Filtrar por producto.
+    - almacen_id (int): Filtrar por almacén.
+    - desde / hasta (datetime): Rango de fecha_ultimo_conteo (desde inclusive, hasta exclusive).
+
+    Retorna:
+    - StreamingResponse: Archivo conteos_inventario.csv / .ndjson (opcionalmente .gz).
+    """
+    trozos = exportar_conteos(formato, producto_id, almacen_id, desde, hasta)
+    return respuesta_exportacion(trozos, "conteos_inventario", formato, gzip)
 
 
 @router.get("/{count_id}", response_model=schemas.ConteoInventario)
@@ -68,18 +115,21 @@ def obtener_conteo_inventario(count_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/", response_model=schemas.ConteoInventario)
-def crear_conteo_inventario(conteo: schemas.CrearConteoInventario, db: Session = Depends(get_db)):
+def crear_conteo_inventario(conteo: schemas.CrearConteoInventario, db: Session = Depends(get_db),
+                            idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key",
+                                                                    description=DESCRIPCION_CLAVE)):
     """
     Crear un nuevo conteo de inventario.
 
     Parámetros:
     - conteo (schemas.CrearConteoInventario): Datos del conteo a crear.
     - db (Session): Sesión de base de datos.
+    - idempotency_key (str, opcional): Los reintentos con la misma clave repiten la respuesta original.
 
     Retorna:
     - schemas.ConteoInventario: Conteo de inventario creado.
     """
-    return crear_conteo(db, conteo)
+    return crear_conteo(db, conteo, idempotency_key)
 
 
 @router.put("/{count_id}", response_model=schemas.ConteoInventario)
@@ -4,26 +4,95 @@ Gestiona las rutas para la creación, consulta,
 actualización y eliminación de movimientos de inventario.
 """
 
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
-from app.schemas.movimiento_schema import MovimientoInventario, CrearMovimientoInventario
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
+from app.schemas.movimiento_schema import (
+    MovimientoInventario,
+    CrearMovimientoInventario,
+    ResultadoCargaMovimientos
+)
 from app.core.config import get_db
+from app.core.etag import ruta_con_etag
+from app.core.idempotencia import DESCRIPCION_CLAVE
+from app.core.exportacion import FormatoExportacion, respuesta_exportacion
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.core.proyeccion import DESCRIPCION_FIELDS, parsear_fields, respuesta_parcial
+from app.core.serializacion import respuesta_lista
 from app.services import movimiento_inventario_service as service
 
 router = APIRouter(
     prefix="/movimientos_inventario",
     tags=["Movimientos de Inventario"],
-    responses={404: {"description": "No encontrado"}}
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("movimientos_inventario"),
 )
 
+# Documentación del cuerpo de la carga masiva (se lee crudo para admitir NDJSON)
+CUERPO_CARGA_MASIVA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": {"type": "array", "items": CrearMovimientoInventario.model_json_schema()}},
+            "application/x-ndjson": {"schema": {"type": "string", "description": "Un movimiento JSON por línea"}},
+        },
+    }
+}
+
 # Obtener todos los movimientos de inventario
 @router.get("/", response_model=List[MovimientoInventario])
-def obtener_movimientos_inventario(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def obtener_movimientos_inventario(request: Request, response: Response, skip: int = 0,
+                                   limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
+                                   cursor: Optional[str] = None,
+                                   fields: Optional[str] = Query(None, description=DESCRIPCION_FIELDS),
+                                   db: Session = Depends(get_db)):
+    """
+    Obtiene los movimientos de inventario con paginación por cursor (o skip/limit).
+    Con `fields` solo se leen y devuelven esos campos.
+    """
+    campos = parsear_fields(fields, MovimientoInventario)
+    pagina = service.obtener_movimientos_inventario(skip, limit, db, cursor, campos)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    if campos:
+        return respuesta_parcial(MovimientoInventario, pagina.items, campos, response)
+    return respuesta_lista(MovimientoInventario, pagina.items, response)
+
+# Carga masiva de movimientos en una sola transacción
+@router.post("/bulk", response_model=ResultadoCargaMovimientos, openapi_extra=CUERPO_CARGA_MASIVA)
+async def cargar_movimientos(request: Request, atomic: bool = False, db: Session = Depends(get_db)):
     """
-    Obtiene todos los movimientos de inventario con paginación.
+    Inserta un lote de movimientos (arreglo JSON o NDJSON) con un único executemany.
+
+    Con atomic=true cualquier fila inválida aborta todo el lote; por defecto se
+    insertan las filas válidas y se devuelven los errores por fila.
+    """
+    cuerpo = await request.body()
+    ndjson = "ndjson" in request.headers.get("content-type", "")
+    return await run_in_threadpool(service.cargar_movimientos, cuerpo, ndjson, atomic, db)
+
+# Exportar movimientos (CSV o NDJSON en streaming)
+@router.get("/export", response_class=StreamingResponse)
+def exportar_movimientos(
+    formato: FormatoExportacion = FormatoExportacion.CSV,
+    gzip: bool = False,
+    producto_id: Optional[int] = None,
+    desde: Optional[datetime] = None,
+    hasta: Optional[datetime] = None,
+):
+    """
+    Exporta todos los movimientos que cumplen los filtros, sin paginar.
+
+    Parámetros:
+    - formato (FormatoExportacion): csv (con encabezado) o ndjson (un objeto por línea).
+    - gzip (bool): Comprimir la salida (archivo .gz).
+    - producto_id (int): Filtrar por producto.
+    - desde / hasta (datetime): Rango de fechas (desde inclusive, hasta exclusive).
     """
-    return service.obtener_movimientos_inventario(skip, limit, db)
+    trozos = service.exportar_movimientos(formato, producto_id, desde, hasta)
+    return respuesta_exportacion(trozos, "movimientos_inventario", formato, gzip)
 
 # Obtener un movimiento por ID
 @router.get("/{movement_id}", response_model=MovimientoInventario)
@@ -35,11 +104,13 @@ def obtener_movimiento(movement_id: int, db: Session = Depends(get_db)):
 
 # Crear un nuevo movimiento de inventario
 @router.post("/", response_model=MovimientoInventario)
-def crear_movimiento(movimiento: CrearMovimientoInventario, db: Session = Depends(get_db)):
+def crear_movimiento(movimiento: CrearMovimientoInventario, db: Session = Depends(get_db),
+                     idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", description=DESCRIPCION_CLAVE)):
     """
     Crea un nuevo movimiento de inventario.
+    Con Idempotency-Key, los reintentos repiten la respuesta original sin crear otro movimiento.
     """
-    return service.crear_movimiento(movimiento, db)
+    return service.crear_movimiento(movimiento, db, idempotency_key)
 
 # Actualizar un movimiento de inventario existente
 @router.put("/{movement_id}", response_model=MovimientoInventario)
@@ -7,59 +7,243 @@ Incluye endpoints para:
 - Crear un nuevo producto.
 - Actualizar un producto existente.
 - Eliminar un producto.
+- Actualizar precios de forma masiva (ajuste sobre un filtro o CSV).
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
 from sqlalchemy.orm import Session
-from typing import List
-from app.schemas.producto_schemas import Producto, CrearProducto, TipoPerecedero
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
+from app.schemas.producto_schemas import Producto, CrearProducto, ActualizarProducto, TipoPerecedero, SugerenciaProducto
+from app.schemas.importacion_schema import ResultadoImportacion
+from app.schemas.precios_schema import AjustePrecios, DestinoPrecio, FilaPrecio, ResultadoPrecios
+from app.schemas.lote_schema import ResultadoLote
+from app.schemas.relaciones_schema import ProductoConRelaciones, RELACIONES_PRODUCTO
 from app.core.config import get_db
+from app.core.cache import ruta_cacheada
+from app.core.etag import ruta_con_etag
+from app.core.lotes import DESCRIPCION_IDS, parsear_ids
+from app.core.exportacion import FormatoExportacion, respuesta_exportacion
+from app.core.importacion import cuerpo_csv, leer_csv, recibir_csv
+from app.core.inclusion import DESCRIPCION_INCLUDE, parsear_include, respuesta_con_relaciones
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.core.proyeccion import DESCRIPCION_FIELDS, parsear_fields, respuesta_parcial
+from app.core.serializacion import respuesta_lista
 from app.services.productos import (
     obtener_todos_los_productos,
+    buscar_productos as buscar_en_catalogo,
+    autocompletar_productos as autocompletar,
     obtener_producto_por_id,
+    obtener_productos_por_ids,
     crear_nuevo_producto,
     actualizar_producto_existente,
-    eliminar_producto
+    modificar_producto as modificar_producto_existente,
+    eliminar_producto as eliminar_producto_existente,
+    exportar_productos as exportar_catalogo,
+    importar_productos as importar_catalogo,
+    ajustar_precios as ajustar_precios_catalogo,
+    importar_precios as importar_precios_catalogo,
+    CLAVE_IMPORTACION
 )
 
 router = APIRouter(
     prefix="/productos",
     tags=["productos"],
-    responses={404: {"description": "No encontrado"}}
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("productos", base=ruta_cacheada("productos", relaciones=RELACIONES_PRODUCTO),
+                              relaciones=RELACIONES_PRODUCTO),
 )
 
 # Obtener productos
 @router.get("/", response_model=List[Producto])
 def obtener_productos(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
     categoria_id: int = None,
     tipo_perecedero: TipoPerecedero = None,
     activo: bool = None,
+    cursor: Optional[str] = None,
+    include: Optional[str] = Query(None, description=DESCRIPCION_INCLUDE),
+    fields: Optional[str] = Query(None, description=DESCRIPCION_FIELDS),
     db: Session = Depends(get_db)
 ):
     """
     Obtener una lista de productos con filtros opcionales.
     
     Parámetros:
-    - skip (int): Número de registros a saltar.
+    - skip (int): Número de registros a saltar (compatibilidad; preferir cursor).
     - limit (int): Límite de registros a obtener.
     - categoria_id (int): Filtrar por ID de categoría.
     - tipo_perecedero (TipoPerecedero): Filtrar por tipo de perecibilidad.
     - activo (bool): Filtrar por estado activo/inactivo.
+    - cursor (str): Cursor opaco de la página siguiente (cabeceras Link / X-Next-Cursor).
+    - include (str): Relaciones a incluir (categoria, proveedores, proveedores.proveedor),
+      cargadas para toda la página con un número fijo de consultas.
+    - fields (str): Campos a devolver (por ejemplo id,nombre,unidad); solo se leen esas columnas.
     """
-    return obtener_todos_los_productos(db, skip, limit, categoria_id, tipo_perecedero, activo)
+    incluir = parsear_include(include, RELACIONES_PRODUCTO)
+    campos = parsear_fields(fields, Producto)
+    if incluir and campos:
+        raise HTTPException(status_code=400, detail="fields e include no se pueden combinar")
+    pagina = obtener_todos_los_productos(db, skip, limit, categoria_id, tipo_perecedero, activo, cursor, incluir, campos)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    if incluir:
+        return respuesta_con_relaciones(ProductoConRelaciones, pagina.items, incluir, response)
+    if campos:
+        return respuesta_parcial(Producto, pagina.items, campos, response)
+    return respuesta_lista(Producto, pagina.items, response)
+
+# Autocompletar nombres desde el índice en memoria
+async def autocompletar_productos(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """
+    Sugerencias para el selector de productos: productos activos con alguna palabra del
+    nombre que empieza por `q` (sin distinguir mayúsculas ni tildes), en orden alfabético.
+
+    Se responde desde un índice en memoria, sin consultar la base de datos.
+
+    Parámetros:
+    - q (str): Texto escrito hasta el momento.
+    - limit (int): Máximo de sugerencias (1-50).
+    """
+    return autocompletar(q, limit)
+
+# Ruta simple (sin ETag ni caché, que leerían versiones_tabla en cada tecla)
+router.add_api_route("/autocomplete", autocompletar_productos, methods=["GET"],
+                     response_model=List[SugerenciaProducto], route_class_override=APIRoute)
+
+# Buscar productos por texto (FTS5, ordenados por relevancia)
+@router.get("/search", response_model=List[Producto])
+def buscar_productos(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    activo: Optional[bool] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Buscar productos por nombre o descripción.
+
+    Cada palabra se busca como prefijo y sin distinguir mayúsculas ni tildes
+    ("harina 000", "tomat"); los resultados vienen ordenados por relevancia.
+
+    Parámetros:
+    - q (str): Texto a buscar.
+    - limit (int): Máximo de resultados (1-100).
+    - activo (bool): Filtrar por estado activo/inactivo.
+    """
+    return respuesta_lista(Producto, buscar_en_catalogo(db, q, limit, activo), response)
+
+# Exportar catálogo de productos (CSV o NDJSON en streaming)
+@router.get("/export", response_class=StreamingResponse)
+def exportar_productos(
+    formato: FormatoExportacion = FormatoExportacion.CSV,
+    gzip: bool = False,
+    categoria_id: Optional[int] = None,
+    activo: Optional[bool] = None,
+):
+    """
+    Exportar todo el catálogo de productos que cumple los filtros, sin paginar.
+
+    Parámetros:
+    - formato (FormatoExportacion): csv (con encabezado) o ndjson (un objeto por línea).
+    - gzip (bool): Comprimir la salida (archivo .gz).
+    - categoria_id (int): Filtrar por ID de categoría.
+    - activo (bool): Filtrar por estado activo/inactivo.
+    """
+    trozos = exportar_catalogo(formato, categoria_id, activo)
+    return respuesta_exportacion(trozos, "productos", formato, gzip)
+
+# Importar catálogo de productos desde CSV (upsert por nombre en una sola transacción)
+@router.post("/import", response_model=ResultadoImportacion, openapi_extra=cuerpo_csv(CrearProducto, CLAVE_IMPORTACION))
+async def importar_productos(request: Request, atomic: bool = False, db: Session = Depends(get_db)):
+    """
+    Importar un catálogo CSV con encabezado (mismas columnas que la exportación).
+
+    Los productos se reconocen por nombre: se insertan los nuevos, se actualizan solo los
+    que cambian y se informan los conteos de insertados, actualizados y sin cambios.
+
+    Parámetros:
+    - atomic (bool): Si es true, cualquier fila inválida aborta toda la importación.
+    """
+    with await recibir_csv(request) as archivo:
+        return await run_in_threadpool(importar_catalogo, db, leer_csv(archivo), atomic)
+
+# Ajuste masivo de precios sobre un filtro (un único UPDATE)
+@router.post("/precios", response_model=ResultadoPrecios)
+def ajustar_precios(ajuste: AjustePrecios, dry_run: bool = False, db: Session = Depends(get_db)):
+    """
+    Ajustar por porcentaje o por monto todos los precios que cumplen el filtro.
+
+    Con destino=proveedor se ajustan los precios de las ofertas (proveedor_productos).
+    Devuelve el número de precios que cambian.
+
+    Parámetros:
+    - dry_run (bool): Si es true, no modifica nada y devuelve las diferencias fila a fila.
+    """
+    return ajustar_precios_catalogo(db, ajuste, dry_run)
+
+# Precios nuevos desde CSV (un UPDATE por lote, en una sola transacción)
+@router.post("/precios/import", response_model=ResultadoPrecios,
+             openapi_extra=cuerpo_csv(FilaPrecio, ("producto_id", "proveedor_id")))
+async def importar_precios(
+    request: Request,
+    destino: DestinoPrecio = DestinoPrecio.PRODUCTO,
+    categoria_id: Optional[int] = None,
+    proveedor_id: Optional[int] = None,
+    tipo_perecible: Optional[TipoPerecedero] = None,
+    dry_run: bool = False,
+    atomic: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    Aplicar los precios de un CSV con columnas producto_id, precio (y proveedor_id si
+    destino=proveedor) a las filas que además cumplen el filtro.
+
+    Parámetros:
+    - dry_run (bool): Si es true, no modifica nada y devuelve las diferencias fila a fila.
+    - atomic (bool): Si es true, cualquier fila inválida aborta toda la operación.
+    """
+    with await recibir_csv(request) as archivo:
+        return await run_in_threadpool(importar_precios_catalogo, db, leer_csv(archivo), destino, categoria_id,
+                                       proveedor_id, tipo_perecible, dry_run, atomic)
+
+# Obtener varios productos por id en una sola petición
+@router.get("/batch", response_model=ResultadoLote[Producto])
+def obtener_productos_lote(ids: str = Query(..., description=DESCRIPCION_IDS), db: Session = Depends(get_db)):
+    """
+    Obtener varios productos por ID con una consulta `IN` por cada 500 ids.
+
+    Los productos se devuelven en el orden pedido; los ids inexistentes se informan
+    en `faltantes` (no es un 404).
+
+    Parámetros:
+    - ids (str): IDs separados por comas (por ejemplo 3,1,2).
+    """
+    return obtener_productos_por_ids(db, parsear_ids(ids))
 
 # Obtener producto por id
 @router.get("/{producto_id}", response_model=Producto)
-def obtener_producto(producto_id: int, db: Session = Depends(get_db)):
+def obtener_producto(producto_id: int, include: Optional[str] = Query(None, description=DESCRIPCION_INCLUDE),
+                     db: Session = Depends(get_db)):
     """
     Obtener un producto por su ID.
     
     Parámetros:
     - producto_id (int): ID del producto a buscar.
+    - include (str): Relaciones a incluir (categoria, proveedores, proveedores.proveedor).
     """
-    return obtener_producto_por_id(db, producto_id)
+    incluir = parsear_include(include, RELACIONES_PRODUCTO)
+    producto = obtener_producto_por_id(db, producto_id, incluir)
+    if incluir:
+        return respuesta_con_relaciones(ProductoConRelaciones, producto, incluir)
+    return producto
 
 # Crear producto
 @router.post("/", response_model=Producto)
@@ -88,6 +272,18 @@ def actualizar_producto(
     """
     return actualizar_producto_existente(db, producto_id, producto)
 
+# Modificar solo los campos enviados de un producto
+@router.patch("/{producto_id}", response_model=Producto)
+def modificar_producto(producto_id: int, cambios: ActualizarProducto, db: Session = Depends(get_db)):
+    """
+    Modificar solo los campos enviados de un producto (los omitidos no se tocan).
+    
+    Parámetros:
+    - producto_id (int): ID del producto a modificar.
+    - cambios (ActualizarProducto): Campos a cambiar.
+    """
+    return modificar_producto_existente(db, producto_id, cambios)
+
 # Eliminar producto
 @router.delete("/{producto_id}")
 def eliminar_producto(producto_id: int, db: Session = Depends(get_db)):
@@ -97,4 +293,4 @@ def eliminar_producto(producto_id: int, db: Session = Depends(get_db)):
     Parámetros:
     - producto_id (int): ID del producto a eliminar.
     """
-    return eliminar_producto(db, producto_id)
+    return eliminar_producto_existente(db, producto_id)
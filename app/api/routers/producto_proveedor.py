@@ -4,28 +4,69 @@ Gestiona las rutas para la creación, consulta,
 actualización y eliminación de productos de proveedor.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
 from app.schemas.producto_proveedor_schema import ProductoProveedor, CrearProductoProveedor
+from app.schemas.importacion_schema import ResultadoImportacion
+from app.schemas.lote_schema import ResultadoLote
+from app.schemas.relaciones_schema import ProductoProveedorConRelaciones, RELACIONES_PRODUCTO_PROVEEDOR
 from app.core.config import get_db
+from app.core.etag import ruta_con_etag
+from app.core.lotes import DESCRIPCION_IDS, parsear_ids
+from app.core.importacion import cuerpo_csv, leer_csv, recibir_csv
+from app.core.inclusion import DESCRIPCION_INCLUDE, parsear_include, respuesta_con_relaciones
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
 from app.services import producto_proveedor_service as service
 
 router = APIRouter(
     prefix="/productos_proveedor",
     tags=["Productos de Proveedor"],
-    responses={404: {"description": "No encontrado"}}
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("proveedor_productos", relaciones=RELACIONES_PRODUCTO_PROVEEDOR),
 )
 
 # Obtener todos los productos de proveedor
 @router.get("/", response_model=List[ProductoProveedor])
-def obtener_productos_proveedor(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    return service.obtener_productos_proveedor(skip, limit, db)
+def obtener_productos_proveedor(request: Request, response: Response, skip: int = 0,
+                                limit: int = Query(10, ge=1, le=LIMITE_MAXIMO),
+                                cursor: Optional[str] = None,
+                                include: Optional[str] = Query(None, description=DESCRIPCION_INCLUDE),
+                                db: Session = Depends(get_db)):
+    incluir = parsear_include(include, RELACIONES_PRODUCTO_PROVEEDOR)
+    pagina = service.obtener_productos_proveedor(skip, limit, db, cursor, incluir)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    if incluir:
+        return respuesta_con_relaciones(ProductoProveedorConRelaciones, pagina.items, incluir, response)
+    return pagina.items
+
+# Importar una lista de precios de proveedor desde CSV (upsert por proveedor y producto)
+@router.post("/import", response_model=ResultadoImportacion,
+             openapi_extra=cuerpo_csv(CrearProductoProveedor, service.CLAVE_IMPORTACION))
+async def importar_productos_proveedor(request: Request, atomic: bool = False, db: Session = Depends(get_db)):
+    """
+    Importa un CSV con encabezado; las filas se reconocen por (proveedor_id, producto_id).
+    Con atomic=true cualquier fila inválida aborta toda la importación.
+    """
+    with await recibir_csv(request) as archivo:
+        return await run_in_threadpool(service.importar_productos_proveedor, leer_csv(archivo), atomic, db)
+
+# Obtener varios productos de proveedor por ID (en el orden pedido, con los inexistentes en `faltantes`)
+@router.get("/batch", response_model=ResultadoLote[ProductoProveedor])
+def obtener_productos_proveedor_lote(ids: str = Query(..., description=DESCRIPCION_IDS), db: Session = Depends(get_db)):
+    return service.obtener_productos_proveedor_por_ids(parsear_ids(ids), db)
 
 # Obtener un producto de proveedor por ID
 @router.get("/{producto_proveedor_id}", response_model=ProductoProveedor)
-def obtener_producto_proveedor(producto_proveedor_id: int, db: Session = Depends(get_db)):
-    return service.obtener_producto_proveedor_por_id(producto_proveedor_id, db)
+def obtener_producto_proveedor(producto_proveedor_id: int,
+                               include: Optional[str] = Query(None, description=DESCRIPCION_INCLUDE),
+                               db: Session = Depends(get_db)):
+    incluir = parsear_include(include, RELACIONES_PRODUCTO_PROVEEDOR)
+    producto_proveedor = service.obtener_producto_proveedor_por_id(producto_proveedor_id, db, incluir)
+    if incluir:
+        return respuesta_con_relaciones(ProductoProveedorConRelaciones, producto_proveedor, incluir)
+    return producto_proveedor
 
 # Crear un nuevo producto de proveedor
 @router.post("/", response_model=ProductoProveedor)
@@ -4,26 +4,54 @@ Gestiona las rutas para la creación, consulta,
 actualización y eliminación de proveedores.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
-from app.schemas.proveedor_schema import Proveedor, CrearProveedor
+from typing import List, Optional
+from app.schemas.proveedor_schema import Proveedor, CrearProveedor, ActualizarProveedor
+from app.schemas.lote_schema import ResultadoLote
 from app.core.config import get_db
+from app.core.cache import ruta_cacheada
+from app.core.etag import ruta_con_etag
+from app.core.lotes import DESCRIPCION_IDS, parsear_ids
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
 from app.services import proveedor_service as service
 
 router = APIRouter(
     prefix="/proveedores",
     tags=["Proveedores"],
-    responses={404: {"description": "No encontrado"}}
+    responses={404: {"description": "No encontrado"}},
+    route_class=ruta_con_etag("proveedores", base=ruta_cacheada("proveedores")),
 )
 
 # Obtener todos los proveedores
 @router.get("/", response_model=List[Proveedor])
-def obtener_proveedores(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
+def obtener_proveedores(request: Request, response: Response, skip: int = 0,
+                        limit: int = Query(10, ge=1, le=LIMITE_MAXIMO),
+                        cursor: Optional[str] = None, db: Session = Depends(get_db)):
     """
-    Obtiene todos los proveedores con paginación.
+    Obtiene los proveedores con paginación por cursor (o skip/limit).
     """
-    return service.obtener_proveedores(skip, limit, db)
+    pagina = service.obtener_proveedores(skip, limit, db, cursor)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    return pagina.items
+
+# Buscar proveedores por texto (FTS5, ordenados por relevancia)
+@router.get("/search", response_model=List[Proveedor])
+def buscar_proveedores(q: str = Query(..., min_length=1, max_length=200), limit: int = Query(20, ge=1, le=100),
+                       db: Session = Depends(get_db)):
+    """
+    Busca proveedores por nombre o persona de contacto. Cada palabra se busca como
+    prefijo, sin distinguir mayúsculas ni tildes.
+    """
+    return service.buscar_proveedores(q, limit, db)
+
+# Obtener varios proveedores por ID en una sola petición
+@router.get("/batch", response_model=ResultadoLote[Proveedor])
+def obtener_proveedores_lote(ids: str = Query(..., description=DESCRIPCION_IDS), db: Session = Depends(get_db)):
+    """
+    Obtiene varios proveedores por ID, en el orden pedido; los inexistentes van en `faltantes`.
+    """
+    return service.obtener_proveedores_por_ids(parsear_ids(ids), db)
 
 # Obtener un proveedor por ID
 @router.get("/{proveedor_id}", response_model=Proveedor)
@@ -49,6 +77,14 @@ def actualizar_proveedor(proveedor_id: int, proveedor: CrearProveedor, db: Sessi
     """
     return service.actualizar_proveedor(proveedor_id, proveedor, db)
 
+# Modificar solo los campos enviados de un proveedor
+@router.patch("/{proveedor_id}", response_model=Proveedor)
+def modificar_proveedor(proveedor_id: int, cambios: ActualizarProveedor, db: Session = Depends(get_db)):
+    """
+    Modifica solo los campos enviados de un proveedor (los omitidos no se tocan).
+    """
+    return service.modificar_proveedor(proveedor_id, cambios, db)
+
 # Eliminar un proveedor
 @router.delete("/{proveedor_id}")
 def eliminar_proveedor(proveedor_id: int, db: Session = Depends(get_db)):
@@ -0,0 +1,46 @@
+"""
+Router StockActual:
+Gestiona las rutas de consulta del stock actual materializado por producto.
+"""
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.schemas.stock_schema import StockActual, DiferenciaStock
+from app.core.config import get_db
+from app.core.paginacion import LIMITE_MAXIMO, agregar_enlace_siguiente
+from app.services import stock_service as service
+
+router = APIRouter(
+    prefix="/stock",
+    tags=["Stock"],
+    responses={404: {"description": "No encontrado"}}
+)
+
+# Obtener el stock actual de todos los productos
+@router.get("/", response_model=List[StockActual])
+def obtener_stock(request: Request, response: Response, skip: int = 0,
+                  limit: int = Query(100, ge=1, le=LIMITE_MAXIMO),
+                  cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    Obtiene el stock actual de los productos con paginación por cursor (o skip/limit).
+    """
+    pagina = service.obtener_stock(skip, limit, db, cursor)
+    agregar_enlace_siguiente(request, response, pagina.siguiente)
+    return pagina.items
+
+# Verificar el stock materializado contra el historial
+@router.get("/verificar", response_model=List[DiferenciaStock])
+def verificar_stock(db: Session = Depends(get_db)):
+    """
+    Compara stock_actual con la suma de los movimientos y devuelve las diferencias.
+    """
+    return service.verificar_stock(db)
+
+# Obtener el stock actual de un producto
+@router.get("/{producto_id}", response_model=StockActual)
+def obtener_stock_producto(producto_id: int, db: Session = Depends(get_db)):
+    """
+    Obtiene el stock actual de un producto por su ID.
+    """
+    return service.obtener_stock_producto(producto_id, db)
@@ -44,9 +44,10 @@ def add_user(user: UserCreate, db: Session = Depends(get_db)):
     return service.crear_usuario(user, db)
 
 @router.put('/{user_id}', response_model=UserOut)
+@router.patch('/{user_id}', response_model=UserOut)
 def update_user(user_id: int, user_update: UserUpdate, db: Session = Depends(get_db)):
     """
-    Actualiza la información de un usuario.
+    Actualiza la información de un usuario (solo los campos enviados, con PUT o PATCH).
     """
     return service.actualizar_usuario(user_id, user_update, db)
 
@@ -0,0 +1,124 @@
+"""
+autocompletado.py
+
+Este módulo implementa un índice de prefijos en memoria para el autocompletado de nombres.
+
+El índice es un arreglo ordenado de claves normalizadas (minúsculas, sin tildes ni signos),
+con una entrada por cada palabra del nombre hasta el final ("Tomate perita" -> "tomate perita"
+y "perita"), y un arreglo paralelo con los ids. Una consulta es una búsqueda binaria
+(`bisect`) del prefijo seguida de un recorrido de las entradas que lo comparten, sin acceder
+a la base de datos. Las altas, cambios y bajas insertan o quitan entradas en su posición.
+
+El índice es por proceso: se construye al arrancar (`cargar`) y lo mantienen los repositorios
+de productos. Las escrituras hechas por otros procesos no se reflejan hasta la siguiente carga.
+
+Componentes principales:
+- normalizar: Texto -> clave comparable (casefold, sin diacríticos, palabras separadas por espacio).
+- IndicePrefijos: Índice ordenado con búsqueda de los k primeros resultados por prefijo.
+- indice_productos: Instancia para los nombres de los productos activos.
+"""
+
+import re
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Tuple
+
+_PALABRA = re.compile(r"\w+")
+# Marcas diacríticas combinantes que deja la descomposición NFKD ("á" -> "a" + U+0301)
+_DIACRITICOS = re.compile(r"[\u0300-\u036f]")
+
+
+def normalizar(texto: str) -> str:
+    """Minúsculas, sin tildes y con las palabras separadas por un espacio."""
+    texto = texto.casefold()
+    if not texto.isascii():
+        texto = _DIACRITICOS.sub("", unicodedata.normalize("NFKD", texto))
+    return " ".join(_PALABRA.findall(texto))
+
+
+def _claves(nombre: str) -> List[str]:
+    """Una clave por palabra del nombre normalizado: desde esa palabra hasta el final."""
+    normalizado = normalizar(nombre)
+    return [normalizado[m.start():] for m in _PALABRA.finditer(normalizado)]
+
+
+class IndicePrefijos:
+    """
+    Claves ordenadas (lista de str) con los ids en un `array` paralelo, en orden (clave, id),
+    y el nombre original de cada id para la respuesta. Las lecturas y escrituras se serializan con un lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._claves: List[str] = []
+        self._ids = array("q")
+        self._nombres: Dict[int, str] = {}
+
+    def cargar(self, filas: Iterable[Tuple[int, str]]):
+        """Reconstruye el índice completo a partir de pares (id, nombre)."""
+        entradas, nombres = [], {}
+        for identificador, nombre in filas:
+            nombres[identificador] = nombre
+            entradas.extend((clave, identificador) for clave in _claves(nombre))
+        entradas.sort()
+        with self._lock:
+            self._claves = [clave for clave, _ in entradas]
+            self._ids = array("q", (identificador for _, identificador in entradas))
+            self._nombres = nombres
+
+    def _posicion(self, clave: str, identificador: int) -> int:
+        """Posición de (clave, id): entre claves repetidas los ids también están ordenados."""
+        inicio = bisect_left(self._claves, clave)
+        fin = bisect_right(self._claves, clave, inicio)
+        return bisect_left(self._ids, identificador, inicio, fin)
+
+    def _quitar(self, identificador: int):
+        nombre = self._nombres.pop(identificador, None)
+        if nombre is None:
+            return
+        for clave in _claves(nombre):
+            posicion = self._posicion(clave, identificador)
+            del self._claves[posicion]
+            del self._ids[posicion]
+
+    def actualizar(self, identificador: int, nombre: str, activo: bool = True):
+        """Alta o cambio de un nombre; con activo=False el id sale del índice."""
+        with self._lock:
+            self._quitar(identificador)
+            if not activo:
+                return
+            self._nombres[identificador] = nombre
+            for clave in _claves(nombre):
+                posicion = self._posicion(clave, identificador)
+                self._claves.insert(posicion, clave)
+                self._ids.insert(posicion, identificador)
+
+    def eliminar(self, identificador: int):
+        with self._lock:
+            self._quitar(identificador)
+
+    def buscar(self, prefijo: str, limite: int = 10) -> List[Tuple[int, str]]:
+        """Hasta `limite` pares (id, nombre) con alguna palabra que empieza por el prefijo, en orden alfabético."""
+        prefijo = normalizar(prefijo)
+        if not prefijo:
+            return []
+        resultados, vistos = [], set()
+        with self._lock:
+            posicion = bisect_left(self._claves, prefijo)
+            while posicion < len(self._claves) and self._claves[posicion].startswith(prefijo):
+                identificador = self._ids[posicion]
+                if identificador not in vistos:
+                    vistos.add(identificador)
+                    resultados.append((identificador, self._nombres[identificador]))
+                    if len(resultados) == limite:
+                        break
+                posicion += 1
+        return resultados
+
+    def __len__(self) -> int:
+        return len(self._nombres)
+
+
+indice_productos = IndicePrefijos()
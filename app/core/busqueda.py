@@ -0,0 +1,47 @@
+"""
+busqueda.py
+
+Este módulo implementa la búsqueda de texto completo sobre los índices FTS5 que crea la
+migración 3 (TABLAS_FTS en app/core/migraciones.py).
+
+El texto buscado se divide en palabras y cada una se busca como prefijo ("harina 000" ->
+`"harina"* "000"*`): todas deben aparecer en alguna de las columnas indexadas. El tokenizador
+unicode61 ignora mayúsculas y tildes ("cafe" encuentra "Café"). Los resultados se ordenan por
+relevancia (bm25), con más peso para las coincidencias en `nombre`.
+
+Componentes principales:
+- consulta_fts: Texto del usuario -> expresión MATCH segura (sin operadores de FTS5).
+- filtrar_busqueda: Aplica el MATCH y el orden por relevancia a una Query o un Select del modelo.
+"""
+
+import re
+from typing import Optional
+
+from sqlalchemy import column, table, text
+
+from app.core.migraciones import TABLAS_FTS
+
+# Peso de una coincidencia en `nombre` frente a las demás columnas indexadas (bm25)
+PESO_NOMBRE = 10.0
+
+_PALABRA = re.compile(r"\w+")
+
+
+def consulta_fts(texto: str) -> Optional[str]:
+    """Palabras del texto como prefijos entre comillas; None si no contiene ninguna palabra."""
+    palabras = _PALABRA.findall(texto)
+    if not palabras:
+        return None
+    return " ".join(f'"{palabra}"*' for palabra in palabras)
+
+
+def filtrar_busqueda(consulta, modelo: type, expresion: str):
+    """Une la consulta con `<tabla>_fts`, filtra por la expresión MATCH y ordena por relevancia."""
+    tabla = modelo.__tablename__
+    fts = table(f"{tabla}_fts", column("rowid"))
+    pesos = ", ".join(str(PESO_NOMBRE if c == "nombre" else 1.0) for c in TABLAS_FTS[tabla])
+    return (
+        consulta.join(fts, fts.c.rowid == modelo.id)
+        .where(text(f"{tabla}_fts MATCH :expresion").bindparams(expresion=expresion))
+        .order_by(text(f"bm25({tabla}_fts, {pesos})"), modelo.id)
+    )
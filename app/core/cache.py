@@ -0,0 +1,186 @@
+"""
+cache.py
+
+Este módulo implementa la caché en proceso de respuestas GET de los catálogos.
+
+Las claves combinan la ruta, los parámetros de la consulta y la versión actual de las
+entidades de las que depende el router. Cada servicio incrementa la versión de su entidad
+al crear, actualizar o eliminar (`invalidar_entidad`), de modo que las entradas anteriores
+dejan de ser alcanzables al instante y terminan saliendo por LRU o TTL.
+
+Componentes principales:
+- VersionesEntidad: Contadores de versión por entidad.
+- CacheRespuestas: Almacén LRU con expiración por TTL y estadísticas (aciertos, fallos, desalojos).
+- versiones / cache_respuestas: Instancias compartidas del proceso.
+- invalidar_entidad: Atajo que usan los servicios tras confirmar una escritura.
+- ruta_cacheada: Fábrica de `route_class` para activar la caché en un APIRouter.
+
+Variables de entorno reconocidas (todas opcionales):
+- CACHE_RESPUESTAS: "false" desactiva la caché en todos los routers (por defecto activa).
+- CACHE_MAX_ENTRADAS: Número máximo de respuestas guardadas (por defecto 1024).
+- CACHE_TTL_SEGUNDOS: Vigencia máxima de una respuesta (por defecto 300).
+- CACHE_ROUTERS_EXCLUIDOS: Entidades separadas por comas cuyo router no se cachea.
+
+Las versiones son locales al proceso: con varios workers, una escritura en otro proceso
+solo se refleja cuando vence el TTL.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.core.inclusion import tablas_incluidas
+
+CACHE_RESPUESTAS = os.getenv("CACHE_RESPUESTAS", "true").lower() in ("1", "true", "si", "yes")
+CACHE_MAX_ENTRADAS = int(os.getenv("CACHE_MAX_ENTRADAS", "1024"))
+CACHE_TTL_SEGUNDOS = float(os.getenv("CACHE_TTL_SEGUNDOS", "300"))
+CACHE_ROUTERS_EXCLUIDOS = {e.strip() for e in os.getenv("CACHE_ROUTERS_EXCLUIDOS", "").split(",") if e.strip()}
+
+
+class VersionesEntidad:
+    """Contador de versión por entidad; empieza en 0 y solo crece."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versiones = {}
+
+    def de(self, entidades: Tuple[str, ...]) -> Tuple[int, ...]:
+        """Versiones actuales de las entidades dadas, en el mismo orden."""
+        with self._lock:
+            return tuple(self._versiones.get(entidad, 0) for entidad in entidades)
+
+    def incrementar(self, entidad: str) -> int:
+        """Incrementa y devuelve la versión de la entidad."""
+        with self._lock:
+            self._versiones[entidad] = self._versiones.get(entidad, 0) + 1
+            return self._versiones[entidad]
+
+    def todas(self) -> dict:
+        with self._lock:
+            return dict(self._versiones)
+
+
+class CacheRespuestas:
+    """
+    Caché LRU con TTL de respuestas ya serializadas (cuerpo, estado y cabeceras).
+    """
+
+    def __init__(self, max_entradas: int, ttl: float):
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entradas: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.expiraciones = 0
+
+    def obtener(self, clave: tuple):
+        """Devuelve el valor guardado o None si no existe o venció."""
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self.fallos += 1
+                return None
+            vence, valor = entrada
+            if vence <= time.monotonic():
+                del self._entradas[clave]
+                self.expiraciones += 1
+                self.fallos += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return valor
+
+    def guardar(self, clave: tuple, valor):
+        """Guarda un valor y desaloja los menos usados si se supera el máximo."""
+        with self._lock:
+            self._entradas[clave] = (time.monotonic() + self.ttl, valor)
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+                self.desalojos += 1
+
+    def limpiar(self):
+        with self._lock:
+            self._entradas.clear()
+
+    def estadisticas(self) -> dict:
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                "entradas": len(self._entradas),
+                "max_entradas": self.max_entradas,
+                "ttl_segundos": self.ttl,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "expiraciones": self.expiraciones,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+            }
+
+
+versiones = VersionesEntidad()
+
+cache_respuestas = CacheRespuestas(CACHE_MAX_ENTRADAS, CACHE_TTL_SEGUNDOS)
+
+
+def invalidar_entidad(entidad: str):
+    """Marca como obsoletas las respuestas que dependen de la entidad (tras una escritura confirmada)."""
+    versiones.incrementar(entidad)
+
+
+def cache_activa(entidad: str) -> bool:
+    return CACHE_RESPUESTAS and entidad not in CACHE_ROUTERS_EXCLUIDOS
+
+
+def _clave(request: Request, entidades: Tuple[str, ...]) -> tuple:
+    return (request.url.path, tuple(sorted(request.query_params.multi_items())), versiones.de(entidades))
+
+
+def ruta_cacheada(entidad: str, *dependencias: str, relaciones: Optional[Dict[str, Tuple[str, ...]]] = None) -> type:
+    """
+    Crea una clase de ruta que cachea las respuestas GET 200 del router.
+
+    Uso:
+        router = APIRouter(prefix="/productos", route_class=ruta_cacheada("productos"))
+
+    Parámetros:
+    - entidad (str): Entidad principal del router (su nombre también sirve para excluirlo).
+    - dependencias (str): Otras entidades cuyas escrituras deben invalidar estas respuestas.
+    - relaciones (dict): Rutas de `?include=` y sus tablas (app.core.inclusion); las respuestas
+      con `include` también se invalidan con las escrituras en las tablas incluidas.
+    """
+    entidades = (entidad,) + dependencias
+
+    class RutaCacheada(APIRoute):
+        def get_route_handler(self) -> Callable:
+            original = super().get_route_handler()
+
+            async def manejador(request: Request) -> Response:
+                if request.method != "GET" or not cache_activa(entidad):
+                    return await original(request)
+
+                # La versión se lee antes de consultar: una escritura concurrente no deja datos viejos bajo la clave nueva
+                clave = _clave(request, entidades + tablas_incluidas(request, relaciones))
+                guardada: Optional[tuple] = cache_respuestas.obtener(clave)
+                if guardada is not None:
+                    cuerpo, estado, cabeceras = guardada
+                    respuesta = Response(content=cuerpo, status_code=estado)
+                    respuesta.raw_headers = list(cabeceras)
+                    return respuesta
+
+                respuesta = await original(request)
+                if respuesta.status_code == 200 and isinstance(getattr(respuesta, "body", None), bytes):
+                    cache_respuestas.guardar(clave, (respuesta.body, respuesta.status_code, tuple(respuesta.raw_headers)))
+                return respuesta
+
+            return manejador
+
+    RutaCacheada.__name__ = f"RutaCacheada_{entidad}"
+    return RutaCacheada
@@ -4,25 +4,173 @@ config.py
 Este módulo configura la conexión a la base de datos para la aplicación, utilizando SQLAlchemy.
 
 Componentes principales:
-- SQLALCHEMY_DATABASE_URL: URL de conexión a la base de datos (en este caso, una base de datos SQLite local).
+- ConfiguracionBD: Perfil del motor (URL, pool, timeouts y PRAGMAs de SQLite) leído desde variables de entorno.
+- settings: Perfil activo, cargado al importar el módulo.
+- crear_motor / crear_motor_async: Fábricas de motores a partir de un perfil.
+- SQLALCHEMY_DATABASE_URL: URL de conexión a la base de datos (por defecto, una base de datos SQLite local).
+- SQLALCHEMY_ASYNC_DATABASE_URL: URL de conexión para el motor asíncrono (aiosqlite).
+- DB_ASYNC: Selecciona si la API expone las rutas síncronas (Session) o asíncronas (AsyncSession).
 - engine: Motor de conexión a la base de datos.
+- async_engine: Motor de conexión asíncrono a la misma base de datos.
 - SessionLocal: Sesión de base de datos para realizar operaciones ORM.
+- AsyncSessionLocal: Fábrica de sesiones asíncronas (AsyncSession).
 - Base: Clase base para la declaración de modelos ORM.
 - get_db: Generador de contexto para obtener y cerrar sesiones de base de datos de manera segura.
+- get_async_db: Equivalente asíncrono de get_db.
+
+Variables de entorno reconocidas (todas opcionales):
+- DATABASE_URL, ASYNC_DATABASE_URL, DB_ASYNC
+- DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_CONNECT_TIMEOUT
+- SQLITE_JOURNAL_MODE, SQLITE_SYNCHRONOUS, SQLITE_MMAP_SIZE, SQLITE_CACHE_SIZE,
+  SQLITE_BUSY_TIMEOUT, SQLITE_TEMP_STORE
 
 Este archivo centraliza la configuración de la base de datos para facilitar cambios futuros (como migrar a otro SGBD).
 """
 
-from sqlalchemy import create_engine
+import os
+from pydantic import BaseModel
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+def _env_bool(nombre: str, defecto: str = "false") -> bool:
+    return os.getenv(nombre, defecto).lower() in ("1", "true", "si", "yes")
+
+
+class ConfiguracionBD(BaseModel):
+    """
+    Perfil del motor de base de datos.
+
+    Los valores de pool solo se aplican a bases de datos en archivo; los PRAGMAs
+    solo se aplican cuando el dialecto es SQLite.
+    """
+    url: str = "sqlite:///./inventarios.db"
+    async_url: str = "sqlite+aiosqlite:///./inventarios.db"
+    db_async: bool = False
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = -1
+    connect_timeout: float = 30
+
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size: int = -64000  # negativo = KiB (64 MiB)
+    sqlite_busy_timeout: int = 5000  # milisegundos
+    sqlite_temp_store: str = "MEMORY"
+
+    @classmethod
+    def desde_entorno(cls) -> "ConfiguracionBD":
+        """Construye el perfil a partir de las variables de entorno."""
+        valores = {
+            "url": os.getenv("DATABASE_URL"),
+            "async_url": os.getenv("ASYNC_DATABASE_URL"),
+            "pool_size": os.getenv("DB_POOL_SIZE"),
+            "max_overflow": os.getenv("DB_MAX_OVERFLOW"),
+            "pool_timeout": os.getenv("DB_POOL_TIMEOUT"),
+            "pool_recycle": os.getenv("DB_POOL_RECYCLE"),
+            "connect_timeout": os.getenv("DB_CONNECT_TIMEOUT"),
+            "sqlite_journal_mode": os.getenv("SQLITE_JOURNAL_MODE"),
+            "sqlite_synchronous": os.getenv("SQLITE_SYNCHRONOUS"),
+            "sqlite_mmap_size": os.getenv("SQLITE_MMAP_SIZE"),
+            "sqlite_cache_size": os.getenv("SQLITE_CACHE_SIZE"),
+            "sqlite_busy_timeout": os.getenv("SQLITE_BUSY_TIMEOUT"),
+            "sqlite_temp_store": os.getenv("SQLITE_TEMP_STORE"),
+        }
+        return cls(db_async=_env_bool("DB_ASYNC"), **{k: v for k, v in valores.items() if v is not None})
+
+    def pragmas(self) -> dict:
+        """PRAGMAs que se aplican a cada conexión SQLite nueva."""
+        return {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "mmap_size": self.sqlite_mmap_size,
+            "cache_size": self.sqlite_cache_size,
+            "busy_timeout": self.sqlite_busy_timeout,
+            "temp_store": self.sqlite_temp_store,
+        }
+
+
+def _es_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def _es_memoria(url: str) -> bool:
+    return make_url(url).database in (None, "", ":memory:")
+
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./inventarios.db"  
+def _registrar_pragmas(sync_engine, config: ConfiguracionBD):
+    """Aplica los PRAGMAs del perfil en cada conexión nueva mediante el evento connect."""
+    pragmas = config.pragmas()
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+    @event.listens_for(sync_engine, "connect")
+    def _aplicar_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for nombre, valor in pragmas.items():
+                cursor.execute(f"PRAGMA {nombre}={valor}")
+        finally:
+            cursor.close()
+
+
+def _argumentos_pool(url: str, config: ConfiguracionBD) -> dict:
+    if _es_sqlite(url) and _es_memoria(url):
+        return {}
+    return {
+        "pool_size": config.pool_size,
+        "max_overflow": config.max_overflow,
+        "pool_timeout": config.pool_timeout,
+        "pool_recycle": config.pool_recycle,
+    }
+
+
+def crear_motor(config: ConfiguracionBD):
+    """Crea el motor síncrono para el perfil dado."""
+    kwargs = _argumentos_pool(config.url, config)
+    if _es_sqlite(config.url):
+        kwargs["connect_args"] = {"check_same_thread": False, "timeout": config.connect_timeout}
+    motor = create_engine(config.url, **kwargs)
+    if _es_sqlite(config.url):
+        _registrar_pragmas(motor, config)
+    return motor
+
+
+def crear_motor_async(config: ConfiguracionBD):
+    """Crea el motor asíncrono para el perfil dado."""
+    kwargs = _argumentos_pool(config.async_url, config)
+    if _es_sqlite(config.async_url):
+        kwargs["connect_args"] = {"timeout": config.connect_timeout}
+        if kwargs.get("pool_size"):
+            # aiosqlite usa NullPool por defecto en archivos: se reutilizan conexiones (y sus PRAGMAs)
+            kwargs["poolclass"] = AsyncAdaptedQueuePool
+    motor = create_async_engine(config.async_url, **kwargs)
+    if _es_sqlite(config.async_url):
+        _registrar_pragmas(motor.sync_engine, config)
+    return motor
+
+
+settings = ConfiguracionBD.desde_entorno()
+
+SQLALCHEMY_DATABASE_URL = settings.url
+SQLALCHEMY_ASYNC_DATABASE_URL = settings.async_url
+
+# "true" para servir las rutas async def con AsyncSession; por defecto se usa el camino síncrono
+DB_ASYNC = settings.db_async
+
+engine = crear_motor(settings)
+
+async_engine = crear_motor_async(settings)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -31,3 +179,7 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
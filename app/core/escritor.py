@@ -0,0 +1,163 @@
+"""
+escritor.py
+
+Este módulo implementa un escritor único con commit agrupado (group commit) para las altas
+de movimientos y conteos de inventario.
+
+Cada alta confirmaba su propia transacción: con varios escritores concurrentes SQLite los
+serializa con el bloqueo de escritura (errores `database is locked` cuando se agota
+busy_timeout) y paga una sincronización a disco por petición. Con ESCRITURA_AGRUPADA=true
+las altas se encolan y un hilo escritor dedicado las ejecuta en una sola transacción cada
+ESCRITURA_ESPERA_MS milisegundos o cada ESCRITURA_MAX_LOTE operaciones (lo que llegue antes).
+Cada petición espera su Future y recibe su propio resultado o su propio error.
+
+Si alguna operación del lote falla, el lote se revierte y sus operaciones se repiten una a
+una con su propio commit, de modo que el error solo llega a quien lo provocó. No se usan
+savepoints: con pysqlite un SAVEPOINT fuera de BEGIN confirmaría antes de tiempo.
+
+Una operación es un callable `operacion(sesion) -> resultado` que agrega, ejecuta y hace
+flush sobre la sesión del escritor, pero nunca commit. Los resultados se entregan separados
+de la sesión (expire_on_commit=False), con sus columnas ya cargadas.
+
+Variables de entorno:
+- ESCRITURA_AGRUPADA: Activa el escritor agrupado (por defecto false).
+- ESCRITURA_ESPERA_MS: Espera máxima para completar un lote (por defecto 5).
+- ESCRITURA_MAX_LOTE: Operaciones por transacción como máximo (por defecto 100).
+
+Componentes principales:
+- EscritorAgrupado: Cola, hilo escritor y estadísticas (transacciones, operaciones, reintentos).
+- escritor: Instancia compartida sobre el motor de la aplicación (se inicia al primer uso).
+"""
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Tuple
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import engine
+
+ESCRITURA_AGRUPADA = os.getenv("ESCRITURA_AGRUPADA", "false").lower() in ("1", "true", "si", "yes")
+ESCRITURA_ESPERA_MS = float(os.getenv("ESCRITURA_ESPERA_MS", "5"))
+ESCRITURA_MAX_LOTE = int(os.getenv("ESCRITURA_MAX_LOTE", "100"))
+
+Operacion = Callable[[Session], Any]
+
+_FIN = object()
+
+
+class EscritorAgrupado:
+    """Ejecuta operaciones de escritura en lotes desde un único hilo."""
+
+    def __init__(self, motor=None, espera_ms: float = None, max_lote: int = None):
+        self._sesiones = sessionmaker(bind=motor if motor is not None else engine,
+                                      autoflush=False, expire_on_commit=False)
+        self.espera = (ESCRITURA_ESPERA_MS if espera_ms is None else espera_ms) / 1000
+        self.max_lote = max_lote or ESCRITURA_MAX_LOTE
+        self._cola: "queue.Queue" = queue.Queue()
+        self._hilo = None
+        self._cerrojo = threading.Lock()
+        self.transacciones = 0
+        self.operaciones = 0
+        self.reintentos = 0
+
+    def iniciar(self):
+        """Arranca el hilo escritor si no está en marcha."""
+        with self._cerrojo:
+            if self._hilo is None or not self._hilo.is_alive():
+                self._hilo = threading.Thread(target=self._bucle, name="escritor-agrupado", daemon=True)
+                self._hilo.start()
+
+    def detener(self, timeout: float = 5):
+        """Procesa lo pendiente y detiene el hilo escritor."""
+        with self._cerrojo:
+            hilo, self._hilo = self._hilo, None
+        if hilo is not None and hilo.is_alive():
+            self._cola.put(_FIN)
+            hilo.join(timeout)
+
+    def enviar(self, operacion: Operacion) -> Future:
+        """Encola la operación y devuelve el Future con su resultado."""
+        if self._hilo is None:
+            self.iniciar()
+        futuro = Future()
+        self._cola.put((operacion, futuro))
+        return futuro
+
+    def ejecutar(self, operacion: Operacion):
+        """Encola la operación y espera su resultado (o relanza su error)."""
+        return self.enviar(operacion).result()
+
+    async def ejecutar_async(self, operacion: Operacion):
+        """Equivalente de ejecutar que espera sin bloquear el bucle de eventos."""
+        return await asyncio.wrap_future(self.enviar(operacion))
+
+    def estadisticas(self) -> dict:
+        return {"transacciones": self.transacciones, "operaciones": self.operaciones, "reintentos": self.reintentos}
+
+    def _bucle(self):
+        fin = False
+        while not fin:
+            primero = self._cola.get()
+            if primero is _FIN:
+                return
+            lote = [primero]
+            limite = time.monotonic() + self.espera
+            while len(lote) < self.max_lote:
+                restante = limite - time.monotonic()
+                try:
+                    elemento = self._cola.get(timeout=restante) if restante > 0 else self._cola.get_nowait()
+                except queue.Empty:
+                    break
+                if elemento is _FIN:
+                    fin = True
+                    break
+                lote.append(elemento)
+            try:
+                self._procesar(lote)
+            except Exception as exc:  # p. ej. sin conexión: que nadie se quede esperando
+                for _, futuro in lote:
+                    if not futuro.done():
+                        futuro.set_exception(exc)
+
+    def _procesar(self, lote: List[Tuple[Operacion, Future]]):
+        pendientes = [(operacion, futuro) for operacion, futuro in lote if futuro.set_running_or_notify_cancel()]
+        if not pendientes:
+            return
+        resultados = []
+        with self._sesiones() as sesion:
+            try:
+                for operacion, _ in pendientes:
+                    resultados.append(operacion(sesion))
+                sesion.commit()
+            except Exception:
+                sesion.rollback()
+            else:
+                self.transacciones += 1
+                self.operaciones += len(pendientes)
+                for (_, futuro), resultado in zip(pendientes, resultados):
+                    futuro.set_result(resultado)
+                return
+
+        # Lote fallido: cada operación en su propia sesión y transacción para aislar el error
+        # (el rollback de una sesión compartida expiraría los resultados ya confirmados)
+        self.reintentos += 1
+        for operacion, futuro in pendientes:
+            with self._sesiones() as sesion:
+                try:
+                    resultado = operacion(sesion)
+                    sesion.commit()
+                except Exception as exc:
+                    sesion.rollback()
+                    futuro.set_exception(exc)
+                else:
+                    self.transacciones += 1
+                    self.operaciones += 1
+                    futuro.set_result(resultado)
+
+
+escritor = EscritorAgrupado()
@@ -0,0 +1,120 @@
+"""
+etag.py
+
+Este módulo agrega `ETag` y GET condicional (`If-None-Match` -> 304) a los routers.
+
+El ETag no se calcula serializando el cuerpo: se deriva de la versión de las tablas de las
+que depende el router, guardada en `versiones_tabla` y mantenida por triggers de la base de
+datos (migración 2). Como los triggers ven cualquier escritura, el ETag es correcto entre
+varios workers y ante cambios hechos fuera de la API.
+
+Si el cliente envía un `If-None-Match` que coincide, se responde 304 tras una sola lectura
+por clave primaria de `versiones_tabla`, sin ejecutar la ruta ni cargar objetos ORM.
+
+Componentes principales:
+- leer_versiones: Versión actual de las tablas dadas.
+- calcular_etag: ETag débil a partir de esas versiones.
+- coincide_etag: Comparación débil contra el valor de `If-None-Match`.
+- ruta_con_etag: Fábrica de `route_class` que aplica lo anterior a las rutas GET de un router.
+
+El ETag es válido para la URL completa (parámetros incluidos), como define HTTP. Si cambia
+el formato de las respuestas sin cambiar los datos, incrementar VERSION_REPRESENTACION.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import engine
+from app.core.inclusion import tablas_incluidas
+
+VERSION_REPRESENTACION = "1"
+
+_metadata = MetaData()
+
+versiones_tabla = Table(
+    "versiones_tabla", _metadata,
+    Column("tabla", String, primary_key=True),
+    Column("version", Integer, nullable=False),
+)
+
+
+def leer_versiones(tablas: Tuple[str, ...]) -> Optional[Tuple[int, ...]]:
+    """
+    Lee la versión de cada tabla (en el mismo orden). Devuelve None si `versiones_tabla`
+    no existe todavía o falta alguna tabla, en cuyo caso no se emite ETag.
+    """
+    try:
+        with engine.connect() as conexion:
+            filas = dict(conexion.execute(
+                select(versiones_tabla.c.tabla, versiones_tabla.c.version).where(versiones_tabla.c.tabla.in_(tablas))
+            ).all())
+    except DBAPIError:
+        return None
+    if len(filas) != len(tablas):
+        return None
+    return tuple(filas[tabla] for tabla in tablas)
+
+
+def calcular_etag(tablas: Tuple[str, ...], versiones: Tuple[int, ...]) -> str:
+    """ETag débil: W/"<representación>-<tabla>.<versión>-..."."""
+    partes = "-".join(f"{tabla}.{version}" for tabla, version in zip(tablas, versiones))
+    return f'W/"{VERSION_REPRESENTACION}-{partes}"'
+
+
+def coincide_etag(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparación débil (RFC 9110): ignora el prefijo W/ y acepta listas de ETags."""
+    if not if_none_match:
+        return False
+    buscado = etag.removeprefix("W/")
+    return any(candidato.strip().removeprefix("W/") == buscado for candidato in if_none_match.split(","))
+
+
+def ruta_con_etag(*tablas: str, base: type = APIRoute, relaciones: Optional[Dict[str, Tuple[str, ...]]] = None) -> type:
+    """
+    Crea una clase de ruta que agrega ETag a las respuestas GET 200 y responde 304
+    cuando `If-None-Match` coincide.
+
+    Uso:
+        router = APIRouter(prefix="/productos", route_class=ruta_con_etag("productos", base=ruta_cacheada("productos")))
+
+    Parámetros:
+    - tablas (str): Tablas (de TABLAS_VERSIONADAS) de las que dependen las respuestas del router.
+    - base (type): Clase de ruta a envolver (por ejemplo, la de la caché de respuestas).
+    - relaciones (dict): Rutas de `?include=` y sus tablas (app.core.inclusion); una petición
+      con `include` también depende de las tablas de las relaciones pedidas.
+    """
+
+    class RutaConEtag(base):
+        def get_route_handler(self) -> Callable:
+            original = super().get_route_handler()
+
+            async def manejador(request: Request) -> Response:
+                if request.method != "GET":
+                    return await original(request)
+
+                # Se lee antes de ejecutar la ruta: si hay una escritura en medio, el ETag queda viejo
+                # y el cliente solo pierde un 304, nunca recibe datos obsoletos.
+                # Va al threadpool porque pedir una conexión al pool puede bloquear (si las rutas
+                # síncronas las tienen todas) y desde el event loop eso detendría al servidor
+                tablas_peticion = tablas + tuple(t for t in tablas_incluidas(request, relaciones) if t not in tablas)
+                versiones = await run_in_threadpool(leer_versiones, tablas_peticion)
+                if versiones is None:
+                    return await original(request)
+                etag = calcular_etag(tablas_peticion, versiones)
+                if coincide_etag(request.headers.get("if-none-match"), etag):
+                    return Response(status_code=304, headers={"ETag": etag})
+
+                respuesta = await original(request)
+                if respuesta.status_code == 200:
+                    respuesta.headers["ETag"] = etag
+                return respuesta
+
+            return manejador
+
+    RutaConEtag.__name__ = f"RutaConEtag_{'_'.join(tablas)}"
+    return RutaConEtag
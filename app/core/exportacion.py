@@ -0,0 +1,114 @@
+"""
+exportacion.py
+
+Este módulo implementa la exportación en streaming (CSV o NDJSON) de tablas completas.
+
+La consulta se ejecuta con `yield_per` sobre una conexión propia (no la sesión de la petición,
+que FastAPI puede cerrar antes de terminar de enviar la respuesta) y las filas se leen por
+lotes de EXPORT_LOTE, se codifican y se envían; la memoria usada no depende del número de
+filas. Las filas se convierten con el mismo serializador que los listados (mismos valores
+que la API en JSON).
+
+Componentes principales:
+- FormatoExportacion: Formatos admitidos (csv, ndjson).
+- lotes_de_filas: Ejecuta un Select y entrega sus filas por lotes.
+- exportar: Lotes de filas -> trozos de bytes en el formato pedido.
+- comprimir_gzip: Comprime un flujo de trozos como un archivo .gz.
+- respuesta_exportacion: StreamingResponse con el nombre de archivo y tipo adecuados.
+
+Variables de entorno reconocidas:
+- EXPORT_LOTE: Filas leídas y codificadas por lote (por defecto 1000).
+"""
+
+import csv
+import io
+import json
+import os
+import zlib
+from enum import Enum
+from typing import Iterable, Iterator, List
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.engine import Row
+
+from app.core.config import engine
+from app.core.serializacion import compilar_serializador
+
+EXPORT_LOTE = int(os.getenv("EXPORT_LOTE", "1000"))
+
+
+class FormatoExportacion(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+_TIPOS = {
+    FormatoExportacion.CSV: "text/csv; charset=utf-8",
+    FormatoExportacion.NDJSON: "application/x-ndjson",
+}
+
+
+def lotes_de_filas(consulta, lote: int = EXPORT_LOTE) -> Iterator[List[Row]]:
+    """Ejecuta la consulta con un cursor que entrega de a `lote` filas y las va devolviendo."""
+    with engine.connect() as conexion:
+        resultado = conexion.execution_options(yield_per=lote).execute(consulta)
+        for filas in resultado.partitions():
+            yield filas
+
+
+def _convertidor(esquema: type[BaseModel], filas: List[Row]):
+    serializar = compilar_serializador(esquema, Row, filas[0]._fields)
+    if serializar is not None:
+        return serializar
+    return lambda fila: esquema.model_validate(fila).model_dump(mode="json")
+
+
+def exportar(esquema: type[BaseModel], lotes: Iterable[List[Row]], formato: FormatoExportacion) -> Iterator[bytes]:
+    """Codifica los lotes en CSV (con encabezado) o NDJSON; un trozo de bytes por lote."""
+    campos = list(esquema.model_fields)
+    convertir = None
+    if formato == FormatoExportacion.CSV:
+        buffer = io.StringIO()
+        escritor = csv.DictWriter(buffer, fieldnames=campos, lineterminator="\n")
+        escritor.writeheader()
+        yield buffer.getvalue().encode("utf-8")
+    for filas in lotes:
+        if not filas:
+            continue
+        convertir = convertir or _convertidor(esquema, filas)
+        if formato == FormatoExportacion.CSV:
+            buffer.seek(0)
+            buffer.truncate()
+            escritor.writerows(convertir(fila) for fila in filas)
+            yield buffer.getvalue().encode("utf-8")
+        else:
+            yield "".join(
+                json.dumps(convertir(fila), ensure_ascii=False, separators=(",", ":")) + "\n" for fila in filas
+            ).encode("utf-8")
+
+
+def comprimir_gzip(trozos: Iterable[bytes]) -> Iterator[bytes]:
+    """Comprime el flujo en formato gzip sin acumularlo en memoria."""
+    compresor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for trozo in trozos:
+        comprimido = compresor.compress(trozo)
+        if comprimido:
+            yield comprimido
+    yield compresor.flush()
+
+
+def respuesta_exportacion(trozos: Iterable[bytes], nombre: str, formato: FormatoExportacion, gzip: bool) -> StreamingResponse:
+    """
+    Envuelve el flujo en un StreamingResponse descargable (`<nombre>.<formato>[.gz]`).
+    Los generadores son síncronos: Starlette los recorre en el threadpool.
+    """
+    archivo = f"{nombre}.{formato.value}"
+    tipo = _TIPOS[formato]
+    if gzip:
+        trozos = comprimir_gzip(trozos)
+        archivo += ".gz"
+        tipo = "application/gzip"
+    return StreamingResponse(
+        trozos, media_type=tipo, headers={"Content-Disposition": f'attachment; filename="{archivo}"'}
+    )
@@ -0,0 +1,123 @@
+"""
+hashing.py
+
+Este módulo ejecuta el trabajo de bcrypt (hash y verificación de contraseñas) en un pool
+de hilos propio y acotado, separado del threadpool compartido de AnyIO.
+
+bcrypt libera el GIL mientras calcula, así que un pool de hilos basta para sacarlo del
+camino de las demás rutas sin el costo de serializar hacia otro proceso. Lo que evita que
+una ráfaga de inicios de sesión acapare el servidor es el límite de admisión: como mucho
+HASH_TRABAJADORES cálculos en curso y HASH_COLA_MAX en espera; por encima de eso se responde
+503 con Retry-After en lugar de encolar sin límite.
+
+En el modo síncrono la ruta espera el resultado desde su hilo del threadpool, de modo que a
+lo sumo HASH_TRABAJADORES + HASH_COLA_MAX hilos quedan ocupados por contraseñas. En el modo
+asíncrono se espera el Future desde el event loop y no se ocupa ningún hilo compartido.
+
+Componentes principales:
+- PoolHashing: Ejecutor acotado con admisión por cupos y estadísticas.
+- pool_hashing: Instancia compartida del proceso.
+- hashear_password / verificar_password: Variantes síncronas para los servicios con Session.
+- hashear_password_async / verificar_password_async: Variantes para los servicios con AsyncSession.
+
+Variables de entorno reconocidas (todas opcionales):
+- HASH_TRABAJADORES: Hilos dedicados a bcrypt (por defecto 2).
+- HASH_COLA_MAX: Trabajos que pueden esperar un hilo libre (por defecto 16).
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.core.security import get_password_hash, verify_and_update_password
+
+HASH_TRABAJADORES = int(os.getenv("HASH_TRABAJADORES", "2"))
+HASH_COLA_MAX = int(os.getenv("HASH_COLA_MAX", "16"))
+
+
+class PoolHashing:
+    """
+    ThreadPoolExecutor con un número fijo de cupos (trabajadores + cola). Un trabajo que no
+    consigue cupo se rechaza de inmediato con 503.
+    """
+
+    def __init__(self, trabajadores: int, cola_max: int):
+        self.trabajadores = max(trabajadores, 1)
+        self.cola_max = max(cola_max, 0)
+        self._ejecutor = ThreadPoolExecutor(max_workers=self.trabajadores, thread_name_prefix="hashing")
+        self._cupos = threading.BoundedSemaphore(self.trabajadores + self.cola_max)
+        self._lock = threading.Lock()
+        self.pendientes = 0
+        self.completados = 0
+        self.rechazados = 0
+
+    def enviar(self, funcion: Callable, *args) -> Future:
+        """Encola el trabajo y devuelve su Future, o lanza 503 si no quedan cupos."""
+        if not self._cupos.acquire(blocking=False):
+            with self._lock:
+                self.rechazados += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Demasiadas solicitudes de autenticación, intente nuevamente",
+                headers={"Retry-After": "1"},
+            )
+        with self._lock:
+            self.pendientes += 1
+        try:
+            futuro = self._ejecutor.submit(funcion, *args)
+        except BaseException:
+            self._liberar(None)
+            raise
+        futuro.add_done_callback(self._liberar)
+        return futuro
+
+    def _liberar(self, _futuro):
+        with self._lock:
+            self.pendientes -= 1
+            self.completados += 1
+        self._cupos.release()
+
+    def ejecutar(self, funcion: Callable, *args):
+        """Ejecuta en el pool y espera el resultado desde el hilo actual."""
+        return self.enviar(funcion, *args).result()
+
+    async def ejecutar_async(self, funcion: Callable, *args):
+        """Ejecuta en el pool y espera el resultado sin bloquear el event loop."""
+        return await asyncio.wrap_future(self.enviar(funcion, *args))
+
+    def estadisticas(self) -> dict:
+        with self._lock:
+            return {
+                "trabajadores": self.trabajadores,
+                "cola_max": self.cola_max,
+                "pendientes": self.pendientes,
+                "completados": self.completados,
+                "rechazados": self.rechazados,
+            }
+
+
+pool_hashing = PoolHashing(HASH_TRABAJADORES, HASH_COLA_MAX)
+
+
+def hashear_password(password: str) -> str:
+    """get_password_hash ejecutado en el pool de hashing."""
+    return pool_hashing.ejecutar(get_password_hash, password)
+
+
+def verificar_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password ejecutado en el pool de hashing."""
+    return pool_hashing.ejecutar(verify_and_update_password, plain_password, hashed_password)
+
+
+async def hashear_password_async(password: str) -> str:
+    """get_password_hash ejecutado en el pool de hashing, esperado desde el event loop."""
+    return await pool_hashing.ejecutar_async(get_password_hash, password)
+
+
+async def verificar_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password ejecutado en el pool de hashing, esperado desde el event loop."""
+    return await pool_hashing.ejecutar_async(verify_and_update_password, plain_password, hashed_password)
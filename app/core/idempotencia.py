@@ -0,0 +1,153 @@
+"""
+idempotencia.py
+
+Este módulo implementa la cabecera `Idempotency-Key` de las altas de movimientos y conteos.
+
+Los lectores de mano con Wi-Fi inestable reintentan `POST /movimientos_inventario/` y
+`POST /conteos_inventario/` cuando no reciben la respuesta, y cada reintento creaba un
+movimiento duplicado. Con la cabecera, la primera petición guarda su respuesta en la tabla
+`claves_idempotencia` en la misma transacción que el alta (sin commits extra) y los
+reintentos con la misma clave reciben esa respuesta sin volver a ejecutarse, con la
+cabecera `Idempotent-Replayed: true`.
+
+- Las claves se guardan por ámbito (`movimientos_inventario:<clave>`) junto con una huella
+  del cuerpo: reutilizar una clave con otro cuerpo responde 422.
+- Cada clave vence a los IDEMPOTENCIA_TTL_SEGUNDOS; las vencidas se borran al reutilizarse
+  y, en bloque, cada IDEMPOTENCIA_PURGA_CADA registros.
+- Delante de la tabla hay una caché LRU en memoria (app.core.cache.CacheRespuestas) para
+  que los reintentos inmediatos no consulten la base de datos.
+- Si dos reintentos llegan a la vez, el segundo choca al confirmar con la clave primaria o
+  con otra restricción del alta (p. ej. el numero_referencia único) y, tras el rollback,
+  repite la respuesta ya guardada por el primero; solo si no hay ninguna se informa el error.
+
+La tabla la crea la migración 4 (app.core.migraciones).
+
+Variables de entorno:
+- IDEMPOTENCIA_TTL_SEGUNDOS: Vigencia de una clave (por defecto 86400, un día).
+- IDEMPOTENCIA_MAX_ENTRADAS: Claves en la caché en memoria (por defecto 10000).
+- IDEMPOTENCIA_PURGA_CADA: Registros entre purgas de claves vencidas (por defecto 1000).
+
+Componentes principales:
+- Peticion: Clave completa y huella de una petición con Idempotency-Key.
+- peticion_idempotente: Construye la Peticion (None sin cabecera; 400 si la clave es inválida).
+- repeticion / repeticion_async: Respuesta guardada para la clave, o None.
+- registrar: Guarda la respuesta en la transacción del alta (sin commit).
+- recordar: Pasa la respuesta a la caché en memoria tras el commit.
+"""
+
+import hashlib
+import itertools
+import os
+import time
+from typing import Optional
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy import Column, Integer, MetaData, String, Table, delete, insert, select
+
+from app.core.cache import CacheRespuestas
+
+IDEMPOTENCIA_TTL_SEGUNDOS = int(os.getenv("IDEMPOTENCIA_TTL_SEGUNDOS", "86400"))
+IDEMPOTENCIA_MAX_ENTRADAS = int(os.getenv("IDEMPOTENCIA_MAX_ENTRADAS", "10000"))
+IDEMPOTENCIA_PURGA_CADA = int(os.getenv("IDEMPOTENCIA_PURGA_CADA", "1000"))
+
+MAX_LARGO_CLAVE = 255
+CABECERA_REPETIDA = "Idempotent-Replayed"
+DESCRIPCION_CLAVE = "Clave única del cliente: los reintentos con la misma clave repiten la respuesta original"
+
+_metadata = MetaData()
+
+claves_idempotencia = Table(
+    "claves_idempotencia", _metadata,
+    Column("clave", String, primary_key=True),
+    Column("huella", String, nullable=False),
+    Column("cuerpo", String, nullable=False),
+    Column("expira", Integer, nullable=False),
+)
+
+cache_claves = CacheRespuestas(IDEMPOTENCIA_MAX_ENTRADAS, IDEMPOTENCIA_TTL_SEGUNDOS)
+
+_registros = itertools.count(1)
+
+
+class Peticion:
+    """Clave completa (ámbito y clave del cliente) y huella del cuerpo de una petición."""
+
+    __slots__ = ("clave", "huella", "cuerpo")
+
+    def __init__(self, clave: str, huella: str):
+        self.clave = clave
+        self.huella = huella
+        self.cuerpo = None  # respuesta serializada, la fija registrar()
+
+
+def peticion_idempotente(ambito: str, clave: Optional[str], datos: BaseModel) -> Optional[Peticion]:
+    """Peticion para la cabecera recibida (None si no vino); 400 si la clave es inválida."""
+    if clave is None:
+        return None
+    clave = clave.strip()
+    if not clave or len(clave) > MAX_LARGO_CLAVE:
+        raise HTTPException(status_code=400, detail=f"Idempotency-Key debe tener entre 1 y {MAX_LARGO_CLAVE} caracteres")
+    huella = hashlib.sha256(datos.model_dump_json().encode()).hexdigest()[:32]
+    return Peticion(f"{ambito}:{clave}", huella)
+
+
+def _respuesta(peticion: Peticion, huella: str, cuerpo: str) -> Response:
+    if huella != peticion.huella:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail="La Idempotency-Key ya se usó con un cuerpo distinto")
+    return Response(content=cuerpo, media_type="application/json", headers={CABECERA_REPETIDA: "true"})
+
+
+def _consulta(peticion: Peticion):
+    return (select(claves_idempotencia.c.huella, claves_idempotencia.c.cuerpo)
+            .where(claves_idempotencia.c.clave == peticion.clave,
+                   claves_idempotencia.c.expira > int(time.time())))
+
+
+def repeticion(db, peticion: Optional[Peticion]) -> Optional[Response]:
+    """Respuesta guardada para la petición (caché en memoria y luego tabla), o None."""
+    if peticion is None:
+        return None
+    guardada = cache_claves.obtener(peticion.clave)
+    if guardada is None:
+        guardada = db.execute(_consulta(peticion)).first()
+        if guardada is None:
+            return None
+        guardada = tuple(guardada)
+        cache_claves.guardar(peticion.clave, guardada)
+    return _respuesta(peticion, *guardada)
+
+
+async def repeticion_async(db, peticion: Optional[Peticion]) -> Optional[Response]:
+    """Equivalente de repeticion sobre una AsyncSession."""
+    if peticion is None:
+        return None
+    guardada = cache_claves.obtener(peticion.clave)
+    if guardada is None:
+        return await db.run_sync(repeticion, peticion)
+    return _respuesta(peticion, *guardada)
+
+
+def registrar(db, peticion: Optional[Peticion], cuerpo: str):
+    """
+    Guarda la respuesta de la petición en la transacción en curso (no hace commit).
+    Borra antes la clave si había vencido y, cada IDEMPOTENCIA_PURGA_CADA registros,
+    todas las claves vencidas.
+    """
+    if peticion is None:
+        return
+    ahora = int(time.time())
+    vencidas = delete(claves_idempotencia).where(claves_idempotencia.c.expira <= ahora)
+    if next(_registros) % IDEMPOTENCIA_PURGA_CADA:
+        vencidas = vencidas.where(claves_idempotencia.c.clave == peticion.clave)
+    db.execute(vencidas)
+    db.execute(insert(claves_idempotencia).values(
+        clave=peticion.clave, huella=peticion.huella, cuerpo=cuerpo, expira=ahora + IDEMPOTENCIA_TTL_SEGUNDOS))
+    peticion.cuerpo = cuerpo
+
+
+def recordar(peticion: Optional[Peticion]):
+    """Pasa la respuesta ya confirmada a la caché en memoria."""
+    if peticion is not None and peticion.cuerpo is not None:
+        cache_claves.guardar(peticion.clave, (peticion.huella, peticion.cuerpo))
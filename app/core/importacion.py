@@ -0,0 +1,241 @@
+"""
+importacion.py
+
+Este módulo implementa la importación masiva desde CSV con upsert por diferencias.
+
+Las filas se leen en streaming con csv.DictReader y se validan con el esquema de creación de
+la entidad. Los registros existentes se buscan por clave natural con un SELECT ... IN por cada
+IMPORT_LOTE claves y se comparan en memoria con las filas recibidas: solo se insertan las
+filas nuevas y solo se actualizan las columnas que cambian, con un executemany por tipo de
+sentencia y todo dentro de una única transacción.
+
+Reglas:
+- Las columnas ausentes del CSV y las celdas vacías no modifican los registros existentes
+  (en los nuevos toman el valor por defecto del esquema).
+- Las columnas desconocidas (por ejemplo `id` en un archivo exportado) se ignoran.
+- Es un error de la fila: no cumplir el esquema, repetir una clave del archivo, coincidir con
+  varios registros existentes o referenciar una clave foránea inexistente.
+
+Componentes principales:
+- recibir_csv: Copia el cuerpo de la petición, a medida que llega, a un archivo temporal
+  (en memoria hasta IMPORT_MEMORIA_MAX bytes y luego en disco).
+- leer_csv: Cuerpo de la petición -> líneas de texto (UTF-8, con o sin BOM).
+- leer_filas: Valida cada fila del CSV con un esquema (también la usa app.core.precios).
+- importar_csv: Valida, calcula las diferencias y aplica los INSERT/UPDATE necesarios.
+- cuerpo_csv: Documentación OpenAPI del cuerpo text/csv de un endpoint de importación.
+
+Variables de entorno reconocidas:
+- IMPORT_LOTE: Claves por consulta de búsqueda (por defecto 500).
+- IMPORT_MEMORIA_MAX: Bytes del CSV recibido que se mantienen en memoria antes de pasar a
+  disco (por defecto 1048576, 1 MiB).
+"""
+
+import csv
+import io
+import os
+from collections import defaultdict
+from enum import Enum
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Iterable, List, Tuple, Union
+
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, inspect, select, tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.schemas.importacion_schema import ErrorFilaImportacion, ResultadoImportacion
+
+IMPORT_LOTE = int(os.getenv("IMPORT_LOTE", "500"))
+IMPORT_MEMORIA_MAX = int(os.getenv("IMPORT_MEMORIA_MAX", str(1024 * 1024)))
+
+
+async def recibir_csv(request: Request) -> SpooledTemporaryFile:
+    """
+    Copia el cuerpo de la petición por trozos a un archivo temporal, sin reunirlo antes en
+    memoria, y lo devuelve posicionado al inicio. El llamador debe cerrarlo.
+    """
+    archivo = SpooledTemporaryFile(max_size=IMPORT_MEMORIA_MAX)
+    try:
+        async for trozo in request.stream():
+            archivo.write(trozo)
+    except BaseException:
+        archivo.close()
+        raise
+    archivo.seek(0)
+    return archivo
+
+
+def leer_csv(cuerpo: Union[bytes, BinaryIO]) -> Iterable[str]:
+    """Envuelve el cuerpo (bytes o archivo binario) como archivo de texto para csv, sin copiarlo por líneas."""
+    if isinstance(cuerpo, (bytes, bytearray)):
+        cuerpo = io.BytesIO(cuerpo)
+    return io.TextIOWrapper(cuerpo, encoding="utf-8-sig", newline="")
+
+
+def cuerpo_csv(esquema: type[BaseModel], clave: Tuple[str, ...]) -> dict:
+    """`openapi_extra` para un endpoint que recibe el CSV crudo en el cuerpo."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {
+                    "type": "string",
+                    "description": f"CSV con encabezado; columnas: {', '.join(esquema.model_fields)}. "
+                                   f"Clave de coincidencia: {', '.join(clave)}.",
+                }},
+            },
+        }
+    }
+
+
+def _lotes(valores: list):
+    for inicio in range(0, len(valores), IMPORT_LOTE):
+        yield valores[inicio:inicio + IMPORT_LOTE]
+
+
+def _mensajes(exc: ValidationError) -> List[str]:
+    return [f"{'.'.join(str(p) for p in error['loc']) or 'fila'}: {error['msg']}" for error in exc.errors(include_url=False)]
+
+
+def _a_columnas(modelo: type, datos: dict) -> dict:
+    """Campos del esquema -> columnas del modelo (resuelve los synonym); los Enum se guardan por valor."""
+    sinonimos = inspect(modelo).synonyms
+    return {
+        (sinonimos[campo].name if campo in sinonimos else campo): (valor.value if isinstance(valor, Enum) else valor)
+        for campo, valor in datos.items()
+    }
+
+
+def leer_filas(lineas: Iterable[str], esquema: type[BaseModel], clave: Tuple[str, ...], errores: dict):
+    """
+    Valida cada fila del CSV con el esquema. Devuelve el número de filas recibidas y, por fila
+    válida, (línea, valores completos, valores presentes en el archivo).
+    """
+    lector = csv.DictReader(lineas)
+    validas, recibidos = [], 0
+    try:
+        encabezado = lector.fieldnames
+        if not encabezado:
+            raise HTTPException(status_code=400, detail="CSV vacío: se esperaba una fila de encabezado")
+        faltantes = [campo for campo in clave if campo not in encabezado]
+        if faltantes:
+            raise HTTPException(status_code=400, detail=f"Faltan columnas clave en el encabezado: {', '.join(faltantes)}")
+        for registro in lector:
+            recibidos += 1
+            datos = {
+                campo: valor.strip() for campo, valor in registro.items()
+                if campo in esquema.model_fields and valor is not None and valor.strip()
+            }
+            try:
+                modelo = esquema.model_validate(datos)
+            except ValidationError as exc:
+                errores[lector.line_num] = _mensajes(exc)
+                continue
+            validas.append((lector.line_num, modelo.model_dump(), modelo.model_dump(include=set(datos))))
+    except (csv.Error, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=400, detail=f"CSV inválido (línea {lector.line_num}): {exc}")
+    return recibidos, validas
+
+
+def _foraneas_inexistentes(db: Session, modelo: type, filas: List[dict]) -> dict:
+    """Valores de cada clave foránea del modelo que no existen en la tabla referenciada."""
+    faltantes = {}
+    for columna in modelo.__table__.columns:
+        for foranea in columna.foreign_keys:
+            valores = list({fila[columna.key] for fila in filas if fila.get(columna.key) is not None})
+            existentes = set()
+            for lote in _lotes(valores):
+                existentes.update(db.scalars(select(foranea.column).where(foranea.column.in_(lote))))
+            faltantes[columna.key] = set(valores) - existentes
+    return faltantes
+
+
+def _existentes(db: Session, modelo: type, columnas_clave: List[str], claves: list):
+    """
+    Busca los registros existentes por clave natural, en lotes de IMPORT_LOTE claves.
+    Devuelve {clave: fila} y el conjunto de claves que coinciden con más de un registro.
+    """
+    tabla = modelo.__table__
+    expresion = tabla.c[columnas_clave[0]] if len(columnas_clave) == 1 else tuple_(*(tabla.c[c] for c in columnas_clave))
+    encontrados, repetidas = {}, set()
+    for lote in _lotes(claves):
+        valores = [c[0] for c in lote] if len(columnas_clave) == 1 else lote
+        for fila in db.execute(select(tabla).where(expresion.in_(valores))).mappings():
+            llave = tuple(fila[c] for c in columnas_clave)
+            if llave in encontrados:
+                repetidas.add(llave)
+            encontrados[llave] = fila
+    return encontrados, repetidas
+
+
+def importar_csv(db: Session, lineas: Iterable[str], modelo: type, esquema: type[BaseModel],
+                 clave: Tuple[str, ...], atomic: bool = False) -> ResultadoImportacion:
+    """
+    Importa un CSV sobre la tabla del modelo: inserta las filas cuya clave natural no existe,
+    actualiza solo las columnas que cambian en las existentes y cuenta las idénticas.
+
+    Con atomic=True cualquier fila con errores aborta la importación (HTTP 422); por defecto
+    se aplican las filas válidas y se informan los errores del resto por línea.
+    """
+    errores = {}
+    recibidos, validas = leer_filas(lineas, esquema, clave, errores)
+    columnas_clave = list(_a_columnas(modelo, dict.fromkeys(clave)))
+
+    filas, vistas = [], {}
+    for linea, completo, presente in validas:
+        completo, presente = _a_columnas(modelo, completo), _a_columnas(modelo, presente)
+        llave = tuple(completo[c] for c in columnas_clave)
+        if llave in vistas:
+            errores[linea] = [f"{', '.join(clave)}: clave repetida en el archivo (línea {vistas[llave]})"]
+            continue
+        vistas[llave] = linea
+        filas.append((linea, llave, completo, presente))
+
+    faltantes = _foraneas_inexistentes(db, modelo, [completo for _, _, completo, _ in filas])
+    existentes, repetidas = _existentes(db, modelo, columnas_clave, [llave for _, llave, _, _ in filas])
+    primaria = inspect(modelo).primary_key[0].key
+
+    nuevas, cambios, sin_cambios = [], defaultdict(list), 0
+    for linea, llave, completo, presente in filas:
+        actual = existentes.get(llave)
+        mensajes = [f"{columna}: {completo[columna]} no existe" for columna, valores in faltantes.items()
+                    if completo.get(columna) in valores]
+        if llave in repetidas:
+            mensajes.append(f"{', '.join(clave)}: coincide con varios registros existentes")
+        if mensajes:
+            errores[linea] = mensajes
+        elif actual is None:
+            nuevas.append(completo)
+        else:
+            diferencias = {columna: valor for columna, valor in presente.items() if actual[columna] != valor}
+            if diferencias:
+                # executemany necesita el mismo conjunto de columnas en cada fila: agrupar por columnas
+                cambios[tuple(sorted(diferencias))].append({primaria: actual[primaria], **diferencias})
+            else:
+                sin_cambios += 1
+
+    def resultado(insertados: int, actualizados: int) -> ResultadoImportacion:
+        return ResultadoImportacion(
+            recibidos=recibidos,
+            insertados=insertados,
+            actualizados=actualizados,
+            sin_cambios=sin_cambios,
+            errores=[ErrorFilaImportacion(linea=i, errores=errores[i]) for i in sorted(errores)],
+        )
+
+    if atomic and errores:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=resultado(0, 0).model_dump())
+
+    actualizados = sum(len(grupo) for grupo in cambios.values())
+    try:
+        if nuevas:
+            db.execute(insert(modelo), nuevas)
+        for grupo in cambios.values():
+            db.execute(update(modelo), grupo)
+        db.commit()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail=f"No se pudo importar el archivo: {exc.__class__.__name__}")
+    return resultado(len(nuevas), actualizados)
@@ -0,0 +1,145 @@
+"""
+inclusion.py
+
+Este módulo implementa el parámetro `?include=` de los listados y detalles.
+
+Sin `include` las rutas devuelven solo las columnas de la entidad y un cliente que necesita
+los nombres relacionados hace una petición por fila (N+1). Con `include=categoria,proveedores.proveedor`
+las relaciones pedidas se cargan junto con la página: las de muchos-a-uno con joinedload (en la
+misma consulta) y las colecciones con selectinload (una consulta `IN` por relación para toda la
+página), de modo que el número de consultas depende de las relaciones pedidas y no del tamaño
+de la página.
+
+La respuesta se arma solo con las relaciones pedidas: las demás no se leen (no se disparan
+cargas perezosas) y no aparecen en el JSON.
+
+Cada router declara sus relaciones como {ruta: tablas de las que depende}; las tablas se usan
+para que el ETag y la caché de respuestas de una petición con `include` también cambien cuando
+se escribe en las tablas incluidas.
+
+Componentes principales:
+- parsear_include: Valida la lista separada por comas contra las rutas permitidas.
+- tablas_incluidas: Tablas adicionales de las que depende una petición (para ETag y caché).
+- opciones_carga: Rutas -> opciones joinedload/selectinload para Query o Select.
+- respuesta_con_relaciones: Serializa con el esquema anidado y devuelve un JSONResponse.
+"""
+
+from typing import Any, Dict, Optional, Tuple, get_args
+
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, selectinload
+
+DESCRIPCION_INCLUDE = "Relaciones a incluir, separadas por comas (por ejemplo categoria,proveedores.proveedor)"
+
+
+def _rutas(include: Optional[str]) -> Tuple[str, ...]:
+    if not include:
+        return ()
+    return tuple(dict.fromkeys(ruta.strip() for ruta in include.split(",") if ruta.strip()))
+
+
+def parsear_include(include: Optional[str], relaciones: Dict[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Rutas pedidas, sin repetir; 400 si alguna no está entre las permitidas."""
+    rutas = _rutas(include)
+    desconocidas = [ruta for ruta in rutas if ruta not in relaciones]
+    if desconocidas:
+        raise HTTPException(
+            status_code=400,
+            detail=f"include no válido: {', '.join(desconocidas)}. Opciones: {', '.join(relaciones)}",
+        )
+    return rutas
+
+
+def tablas_incluidas(request: Request, relaciones: Optional[Dict[str, Tuple[str, ...]]]) -> Tuple[str, ...]:
+    """Tablas de las relaciones pedidas en `include` (las rutas desconocidas se ignoran)."""
+    if not relaciones:
+        return ()
+    rutas = _rutas(request.query_params.get("include"))
+    return tuple(dict.fromkeys(tabla for ruta in rutas for tabla in relaciones.get(ruta, ())))
+
+
+def _arbol(rutas: Tuple[str, ...]) -> dict:
+    """("proveedores", "proveedores.proveedor") -> {"proveedores": {"proveedor": {}}}"""
+    arbol = {}
+    for ruta in rutas:
+        nodo = arbol
+        for parte in ruta.split("."):
+            nodo = nodo.setdefault(parte, {})
+    return arbol
+
+
+def opciones_carga(modelo: type, rutas: Tuple[str, ...]) -> list:
+    """
+    Opciones de carga para las rutas pedidas: joinedload para muchos-a-uno (sin consultas
+    adicionales) y selectinload para colecciones (una consulta por relación y página).
+    """
+    opciones = []
+
+    def recorrer(clase, arbol: dict, padre):
+        for nombre, hijos in arbol.items():
+            relacion = inspect(clase).relationships[nombre]
+            atributo = getattr(clase, nombre)
+            if padre is None:
+                cargador = selectinload(atributo) if relacion.uselist else joinedload(atributo)
+            else:
+                cargador = padre.selectinload(atributo) if relacion.uselist else padre.joinedload(atributo)
+            if hijos:
+                recorrer(relacion.mapper.class_, hijos, cargador)
+            else:
+                opciones.append(cargador)
+
+    recorrer(modelo, _arbol(rutas), None)
+    return opciones
+
+
+def _esquema_anidado(anotacion) -> Optional[type[BaseModel]]:
+    """Esquema pydantic dentro de una anotación (Optional[List[X]] -> X), o None."""
+    if isinstance(anotacion, type) and issubclass(anotacion, BaseModel):
+        return anotacion
+    for argumento in get_args(anotacion):
+        esquema = _esquema_anidado(argumento)
+        if esquema is not None:
+            return esquema
+    return None
+
+
+def _datos(esquema: type[BaseModel], objeto: Any, arbol: dict) -> dict:
+    """Campos del esquema leídos del objeto; de los campos anidados, solo las relaciones pedidas."""
+    datos = {}
+    for campo, info in esquema.model_fields.items():
+        anidado = _esquema_anidado(info.annotation)
+        if anidado is None:
+            datos[campo] = getattr(objeto, campo)
+        elif campo in arbol:
+            valor = getattr(objeto, campo)
+            if isinstance(valor, list):
+                datos[campo] = [_datos(anidado, elemento, arbol[campo]) for elemento in valor]
+            else:
+                datos[campo] = None if valor is None else _datos(anidado, valor, arbol[campo])
+    return datos
+
+
+def serializar_con_relaciones(esquema: type[BaseModel], objeto: Any, rutas: Tuple[str, ...]) -> dict:
+    """Objeto ORM -> dict JSON con las columnas del esquema y solo las relaciones pedidas."""
+    return esquema.model_validate(_datos(esquema, objeto, _arbol(rutas))).model_dump(mode="json", exclude_unset=True)
+
+
+def respuesta_con_relaciones(esquema: type[BaseModel], contenido, rutas: Tuple[str, ...],
+                             response: Optional[Response] = None) -> JSONResponse:
+    """
+    JSONResponse con un objeto o una lista serializados con el esquema anidado, conservando
+    las cabeceras ya puestas en `response` (Link, X-Next-Cursor...).
+    """
+    if isinstance(contenido, list):
+        cuerpo = [serializar_con_relaciones(esquema, objeto, rutas) for objeto in contenido]
+    else:
+        cuerpo = serializar_con_relaciones(esquema, contenido, rutas)
+    respuesta = JSONResponse(cuerpo)
+    if response is not None:
+        for nombre, valor in response.headers.items():
+            if nombre != "content-length":
+                respuesta.headers.append(nombre, valor)
+    return respuesta
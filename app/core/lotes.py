@@ -0,0 +1,73 @@
+"""
+lotes.py
+
+Este módulo implementa la lectura de varias entidades por id en una sola petición
+(`GET /<entidad>/batch?ids=3,1,2`).
+
+Un cliente que necesita 50-200 registros concretos (una planilla de conteo, un pedido a un
+proveedor) hacía una petición por id, y cada una pagaba autenticación, sesión y consulta.
+Aquí los ids se resuelven con una consulta `IN` por trozo de TROZO_IDS ids (el límite de
+parámetros de SQLite queda lejos), los resultados se devuelven en el orden pedido y los ids
+que no existen se informan aparte en lugar de responder 404.
+
+Componentes principales:
+- Lote: Resultado (items en el orden pedido e ids faltantes).
+- parsear_ids: Valida la lista separada por comas (enteros, sin repetir, hasta MAX_IDS_LOTE).
+- obtener_lote: Resuelve los ids sobre una consulta síncrona (Query).
+- obtener_lote_async: Equivalente para consultas Select ejecutadas con AsyncSession.
+"""
+
+from typing import Any, Iterable, List, NamedTuple
+
+from fastapi import HTTPException
+
+from app.core.paginacion import leer_filas_async
+
+MAX_IDS_LOTE = 1000
+TROZO_IDS = 500
+
+DESCRIPCION_IDS = f"Ids separados por comas (hasta {MAX_IDS_LOTE}); la respuesta conserva el orden"
+
+
+class Lote(NamedTuple):
+    items: List[Any]
+    faltantes: List[int]
+
+
+def parsear_ids(ids: str) -> List[int]:
+    """Ids pedidos en orden y sin repetir; 400 si alguno no es entero o son demasiados."""
+    try:
+        pedidos = list(dict.fromkeys(int(valor) for valor in ids.split(",") if valor.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids debe ser una lista de enteros separados por comas")
+    if not pedidos:
+        raise HTTPException(status_code=400, detail="ids no puede estar vacío")
+    if len(pedidos) > MAX_IDS_LOTE:
+        raise HTTPException(status_code=400, detail=f"Se admiten hasta {MAX_IDS_LOTE} ids por petición")
+    return pedidos
+
+
+def _trozos(ids: List[int]) -> Iterable[List[int]]:
+    for inicio in range(0, len(ids), TROZO_IDS):
+        yield ids[inicio:inicio + TROZO_IDS]
+
+
+def _ordenar(filas: Iterable[Any], clave: str, ids: List[int]) -> Lote:
+    por_id = {getattr(fila, clave): fila for fila in filas}
+    return Lote([por_id[i] for i in ids if i in por_id], [i for i in ids if i not in por_id])
+
+
+def obtener_lote(consulta, columna, ids: List[int]) -> Lote:
+    """Filas de la consulta cuyo `columna` está en `ids`, en el orden de `ids`."""
+    filas = []
+    for trozo in _trozos(ids):
+        filas.extend(consulta.filter(columna.in_(trozo)).all())
+    return _ordenar(filas, columna.key, ids)
+
+
+async def obtener_lote_async(db, consulta, columna, ids: List[int]) -> Lote:
+    """Equivalente de obtener_lote para un Select sobre una AsyncSession."""
+    filas = []
+    for trozo in _trozos(ids):
+        filas.extend(await leer_filas_async(db, consulta.filter(columna.in_(trozo))))
+    return _ordenar(filas, columna.key, ids)
@@ -0,0 +1,182 @@
+"""
+migraciones.py
+
+Este módulo implementa un sistema mínimo de migraciones versionadas del esquema.
+
+`Base.metadata.create_all` crea las tablas (y sus índices) que faltan, pero no modifica
+tablas existentes: una base de datos de producción creada antes de declarar un índice
+nunca lo recibe. Las migraciones cubren ese hueco aplicando sentencias DDL sobre la base
+de datos en uso y registrando cada versión aplicada en la tabla `schema_version`.
+
+Componentes principales:
+- Migracion: Versión, descripción y sentencias SQL de una migración.
+- MIGRACIONES: Lista ordenada de migraciones conocidas (agregar nuevas al final).
+- TABLAS_VERSIONADAS: Tablas con contador de versión en `versiones_tabla` (usado por los ETag).
+- TABLAS_FTS: Índices de texto completo (FTS5) y las columnas que indexan (app.core.busqueda).
+- versiones_aplicadas: Versiones registradas en `schema_version`.
+- migraciones_pendientes: Migraciones aún no aplicadas.
+- aplicar_migraciones: Aplica las pendientes, cada una en su propia transacción.
+
+Las sentencias deben ser idempotentes (`IF NOT EXISTS`) para convivir con `create_all`,
+que ya crea los índices declarados en los modelos cuando la tabla es nueva.
+
+Uso desde la línea de comandos: `python -m app.utils.migrar`.
+"""
+
+from typing import List, NamedTuple, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import engine
+
+
+class Migracion(NamedTuple):
+    version: int
+    descripcion: str
+    sentencias: Tuple[str, ...]
+
+
+# Tablas cuya versión (versiones_tabla) se incrementa por trigger en cada escritura
+TABLAS_VERSIONADAS = (
+    "categorias", "productos", "proveedores", "proveedor_productos", "almacenes",
+    "conteos_inventario", "movimientos_inventario",
+)
+
+
+def _sentencias_versiones_tabla(tablas) -> Tuple[str, ...]:
+    """Tabla versiones_tabla y triggers AFTER INSERT/UPDATE/DELETE que la mantienen (SQLite)."""
+    sentencias = [
+        "CREATE TABLE IF NOT EXISTS versiones_tabla "
+        "(tabla TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0)",
+    ]
+    for tabla in tablas:
+        sentencias.append(f"INSERT OR IGNORE INTO versiones_tabla (tabla, version) VALUES ('{tabla}', 0)")
+        for evento in ("INSERT", "UPDATE", "DELETE"):
+            sentencias.append(
+                f"CREATE TRIGGER IF NOT EXISTS tr_{tabla}_version_{evento.lower()} AFTER {evento} ON {tabla} "
+                f"BEGIN UPDATE versiones_tabla SET version = version + 1 WHERE tabla = '{tabla}'; END"
+            )
+    return tuple(sentencias)
+
+
+# Tablas con índice de texto completo `<tabla>_fts` y las columnas indexadas
+TABLAS_FTS = {
+    "productos": ("nombre", "descripcion"),
+    "proveedores": ("nombre", "persona_contacto"),
+}
+
+
+def _sentencias_fts(tablas: dict) -> Tuple[str, ...]:
+    """
+    Tablas FTS5 de contenido externo (el texto se lee de la tabla original, no se duplica),
+    sin distinguir mayúsculas ni tildes y con índices de prefijo de 2 y 3 caracteres, más los
+    triggers que las mantienen sincronizadas y la reconstrucción con las filas existentes.
+    """
+    sentencias = []
+    for tabla, columnas in tablas.items():
+        fts = f"{tabla}_fts"
+        lista = ", ".join(columnas)
+        nuevas = ", ".join(f"new.{c}" for c in columnas)
+        viejas = ", ".join(f"old.{c}" for c in columnas)
+        borrar = f"INSERT INTO {fts} ({fts}, rowid, {lista}) VALUES ('delete', old.id, {viejas});"
+        insertar = f"INSERT INTO {fts} (rowid, {lista}) VALUES (new.id, {nuevas});"
+        sentencias += [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({lista}, content='{tabla}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+            f"CREATE TRIGGER IF NOT EXISTS tr_{fts}_insert AFTER INSERT ON {tabla} BEGIN {insertar} END",
+            f"CREATE TRIGGER IF NOT EXISTS tr_{fts}_delete AFTER DELETE ON {tabla} BEGIN {borrar} END",
+            f"CREATE TRIGGER IF NOT EXISTS tr_{fts}_update AFTER UPDATE OF {lista} ON {tabla} "
+            f"BEGIN {borrar} {insertar} END",
+            f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')",
+        ]
+    return tuple(sentencias)
+
+
+MIGRACIONES: List[Migracion] = [
+    Migracion(1, "Índices compuestos para los filtros frecuentes", (
+        "CREATE INDEX IF NOT EXISTS ix_movimientos_inventario_producto_fecha "
+        "ON movimientos_inventario (producto_id, fecha)",
+        "CREATE INDEX IF NOT EXISTS ix_movimientos_inventario_fecha ON movimientos_inventario (fecha)",
+        "CREATE INDEX IF NOT EXISTS ix_conteos_inventario_producto_almacen "
+        "ON conteos_inventario (producto_id, almacen_id)",
+        "CREATE INDEX IF NOT EXISTS ix_productos_categoria_activo_tipo "
+        "ON productos (categoria_id, activo, tipo_perecible)",
+        "CREATE INDEX IF NOT EXISTS ix_proveedor_productos_producto_proveedor "
+        "ON proveedor_productos (producto_id, proveedor_id)",
+        "ANALYZE",
+    )),
+    Migracion(2, "Versiones por tabla mantenidas por triggers (ETag)", _sentencias_versiones_tabla(TABLAS_VERSIONADAS)),
+    Migracion(3, "Búsqueda de texto completo (FTS5) en productos y proveedores", _sentencias_fts(TABLAS_FTS)),
+    Migracion(4, "Claves de idempotencia y numero_referencia único por producto", (
+        "CREATE TABLE IF NOT EXISTS claves_idempotencia (clave TEXT PRIMARY KEY, huella TEXT NOT NULL, "
+        "cuerpo TEXT NOT NULL, expira INTEGER NOT NULL) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS ix_claves_idempotencia_expira ON claves_idempotencia (expira)",
+        # Los duplicados previos conservan su referencia con el sufijo #<id> para no perder datos
+        "UPDATE movimientos_inventario SET numero_referencia = numero_referencia || '#' || id "
+        "WHERE numero_referencia IS NOT NULL AND numero_referencia <> '' AND id NOT IN ("
+        "SELECT MIN(id) FROM movimientos_inventario WHERE numero_referencia IS NOT NULL "
+        "GROUP BY producto_id, numero_referencia)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_movimientos_inventario_producto_referencia "
+        "ON movimientos_inventario (producto_id, numero_referencia) "
+        "WHERE numero_referencia IS NOT NULL AND numero_referencia <> ''",
+    )),
+    Migracion(5, "stock_actual único por producto y almacén (upsert)", (
+        # Los registros repetidos se suman en el de menor id antes de crear el índice único
+        "UPDATE stock_actual SET cantidad = (SELECT SUM(s.cantidad) FROM stock_actual s "
+        "WHERE s.producto_id = stock_actual.producto_id AND s.almacen_id IS stock_actual.almacen_id) "
+        "WHERE id IN (SELECT MIN(id) FROM stock_actual GROUP BY producto_id, IFNULL(almacen_id, 0) "
+        "HAVING COUNT(*) > 1)",
+        "DELETE FROM stock_actual WHERE id NOT IN ("
+        "SELECT MIN(id) FROM stock_actual GROUP BY producto_id, IFNULL(almacen_id, 0))",
+        "DROP INDEX IF EXISTS ix_stock_actual_producto_almacen",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_stock_actual_producto_almacen "
+        "ON stock_actual (producto_id, IFNULL(almacen_id, 0))",
+    )),
+]
+
+_metadata = MetaData()
+
+schema_version = Table(
+    "schema_version", _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("descripcion", String, nullable=False),
+    Column("aplicada_en", DateTime, server_default=func.now(), nullable=False),
+)
+
+
+def versiones_aplicadas(conexion) -> set:
+    """Devuelve las versiones registradas en `schema_version` (la crea si no existe)."""
+    schema_version.create(conexion, checkfirst=True)
+    return set(conexion.scalars(select(schema_version.c.version)))
+
+
+def migraciones_pendientes(conexion) -> List[Migracion]:
+    """Migraciones de MIGRACIONES que todavía no se aplicaron, en orden de versión."""
+    aplicadas = versiones_aplicadas(conexion)
+    return [m for m in sorted(MIGRACIONES, key=lambda m: m.version) if m.version not in aplicadas]
+
+
+def aplicar_migraciones(motor=engine) -> List[Migracion]:
+    """
+    Aplica las migraciones pendientes sobre el motor dado y devuelve las aplicadas.
+
+    Cada migración corre en su propia transacción junto con el registro de su versión,
+    de modo que un fallo no deja versiones a medio aplicar. Si otro proceso registra la
+    misma versión en paralelo, la inserción duplicada se descarta.
+    """
+    with motor.begin() as conexion:
+        pendientes = migraciones_pendientes(conexion)
+
+    aplicadas = []
+    for migracion in pendientes:
+        try:
+            with motor.begin() as conexion:
+                for sentencia in migracion.sentencias:
+                    conexion.exec_driver_sql(sentencia)
+                conexion.execute(schema_version.insert().values(
+                    version=migracion.version, descripcion=migracion.descripcion))
+        except IntegrityError:
+            continue
+        aplicadas.append(migracion)
+    return aplicadas
@@ -0,0 +1,118 @@
+"""
+paginacion.py
+
+Este módulo implementa la paginación por cursor (keyset) compartida por todos los listados.
+
+En lugar de `OFFSET skip`, que obliga a SQLite a recorrer y descartar `skip` filas,
+la página siguiente se pide con un cursor opaco que codifica la clave de la última
+fila devuelta; la consulta filtra `(columnas) > (valores del cursor)` y usa el índice.
+
+Componentes principales:
+- Pagina: Resultado de una consulta paginada (items y cursor de la página siguiente).
+- codificar_cursor / decodificar_cursor: Conversión entre valores de clave y el token opaco.
+- aplicar_cursor: Agrega orden, filtro por cursor, offset y límite (+1) a una consulta.
+- cortar_pagina: Recorta la fila extra y calcula el cursor siguiente.
+- paginar: Atajo para consultas síncronas (Query) que combina ambos pasos.
+- paginar_async: Equivalente para consultas Select ejecutadas con AsyncSession.
+- leer_filas_async: Ejecuta un Select con AsyncSession (instancias o filas según lo seleccionado).
+- agregar_enlace_siguiente: Publica el cursor en las cabeceras `Link` y `X-Next-Cursor`.
+
+`skip` sigue funcionando por compatibilidad: se aplica después del filtro por cursor.
+Los routers limitan `limit` a 1..LIMITE_MAXIMO; con un límite menor a 1 la página queda vacía.
+Los valores de la clave deben ser serializables en JSON (enteros o cadenas).
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, List, NamedTuple, Optional
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import tuple_
+
+# Máximo de filas por página que aceptan los listados (`limit`)
+LIMITE_MAXIMO = 1000
+
+
+class Pagina(NamedTuple):
+    items: List[Any]
+    siguiente: Optional[str]
+
+
+def codificar_cursor(valores: list) -> str:
+    """Codifica los valores de la clave como un token base64 url-safe."""
+    crudo = json.dumps(valores, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(crudo).rstrip(b"=").decode()
+
+
+def decodificar_cursor(cursor: str, columnas: list) -> list:
+    """Decodifica un token de cursor; responde 400 si no es válido para estas columnas."""
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        valores = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    if not isinstance(valores, list) or len(valores) != len(columnas):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    return valores
+
+
+def aplicar_cursor(consulta, columnas: list, cursor: Optional[str], skip: int, limit: int):
+    """
+    Ordena por las columnas de la clave, filtra a partir del cursor y pide una fila
+    extra para saber si existe una página siguiente. Acepta Query o Select.
+    """
+    consulta = consulta.order_by(*columnas)
+    if cursor:
+        valores = decodificar_cursor(cursor, columnas)
+        if len(columnas) == 1:
+            consulta = consulta.filter(columnas[0] > valores[0])
+        else:
+            consulta = consulta.filter(tuple_(*columnas) > tuple_(*valores))
+    if skip:
+        consulta = consulta.offset(skip)
+    return consulta.limit(limit + 1)
+
+
+def cortar_pagina(filas: list, columnas: list, limit: int) -> Pagina:
+    """Descarta la fila extra y genera el cursor a partir de la última fila de la página."""
+    if limit < 1:
+        return Pagina([], None)
+    if len(filas) <= limit:
+        return Pagina(list(filas), None)
+    filas = list(filas[:limit])
+    ultima = filas[-1]
+    return Pagina(filas, codificar_cursor([getattr(ultima, columna.key) for columna in columnas]))
+
+
+def paginar(consulta, columnas: list, cursor: Optional[str], skip: int, limit: int) -> Pagina:
+    """Pagina una consulta síncrona (Query) por cursor."""
+    return cortar_pagina(aplicar_cursor(consulta, columnas, cursor, skip, limit).all(), columnas, limit)
+
+
+async def leer_filas_async(db, consulta) -> list:
+    """Ejecuta un Select sobre una AsyncSession y devuelve sus filas."""
+    resultado = await db.execute(consulta)
+    # select(Modelo) devuelve instancias; un select de columnas (solo_lectura) devuelve las filas
+    descripciones = consulta.column_descriptions
+    if len(descripciones) == 1 and descripciones[0]["expr"] is descripciones[0]["entity"]:
+        return resultado.scalars().all()
+    return resultado.all()
+
+
+async def paginar_async(db, consulta, columnas: list, cursor: Optional[str], skip: int, limit: int) -> Pagina:
+    """Pagina una consulta Select sobre una AsyncSession por cursor."""
+    filas = await leer_filas_async(db, aplicar_cursor(consulta, columnas, cursor, skip, limit))
+    return cortar_pagina(filas, columnas, limit)
+
+
+def agregar_enlace_siguiente(request: Request, response: Response, siguiente: Optional[str]):
+    """
+    Publica el cursor de la página siguiente en `X-Next-Cursor` y en un `Link` rel="next"
+    que reutiliza los parámetros de la petición actual (sin `skip`).
+    """
+    if not siguiente:
+        return
+    url = request.url.remove_query_params("skip").include_query_params(cursor=siguiente)
+    response.headers["X-Next-Cursor"] = siguiente
+    response.headers["Link"] = f'<{url}>; rel="next"'
@@ -0,0 +1,179 @@
+"""
+precios.py
+
+Este módulo implementa la actualización masiva de precios con sentencias por conjuntos.
+
+Cuando un proveedor sube los precios había que hacer un PUT por producto (lectura, commit y
+refresh por fila). Aquí un ajuste es un único `UPDATE` sobre todas las filas que cumplen el
+filtro, y un CSV de precios nuevos se aplica con un `UPDATE ... SET precio = CASE clave ...`
+por cada IMPORT_LOTE filas, todo dentro de una única transacción.
+
+- El destino es `productos.precio` o `proveedor_productos.precio` (la oferta de cada proveedor).
+- Los filtros (categoría, proveedor, tipo de perecibilidad) se combinan con AND; con destino
+  producto el proveedor filtra los productos que ofrece, y con destino proveedor la categoría
+  y el tipo filtran por el producto de la oferta.
+- Solo cuentan como afectadas las filas cuyo precio cambia (`precio IS NOT nuevo`); los
+  precios nulos no se ajustan por porcentaje ni monto.
+- Un ajuste que dejaría algún precio negativo se rechaza (422) sin modificar nada.
+- Con dry_run la misma condición se ejecuta como SELECT y se devuelven las diferencias fila a
+  fila sin escribir.
+
+Componentes principales:
+- ajustar_precios: Ajuste porcentual o absoluto sobre un filtro.
+- importar_precios: Precios nuevos desde CSV (producto_id, proveedor_id, precio).
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, case, func, null, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from app.core.importacion import IMPORT_LOTE, leer_filas
+from app.models.producto_model import Producto
+from app.models.producto_proveedor_model import ProveedorProducto
+from app.schemas.importacion_schema import ErrorFilaImportacion
+from app.schemas.precios_schema import (
+    AjustePrecios, CambioPrecio, DestinoPrecio, FilaPrecio, ResultadoPrecios,
+)
+
+
+def _modelo(destino: DestinoPrecio):
+    return Producto if destino is DestinoPrecio.PRODUCTO else ProveedorProducto
+
+
+def _condiciones(destino: DestinoPrecio, categoria_id: Optional[int] = None, proveedor_id: Optional[int] = None,
+                 tipo_perecible=None) -> list:
+    """Condiciones WHERE del filtro sobre la tabla de destino."""
+    del_producto = []
+    if categoria_id is not None:
+        del_producto.append(Producto.categoria_id == categoria_id)
+    if tipo_perecible is not None:
+        del_producto.append(Producto.tipo_perecible == tipo_perecible)
+
+    if destino is DestinoPrecio.PRODUCTO:
+        condiciones = del_producto
+        if proveedor_id is not None:
+            ofrecidos = select(ProveedorProducto.producto_id).where(ProveedorProducto.proveedor_id == proveedor_id)
+            condiciones.append(Producto.id.in_(ofrecidos.correlate(None)))
+        return condiciones
+
+    condiciones = []
+    if proveedor_id is not None:
+        condiciones.append(ProveedorProducto.proveedor_id == proveedor_id)
+    if del_producto:
+        # Sin correlacionar: la vista previa une productos en la consulta exterior
+        condiciones.append(ProveedorProducto.producto_id.in_(select(Producto.id).where(*del_producto).correlate(None)))
+    return condiciones
+
+
+def _aplicar(db: Session, destino: DestinoPrecio, nuevo, condiciones: list, dry_run: bool) -> Tuple[int, List[CambioPrecio]]:
+    """
+    Aplica `precio = nuevo` a las filas que cumplen las condiciones y cuyo precio cambia.
+    Con dry_run solo consulta las diferencias. No hace commit.
+    """
+    modelo = _modelo(destino)
+    condiciones = [*condiciones, modelo.precio.is_distinct_from(nuevo)]
+    if not dry_run:
+        sentencia = update(modelo).where(*condiciones).values(precio=nuevo)
+        return db.execute(sentencia.execution_options(synchronize_session=False)).rowcount, []
+
+    if destino is DestinoPrecio.PRODUCTO:
+        consulta = select(Producto.id, null(), Producto.nombre, Producto.precio, nuevo).order_by(Producto.id)
+    else:
+        consulta = (select(ProveedorProducto.producto_id, ProveedorProducto.proveedor_id, Producto.nombre,
+                           ProveedorProducto.precio, nuevo)
+                    .join(Producto, Producto.id == ProveedorProducto.producto_id)
+                    .order_by(ProveedorProducto.producto_id, ProveedorProducto.proveedor_id))
+    cambios = [
+        CambioPrecio(producto_id=producto_id, proveedor_id=proveedor_id, nombre=nombre,
+                     precio_anterior=anterior, precio_nuevo=precio)
+        for producto_id, proveedor_id, nombre, anterior, precio in db.execute(consulta.where(*condiciones))
+    ]
+    return len(cambios), cambios
+
+
+def ajustar_precios(db: Session, ajuste: AjustePrecios, dry_run: bool = False) -> ResultadoPrecios:
+    """
+    Suma `monto` o aplica `porcentaje` a todos los precios del filtro con un único UPDATE
+    (redondeados a `decimales`). Con dry_run devuelve las diferencias sin modificar nada.
+    """
+    if (ajuste.porcentaje is None) == (ajuste.monto is None):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail="Indique exactamente uno de porcentaje o monto")
+    precio = _modelo(ajuste.destino).precio
+    if ajuste.porcentaje is not None:
+        nuevo = func.round(precio * (1 + ajuste.porcentaje / 100), ajuste.decimales)
+    else:
+        nuevo = func.round(precio + ajuste.monto, ajuste.decimales)
+    condiciones = [precio.is_not(None), *_condiciones(ajuste.destino, ajuste.categoria_id, ajuste.proveedor_id,
+                                                      ajuste.tipo_perecible)]
+
+    negativos = db.scalar(select(func.count()).select_from(_modelo(ajuste.destino)).where(*condiciones, nuevo < 0))
+    if negativos:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail=f"El ajuste dejaría {negativos} precios negativos")
+
+    afectados, cambios = _aplicar(db, ajuste.destino, nuevo, condiciones, dry_run)
+    if not dry_run:
+        db.commit()
+    return ResultadoPrecios(afectados=afectados, dry_run=dry_run, cambios=cambios)
+
+
+def _precio_por_clave(destino: DestinoPrecio, filas: list):
+    """Expresión CASE con el precio nuevo de cada clave del lote y la condición IN de esas claves."""
+    if destino is DestinoPrecio.PRODUCTO:
+        nuevo = case({fila.producto_id: fila.precio for fila in filas}, value=Producto.id)
+        return nuevo, Producto.id.in_([fila.producto_id for fila in filas])
+    clave = (ProveedorProducto.producto_id, ProveedorProducto.proveedor_id)
+    nuevo = case(*((and_(clave[0] == fila.producto_id, clave[1] == fila.proveedor_id), fila.precio) for fila in filas))
+    return nuevo, tuple_(*clave).in_([(fila.producto_id, fila.proveedor_id) for fila in filas])
+
+
+def importar_precios(db: Session, lineas: Iterable[str], destino: DestinoPrecio, categoria_id: Optional[int] = None,
+                     proveedor_id: Optional[int] = None, tipo_perecible=None, dry_run: bool = False,
+                     atomic: bool = False) -> ResultadoPrecios:
+    """
+    Aplica los precios de un CSV (producto_id[, proveedor_id], precio) a las filas que además
+    cumplen el filtro, con un UPDATE por cada IMPORT_LOTE filas en una sola transacción.
+
+    Las filas inválidas o repetidas se informan por línea; con atomic=True cualquiera de ellas
+    aborta la operación (HTTP 422).
+    """
+    clave = ("producto_id",) if destino is DestinoPrecio.PRODUCTO else ("producto_id", "proveedor_id")
+    errores = {}
+    _, validas = leer_filas(lineas, FilaPrecio, (*clave, "precio"), errores)
+
+    filas, vistas = [], {}
+    for linea, completo, _ in validas:
+        fila = FilaPrecio.model_validate(completo)
+        llave = tuple(completo[campo] for campo in clave)
+        if None in llave:
+            errores[linea] = ["proveedor_id: obligatorio con destino=proveedor"]
+        elif llave in vistas:
+            errores[linea] = [f"{', '.join(clave)}: clave repetida en el archivo (línea {vistas[llave]})"]
+        else:
+            vistas[llave] = linea
+            filas.append(fila)
+
+    def resultado(afectados: int, cambios: List[CambioPrecio]) -> ResultadoPrecios:
+        return ResultadoPrecios(
+            afectados=afectados,
+            dry_run=dry_run,
+            cambios=cambios,
+            errores=[ErrorFilaImportacion(linea=i, errores=errores[i]) for i in sorted(errores)],
+        )
+
+    if atomic and errores:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=resultado(0, []).model_dump())
+
+    condiciones = _condiciones(destino, categoria_id, proveedor_id, tipo_perecible)
+    afectados, cambios = 0, []
+    for inicio in range(0, len(filas), IMPORT_LOTE):
+        nuevo, en_lote = _precio_por_clave(destino, filas[inicio:inicio + IMPORT_LOTE])
+        cantidad, diferencias = _aplicar(db, destino, nuevo, [en_lote, *condiciones], dry_run)
+        afectados += cantidad
+        cambios.extend(diferencias)
+    if not dry_run:
+        db.commit()
+    return resultado(afectados, cambios)
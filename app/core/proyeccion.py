@@ -0,0 +1,74 @@
+"""
+proyeccion.py
+
+Este módulo implementa el parámetro `?fields=` (campos dispersos) de los listados.
+
+Con `fields=id,nombre,unidad` el repositorio selecciona solo esas columnas (más la clave
+primaria, que usa el cursor de paginación) mediante el modo Core de app.core.solo_lectura,
+y la respuesta se serializa con un esquema pydantic reducido a los campos pedidos. Así no se
+leen ni se envían columnas que el cliente no usa (por ejemplo, descripciones largas).
+
+Los esquemas reducidos se crean una vez por combinación de campos (`esquema_parcial`, con
+caché) y se serializan con el camino rápido de app.core.serializacion.
+
+Componentes principales:
+- parsear_fields: Valida la lista separada por comas contra los campos del esquema.
+- esquema_parcial: Esquema pydantic con solo los campos pedidos (cacheado).
+- respuesta_parcial: Serializa las filas con el esquema reducido y devuelve la respuesta.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Response
+from pydantic import BaseModel, ConfigDict, create_model
+
+from app.core.serializacion import RespuestaJSONRapida, serializar_lista
+
+DESCRIPCION_FIELDS = "Campos a devolver, separados por comas (por ejemplo id,nombre,unidad)"
+
+
+def parsear_fields(fields: Optional[str], esquema: type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Campos pedidos en el orden del esquema (None si no se pidió ninguno);
+    400 si alguno no existe en el esquema.
+    """
+    if not fields:
+        return None
+    pedidos = {campo.strip() for campo in fields.split(",") if campo.strip()}
+    if not pedidos:
+        return None
+    desconocidos = sorted(pedidos - esquema.model_fields.keys())
+    if desconocidos:
+        raise HTTPException(
+            status_code=400,
+            detail=f"fields no válido: {', '.join(desconocidos)}. Opciones: {', '.join(esquema.model_fields)}",
+        )
+    return tuple(campo for campo in esquema.model_fields if campo in pedidos)
+
+
+@lru_cache(maxsize=256)
+def esquema_parcial(esquema: type[BaseModel], campos: Tuple[str, ...]) -> type[BaseModel]:
+    """Esquema con solo `campos`, con los mismos tipos y metadatos que en `esquema`."""
+    return create_model(
+        f"{esquema.__name__}Parcial",
+        __config__=ConfigDict(from_attributes=True),
+        **{campo: (esquema.model_fields[campo].annotation, esquema.model_fields[campo]) for campo in campos},
+    )
+
+
+def respuesta_parcial(esquema: type[BaseModel], filas: List[Any], campos: Tuple[str, ...],
+                      response: Response) -> RespuestaJSONRapida:
+    """
+    Respuesta con las filas serializadas con el esquema reducido, conservando las cabeceras
+    ya puestas en `response` (Link, X-Next-Cursor...).
+    """
+    parcial = esquema_parcial(esquema, campos)
+    cuerpo = serializar_lista(parcial, filas)
+    if cuerpo is None:
+        cuerpo = [parcial.model_validate(fila).model_dump(mode="json") for fila in filas]
+    respuesta = RespuestaJSONRapida(cuerpo)
+    for nombre, valor in response.headers.items():
+        if nombre != "content-length":
+            respuesta.headers.append(nombre, valor)
+    return respuesta
@@ -0,0 +1,95 @@
+"""
+retorno.py
+
+Este módulo implementa las escrituras de una sola sentencia con `RETURNING` (SQLite 3.35+).
+
+Las modificaciones hacían SELECT de la entidad, `setattr` de cada campo, commit y `refresh`
+(dos o tres viajes a la base de datos por escritura) y las bajas cargaban la entidad antes
+de borrarla. Aquí una modificación es un único `UPDATE ... RETURNING` con solo los campos
+recibidos (PATCH con `exclude_unset`) y una baja es un único `DELETE ... RETURNING`; que no
+vuelva ninguna fila significa que el id no existe (404).
+
+Las filas devueltas son `Row` con las columnas del modelo etiquetadas por atributo (las de
+app.core.solo_lectura), que pydantic serializa igual que las instancias.
+
+Las bajas mantienen la regla del ORM, que no podía borrar una entidad con registros
+asociados (las claves foráneas hijas son NOT NULL): la sentencia excluye esas filas con
+`NOT EXISTS` y, solo si no borró nada, se comprueba si el id existe para responder 409 en
+lugar de 404.
+
+Componentes principales:
+- actualizar_fila / actualizar_fila_async: UPDATE ... RETURNING de los valores dados.
+- eliminar_fila / eliminar_fila_async: DELETE ... RETURNING (409 si tiene registros asociados).
+
+Las funciones no hacen commit: lo hace el repositorio que las llama.
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, exists, inspect, select, update
+from sqlalchemy.orm import RelationshipDirection
+
+from app.core.solo_lectura import columnas_lectura
+
+DETALLE_REFERENCIADA = "No se puede eliminar: tiene registros asociados"
+
+
+def _clave(modelo):
+    return inspect(modelo).primary_key[0]
+
+
+@lru_cache(maxsize=64)
+def _referencias(modelo) -> Tuple:
+    """Condiciones EXISTS de las relaciones uno a muchos del modelo (hijos que apuntan a la fila)."""
+    condiciones = []
+    for relacion in inspect(modelo).relationships:
+        if relacion.direction is RelationshipDirection.ONETOMANY:
+            for local, remota in relacion.local_remote_pairs:
+                condiciones.append(exists().where(remota == local))
+    return tuple(condiciones)
+
+
+def _sentencia_actualizar(modelo, id_: int, valores: dict):
+    columnas = columnas_lectura(modelo)
+    if not valores:
+        return select(*columnas).where(_clave(modelo) == id_)
+    return (update(modelo).where(_clave(modelo) == id_).values(**valores)
+            .returning(*columnas).execution_options(synchronize_session=False))
+
+
+def _sentencia_eliminar(modelo, id_: int):
+    return (delete(modelo).where(_clave(modelo) == id_, *(~condicion for condicion in _referencias(modelo)))
+            .returning(*columnas_lectura(modelo)).execution_options(synchronize_session=False))
+
+
+def actualizar_fila(db, modelo, id_: int, valores: dict):
+    """Fila modificada (o la actual si `valores` está vacío); None si el id no existe."""
+    return db.execute(_sentencia_actualizar(modelo, id_, valores)).first()
+
+
+async def actualizar_fila_async(db, modelo, id_: int, valores: dict):
+    """Equivalente de actualizar_fila sobre una AsyncSession."""
+    return (await db.execute(_sentencia_actualizar(modelo, id_, valores))).first()
+
+
+def _referenciada(existe: Optional[int]):
+    if existe is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=DETALLE_REFERENCIADA)
+
+
+def eliminar_fila(db, modelo, id_: int):
+    """Fila borrada; None si el id no existe; 409 si tiene registros asociados."""
+    fila = db.execute(_sentencia_eliminar(modelo, id_)).first()
+    if fila is None and _referencias(modelo):
+        _referenciada(db.scalar(select(_clave(modelo)).where(_clave(modelo) == id_)))
+    return fila
+
+
+async def eliminar_fila_async(db, modelo, id_: int):
+    """Equivalente de eliminar_fila sobre una AsyncSession."""
+    fila = (await db.execute(_sentencia_eliminar(modelo, id_))).first()
+    if fila is None and _referencias(modelo):
+        _referenciada(await db.scalar(select(_clave(modelo)).where(_clave(modelo) == id_)))
+    return fila
@@ -8,19 +8,31 @@ Este módulo gestiona la seguridad de la aplicación, incluyendo:
 Funciones principales:
 - verify_password: Verifica si una contraseña coincide con su hash almacenado.
 - get_password_hash: Genera un hash seguro para una contraseña.
+- verify_and_update_password: Verifica y, si el hash usa otro costo, devuelve uno nuevo.
 - create_access_token: Crea un token JWT de acceso con datos específicos y tiempo de expiración.
 - decode_access_token: Decodifica y valida un token JWT.
+- CacheTokens / cache_tokens: LRU acotada de tokens ya verificados, cada uno vigente hasta su `exp`.
+- verificar_token: decode_access_token con la caché delante (usado por AuthMiddleware).
 
 ¡IMPORTANTE! Asegúrate de mantener la SECRET_KEY segura y privada en un entorno de producción.
 """
 
+import heapq
+import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
 
+# Costo de bcrypt (log2 de las rondas). Los hashes con otro costo se regeneran al iniciar sesión
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
 # Contexto de hashing para contraseñas con Bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 # =====================================
 # CONFIGURACIÓN DE JWT Y OAUTH2
@@ -30,6 +42,9 @@ SECRET_KEY = "kafklajf<<<<>><><&&&@@afaf__9o9n009n"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Máximo de tokens verificados que se recuerdan (0 desactiva la caché)
+TOKEN_CACHE_MAX = int(os.getenv("TOKEN_CACHE_MAX", "4096"))
+
 # =====================================
 # FUNCIONES DE GESTIÓN DE CONTRASEÑAS
 # =====================================
@@ -61,6 +76,21 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    Verifica la contraseña y, si coincide pero el hash se generó con otro costo
+    (BCRYPT_ROUNDS cambió), devuelve también el hash nuevo para guardarlo.
+
+    Args:
+        plain_password (str): La contraseña en texto plano proporcionada por el usuario.
+        hashed_password (str): El hash almacenado de la contraseña.
+
+    Returns:
+        tuple[bool, Optional[str]]: (coincide, hash nuevo o None si no hace falta cambiarlo).
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 # =====================================
 # FUNCIONES DE MANEJO DE TOKENS JWT
 # =====================================
@@ -79,7 +109,7 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     """
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.time() + expires_delta
+        expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
     
@@ -125,3 +155,109 @@ def decode_access_token(token: str) -> dict:
             detail="No se pudieron validar las credenciales.",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+
+# =====================================
+# CACHÉ DE TOKENS VERIFICADOS
+# =====================================
+
+class CacheTokens:
+    """
+    LRU acotada token -> payload ya verificado.
+
+    Cada entrada vence en el `exp` del propio token: al consultarla después de esa hora
+    se descarta (y el token se vuelve a validar, lo que lo rechaza), y al guardar se
+    purgan todas las vencidas. Los tokens sin `exp` no se guardan.
+    """
+
+    def __init__(self, max_entradas: int):
+        self.max_entradas = max_entradas
+        self._lock = threading.Lock()
+        self._entradas: "OrderedDict[str, tuple]" = OrderedDict()
+        self._vencimientos = []  # heap de (exp, token)
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.expiraciones = 0
+
+    def obtener(self, token: str) -> Optional[dict]:
+        with self._lock:
+            entrada = self._entradas.get(token)
+            if entrada is None:
+                self.fallos += 1
+                return None
+            exp, payload = entrada
+            if exp <= time.time():
+                del self._entradas[token]
+                self.expiraciones += 1
+                self.fallos += 1
+                return None
+            self._entradas.move_to_end(token)
+            self.aciertos += 1
+            return payload
+
+    def guardar(self, token: str, payload: dict):
+        exp = payload.get("exp")
+        if self.max_entradas <= 0 or not isinstance(exp, (int, float)):
+            return
+        with self._lock:
+            self._purgar_vencidos(time.time())
+            self._entradas[token] = (exp, payload)
+            self._entradas.move_to_end(token)
+            heapq.heappush(self._vencimientos, (exp, token))
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+                self.desalojos += 1
+
+    def _purgar_vencidos(self, ahora: float):
+        while self._vencimientos and self._vencimientos[0][0] <= ahora:
+            exp, token = heapq.heappop(self._vencimientos)
+            entrada = self._entradas.get(token)
+            if entrada is not None and entrada[0] == exp:
+                del self._entradas[token]
+                self.expiraciones += 1
+        # El heap conserva tokens ya desalojados por LRU; se compacta si crece de más
+        if len(self._vencimientos) > 2 * max(self.max_entradas, 1):
+            self._vencimientos = [(exp, token) for token, (exp, _) in self._entradas.items()]
+            heapq.heapify(self._vencimientos)
+
+    def limpiar(self):
+        with self._lock:
+            self._entradas.clear()
+            self._vencimientos.clear()
+
+    def estadisticas(self) -> dict:
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                "entradas": len(self._entradas),
+                "max_entradas": self.max_entradas,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "expiraciones": self.expiraciones,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+            }
+
+
+cache_tokens = CacheTokens(TOKEN_CACHE_MAX)
+
+
+def verificar_token(token: str) -> dict:
+    """
+    Devuelve el payload de un token válido, verificando la firma solo la primera vez.
+
+    Args:
+        token (str): El token JWT recibido en Authorization.
+
+    Returns:
+        dict: Los datos contenidos en el token.
+
+    Raises:
+        HTTPException: Si el token no es válido o ha expirado.
+    """
+    payload = cache_tokens.obtener(token)
+    if payload is None:
+        payload = decode_access_token(token)
+        cache_tokens.guardar(token, payload)
+    return payload
@@ -0,0 +1,186 @@
+"""
+serializacion.py
+
+Este módulo implementa un camino rápido (opcional) para serializar listados de objetos ORM.
+
+Con `response_model=List[Esquema]`, FastAPI valida cada fila con pydantic (`from_attributes`),
+la vuelve a convertir a tipos JSON y la codifica con `json`. Para esquemas planos (enteros,
+flotantes, cadenas, booleanos, enums y fechas) ese trabajo se puede hacer directamente: se
+compila una vez por esquema una lista de (campo, conversión) y cada fila se convierte a un
+dict (leyendo el estado de la instancia sin pasar por los descriptores de SQLAlchemy) y se
+codifica con los mismos parámetros que JSONResponse, de modo que el resultado es idéntico
+byte a byte al de la ruta normal.
+
+Si el esquema tiene algo que este camino no reproduce (alias, validadores, modelos anidados,
+otros tipos), o una fila no tiene algún atributo, se usa la ruta normal de FastAPI.
+
+No se usa orjson ni `TypeAdapter.dump_json`: ambos escriben los flotantes grandes o pequeños
+con otro formato (1e16 en lugar de 1e+16) y la salida dejaría de ser idéntica.
+
+Componentes principales:
+- compilar_serializador: Conversión fila -> dict precompilada para un esquema (o None).
+- serializar_lista: Lista de objetos ORM -> bytes JSON.
+- RespuestaJSONRapida: JSONResponse que acepta el cuerpo ya codificado.
+- respuesta_lista: Lo que devuelven las rutas de listado (respuesta rápida o las filas tal cual).
+
+Variables de entorno reconocidas:
+- JSON_RAPIDO: "true" activa el camino rápido en los listados (por defecto desactivado).
+"""
+
+import dataclasses
+import enum
+import json
+import operator
+import os
+import types
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple, Union, get_args, get_origin
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine import Row
+
+JSON_RAPIDO = os.getenv("JSON_RAPIDO", "false").lower() in ("1", "true", "si", "yes")
+
+
+def _como_float(valor):
+    # pydantic convierte enteros a float en campos float (5 -> 5.0)
+    return float(valor) if isinstance(valor, int) and not isinstance(valor, bool) else valor
+
+
+def _como_enum(valor):
+    return valor.value if isinstance(valor, enum.Enum) else valor
+
+
+def _como_fecha(valor):
+    # Mismo formato que pydantic: isoformat, con "Z" para UTC
+    if not isinstance(valor, (date, datetime)):
+        return valor
+    texto = valor.isoformat()
+    return texto[:-6] + "Z" if texto.endswith("+00:00") else texto
+
+
+def _identidad(valor):
+    return valor
+
+
+def _conversion(anotacion) -> Optional[Callable]:
+    """Función de conversión para un tipo de campo, None si no aplica conversión, o ... si no se soporta."""
+    if get_origin(anotacion) in (Union, types.UnionType):
+        argumentos = [a for a in get_args(anotacion) if a is not type(None)]
+        return _conversion(argumentos[0]) if len(argumentos) == 1 else ...
+    if anotacion in (int, str, bool):
+        return None
+    if anotacion is float:
+        return _como_float
+    if anotacion in (datetime, date):
+        return _como_fecha
+    if isinstance(anotacion, type) and issubclass(anotacion, enum.Enum):
+        return _como_enum
+    return ...
+
+
+@lru_cache(maxsize=None)
+def compilar_serializador(
+    esquema: type[BaseModel], clase: Optional[type] = None, campos_fila: Optional[Tuple[str, ...]] = None
+) -> Optional[Callable[[Any], dict]]:
+    """
+    Devuelve una función objeto -> dict equivalente a validar con `esquema` y volcar en
+    modo JSON, o None si el esquema no se puede compilar.
+
+    Si `clase` es un modelo ORM, los valores se leen directamente del `__dict__` de cada
+    instancia (resolviendo los `synonym`), sin pasar por los descriptores de SQLAlchemy;
+    una fila con algún atributo sin cargar se lee con getattr, que lo carga como siempre.
+    Para filas `Row` (modo solo_lectura) se indica `campos_fila` (sus `_fields`) y los valores
+    se leen por posición.
+    """
+    decoradores = esquema.__pydantic_decorators__
+    if any(getattr(decoradores, f.name) for f in dataclasses.fields(decoradores)):
+        return None
+    nombres = []
+    conversiones = []
+    for nombre, campo in esquema.model_fields.items():
+        if campo.alias not in (None, nombre) or campo.serialization_alias not in (None, nombre):
+            return None
+        conversion = _conversion(campo.annotation)
+        if conversion is ...:
+            return None
+        nombres.append(nombre)
+        if conversion is not None:
+            conversiones.append((nombre, conversion))
+    if not nombres:
+        return None
+
+    if campos_fila is not None:
+        # Filas Row de solo_lectura: columnas etiquetadas con el nombre del atributo, leídas por posición
+        if not set(nombres) <= set(campos_fila):
+            return None
+        estado = _identidad
+        claves = [campos_fila.index(nombre) for nombre in nombres]
+    else:
+        estado = operator.attrgetter("__dict__")
+        mapper = sa_inspect(clase, raiseerr=False) if clase is not None else None
+        sinonimos = {s.key: s.name for s in mapper.synonyms} if mapper is not None else {}
+        claves = [sinonimos.get(nombre, nombre) for nombre in nombres]
+    # itemgetter con una sola clave devuelve el valor suelto en lugar de una tupla
+    leer = operator.itemgetter(*claves) if len(claves) > 1 else (lambda d: (d[claves[0]],))
+
+    def serializar(fila) -> dict:
+        try:
+            datos = dict(zip(nombres, leer(estado(fila))))
+        except (AttributeError, KeyError):
+            datos = {nombre: getattr(fila, nombre) for nombre in nombres}
+        for nombre, conversion in conversiones:
+            valor = datos[nombre]
+            if valor is not None:
+                datos[nombre] = conversion(valor)
+        return datos
+
+    return serializar
+
+
+def serializar_lista(esquema: type[BaseModel], filas: List[Any]) -> Optional[bytes]:
+    """Codifica las filas como JSONResponse lo haría tras validar; None si no es posible."""
+    if filas and isinstance(filas[0], Row):
+        serializar = compilar_serializador(esquema, Row, filas[0]._fields)
+    else:
+        serializar = compilar_serializador(esquema, type(filas[0]) if filas else None)
+    if serializar is None:
+        return None
+    try:
+        contenido = [serializar(fila) for fila in filas]
+    except AttributeError:
+        return None
+    return json.dumps(
+        contenido, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class RespuestaJSONRapida(JSONResponse):
+    """JSONResponse que recibe el cuerpo ya codificado (bytes) y lo envía tal cual."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return super().render(content)
+
+
+def respuesta_lista(esquema: type[BaseModel], filas: List[Any], response: Response):
+    """
+    Con JSON_RAPIDO devuelve una RespuestaJSONRapida con las cabeceras ya puestas en `response`
+    (Link, X-Next-Cursor...). Si no, o si el esquema no admite el camino rápido, devuelve las
+    filas para que FastAPI las procese con `response_model` como siempre.
+    """
+    if not JSON_RAPIDO:
+        return filas
+    cuerpo = serializar_lista(esquema, filas)
+    if cuerpo is None:
+        return filas
+    respuesta = RespuestaJSONRapida(cuerpo)
+    for nombre, valor in response.headers.items():
+        if nombre != "content-length":
+            respuesta.headers.append(nombre, valor)
+    return respuesta
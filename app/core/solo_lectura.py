@@ -0,0 +1,63 @@
+"""
+solo_lectura.py
+
+Este módulo implementa el modo de lectura con Core para los listados.
+
+Por defecto los listados cargan instancias ORM completas: cada fila se registra en el identity
+map de la sesión, con su estado de instrumentación, aunque la petición solo la lee para
+serializarla. Con LECTURA_CORE activo, los repositorios seleccionan las columnas del modelo
+(y sus `synonym`, con el nombre del atributo) y devuelven objetos `Row` de SQLAlchemy: tuplas
+con nombre, sin identity map ni seguimiento de cambios, que pydantic (`from_attributes`) y el
+camino rápido de serialización leen igual que las instancias.
+
+Solo se usa en listados de lectura: las filas devueltas no se pueden modificar ni guardar.
+
+Los listados con `?fields=` (app.core.proyeccion) usan siempre este modo, seleccionando solo
+las columnas pedidas más la clave primaria (que necesita el cursor de paginación).
+
+Componentes principales:
+- columnas_lectura: Columnas (etiquetadas por atributo) que reemplazan a la entidad en el SELECT.
+- consulta_listado: Query síncrona del listado (entidad o columnas según LECTURA_CORE o `campos`).
+- select_listado: Equivalente como Select para AsyncSession.
+
+Variables de entorno reconocidas:
+- LECTURA_CORE: "true" activa el modo Core en los listados (por defecto desactivado).
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Query, Session
+
+LECTURA_CORE = os.getenv("LECTURA_CORE", "false").lower() in ("1", "true", "si", "yes")
+
+
+@lru_cache(maxsize=256)
+def columnas_lectura(modelo: type, campos: Optional[Tuple[str, ...]] = None) -> Tuple:
+    """
+    Columnas mapeadas del modelo y sus sinónimos, cada una con el nombre de su atributo.
+    Con `campos`, solo esas y las de la clave primaria.
+    """
+    mapper = inspect(modelo)
+    columnas = [getattr(modelo, propiedad.key).label(propiedad.key) for propiedad in mapper.column_attrs]
+    columnas += [getattr(modelo, sinonimo.name).label(sinonimo.key) for sinonimo in mapper.synonyms]
+    if campos is not None:
+        clave = {mapper.get_property_by_column(columna).key for columna in mapper.primary_key}
+        columnas = [columna for columna in columnas if columna.key in clave or columna.key in campos]
+    return tuple(columnas)
+
+
+def consulta_listado(db: Session, modelo: type, campos: Optional[Tuple[str, ...]] = None) -> Query:
+    """Query base de un listado: filas `Row` con LECTURA_CORE o `campos`, instancias ORM si no."""
+    if LECTURA_CORE or campos:
+        return db.query(*columnas_lectura(modelo, campos or None))
+    return db.query(modelo)
+
+
+def select_listado(modelo: type, campos: Optional[Tuple[str, ...]] = None):
+    """Select base de un listado para AsyncSession (mismo criterio que consulta_listado)."""
+    if LECTURA_CORE or campos:
+        return select(*columnas_lectura(modelo, campos or None))
+    return select(modelo)
@@ -11,7 +11,7 @@ Atributos:
 - producto_id (int): Identificador del producto contado (relacionado con la tabla 'productos').
 - almacen_id (int): Identificador del almacén donde se realizó el conteo (relacionado con la tabla 'almacenes').
 - cantidad (float): Cantidad del producto contada en el almacén.
-- contado_por (str): Nombre de la persona que realizó el conteo.
+- contado_por (str): Nombre de la persona que realizó el conteo (expuesto también como 'responsable').
 - fecha_ultimo_conteo (datetime): Fecha y hora del último conteo (por defecto, la fecha y hora actual).
 
 Relaciones:
@@ -23,14 +23,17 @@ de productos en los diferentes almacenes.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Index
+from sqlalchemy.orm import relationship, synonym
 from app.core.config import Base
 
 
 # Modelo de Conteo de Inventario (ConteoInventario)
 class ConteoInventario(Base):
     __tablename__ = "conteos_inventario"
+    __table_args__ = (
+        Index("ix_conteos_inventario_producto_almacen", "producto_id", "almacen_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     producto_id = Column(Integer, ForeignKey("productos.id"), nullable=False)
@@ -39,6 +42,9 @@ class ConteoInventario(Base):
     contado_por = Column(String, nullable=False)
     fecha_ultimo_conteo = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Alias usado por los esquemas (responsable <-> contado_por)
+    responsable = synonym("contado_por")
+
     # Relación con producto y Almacen
-    producto = relationship("producto")
+    producto = relationship("Producto")
     almacen = relationship("Almacen", back_populates="conteos_inventario")
\ No newline at end of file
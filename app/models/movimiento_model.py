@@ -22,7 +22,7 @@ Este modelo permite rastrear los movimientos de inventario, tanto de entrada com
 el control de stock y el historial de transacciones de productos.
 """
 
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from app.core.config import Base
 from sqlalchemy.sql import func
@@ -31,6 +31,13 @@ from sqlalchemy.sql import func
 # Modelo de Movimiento de Inventario (MovimientoInventario)
 class MovimientoInventario(Base):
     __tablename__ = "movimientos_inventario"
+    __table_args__ = (
+        Index("ix_movimientos_inventario_producto_fecha", "producto_id", "fecha"),
+        Index("ix_movimientos_inventario_fecha", "fecha"),
+        # Segunda barrera contra reintentos duplicados (ver app.core.idempotencia)
+        Index("ux_movimientos_inventario_producto_referencia", "producto_id", "numero_referencia", unique=True,
+              sqlite_where=text("numero_referencia IS NOT NULL AND numero_referencia <> ''")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     producto_id = Column(Integer, ForeignKey("productos.id"), nullable=False)
@@ -41,4 +48,4 @@ class MovimientoInventario(Base):
     fecha = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relación con producto
-    producto = relationship("producto", back_populates="movimientos_inventario")
+    producto = relationship("Producto", back_populates="movimientos_inventario")
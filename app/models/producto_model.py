@@ -27,7 +27,7 @@ Este modelo permite gestionar los datos de los productos en el inventario, inclu
 estado de perecibilidad, proveedores asociados y movimientos de stock.
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from app.core.config import Base
 from app.models.categoria_model import TipoPerecibleEnum
@@ -36,6 +36,9 @@ from app.models.categoria_model import TipoPerecibleEnum
 # Modelo de Product
 class Producto(Base):
     __tablename__ = "productos"
+    __table_args__ = (
+        Index("ix_productos_categoria_activo_tipo", "categoria_id", "activo", "tipo_perecible"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     nombre = Column(String, nullable=False)
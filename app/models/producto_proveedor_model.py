@@ -13,7 +13,7 @@ Atributos:
 - producto_id (int): Identificador del producto asociado (relacionado con la tabla 'productos').
 - precio (float, opcional): Precio del producto ofrecido por el proveedor.
 - cantidad_minima_orden (int, opcional): Cantidad mínima requerida para realizar un pedido al proveedor.
-- dias_entrega (int, opcional): Tiempo de entrega estimado en días.
+- dias_entrega (int, opcional): Tiempo de entrega estimado en días (expuesto también como 'tiempo_entrega_dias').
 
 Relaciones:
 - proveedor: Relación con el modelo Proveedor para acceder a la información del proveedor asociado.
@@ -23,12 +23,15 @@ Este modelo permite gestionar la información sobre los proveedores de cada prod
 incluyendo precios, mínimos de pedido y tiempos de entrega, lo que facilita la administración de inventarios.
 """
 
-from sqlalchemy import Column, Integer, Float, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, Float, ForeignKey, Index
+from sqlalchemy.orm import relationship, synonym
 from app.core.config import Base
 
 class ProveedorProducto(Base):
     __tablename__ = "proveedor_productos"
+    __table_args__ = (
+        Index("ix_proveedor_productos_producto_proveedor", "producto_id", "proveedor_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     proveedor_id = Column(Integer, ForeignKey("proveedores.id"), nullable=False)
@@ -37,5 +40,8 @@ class ProveedorProducto(Base):
     cantidad_minima_orden = Column(Integer, nullable=True)
     dias_entrega = Column(Integer, nullable=True)
 
+    # Alias usado por los esquemas (tiempo_entrega_dias <-> dias_entrega)
+    tiempo_entrega_dias = synonym("dias_entrega")
+
     proveedor = relationship("Proveedor", back_populates="productos")
     producto = relationship("Producto", back_populates="proveedores")
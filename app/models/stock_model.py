@@ -0,0 +1,48 @@
+"""
+stock_model.py
+
+Este módulo define el modelo de datos para el stock actual materializado de cada producto.
+
+Modelo:
+- StockActual: Existencia vigente de un producto (y almacén, cuando se conoce), mantenida
+  incrementalmente por cada movimiento de inventario.
+
+Atributos:
+- id (int): Identificador único del registro de stock.
+- producto_id (int): Identificador del producto (relacionado con la tabla 'productos').
+- almacen_id (int, opcional): Identificador del almacén (relacionado con la tabla 'almacenes').
+  Es nulo para el stock global del producto, que es el que mantienen los movimientos.
+  Hay un único registro por (producto_id, almacen_id), nulo incluido.
+- cantidad (float): Existencia actual (suma con signo de los movimientos).
+- actualizado_en (datetime): Fecha y hora de la última actualización.
+
+Relaciones:
+- producto: Relación con el modelo Producto.
+
+Este modelo evita sumar todo el historial de MovimientoInventario para conocer el stock de un producto.
+Puede reconstruirse y verificarse contra el historial con `python -m app.utils.reconstruir_stock`.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime, Index, text
+from sqlalchemy.orm import relationship
+from app.core.config import Base
+
+
+# Modelo de Stock Actual (StockActual)
+class StockActual(Base):
+    __tablename__ = "stock_actual"
+    __table_args__ = (
+        # Un registro por producto y almacén; IFNULL porque SQLite trata cada NULL como distinto
+        # y el stock global (almacen_id nulo) también debe ser único (migración 5)
+        Index("ux_stock_actual_producto_almacen", "producto_id", text("IFNULL(almacen_id, 0)"), unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    producto_id = Column(Integer, ForeignKey("productos.id"), nullable=False)
+    almacen_id = Column(Integer, ForeignKey("almacenes.id"), nullable=True)
+    cantidad = Column(Float, nullable=False, default=0)
+    actualizado_en = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relación con producto
+    producto = relationship("Producto")
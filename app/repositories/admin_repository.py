@@ -0,0 +1,14 @@
+"""
+Repositorio Admin:
+Consultas de diagnóstico sobre la conexión activa a la base de datos.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+def leer_pragmas(db: Session, nombres) -> dict:
+    """
+    Lee el valor efectivo de cada PRAGMA en la conexión de la sesión.
+    """
+    return {nombre: db.execute(text(f"PRAGMA {nombre}")).scalar() for nombre in nombres}
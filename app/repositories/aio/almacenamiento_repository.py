@@ -0,0 +1,59 @@
+"""
+Este módulo gestiona las operaciones asíncronas de base de datos para los almacenes.
+
+Define AlmacenamientoRepository, equivalente con AsyncSession del repositorio síncrono.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.almacen_model import Almacen
+from app.core.lotes import obtener_lote_async
+from app.core.paginacion import paginar_async
+from app.core.retorno import actualizar_fila_async, eliminar_fila_async
+
+
+class AlmacenamientoRepository:
+    """
+    Repositorio asíncrono para operaciones de base de datos sobre almacenes.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Constructor del repositorio de almacenes.
+
+        Args:
+            db (AsyncSession): Sesión asíncrona de base de datos inyectada.
+        """
+        self.db = db
+
+    async def obtener_todos(self, skip: int = 0, limit: int = 100, cursor: str = None):
+        """Obtener una página de almacenes (cursor por id)."""
+        return await paginar_async(self.db, select(Almacen), [Almacen.id], cursor, skip, limit)
+
+    async def obtener_por_id(self, storage_id: int):
+        """Obtener un almacén por su ID."""
+        return await self.db.get(Almacen, storage_id)
+
+    async def obtener_por_ids(self, ids: list):
+        """Obtener los almacenes de una lista de ids, en el orden pedido."""
+        return await obtener_lote_async(self.db, select(Almacen), Almacen.id, ids)
+
+    async def crear(self, almacen):
+        """Crear un nuevo almacén."""
+        db_storage = Almacen(**almacen.model_dump())
+        self.db.add(db_storage)
+        await self.db.commit()
+        await self.db.refresh(db_storage)
+        return db_storage
+
+    async def actualizar(self, storage_id: int, valores: dict):
+        """Actualizar un almacén con un UPDATE ... RETURNING (None si no existe)."""
+        almacen = await actualizar_fila_async(self.db, Almacen, storage_id, valores)
+        await self.db.commit()
+        return almacen
+
+    async def eliminar(self, storage_id: int):
+        """Eliminar un almacén con un DELETE ... RETURNING (None si no existe)."""
+        almacen = await eliminar_fila_async(self.db, Almacen, storage_id)
+        await self.db.commit()
+        return almacen
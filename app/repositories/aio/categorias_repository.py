@@ -0,0 +1,57 @@
+"""
+Este módulo gestiona las operaciones asíncronas de base de datos para las categorías.
+
+Define CategoriaRepository, equivalente con AsyncSession del repositorio síncrono.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.categoria_model import Categoria
+from app.core.lotes import obtener_lote_async
+from app.core.paginacion import paginar_async
+from app.core.retorno import actualizar_fila_async, eliminar_fila_async
+
+
+class CategoriaRepository:
+    """
+    Repositorio asíncrono para operaciones de base de datos sobre categorías.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """Constructor del repositorio de categorías."""
+        self.db = db
+
+    async def obtener_todas(self, skip=0, limit=100, tipo=None, cursor=None):
+        """Obtener una página de categorías con filtro opcional por tipo (cursor por id)."""
+        query = select(Categoria)
+        if tipo:
+            query = query.where(Categoria.tipo == tipo)
+        return await paginar_async(self.db, query, [Categoria.id], cursor, skip, limit)
+
+    async def obtener_por_id(self, categoria_id: int):
+        """Obtener una categoría por su ID."""
+        return await self.db.get(Categoria, categoria_id)
+
+    async def obtener_por_ids(self, ids: list):
+        """Obtener las categorías de una lista de ids, en el orden pedido."""
+        return await obtener_lote_async(self.db, select(Categoria), Categoria.id, ids)
+
+    async def crear(self, categoria):
+        """Crear una nueva categoría."""
+        db_categoria = Categoria(**categoria.model_dump())
+        self.db.add(db_categoria)
+        await self.db.commit()
+        await self.db.refresh(db_categoria)
+        return db_categoria
+
+    async def actualizar(self, categoria_id: int, valores: dict):
+        """Actualizar una categoría con un UPDATE ... RETURNING (None si no existe)."""
+        categoria = await actualizar_fila_async(self.db, Categoria, categoria_id, valores)
+        await self.db.commit()
+        return categoria
+
+    async def eliminar(self, categoria_id: int):
+        """Eliminar una categoría con un DELETE ... RETURNING (None si no existe)."""
+        categoria = await eliminar_fila_async(self.db, Categoria, categoria_id)
+        await self.db.commit()
+        return categoria
@@ -0,0 +1,47 @@
+"""
+Versión asíncrona (AsyncSession) de las consultas de conteos de inventario.
+
+Incluye funciones para:
+- Obtener todos los conteos.
+- Obtener un conteo por ID.
+- Crear un conteo.
+- Actualizar un conteo.
+- Eliminar un conteo.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.conteo_model import ConteoInventario
+from app.core.paginacion import paginar_async
+from app.core.solo_lectura import select_listado
+
+
+async def get_conteos(db: AsyncSession, skip: int, limit: int, cursor: str = None, campos: tuple = None):
+    """ Obtener una página de conteos de inventario (cursor por id; con `campos`, solo esas columnas) """
+    return await paginar_async(db, select_listado(ConteoInventario, campos), [ConteoInventario.id], cursor, skip, limit)
+
+
+async def get_conteo_by_id(db: AsyncSession, count_id: int):
+    """ Obtener un conteo de inventario por su ID """
+    return await db.get(ConteoInventario, count_id)
+
+
+async def create_conteo(db: AsyncSession, conteo):
+    """ Crear un nuevo conteo de inventario """
+    db.add(conteo)
+    await db.commit()
+    await db.refresh(conteo)
+    return conteo
+
+
+async def update_conteo(db: AsyncSession, conteo):
+    """ Actualizar un conteo de inventario """
+    await db.commit()
+    await db.refresh(conteo)
+    return conteo
+
+
+async def delete_conteo(db: AsyncSession, conteo):
+    """ Eliminar un conteo de inventario """
+    await db.delete(conteo)
+    await db.commit()
+    return {"mensaje": "Conteo de inventario eliminado exitosamente"}
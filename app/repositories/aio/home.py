@@ -0,0 +1,15 @@
+"""
+Versión asíncrona de las consultas de estadísticas de la página de inicio.
+
+Incluye funciones para:
+- Obtener los totales de productos, proveedores, almacenes e inventario en una sola consulta.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.home import consulta_totales
+
+
+async def get_totales(db: AsyncSession) -> dict:
+    """Obtener los totales de productos, proveedores, almacenes e inventario en una sola consulta."""
+    fila = (await db.execute(consulta_totales())).one()
+    return dict(fila._mapping)
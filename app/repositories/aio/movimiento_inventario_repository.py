@@ -0,0 +1,50 @@
+"""
+Repositorio MovimientoInventario (asíncrono):
+Equivalente con AsyncSession del repositorio síncrono de movimientos de inventario.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.movimiento_model import MovimientoInventario
+from app.core.paginacion import paginar_async
+from app.core.solo_lectura import select_listado
+
+async def obtener_movimientos_inventario(skip: int, limit: int, db: AsyncSession, cursor: str = None, campos: tuple = None):
+    """
+    Obtiene una página de movimientos de inventario (cursor por id, creciente con la fecha de alta).
+    Con `campos` solo se seleccionan esas columnas.
+    """
+    consulta = select_listado(MovimientoInventario, campos)
+    return await paginar_async(db, consulta, [MovimientoInventario.id], cursor, skip, limit)
+
+async def obtener_movimiento_por_id(movement_id: int, db: AsyncSession):
+    """
+    Obtiene un movimiento de inventario por su ID.
+    """
+    return await db.get(MovimientoInventario, movement_id)
+
+async def crear_movimiento(movimiento: MovimientoInventario, db: AsyncSession):
+    """
+    Crea un nuevo movimiento de inventario.
+    """
+    db.add(movimiento)
+    await db.commit()
+    await db.refresh(movimiento)
+    return movimiento
+
+async def actualizar_movimiento(db: AsyncSession, movimiento_existente: MovimientoInventario, datos_actualizados: dict):
+    """
+    Actualiza un movimiento de inventario existente con los datos proporcionados.
+    """
+    for key, value in datos_actualizados.items():
+        setattr(movimiento_existente, key, value)
+
+    await db.commit()
+    await db.refresh(movimiento_existente)
+    return movimiento_existente
+
+async def eliminar_movimiento(movimiento: MovimientoInventario, db: AsyncSession):
+    """
+    Elimina un movimiento de inventario existente.
+    """
+    await db.delete(movimiento)
+    await db.commit()
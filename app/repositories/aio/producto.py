@@ -0,0 +1,96 @@
+"""
+Versión asíncrona (AsyncSession) del repositorio de productos.
+
+Incluye funciones para:
+- Obtener productos con filtros.
+- Obtener un producto por ID.
+- Crear un nuevo producto.
+- Actualizar un producto existente.
+- Eliminar un producto.
+- Buscar productos por texto (FTS5).
+
+Las altas, cambios y bajas confirmadas actualizan el índice de autocompletado en memoria.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.producto_model import Producto
+from app.core.autocompletado import indice_productos
+from app.core.busqueda import consulta_fts, filtrar_busqueda
+from app.core.inclusion import opciones_carga
+from app.core.lotes import obtener_lote_async
+from app.core.paginacion import leer_filas_async, paginar_async
+from app.core.retorno import actualizar_fila_async, eliminar_fila_async
+from app.core.solo_lectura import select_listado
+
+async def get_productos(db: AsyncSession, skip: int, limit: int, categoria_id: int, tipo_perecedero, activo: bool,
+                        cursor: str = None, incluir: tuple = (), campos: tuple = None):
+    """
+    Obtiene una lista de productos aplicando filtros opcionales (y las relaciones de `incluir`
+    o solo las columnas de `campos`).
+    """
+    query = select(Producto).options(*opciones_carga(Producto, incluir)) if incluir else select_listado(Producto, campos)
+    if categoria_id:
+        query = query.where(Producto.categoria_id == categoria_id)
+    if tipo_perecedero:
+        query = query.where(Producto.tipo_perecible == tipo_perecedero)
+    if activo is not None:
+        query = query.where(Producto.activo == activo)
+    return await paginar_async(db, query, [Producto.id], cursor, skip, limit)
+
+async def buscar_productos(db: AsyncSession, texto: str, limit: int, activo: bool = None):
+    """
+    Busca productos por nombre o descripción (prefijos, sin tildes), ordenados por relevancia.
+    """
+    expresion = consulta_fts(texto)
+    if expresion is None:
+        return []
+    query = filtrar_busqueda(select_listado(Producto), Producto, expresion)
+    if activo is not None:
+        query = query.where(Producto.activo == activo)
+    return await leer_filas_async(db, query.limit(limit))
+
+async def get_producto_by_id(db: AsyncSession, producto_id: int, incluir: tuple = ()):
+    """
+    Obtiene un producto específico por su ID (con las relaciones de `incluir`).
+    """
+    return await db.get(Producto, producto_id, options=opciones_carga(Producto, incluir))
+
+async def get_productos_by_ids(db: AsyncSession, ids: list):
+    """
+    Obtiene los productos de una lista de ids (consultas IN por trozos), en el orden pedido.
+    """
+    return await obtener_lote_async(db, select_listado(Producto), Producto.id, ids)
+
+async def create_producto(db: AsyncSession, producto_data):
+    """
+    Crea un nuevo producto en la base de datos.
+    """
+    db_producto = Producto(**producto_data.dict())
+    db.add(db_producto)
+    await db.commit()
+    await db.refresh(db_producto)
+    indice_productos.actualizar(db_producto.id, db_producto.nombre, db_producto.activo)
+    return db_producto
+
+async def update_producto(db: AsyncSession, producto_id: int, producto_data, parcial: bool = False):
+    """
+    Actualiza un producto existente con un único UPDATE ... RETURNING (con `parcial`, solo
+    los campos enviados). Devuelve la fila actualizada o None si no existe.
+    """
+    fila = await actualizar_fila_async(db, Producto, producto_id, producto_data.dict(exclude_unset=parcial))
+    await db.commit()
+    if fila is not None:
+        indice_productos.actualizar(fila.id, fila.nombre, fila.activo)
+    return fila
+
+async def delete_producto(db: AsyncSession, producto_id: int):
+    """
+    Elimina un producto con un único DELETE ... RETURNING (409 si tiene registros asociados).
+    """
+    fila = await eliminar_fila_async(db, Producto, producto_id)
+    if fila is None:
+        return None
+    await db.commit()
+    indice_productos.eliminar(producto_id)
+    return True
@@ -0,0 +1,39 @@
+"""
+Repositorio ProductoProveedor (asíncrono):
+Equivalente con AsyncSession del repositorio síncrono de productos de proveedor.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.producto_proveedor_model import ProveedorProducto
+from app.core.inclusion import opciones_carga
+from app.core.lotes import obtener_lote_async
+from app.core.paginacion import paginar_async
+
+async def obtener_productos_proveedor(skip: int, limit: int, db: AsyncSession, cursor: str = None, incluir: tuple = ()):
+    consulta = select(ProveedorProducto).options(*opciones_carga(ProveedorProducto, incluir))
+    return await paginar_async(db, consulta, [ProveedorProducto.id], cursor, skip, limit)
+
+async def obtener_productos_proveedor_por_ids(ids: list, db: AsyncSession):
+    return await obtener_lote_async(db, select(ProveedorProducto), ProveedorProducto.id, ids)
+
+async def obtener_producto_proveedor_por_id(producto_proveedor_id: int, db: AsyncSession, incluir: tuple = ()):
+    return await db.get(ProveedorProducto, producto_proveedor_id, options=opciones_carga(ProveedorProducto, incluir))
+
+async def crear_producto_proveedor(producto_proveedor: ProveedorProducto, db: AsyncSession):
+    db.add(producto_proveedor)
+    await db.commit()
+    await db.refresh(producto_proveedor)
+    return producto_proveedor
+
+async def actualizar_producto_proveedor(db: AsyncSession, producto_proveedor_existente: ProveedorProducto, datos_actualizados: dict):
+    for key, value in datos_actualizados.items():
+        setattr(producto_proveedor_existente, key, value)
+
+    await db.commit()
+    await db.refresh(producto_proveedor_existente)
+    return producto_proveedor_existente
+
+async def eliminar_producto_proveedor(producto_proveedor: ProveedorProducto, db: AsyncSession):
+    await db.delete(producto_proveedor)
+    await db.commit()
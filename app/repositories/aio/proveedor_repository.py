@@ -0,0 +1,67 @@
+"""
+Repositorio Proveedor (asíncrono):
+Equivalente con AsyncSession del repositorio síncrono de proveedores.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.proveedor_model import Proveedor as ProveedorModel
+from app.core.busqueda import consulta_fts, filtrar_busqueda
+from app.core.lotes import obtener_lote_async
+from app.core.paginacion import paginar_async
+from app.core.retorno import actualizar_fila_async, eliminar_fila_async
+
+async def obtener_proveedores(skip: int, limit: int, db: AsyncSession, cursor: str = None):
+    """
+    Obtiene una página de proveedores (cursor por id).
+    """
+    return await paginar_async(db, select(ProveedorModel), [ProveedorModel.id], cursor, skip, limit)
+
+async def buscar_proveedores(texto: str, limit: int, db: AsyncSession):
+    """
+    Busca proveedores por nombre o persona de contacto, ordenados por relevancia.
+    """
+    expresion = consulta_fts(texto)
+    if expresion is None:
+        return []
+    consulta = filtrar_busqueda(select(ProveedorModel), ProveedorModel, expresion).limit(limit)
+    return (await db.execute(consulta)).scalars().all()
+
+async def obtener_proveedor_por_id(proveedor_id: int, db: AsyncSession):
+    """
+    Obtiene un proveedor por su ID.
+    """
+    return await db.get(ProveedorModel, proveedor_id)
+
+async def obtener_proveedores_por_ids(ids: list, db: AsyncSession):
+    """
+    Obtiene los proveedores de una lista de ids, en el orden pedido.
+    """
+    return await obtener_lote_async(db, select(ProveedorModel), ProveedorModel.id, ids)
+
+async def crear_proveedor(nuevo_proveedor: ProveedorModel, db: AsyncSession):
+    """
+    Crea un nuevo proveedor.
+    """
+    db.add(nuevo_proveedor)
+    await db.commit()
+    await db.refresh(nuevo_proveedor)
+    return nuevo_proveedor
+
+async def actualizar_proveedor(db: AsyncSession, proveedor_id: int, datos_actualizados: dict):
+    """
+    Actualiza un proveedor con un único UPDATE ... RETURNING de los datos proporcionados.
+    Devuelve la fila actualizada o None si no existe.
+    """
+    fila = await actualizar_fila_async(db, ProveedorModel, proveedor_id, datos_actualizados)
+    await db.commit()
+    return fila
+
+async def eliminar_proveedor(proveedor_id: int, db: AsyncSession):
+    """
+    Elimina un proveedor con un único DELETE ... RETURNING (409 si tiene registros asociados).
+    Devuelve la fila eliminada o None si no existe.
+    """
+    fila = await eliminar_fila_async(db, ProveedorModel, proveedor_id)
+    await db.commit()
+    return fila
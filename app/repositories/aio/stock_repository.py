@@ -0,0 +1,17 @@
+"""
+Repositorio StockActual (asíncrono):
+Equivalente con AsyncSession de los ajustes incrementales de stock_actual.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.stock_repository import sentencia_ajuste
+
+
+async def ajustar_stock(db: AsyncSession, producto_id: int, delta: float, almacen_id: int = None):
+    """
+    Suma `delta` al stock del producto, creando el registro si no existe, en una sola
+    sentencia. No hace commit.
+    """
+    if not delta:
+        return
+    await db.execute(sentencia_ajuste(producto_id, delta, almacen_id))
@@ -0,0 +1,49 @@
+"""
+Repositorio Usuario (asíncrono):
+Equivalente con AsyncSession del repositorio síncrono de usuarios.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user_model import UserModel
+from app.core.retorno import actualizar_fila_async, eliminar_fila_async
+
+async def obtener_usuario_por_username(username: str, db: AsyncSession):
+    """
+    Obtiene un usuario por su nombre de usuario.
+    """
+    result = await db.execute(select(UserModel).where(UserModel.username == username))
+    return result.scalars().first()
+
+async def obtener_usuario_por_id(user_id: int, db: AsyncSession):
+    """
+    Obtiene un usuario por su ID.
+    """
+    return await db.get(UserModel, user_id)
+
+async def crear_usuario(nuevo_usuario: UserModel, db: AsyncSession):
+    """
+    Crea un nuevo usuario.
+    """
+    db.add(nuevo_usuario)
+    await db.commit()
+    await db.refresh(nuevo_usuario)
+    return nuevo_usuario
+
+async def actualizar_usuario(db: AsyncSession, user_id: int, datos_actualizados: dict):
+    """
+    Actualiza un usuario con un único UPDATE ... RETURNING de los datos proporcionados.
+    Devuelve la fila actualizada o None si no existe.
+    """
+    fila = await actualizar_fila_async(db, UserModel, user_id, datos_actualizados)
+    await db.commit()
+    return fila
+
+async def eliminar_usuario(user_id: int, db: AsyncSession):
+    """
+    Elimina un usuario con un único DELETE ... RETURNING.
+    Devuelve la fila eliminada o None si no existe.
+    """
+    fila = await eliminar_fila_async(db, UserModel, user_id)
+    await db.commit()
+    return fila
@@ -7,6 +7,9 @@ con la base de datos para realizar operaciones CRUD sobre el modelo Almacen.
 
 from sqlalchemy.orm import Session
 from app.models.almacen_model import Almacen
+from app.core.lotes import obtener_lote
+from app.core.paginacion import paginar
+from app.core.retorno import actualizar_fila, eliminar_fila
 
 
 class AlmacenamientoRepository:
@@ -23,14 +26,18 @@ class AlmacenamientoRepository:
         """
         self.db = db
 
-    def obtener_todos(self, skip: int = 0, limit: int = 100):
-        """Obtener todos los almacenes."""
-        return self.db.query(Almacen).offset(skip).limit(limit).all()
+    def obtener_todos(self, skip: int = 0, limit: int = 100, cursor: str = None):
+        """Obtener una página de almacenes (cursor por id)."""
+        return paginar(self.db.query(Almacen), [Almacen.id], cursor, skip, limit)
 
     def obtener_por_id(self, storage_id: int):
         """Obtener un almacén por su ID."""
         return self.db.query(Almacen).filter(Almacen.id == storage_id).first()
 
+    def obtener_por_ids(self, ids: list):
+        """Obtener los almacenes de una lista de ids, en el orden pedido."""
+        return obtener_lote(self.db.query(Almacen), Almacen.id, ids)
+
     def crear(self, almacen):
         """Crear un nuevo almacén."""
         db_storage = Almacen(**almacen.model_dump())
@@ -39,13 +46,14 @@ class AlmacenamientoRepository:
         self.db.refresh(db_storage)
         return db_storage
 
-    def actualizar(self, almacen):
-        """Actualizar un almacén existente."""
+    def actualizar(self, storage_id: int, valores: dict):
+        """Actualizar un almacén con un UPDATE ... RETURNING (None si no existe)."""
+        almacen = actualizar_fila(self.db, Almacen, storage_id, valores)
         self.db.commit()
-        self.db.refresh(almacen)
         return almacen
 
-    def eliminar(self, almacen):
-        """Eliminar un almacén por su ID."""
-        self.db.delete(almacen)
+    def eliminar(self, storage_id: int):
+        """Eliminar un almacén con un DELETE ... RETURNING (None si no existe)."""
+        almacen = eliminar_fila(self.db, Almacen, storage_id)
         self.db.commit()
+        return almacen
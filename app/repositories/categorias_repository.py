@@ -7,6 +7,9 @@ con la base de datos para realizar operaciones CRUD sobre el modelo Categoria.
 
 from sqlalchemy.orm import Session
 from app.models.categoria_model import Categoria
+from app.core.lotes import obtener_lote
+from app.core.paginacion import paginar
+from app.core.retorno import actualizar_fila, eliminar_fila
 
 
 class CategoriaRepository:
@@ -18,17 +21,21 @@ class CategoriaRepository:
         """Constructor del repositorio de categorías."""
         self.db = db
 
-    def obtener_todas(self, skip=0, limit=100, tipo=None):
-        """Obtener todas las categorías con filtro opcional por tipo."""
+    def obtener_todas(self, skip=0, limit=100, tipo=None, cursor=None):
+        """Obtener una página de categorías con filtro opcional por tipo (cursor por id)."""
         query = self.db.query(Categoria)
         if tipo:
             query = query.filter(Categoria.tipo == tipo)
-        return query.offset(skip).limit(limit).all()
+        return paginar(query, [Categoria.id], cursor, skip, limit)
 
     def obtener_por_id(self, categoria_id: int):
         """Obtener una categoría por su ID."""
         return self.db.query(Categoria).filter(Categoria.id == categoria_id).first()
 
+    def obtener_por_ids(self, ids: list):
+        """Obtener las categorías de una lista de ids, en el orden pedido."""
+        return obtener_lote(self.db.query(Categoria), Categoria.id, ids)
+
     def crear(self, categoria):
         """Crear una nueva categoría."""
         db_categoria = Categoria(**categoria.model_dump())
@@ -37,13 +44,14 @@ class CategoriaRepository:
         self.db.refresh(db_categoria)
         return db_categoria
 
-    def actualizar(self, categoria):
-        """Actualizar una categoría existente."""
+    def actualizar(self, categoria_id: int, valores: dict):
+        """Actualizar una categoría con un UPDATE ... RETURNING (None si no existe)."""
+        categoria = actualizar_fila(self.db, Categoria, categoria_id, valores)
         self.db.commit()
-        self.db.refresh(categoria)
         return categoria
 
-    def eliminar(self, categoria):
-        """Eliminar una categoría por su ID."""
-        self.db.delete(categoria)
+    def eliminar(self, categoria_id: int):
+        """Eliminar una categoría con un DELETE ... RETURNING (None si no existe)."""
+        categoria = eliminar_fila(self.db, Categoria, categoria_id)
         self.db.commit()
+        return categoria
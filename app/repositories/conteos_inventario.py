@@ -9,13 +9,16 @@ Incluye funciones para:
 - Eliminar un conteo.
 """
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.models.conteo_model import ConteoInventario
+from app.core.paginacion import paginar
+from app.core.solo_lectura import columnas_lectura, consulta_listado
 
 
-def get_conteos(db: Session, skip: int, limit: int):
-    """ Obtener todos los conteos de inventario """
-    return db.query(ConteoInventario).offset(skip).limit(limit).all()
+def get_conteos(db: Session, skip: int, limit: int, cursor: str = None, campos: tuple = None):
+    """ Obtener una página de conteos de inventario (cursor por id; con `campos`, solo esas columnas) """
+    return paginar(consulta_listado(db, ConteoInventario, campos), [ConteoInventario.id], cursor, skip, limit)
 
 
 def get_conteo_by_id(db: Session, count_id: int):
@@ -31,6 +34,14 @@ def create_conteo(db: Session, conteo):
     return conteo
 
 
+def add_conteo(db: Session, conteo):
+    """ Agregar un conteo de inventario sin commit (lo confirma el escritor agrupado) """
+    db.add(conteo)
+    db.flush()
+    db.refresh(conteo)
+    return conteo
+
+
 def update_conteo(db: Session, conteo):
     """ Actualizar un conteo de inventario """
     db.commit()
@@ -43,3 +54,17 @@ def delete_conteo(db: Session, conteo):
     db.delete(conteo)
     db.commit()
     return {"mensaje": "Conteo de inventario eliminado exitosamente"}
+
+
+def consulta_exportacion(producto_id: int = None, almacen_id: int = None, desde=None, hasta=None):
+    """ Select de columnas (sin ORM) para exportar conteos, ordenado por id; fechas: desde inclusive, hasta exclusive """
+    consulta = select(*columnas_lectura(ConteoInventario)).order_by(ConteoInventario.id)
+    if producto_id is not None:
+        consulta = consulta.where(ConteoInventario.producto_id == producto_id)
+    if almacen_id is not None:
+        consulta = consulta.where(ConteoInventario.almacen_id == almacen_id)
+    if desde is not None:
+        consulta = consulta.where(ConteoInventario.fecha_ultimo_conteo >= desde)
+    if hasta is not None:
+        consulta = consulta.where(ConteoInventario.fecha_ultimo_conteo < hasta)
+    return consulta
@@ -2,12 +2,10 @@
 Este módulo gestiona las consultas a la base de datos para obtener estadísticas de la página de inicio.
 
 Incluye funciones para:
-- Obtener el conteo de productos.
-- Obtener el conteo de proveedores.
-- Obtener el conteo de almacenes.
-- Obtener el conteo de registros de inventario.
+- Obtener los totales de productos, proveedores, almacenes e inventario en una sola consulta.
 """
 
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 from app.models.producto_model import Producto
 from app.models.proveedor_model import Proveedor
@@ -15,50 +13,29 @@ from app.models.almacen_model import Almacen
 from app.models.conteo_model import ConteoInventario
 
 
-def get_count_productos(db: Session) -> int:
-    """
-    Obtener el total de productos registrados.
-    
-    Parámetros:
-    - db (Session): Sesión de base de datos.
-    
-    Retorna:
-    - int: Total de productos.
-    """
-    return db.query(Producto).count()
+def _contar(modelo):
+    return select(func.count()).select_from(modelo).scalar_subquery()
 
-def get_count_proveedores(db: Session) -> int:
-    """
-    Obtener el total de proveedores registrados.
-    
-    Parámetros:
-    - db (Session): Sesión de base de datos.
-    
-    Retorna:
-    - int: Total de proveedores.
-    """
-    return db.query(Proveedor).count()
 
-def get_count_almacenes(db: Session) -> int:
-    """
-    Obtener el total de almacenes registrados.
-    
-    Parámetros:
-    - db (Session): Sesión de base de datos.
-    
-    Retorna:
-    - int: Total de almacenes.
-    """
-    return db.query(Almacen).count()
+def consulta_totales():
+    """SELECT con los cuatro totales como subconsultas escalares (lo ejecutan get_totales y su versión asíncrona)."""
+    return select(
+        _contar(Producto).label("productos"),
+        _contar(Proveedor).label("proveedores"),
+        _contar(Almacen).label("almacenes"),
+        _contar(ConteoInventario).label("inventario"),
+    )
+
 
-def get_count_inventario(db: Session) -> int:
+def get_totales(db: Session) -> dict:
     """
-    Obtener el total de registros en inventario.
-    
+    Obtener los totales de productos, proveedores, almacenes e inventario en una sola consulta.
+
     Parámetros:
     - db (Session): Sesión de base de datos.
-    
+
     Retorna:
-    - int: Total de registros de inventario.
+    - dict: Totales con las claves de HomeInfo.
     """
-    return db.query(ConteoInventario).count()
+    fila = db.execute(consulta_totales()).one()
+    return dict(fila._mapping)
@@ -4,14 +4,19 @@ Encapsula la lógica de acceso a datos para los movimientos de inventario,
 facilitando las operaciones CRUD con la base de datos.
 """
 
+from sqlalchemy import select, insert
 from sqlalchemy.orm import Session
 from app.models.movimiento_model import MovimientoInventario
+from app.models.producto_model import Producto
+from app.core.paginacion import paginar
+from app.core.solo_lectura import columnas_lectura, consulta_listado
 
-def obtener_movimientos_inventario(skip: int, limit: int, db: Session):
+def obtener_movimientos_inventario(skip: int, limit: int, db: Session, cursor: str = None, campos: tuple = None):
     """
-    Obtiene una lista de movimientos de inventario con paginación.
+    Obtiene una página de movimientos de inventario (cursor por id, creciente con la fecha de alta).
+    Con `campos` solo se seleccionan esas columnas.
     """
-    return db.query(MovimientoInventario).offset(skip).limit(limit).all()
+    return paginar(consulta_listado(db, MovimientoInventario, campos), [MovimientoInventario.id], cursor, skip, limit)
 
 def obtener_movimiento_por_id(movement_id: int, db: Session):
     """
@@ -28,11 +33,20 @@ def crear_movimiento(movimiento: MovimientoInventario, db: Session):
     db.refresh(movimiento)
     return movimiento
 
+def agregar_movimiento(movimiento: MovimientoInventario, db: Session):
+    """
+    Agrega un movimiento de inventario sin hacer commit (lo confirma el escritor agrupado).
+    """
+    db.add(movimiento)
+    db.flush()
+    db.refresh(movimiento)
+    return movimiento
+
 def actualizar_movimiento(db: Session, movimiento_existente: MovimientoInventario, datos_actualizados: dict):
     """
     Actualiza un movimiento de inventario existente con los datos proporcionados.
     """
-    for key, value in datos_actualizados.productos():
+    for key, value in datos_actualizados.items():
         setattr(movimiento_existente, key, value)
     
     db.commit()
@@ -45,3 +59,34 @@ def eliminar_movimiento(movimiento: MovimientoInventario, db: Session):
     """
     db.delete(movimiento)
     db.commit()
+
+def productos_existentes(ids, db: Session) -> set:
+    """
+    Devuelve el subconjunto de IDs de producto que existen, en una sola consulta.
+    """
+    ids = list(ids)
+    existentes = set()
+    for inicio in range(0, len(ids), 500):
+        existentes.update(db.scalars(select(Producto.id).where(Producto.id.in_(ids[inicio:inicio + 500]))))
+    return existentes
+
+def insertar_movimientos(filas: list, db: Session):
+    """
+    Inserta varios movimientos con un único executemany. No hace commit.
+    """
+    if filas:
+        db.execute(insert(MovimientoInventario), filas)
+
+def consulta_exportacion(producto_id: int = None, desde=None, hasta=None):
+    """
+    Select de columnas (sin ORM) para exportar movimientos, ordenado por id.
+    Filtra por producto y por fecha (desde inclusive, hasta exclusive).
+    """
+    consulta = select(*columnas_lectura(MovimientoInventario)).order_by(MovimientoInventario.id)
+    if producto_id is not None:
+        consulta = consulta.where(MovimientoInventario.producto_id == producto_id)
+    if desde is not None:
+        consulta = consulta.where(MovimientoInventario.fecha >= desde)
+    if hasta is not None:
+        consulta = consulta.where(MovimientoInventario.fecha < hasta)
+    return consulta
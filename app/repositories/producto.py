@@ -7,29 +7,65 @@ Incluye funciones para:
 - Crear un nuevo producto.
 - Actualizar un producto existente.
 - Eliminar un producto.
+- Buscar productos por texto (FTS5).
+- Leer los nombres que alimentan el índice de autocompletado.
+
+Las altas, cambios y bajas confirmadas actualizan el índice de autocompletado en memoria.
 """
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.models.producto_model import Producto
+from app.core.autocompletado import indice_productos
+from app.core.busqueda import consulta_fts, filtrar_busqueda
+from app.core.inclusion import opciones_carga
+from app.core.lotes import obtener_lote
+from app.core.paginacion import paginar
+from app.core.retorno import actualizar_fila, eliminar_fila
+from app.core.solo_lectura import columnas_lectura, consulta_listado
 
-def get_productos(db: Session, skip: int, limit: int, categoria_id: int, tipo_perecedero, activo: bool):
+def get_productos(db: Session, skip: int, limit: int, categoria_id: int, tipo_perecedero, activo: bool, cursor: str = None,
+                  incluir: tuple = (), campos: tuple = None):
     """
-    Obtiene una lista de productos aplicando filtros opcionales.
+    Obtiene una página de productos aplicando filtros opcionales (cursor por id).
+    Las relaciones de `incluir` se cargan para toda la página (instancias ORM);
+    con `campos` solo se seleccionan esas columnas (filas Row).
     """
-    query = db.query(Producto)
+    if incluir:
+        query = db.query(Producto).options(*opciones_carga(Producto, incluir))
+    else:
+        query = consulta_listado(db, Producto, campos)
     if categoria_id:
         query = query.filter(Producto.categoria_id == categoria_id)
     if tipo_perecedero:
         query = query.filter(Producto.tipo_perecible == tipo_perecedero)
     if activo is not None:
         query = query.filter(Producto.activo == activo)
-    return query.offset(skip).limit(limit).all()
+    return paginar(query, [Producto.id], cursor, skip, limit)
+
+def buscar_productos(db: Session, texto: str, limit: int, activo: bool = None):
+    """
+    Busca productos por nombre o descripción (prefijos, sin tildes), ordenados por relevancia.
+    """
+    expresion = consulta_fts(texto)
+    if expresion is None:
+        return []
+    query = filtrar_busqueda(consulta_listado(db, Producto), Producto, expresion)
+    if activo is not None:
+        query = query.filter(Producto.activo == activo)
+    return query.limit(limit).all()
 
-def get_producto_by_id(db: Session, producto_id: int):
+def get_producto_by_id(db: Session, producto_id: int, incluir: tuple = ()):
     """
-    Obtiene un producto específico por su ID.
+    Obtiene un producto específico por su ID (con las relaciones de `incluir`).
     """
-    return db.query(Producto).filter(Producto.id == producto_id).first()
+    return db.query(Producto).options(*opciones_carga(Producto, incluir)).filter(Producto.id == producto_id).first()
+
+def get_productos_by_ids(db: Session, ids: list):
+    """
+    Obtiene los productos de una lista de ids (consultas IN por trozos), en el orden pedido.
+    """
+    return obtener_lote(consulta_listado(db, Producto), Producto.id, ids)
 
 def create_producto(db: Session, producto_data):
     """
@@ -39,32 +75,44 @@ def create_producto(db: Session, producto_data):
     db.add(db_producto)
     db.commit()
     db.refresh(db_producto)
+    indice_productos.actualizar(db_producto.id, db_producto.nombre, db_producto.activo)
     return db_producto
 
-def update_producto(db: Session, producto_id: int, producto_data):
+def update_producto(db: Session, producto_id: int, producto_data, parcial: bool = False):
     """
-    Actualiza un producto existente en la base de datos.
+    Actualiza un producto existente con un único UPDATE ... RETURNING (con `parcial`, solo
+    los campos enviados). Devuelve la fila actualizada o None si no existe.
     """
-    db_producto = db.query(Producto).filter(Producto.id == producto_id).first()
-    if not db_producto:
-        return None
-    
-    # Actualizar los campos del producto
-    for key, value in producto_data.dict().productos():
-        setattr(db_producto, key, value)
-    
+    fila = actualizar_fila(db, Producto, producto_id, producto_data.dict(exclude_unset=parcial))
     db.commit()
-    db.refresh(db_producto)
-    return db_producto
+    if fila is not None:
+        indice_productos.actualizar(fila.id, fila.nombre, fila.activo)
+    return fila
 
 def delete_producto(db: Session, producto_id: int):
     """
-    Elimina un producto de la base de datos.
+    Elimina un producto con un único DELETE ... RETURNING (409 si tiene registros asociados).
     """
-    db_producto = db.query(Producto).filter(Producto.id == producto_id).first()
-    if not db_producto:
+    fila = eliminar_fila(db, Producto, producto_id)
+    if fila is None:
         return None
-    
-    db.delete(db_producto)
     db.commit()
+    indice_productos.eliminar(producto_id)
     return True
+
+def nombres_activos(db: Session):
+    """
+    Pares (id, nombre) de los productos activos, para construir el índice de autocompletado.
+    """
+    return db.execute(select(Producto.id, Producto.nombre).where(Producto.activo.is_(True))).all()
+
+def consulta_exportacion(categoria_id: int = None, activo: bool = None):
+    """
+    Select de columnas (sin ORM) para exportar el catálogo de productos, ordenado por id.
+    """
+    consulta = select(*columnas_lectura(Producto)).order_by(Producto.id)
+    if categoria_id is not None:
+        consulta = consulta.where(Producto.categoria_id == categoria_id)
+    if activo is not None:
+        consulta = consulta.where(Producto.activo == activo)
+    return consulta
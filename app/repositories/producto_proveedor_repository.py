@@ -6,12 +6,20 @@ facilitando las operaciones CRUD con la base de datos.
 
 from sqlalchemy.orm import Session
 from app.models.producto_proveedor_model import ProveedorProducto
+from app.core.inclusion import opciones_carga
+from app.core.lotes import obtener_lote
+from app.core.paginacion import paginar
 
-def obtener_productos_proveedor(skip: int, limit: int, db: Session):
-    return db.query(ProveedorProducto).offset(skip).limit(limit).all()
+def obtener_productos_proveedor(skip: int, limit: int, db: Session, cursor: str = None, incluir: tuple = ()):
+    query = db.query(ProveedorProducto).options(*opciones_carga(ProveedorProducto, incluir))
+    return paginar(query, [ProveedorProducto.id], cursor, skip, limit)
 
-def obtener_producto_proveedor_por_id(producto_proveedor_id: int, db: Session):
-    return db.query(ProveedorProducto).filter(ProveedorProducto.id == producto_proveedor_id).first()
+def obtener_productos_proveedor_por_ids(ids: list, db: Session):
+    return obtener_lote(db.query(ProveedorProducto), ProveedorProducto.id, ids)
+
+def obtener_producto_proveedor_por_id(producto_proveedor_id: int, db: Session, incluir: tuple = ()):
+    query = db.query(ProveedorProducto).options(*opciones_carga(ProveedorProducto, incluir))
+    return query.filter(ProveedorProducto.id == producto_proveedor_id).first()
 
 def crear_producto_proveedor(producto_proveedor: ProveedorProducto, db: Session):
     db.add(producto_proveedor)
@@ -20,7 +28,7 @@ def crear_producto_proveedor(producto_proveedor: ProveedorProducto, db: Session)
     return producto_proveedor
 
 def actualizar_producto_proveedor(db: Session, producto_proveedor_existente: ProveedorProducto, datos_actualizados: dict):
-    for key, value in datos_actualizados.productos():
+    for key, value in datos_actualizados.items():
         setattr(producto_proveedor_existente, key, value)
     
     db.commit()
@@ -6,12 +6,25 @@ facilitando las operaciones CRUD con la base de datos.
 
 from sqlalchemy.orm import Session
 from app.models.proveedor_model import Proveedor as ProveedorModel
+from app.core.busqueda import consulta_fts, filtrar_busqueda
+from app.core.lotes import obtener_lote
+from app.core.paginacion import paginar
+from app.core.retorno import actualizar_fila, eliminar_fila
 
-def obtener_proveedores(skip: int, limit: int, db: Session):
+def obtener_proveedores(skip: int, limit: int, db: Session, cursor: str = None):
     """
-    Obtiene una lista de proveedores con paginación.
+    Obtiene una página de proveedores (cursor por id).
     """
-    return db.query(ProveedorModel).offset(skip).limit(limit).all()
+    return paginar(db.query(ProveedorModel), [ProveedorModel.id], cursor, skip, limit)
+
+def buscar_proveedores(texto: str, limit: int, db: Session):
+    """
+    Busca proveedores por nombre o persona de contacto, ordenados por relevancia.
+    """
+    expresion = consulta_fts(texto)
+    if expresion is None:
+        return []
+    return filtrar_busqueda(db.query(ProveedorModel), ProveedorModel, expresion).limit(limit).all()
 
 def obtener_proveedor_por_id(proveedor_id: int, db: Session):
     """
@@ -19,6 +32,12 @@ def obtener_proveedor_por_id(proveedor_id: int, db: Session):
     """
     return db.query(ProveedorModel).filter(ProveedorModel.id == proveedor_id).first()
 
+def obtener_proveedores_por_ids(ids: list, db: Session):
+    """
+    Obtiene los proveedores de una lista de ids, en el orden pedido.
+    """
+    return obtener_lote(db.query(ProveedorModel), ProveedorModel.id, ids)
+
 def crear_proveedor(nuevo_proveedor: ProveedorModel, db: Session):
     """
     Crea un nuevo proveedor.
@@ -28,20 +47,20 @@ def crear_proveedor(nuevo_proveedor: ProveedorModel, db: Session):
     db.refresh(nuevo_proveedor)
     return nuevo_proveedor
 
-def actualizar_proveedor(db: Session, proveedor_existente: ProveedorModel, datos_actualizados: dict):
+def actualizar_proveedor(db: Session, proveedor_id: int, datos_actualizados: dict):
     """
-    Actualiza un proveedor existente con los datos proporcionados.
+    Actualiza un proveedor con un único UPDATE ... RETURNING de los datos proporcionados.
+    Devuelve la fila actualizada o None si no existe.
     """
-    for key, value in datos_actualizados.productos():
-        setattr(proveedor_existente, key, value)
-    
+    fila = actualizar_fila(db, ProveedorModel, proveedor_id, datos_actualizados)
     db.commit()
-    db.refresh(proveedor_existente)
-    return proveedor_existente
+    return fila
 
-def eliminar_proveedor(proveedor: ProveedorModel, db: Session):
+def eliminar_proveedor(proveedor_id: int, db: Session):
     """
-    Elimina un proveedor existente.
+    Elimina un proveedor con un único DELETE ... RETURNING (409 si tiene registros asociados).
+    Devuelve la fila eliminada o None si no existe.
     """
-    db.delete(proveedor)
+    fila = eliminar_fila(db, ProveedorModel, proveedor_id)
     db.commit()
+    return fila
@@ -0,0 +1,111 @@
+"""
+Repositorio StockActual:
+Mantiene la tabla materializada stock_actual a partir de los movimientos de inventario.
+
+Las funciones de ajuste no hacen commit: se ejecutan dentro de la transacción del
+movimiento que las origina, de modo que el stock y el historial se confirman juntos.
+"""
+
+from sqlalchemy import select, insert, delete, func, case, literal_column
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.models.stock_model import StockActual
+from app.models.movimiento_model import MovimientoInventario
+from app.core.paginacion import paginar
+
+TOLERANCIA = 1e-6
+
+
+def delta_movimiento(tipo_movimiento: str, cantidad: float) -> float:
+    """
+    Efecto con signo de un movimiento sobre el stock: las salidas restan, el resto suma.
+    """
+    if (tipo_movimiento or "").strip().lower() == "salida":
+        return -abs(cantidad)
+    return cantidad
+
+def _delta_sql():
+    """Expresión SQL equivalente a delta_movimiento, usada para reconstruir desde el historial."""
+    return case(
+        (func.lower(func.trim(MovimientoInventario.tipo_movimiento)) == "salida", -func.abs(MovimientoInventario.cantidad)),
+        else_=MovimientoInventario.cantidad,
+    )
+
+def filtro_stock(producto_id: int, almacen_id=None):
+    """Condiciones que identifican el registro de stock de un producto (y almacén)."""
+    if almacen_id is None:
+        return (StockActual.producto_id == producto_id, StockActual.almacen_id.is_(None))
+    return (StockActual.producto_id == producto_id, StockActual.almacen_id == almacen_id)
+
+def sentencia_ajuste(producto_id: int, delta: float, almacen_id: int = None):
+    """
+    INSERT ... ON CONFLICT DO UPDATE que suma `delta` al registro del producto (y almacén)
+    o lo crea; el conflicto se resuelve sobre ux_stock_actual_producto_almacen.
+    """
+    sentencia = sqlite_insert(StockActual).values(producto_id=producto_id, almacen_id=almacen_id, cantidad=delta)
+    return sentencia.on_conflict_do_update(
+        index_elements=[StockActual.producto_id, func.ifnull(StockActual.almacen_id, literal_column("0"))],
+        set_={"cantidad": StockActual.cantidad + sentencia.excluded.cantidad, "actualizado_en": func.now()},
+    )
+
+def ajustar_stock(db: Session, producto_id: int, delta: float, almacen_id: int = None):
+    """
+    Suma `delta` al stock del producto, creando el registro si no existe, en una sola
+    sentencia. No hace commit.
+    """
+    if not delta:
+        return
+    db.execute(sentencia_ajuste(producto_id, delta, almacen_id))
+
+def obtener_stock(db: Session, skip: int, limit: int, cursor: str = None):
+    """
+    Obtiene una página del stock actual de los productos (cursor por id).
+    """
+    return paginar(db.query(StockActual), [StockActual.id], cursor, skip, limit)
+
+def obtener_stock_producto(db: Session, producto_id: int):
+    """
+    Obtiene el stock global (sin almacén) de un producto.
+    """
+    return db.query(StockActual).filter(*filtro_stock(producto_id, None)).first()
+
+def calcular_stock_desde_historial(db: Session) -> dict:
+    """
+    Recalcula el stock global de cada producto sumando todo el historial de movimientos.
+    """
+    filas = db.execute(
+        select(MovimientoInventario.producto_id, func.sum(_delta_sql()))
+        .group_by(MovimientoInventario.producto_id)
+    ).all()
+    return {producto_id: total or 0.0 for producto_id, total in filas}
+
+def verificar_stock(db: Session) -> list:
+    """
+    Compara stock_actual con el historial y devuelve las discrepancias encontradas.
+    """
+    esperado = calcular_stock_desde_historial(db)
+    materializado = dict(db.execute(
+        select(StockActual.producto_id, StockActual.cantidad).where(StockActual.almacen_id.is_(None))
+    ).all())
+    diferencias = []
+    for producto_id in sorted(esperado.keys() | materializado.keys()):
+        actual = materializado.get(producto_id, 0.0)
+        historial = esperado.get(producto_id, 0.0)
+        if abs(actual - historial) > TOLERANCIA:
+            diferencias.append({"producto_id": producto_id, "materializado": actual, "historial": historial})
+    return diferencias
+
+def reconstruir_stock(db: Session) -> int:
+    """
+    Reemplaza el stock global de todos los productos por el calculado desde el historial.
+    Devuelve la cantidad de productos escritos.
+    """
+    esperado = calcular_stock_desde_historial(db)
+    db.execute(delete(StockActual).where(StockActual.almacen_id.is_(None)))
+    if esperado:
+        db.execute(insert(StockActual), [
+            {"producto_id": producto_id, "almacen_id": None, "cantidad": cantidad}
+            for producto_id, cantidad in esperado.items()
+        ])
+    db.commit()
+    return len(esperado)
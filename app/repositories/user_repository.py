@@ -6,6 +6,7 @@ facilitando las operaciones CRUD con la base de datos.
 
 from sqlalchemy.orm import Session
 from app.models.user_model import UserModel
+from app.core.retorno import actualizar_fila, eliminar_fila
 
 def obtener_usuario_por_username(username: str, db: Session):
     """
@@ -28,20 +29,20 @@ def crear_usuario(nuevo_usuario: UserModel, db: Session):
     db.refresh(nuevo_usuario)
     return nuevo_usuario
 
-def actualizar_usuario(db: Session, usuario_existente: UserModel, datos_actualizados: dict):
+def actualizar_usuario(db: Session, user_id: int, datos_actualizados: dict):
     """
-    Actualiza un usuario existente con los datos proporcionados.
+    Actualiza un usuario con un único UPDATE ... RETURNING de los datos proporcionados.
+    Devuelve la fila actualizada o None si no existe.
     """
-    for key, value in datos_actualizados.productos():
-        setattr(usuario_existente, key, value)
-    
+    fila = actualizar_fila(db, UserModel, user_id, datos_actualizados)
     db.commit()
-    db.refresh(usuario_existente)
-    return usuario_existente
+    return fila
 
-def eliminar_usuario(usuario: UserModel, db: Session):
+def eliminar_usuario(user_id: int, db: Session):
     """
-    Elimina un usuario existente.
+    Elimina un usuario con un único DELETE ... RETURNING.
+    Devuelve la fila eliminada o None si no existe.
     """
-    db.delete(usuario)
+    fila = eliminar_fila(db, UserModel, user_id)
     db.commit()
+    return fila
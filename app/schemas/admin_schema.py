@@ -0,0 +1,66 @@
+"""
+admin_schema.py
+
+Este módulo define los esquemas utilizados por los endpoints de administración.
+
+Esquemas:
+- PerfilBaseDatos: Perfil activo del motor de base de datos (configuración, pool y PRAGMAs efectivos).
+- EstadisticasCache: Estado de la caché de respuestas GET (tamaño, aciertos, fallos, desalojos y versiones).
+- EstadisticasCacheTokens: Estado de la caché de tokens verificados del AuthMiddleware.
+
+Atributos:
+- url (str): URL del motor síncrono (sin contraseña).
+- async_url (str): URL del motor asíncrono (sin contraseña).
+- db_async (bool): Indica si la API sirve las rutas asíncronas.
+- configuracion (dict): Valores de pool, timeouts y PRAGMAs solicitados por configuración.
+- pool (str): Estado actual del pool de conexiones.
+- pragmas (dict): Valores de PRAGMA efectivos leídos de una conexión (solo SQLite).
+
+Atributos de EstadisticasCache:
+- activa (bool): Indica si la caché está habilitada globalmente.
+- routers_excluidos (list): Entidades cuyo router no se cachea.
+- entradas / max_entradas (int): Respuestas guardadas y capacidad máxima.
+- ttl_segundos (float): Vigencia máxima de una respuesta.
+- aciertos / fallos / desalojos / expiraciones (int): Contadores acumulados desde el arranque.
+- tasa_aciertos (float): aciertos / (aciertos + fallos).
+- versiones (dict): Versión actual de cada entidad invalidada al menos una vez.
+
+EstadisticasCacheTokens tiene los mismos contadores (sin TTL ni versiones): cada token
+vence en su propio `exp`.
+"""
+
+from pydantic import BaseModel
+from typing import Dict, Any, List
+
+
+class PerfilBaseDatos(BaseModel):
+    url: str
+    async_url: str
+    db_async: bool
+    configuracion: Dict[str, Any]
+    pool: str
+    pragmas: Dict[str, Any]
+
+
+class EstadisticasCache(BaseModel):
+    activa: bool
+    routers_excluidos: List[str]
+    entradas: int
+    max_entradas: int
+    ttl_segundos: float
+    aciertos: int
+    fallos: int
+    desalojos: int
+    expiraciones: int
+    tasa_aciertos: float
+    versiones: Dict[str, int]
+
+
+class EstadisticasCacheTokens(BaseModel):
+    entradas: int
+    max_entradas: int
+    aciertos: int
+    fallos: int
+    desalojos: int
+    expiraciones: int
+    tasa_aciertos: float
@@ -8,6 +8,7 @@ Esquemas:
 - AlmacenBase: Esquema base que incluye los atributos comunes de un almacén.
 - CrearAlmacen: Hereda de AlmacenBase y se utiliza al crear un nuevo almacén.
 - Almacen: Extiende AlmacenBase agregando el ID del almacén, utilizado para respuestas de lectura.
+- ActualizarAlmacen: Cambios parciales (PATCH); solo se modifican los campos enviados.
 
 Atributos:
 - nombre (str): Nombre del almacén.
@@ -35,6 +36,14 @@ class AlmacenBase(BaseModel):
 class CrearAlmacen(AlmacenBase):
     pass
 
+# Los campos obligatorios no admiten null explícito: omitirlos es la forma de no cambiarlos
+class ActualizarAlmacen(BaseModel):
+    nombre: str = Field(None, description="Nombre del almacén")
+    tipo: str = Field(None, description="Tipo de almacén")
+    rango_temperatura: Optional[str] = Field(None, description="Rango de temperatura")
+    capacidad: float = Field(None, description="Capacidad total")
+    uso_actual: float = Field(None, description="Uso actual")
+
 class Almacen(AlmacenBase):
     id: int
     
@@ -13,6 +13,7 @@ Esquemas:
 - CategoriaBase: Esquema base que incluye los atributos comunes de una categoría.
 - CrearCategoria: Hereda de CategoriaBase y se utiliza al crear una nueva categoría.
 - Categoria: Extiende CategoriaBase agregando el ID de la categoría, utilizado para respuestas de lectura.
+- ActualizarCategoria: Cambios parciales (PATCH); solo se modifican los campos enviados.
 
 Atributos:
 - nombre (str): Nombre de la categoría.
@@ -58,6 +59,12 @@ class CrearCategoria(CategoriaBase):
     pass
 
 
+# Los campos obligatorios no admiten null explícito: omitirlos es la forma de no cambiarlos
+class ActualizarCategoria(BaseModel):
+    nombre: str = Field(None, description="Nombre de la categoría")
+    tipo: TipoCategoria = Field(None, description="Tipo de categoría")
+    descripcion: Optional[str] = Field(None, description="Descripción de la categoría")
+
 class Categoria(CategoriaBase):
     id: int
     
@@ -0,0 +1,25 @@
+"""
+importacion_schema.py
+
+Este módulo define los esquemas de respuesta de las importaciones CSV (app.core.importacion).
+
+Esquemas:
+- ErrorFilaImportacion: Errores de una fila del CSV que no se importó.
+- ResultadoImportacion: Resumen de una importación (filas recibidas, insertadas, actualizadas,
+  sin cambios y errores por fila).
+"""
+
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class ErrorFilaImportacion(BaseModel):
+    linea: int = Field(..., description="Línea del CSV (el encabezado es la línea 1)")
+    errores: List[str] = Field(..., description="Mensajes de error de la fila")
+
+class ResultadoImportacion(BaseModel):
+    recibidos: int = Field(..., description="Filas de datos recibidas")
+    insertados: int = Field(..., description="Filas nuevas insertadas")
+    actualizados: int = Field(..., description="Filas existentes con algún campo modificado")
+    sin_cambios: int = Field(..., description="Filas existentes idénticas a las recibidas")
+    errores: List[ErrorFilaImportacion] = Field(default_factory=list, description="Filas rechazadas")
@@ -0,0 +1,19 @@
+"""
+lote_schema.py
+
+Este módulo define el esquema de respuesta de las lecturas por lista de ids (app.core.lotes).
+
+Esquemas:
+- ResultadoLote: Entidades encontradas, en el orden pedido, e ids que no existen.
+  Es genérico: ResultadoLote[Producto], ResultadoLote[Proveedor]...
+"""
+
+from pydantic import BaseModel, Field
+from typing import Generic, List, TypeVar
+
+T = TypeVar("T")
+
+
+class ResultadoLote(BaseModel, Generic[T]):
+    items: List[T] = Field(..., description="Entidades encontradas, en el orden de los ids pedidos")
+    faltantes: List[int] = Field(default_factory=list, description="Ids pedidos que no existen")
@@ -7,6 +7,8 @@ Esquemas:
 - MovimientoInventarioBase: Esquema base que incluye los atributos comunes para crear y visualizar movimientos de inventario.
 - CrearMovimientoInventario: Hereda de MovimientoInventarioBase y se utiliza al registrar un nuevo movimiento de inventario.
 - MovimientoInventario: Extiende MovimientoInventarioBase con el identificador único (id) y la fecha en que se registró el movimiento.
+- ErrorFilaMovimiento: Errores de una fila rechazada en una carga masiva.
+- ResultadoCargaMovimientos: Resumen de una carga masiva (filas recibidas, insertadas y errores por fila).
 
 Atributos:
 - producto_id (int): ID del producto relacionado con el movimiento.
@@ -21,7 +23,7 @@ Estos esquemas son utilizados en las operaciones de creación, actualización y
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 
 
@@ -41,4 +43,13 @@ class MovimientoInventario(MovimientoInventarioBase):
     fecha: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ErrorFilaMovimiento(BaseModel):
+    fila: int = Field(..., description="Posición de la fila en el lote (desde 0)")
+    errores: List[str] = Field(..., description="Mensajes de error de la fila")
+
+class ResultadoCargaMovimientos(BaseModel):
+    recibidos: int = Field(..., description="Filas recibidas")
+    insertados: int = Field(..., description="Filas insertadas")
+    errores: List[ErrorFilaMovimiento] = Field(default_factory=list, description="Filas rechazadas")
@@ -0,0 +1,51 @@
+"""
+precios_schema.py
+
+Este módulo define los esquemas de la actualización masiva de precios (app.core.precios).
+
+Esquemas:
+- DestinoPrecio: Precio que se modifica (el del producto o el de la oferta de cada proveedor).
+- AjustePrecios: Cambio porcentual o absoluto aplicado a todos los precios que cumplen el filtro.
+- FilaPrecio: Fila del CSV de precios nuevos (producto, proveedor opcional y precio).
+- CambioPrecio: Diferencia de una fila (solo en dry-run).
+- ResultadoPrecios: Filas afectadas, diferencias del dry-run y errores por fila del CSV.
+"""
+
+from enum import Enum
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from app.schemas.categorias_schema import TipoPerecedero
+from app.schemas.importacion_schema import ErrorFilaImportacion
+
+
+class DestinoPrecio(str, Enum):
+    PRODUCTO = "producto"
+    PROVEEDOR = "proveedor"
+
+# Exactamente uno de porcentaje o monto; los filtros se combinan con AND
+class AjustePrecios(BaseModel):
+    destino: DestinoPrecio = Field(DestinoPrecio.PRODUCTO, description="productos.precio o proveedor_productos.precio")
+    porcentaje: Optional[float] = Field(None, gt=-100, description="Variación porcentual (10 = +10 %)")
+    monto: Optional[float] = Field(None, description="Importe que se suma al precio actual (negativo para bajarlo)")
+    decimales: int = Field(2, ge=0, le=6, description="Decimales a los que se redondea el precio nuevo")
+    categoria_id: Optional[int] = Field(None, description="Solo productos de esta categoría")
+    proveedor_id: Optional[int] = Field(None, description="Solo productos (u ofertas) de este proveedor")
+    tipo_perecible: Optional[TipoPerecedero] = Field(None, description="Solo productos de este tipo de perecibilidad")
+
+class FilaPrecio(BaseModel):
+    producto_id: int = Field(..., description="ID del producto")
+    proveedor_id: Optional[int] = Field(None, description="ID del proveedor (obligatorio con destino=proveedor)")
+    precio: float = Field(..., ge=0, description="Precio nuevo")
+
+class CambioPrecio(BaseModel):
+    producto_id: int
+    proveedor_id: Optional[int] = None
+    nombre: str = Field(..., description="Nombre del producto")
+    precio_anterior: Optional[float]
+    precio_nuevo: float
+
+class ResultadoPrecios(BaseModel):
+    afectados: int = Field(..., description="Precios que cambian (o cambiarían, en dry-run)")
+    dry_run: bool = Field(..., description="True si no se modificó nada")
+    cambios: List[CambioPrecio] = Field(default_factory=list, description="Diferencias fila a fila (solo en dry-run)")
+    errores: List[ErrorFilaImportacion] = Field(default_factory=list, description="Filas del CSV rechazadas")
@@ -7,6 +7,8 @@ Esquemas:
 - ProductoBase: Esquema base que incluye los atributos comunes para crear y visualizar un producto.
 - CrearProducto: Hereda de ProductoBase y se utiliza al registrar un nuevo producto.
 - Producto: Extiende ProductoBase con el identificador único (id) del producto.
+- ActualizarProducto: Cambios parciales (PATCH); solo se modifican los campos enviados.
+- SugerenciaProducto: Resultado del autocompletado (id y nombre).
 
 Atributos:
 - nombre (str): Nombre del producto.
@@ -41,8 +43,23 @@ class ProductoBase(BaseModel):
 class CrearProducto(ProductoBase):
     pass
 
+# Los campos obligatorios no admiten null explícito: omitirlos es la forma de no cambiarlos
+class ActualizarProducto(BaseModel):
+    nombre: str = Field(None, description="Nombre del producto")
+    descripcion: Optional[str] = Field(None, description="Descripción del producto")
+    categoria_id: int = Field(None, description="ID de la categoría a la que pertenece")
+    tipo_perecible: Optional[TipoPerecedero] = Field(None, description="Tipo de perecibilidad")
+    stock_minimo: Optional[int] = Field(None, description="Stock mínimo requerido")
+    unidad: Optional[str] = Field(None, description="Unidad de medida")
+    precio: Optional[float] = Field(None, description="Precio unitario")
+    activo: bool = Field(None, description="Estado activo/inactivo del producto")
+
 class Producto(ProductoBase):
     id: int
     
     class Config:
         from_attributes = True
+
+class SugerenciaProducto(BaseModel):
+    id: int
+    nombre: str
@@ -7,6 +7,7 @@ Esquemas:
 - ProveedorBase: Esquema base que incluye los atributos comunes para crear y visualizar un proveedor.
 - CrearProveedor: Hereda de ProveedorBase y se utiliza al registrar un nuevo proveedor.
 - Proveedor: Extiende ProveedorBase con el identificador único (id) del proveedor.
+- ActualizarProveedor: Cambios parciales (PATCH); solo se modifican los campos enviados.
 
 Atributos:
 - nombre (str): Nombre del proveedor.
@@ -34,6 +35,14 @@ class ProveedorBase(BaseModel):
 class CrearProveedor(ProveedorBase):
     pass
 
+# nombre no admite null explícito: omitirlo es la forma de no cambiarlo
+class ActualizarProveedor(BaseModel):
+    nombre: str = Field(None, description="Nombre del proveedor")
+    persona_contacto: Optional[str] = Field(None, description="Persona de contacto")
+    correo: Optional[EmailStr] = Field(None, description="Correo electrónico")
+    telefono: Optional[str] = Field(None, description="Teléfono")
+    direccion: Optional[str] = Field(None, description="Dirección")
+
 class Proveedor(ProveedorBase):
     id: int
     
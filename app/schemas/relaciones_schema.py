@@ -0,0 +1,51 @@
+"""
+relaciones_schema.py
+
+Este módulo define los esquemas de respuesta con relaciones anidadas (`?include=`).
+
+Esquemas:
+- ProductoConRelaciones: Producto con su categoría y sus proveedores.
+- ProductoProveedorConRelaciones: Relación producto-proveedor con el proveedor y el producto.
+
+Relaciones admitidas (ruta de include -> tablas de las que depende la respuesta):
+- RELACIONES_PRODUCTO: Para /productos.
+- RELACIONES_PRODUCTO_PROVEEDOR: Para /productos_proveedor.
+
+Las relaciones son opcionales: solo aparecen en la respuesta las pedidas en `include`
+(app.core.inclusion); el resto de los campos es igual al del esquema sin relaciones.
+"""
+
+from __future__ import annotations
+
+from pydantic import Field
+from typing import Dict, List, Optional, Tuple
+from app.schemas.categorias_schema import Categoria
+from app.schemas.producto_proveedor_schema import ProductoProveedor
+from app.schemas.producto_schemas import Producto
+from app.schemas.proveedor_schema import Proveedor
+
+
+class ProductoProveedorConRelaciones(ProductoProveedor):
+    proveedor: Optional[Proveedor] = Field(None, description="Proveedor (include=proveedor)")
+    producto: Optional[ProductoConRelaciones] = Field(None, description="Producto (include=producto)")
+
+class ProductoConRelaciones(Producto):
+    categoria: Optional[Categoria] = Field(None, description="Categoría (include=categoria)")
+    proveedores: Optional[List[ProductoProveedorConRelaciones]] = Field(
+        None, description="Proveedores del producto (include=proveedores o proveedores.proveedor)")
+
+
+ProductoProveedorConRelaciones.model_rebuild()
+
+
+RELACIONES_PRODUCTO: Dict[str, Tuple[str, ...]] = {
+    "categoria": ("categorias",),
+    "proveedores": ("proveedor_productos",),
+    "proveedores.proveedor": ("proveedor_productos", "proveedores"),
+}
+
+RELACIONES_PRODUCTO_PROVEEDOR: Dict[str, Tuple[str, ...]] = {
+    "proveedor": ("proveedores",),
+    "producto": ("productos",),
+    "producto.categoria": ("productos", "categorias"),
+}
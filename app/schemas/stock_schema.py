@@ -0,0 +1,36 @@
+"""
+stock_schema.py
+
+Este módulo define los esquemas utilizados para consultar el stock actual materializado.
+
+Esquemas:
+- StockActual: Existencia vigente de un producto (y almacén, cuando se conoce).
+- DiferenciaStock: Discrepancia entre el stock materializado y el historial de movimientos.
+
+Atributos:
+- producto_id (int): ID del producto.
+- almacen_id (int, opcional): ID del almacén (nulo para el stock global del producto).
+- cantidad (float): Existencia actual.
+- actualizado_en (datetime): Fecha y hora de la última actualización.
+- materializado (float): Cantidad registrada en stock_actual (solo en DiferenciaStock).
+- historial (float): Cantidad calculada a partir de los movimientos (solo en DiferenciaStock).
+"""
+
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class StockActual(BaseModel):
+    producto_id: int
+    almacen_id: Optional[int] = None
+    cantidad: float
+    actualizado_en: datetime
+
+    class Config:
+        from_attributes = True
+
+class DiferenciaStock(BaseModel):
+    producto_id: int
+    materializado: float
+    historial: float
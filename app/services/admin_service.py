@@ -0,0 +1,62 @@
+"""
+Servicio Admin:
+Expone información de diagnóstico sobre el perfil activo del motor de base de datos
+y sobre las cachés de respuestas y de tokens.
+"""
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+from app.core.config import settings, engine
+from app.core import cache
+from app.core.security import cache_tokens
+from app.repositories import admin_repository as repo
+from app.schemas.admin_schema import PerfilBaseDatos, EstadisticasCache, EstadisticasCacheTokens
+
+
+def _ocultar_password(url: str) -> str:
+    return make_url(url).render_as_string(hide_password=True)
+
+
+def obtener_perfil_base_datos(db: Session) -> PerfilBaseDatos:
+    """
+    Devuelve la configuración solicitada junto con los valores efectivos de la conexión.
+    """
+    pragmas = {}
+    if engine.dialect.name == "sqlite":
+        pragmas = repo.leer_pragmas(db, settings.pragmas().keys())
+
+    return PerfilBaseDatos(
+        url=_ocultar_password(settings.url),
+        async_url=_ocultar_password(settings.async_url),
+        db_async=settings.db_async,
+        configuracion=settings.model_dump(exclude={"url", "async_url", "db_async"}),
+        pool=engine.pool.status(),
+        pragmas=pragmas,
+    )
+
+
+def obtener_estadisticas_cache() -> EstadisticasCache:
+    """
+    Devuelve las estadísticas de la caché de respuestas y las versiones de cada entidad.
+    """
+    return EstadisticasCache(
+        activa=cache.CACHE_RESPUESTAS,
+        routers_excluidos=sorted(cache.CACHE_ROUTERS_EXCLUIDOS),
+        versiones=cache.versiones.todas(),
+        **cache.cache_respuestas.estadisticas(),
+    )
+
+
+def limpiar_cache() -> EstadisticasCache:
+    """
+    Vacía la caché de respuestas (los contadores se conservan).
+    """
+    cache.cache_respuestas.limpiar()
+    return obtener_estadisticas_cache()
+
+
+def obtener_estadisticas_tokens() -> EstadisticasCacheTokens:
+    """
+    Devuelve las estadísticas de la caché de tokens verificados.
+    """
+    return EstadisticasCacheTokens(**cache_tokens.estadisticas())
@@ -0,0 +1,86 @@
+"""
+Este módulo contiene la lógica de negocio asíncrona para la gestión de almacenes.
+
+Define AlmacenamientoService, equivalente con AsyncSession del servicio síncrono.
+"""
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import almacenamiento_schema as schemas
+from app.repositories.aio.almacenamiento_repository import AlmacenamientoRepository
+from app.core.cache import invalidar_entidad
+from app.services.home import ajustar_contador
+
+
+class AlmacenamientoService:
+    """
+    Servicio de negocios asíncrono para la gestión de almacenes.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Constructor del servicio de almacenes.
+
+        Args:
+            db (AsyncSession): Sesión asíncrona de base de datos inyectada.
+        """
+        self.db = db
+        self.repo = AlmacenamientoRepository(db)
+
+    async def obtener_todos(self, skip: int = 0, limit: int = 100, cursor: str = None):
+        """
+        Obtener todos los almacenes con paginación.
+        """
+        return await self.repo.obtener_todos(skip, limit, cursor)
+
+    async def obtener_por_id(self, storage_id: int):
+        """
+        Obtener un almacén por su ID.
+        """
+        almacen = await self.repo.obtener_por_id(storage_id)
+        if almacen is None:
+            raise HTTPException(status_code=404, detail="Almacén no encontrado")
+        return almacen
+
+    async def obtener_por_ids(self, ids: list):
+        """
+        Obtener los almacenes de una lista de ids (en orden) y los ids que no existen.
+        """
+        return await self.repo.obtener_por_ids(ids)
+
+    async def crear(self, almacen: schemas.CrearAlmacen):
+        """
+        Crear un nuevo almacén.
+        """
+        nuevo = await self.repo.crear(almacen)
+        ajustar_contador("almacenes", 1)
+        invalidar_entidad("almacenes")
+        return nuevo
+
+    async def actualizar(self, storage_id: int, almacen: schemas.CrearAlmacen):
+        """
+        Actualizar (reemplazar) un almacén existente.
+        """
+        return await self._actualizar(storage_id, almacen.model_dump())
+
+    async def modificar(self, storage_id: int, cambios: schemas.ActualizarAlmacen):
+        """
+        Modificar solo los campos enviados de un almacén (PATCH).
+        """
+        return await self._actualizar(storage_id, cambios.model_dump(exclude_unset=True))
+
+    async def _actualizar(self, storage_id: int, valores: dict):
+        actualizado = await self.repo.actualizar(storage_id, valores)
+        if actualizado is None:
+            raise HTTPException(status_code=404, detail="Almacén no encontrado")
+        invalidar_entidad("almacenes")
+        return actualizado
+
+    async def eliminar(self, storage_id: int):
+        """
+        Eliminar un almacén por su ID (409 si tiene conteos asociados).
+        """
+        if await self.repo.eliminar(storage_id) is None:
+            raise HTTPException(status_code=404, detail="Almacén no encontrado")
+        ajustar_contador("almacenes", -1)
+        invalidar_entidad("almacenes")
@@ -0,0 +1,69 @@
+"""
+Este módulo contiene la lógica de negocio asíncrona para la gestión de categorías.
+
+Define CategoriaService, equivalente con AsyncSession del servicio síncrono.
+"""
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.categorias_schema import ActualizarCategoria, CrearCategoria
+from app.repositories.aio.categorias_repository import CategoriaRepository
+from app.core.cache import invalidar_entidad
+
+
+class CategoriaService:
+    """
+    Servicio de negocios asíncrono para la gestión de categorías.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Constructor del servicio de categorías.
+
+        Args:
+            db (AsyncSession): Sesión asíncrona de base de datos inyectada.
+        """
+        self.db = db
+        self.repo = CategoriaRepository(db)
+
+    async def obtener_todas(self, skip: int = 0, limit: int = 100, tipo=None, cursor: str = None):
+        """Obtener todas las categorías con paginación y filtro opcional."""
+        return await self.repo.obtener_todas(skip, limit, tipo, cursor)
+
+    async def obtener_por_id(self, categoria_id: int):
+        """Obtener una categoría por su ID."""
+        categoria = await self.repo.obtener_por_id(categoria_id)
+        if categoria is None:
+            raise HTTPException(status_code=404, detail="Categoría no encontrada")
+        return categoria
+
+    async def obtener_por_ids(self, ids: list):
+        """Obtener las categorías de una lista de ids (en orden) y los ids que no existen."""
+        return await self.repo.obtener_por_ids(ids)
+
+    async def crear(self, categoria: CrearCategoria):
+        """Crear una nueva categoría."""
+        nueva = await self.repo.crear(categoria)
+        invalidar_entidad("categorias")
+        return nueva
+
+    async def actualizar(self, categoria_id: int, categoria: CrearCategoria):
+        """Actualizar (reemplazar) una categoría existente."""
+        return await self._actualizar(categoria_id, categoria.model_dump())
+
+    async def modificar(self, categoria_id: int, cambios: ActualizarCategoria):
+        """Modificar solo los campos enviados de una categoría (PATCH)."""
+        return await self._actualizar(categoria_id, cambios.model_dump(exclude_unset=True))
+
+    async def _actualizar(self, categoria_id: int, valores: dict):
+        actualizada = await self.repo.actualizar(categoria_id, valores)
+        if actualizada is None:
+            raise HTTPException(status_code=404, detail="Categoría no encontrada")
+        invalidar_entidad("categorias")
+        return actualizada
+
+    async def eliminar(self, categoria_id: int):
+        """Eliminar una categoría por su ID (409 si tiene productos)."""
+        if await self.repo.eliminar(categoria_id) is None:
+            raise HTTPException(status_code=404, detail="Categoría no encontrada")
+        invalidar_entidad("categorias")
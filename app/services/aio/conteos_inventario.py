@@ -0,0 +1,85 @@
+"""
+Lógica de negocio asíncrona para gestionar los conteos de inventario.
+
+Incluye funciones para:
+- Obtener todos los conteos de inventario.
+- Obtener un conteo por ID.
+- Crear un nuevo conteo.
+- Actualizar un conteo existente.
+- Eliminar un conteo.
+"""
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+from app.schemas import conteo_schema as schemas
+from app.services.home import ajustar_contador
+from app.core.escritor import ESCRITURA_AGRUPADA, escritor
+from app.core import idempotencia
+from app.services.conteos_inventario import AMBITO_IDEMPOTENCIA, operacion_alta_conteo
+from app.repositories.aio.conteos_inventario import (
+    get_conteos,
+    get_conteo_by_id,
+    update_conteo,
+    delete_conteo
+)
+
+
+async def obtener_conteos(db: AsyncSession, skip: int, limit: int, cursor: str = None, campos: tuple = None):
+    """ Obtener todos los conteos de inventario """
+    return await get_conteos(db, skip, limit, cursor, campos)
+
+
+async def obtener_conteo_por_id(db: AsyncSession, count_id: int):
+    """ Obtener un conteo de inventario por su ID """
+    return await get_conteo_by_id(db, count_id)
+
+
+async def crear_conteo(db: AsyncSession, conteo: schemas.CrearConteoInventario, clave_idempotencia: str = None):
+    """
+    Crear un nuevo conteo de inventario (en lote con ESCRITURA_AGRUPADA=true).
+    Con `clave_idempotencia`, un reintento con la misma clave devuelve la respuesta original.
+    """
+    peticion = idempotencia.peticion_idempotente(AMBITO_IDEMPOTENCIA, clave_idempotencia, conteo)
+    repetida = await idempotencia.repeticion_async(db, peticion)
+    if repetida is not None:
+        return repetida
+
+    operacion = operacion_alta_conteo(conteo, peticion)
+    try:
+        if ESCRITURA_AGRUPADA:
+            nuevo = await escritor.ejecutar_async(operacion)
+        else:
+            nuevo = await db.run_sync(operacion)
+            await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        # Un reintento concurrente puede chocar con la clave o con otra restricción del alta
+        repetida = await idempotencia.repeticion_async(db, peticion)
+        if repetida is not None:
+            return repetida
+        raise
+    idempotencia.recordar(peticion)
+    ajustar_contador("inventario", 1)
+    return nuevo
+
+
+async def actualizar_conteo(db: AsyncSession, count_id: int, conteo: schemas.CrearConteoInventario):
+    """ Actualizar un conteo de inventario """
+    db_conteo = await get_conteo_by_id(db, count_id)
+    if db_conteo is None:
+        raise HTTPException(status_code=404, detail="Conteo de inventario no encontrado")
+
+    for key, value in conteo.dict().items():
+        setattr(db_conteo, key, value)
+    return await update_conteo(db, db_conteo)
+
+
+async def eliminar_conteo(db: AsyncSession, count_id: int):
+    """ Eliminar un conteo de inventario """
+    conteo = await get_conteo_by_id(db, count_id)
+    if conteo is None:
+        raise HTTPException(status_code=404, detail="Conteo de inventario no encontrado")
+    resultado = await delete_conteo(db, conteo)
+    ajustar_contador("inventario", -1)
+    return resultado
@@ -0,0 +1,26 @@
+"""
+Lógica de negocio asíncrona para obtener estadísticas de la página de inicio.
+
+Comparte la caché de totales (contadores_home) con el servicio síncrono.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.home import HomeInfo
+from app.repositories.aio.home import get_totales
+from app.services.home import contadores_home
+
+async def obtener_estadisticas_home(db: AsyncSession) -> HomeInfo:
+    """
+    Obtener estadísticas para la página de inicio.
+
+    Parámetros:
+    - db (AsyncSession): Sesión asíncrona de base de datos (solo se usa al recontar).
+
+    Retorna:
+    - HomeInfo: Objeto con las estadísticas generales.
+    """
+    valores = contadores_home.vigentes()
+    if valores is None:
+        valores = await get_totales(db)
+        contadores_home.cargar(valores)
+    return HomeInfo(**valores)
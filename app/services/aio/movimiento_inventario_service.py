@@ -0,0 +1,95 @@
+"""
+Servicio MovimientoInventario (asíncrono):
+Gestiona la lógica de negocio para los movimientos de inventario
+sobre AsyncSession, coordinando las operaciones con el repositorio asíncrono.
+
+Cada alta, modificación o baja ajusta stock_actual en la misma transacción que el movimiento.
+Con ESCRITURA_AGRUPADA=true las altas se confirman en lote desde app.core.escritor.
+Las altas admiten una clave de idempotencia (app.core.idempotencia).
+"""
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+from app.schemas.movimiento_schema import CrearMovimientoInventario
+from app.repositories.aio import movimiento_inventario_repository as repo
+from app.repositories.aio import stock_repository as stock_repo
+from app.repositories.stock_repository import delta_movimiento
+from app.core.escritor import ESCRITURA_AGRUPADA, escritor
+from app.core import idempotencia
+from app.services.movimiento_inventario_service import (
+    AMBITO_IDEMPOTENCIA,
+    error_integridad,
+    operacion_alta_movimiento
+)
+
+async def obtener_movimientos_inventario(skip: int, limit: int, db: AsyncSession, cursor: str = None, campos: tuple = None):
+    """
+    Obtiene una lista de movimientos de inventario con paginación (con `campos`, solo esas columnas).
+    """
+    return await repo.obtener_movimientos_inventario(skip, limit, db, cursor, campos)
+
+async def obtener_movimiento_por_id(movement_id: int, db: AsyncSession):
+    """
+    Obtiene un movimiento de inventario por su ID.
+    Lanza una excepción si no se encuentra.
+    """
+    movimiento = await repo.obtener_movimiento_por_id(movement_id, db)
+    if movimiento is None:
+        raise HTTPException(status_code=404, detail="Movimiento no encontrado")
+    return movimiento
+
+async def crear_movimiento(movimiento: CrearMovimientoInventario, db: AsyncSession, clave_idempotencia: str = None):
+    """
+    Crea un nuevo movimiento de inventario.
+    Con `clave_idempotencia`, un reintento con la misma clave devuelve la respuesta original
+    sin crear otro movimiento; un numero_referencia repetido para el producto da 409.
+    """
+    peticion = idempotencia.peticion_idempotente(AMBITO_IDEMPOTENCIA, clave_idempotencia, movimiento)
+    repetida = await idempotencia.repeticion_async(db, peticion)
+    if repetida is not None:
+        return repetida
+
+    operacion = operacion_alta_movimiento(movimiento, peticion)
+    try:
+        if ESCRITURA_AGRUPADA:
+            nuevo = await escritor.ejecutar_async(operacion)
+        else:
+            nuevo = await db.run_sync(operacion)
+            await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        # Un reintento concurrente choca con la clave o con otra restricción (numero_referencia)
+        repetida = await idempotencia.repeticion_async(db, peticion)
+        if repetida is not None:
+            return repetida
+        raise error_integridad(exc, movimiento)
+    idempotencia.recordar(peticion)
+    return nuevo
+
+async def actualizar_movimiento(movement_id: int, datos_actualizados: CrearMovimientoInventario, db: AsyncSession):
+    """
+    Actualiza un movimiento de inventario existente.
+    Lanza una excepción si no se encuentra.
+    """
+    movimiento_existente = await obtener_movimiento_por_id(movement_id, db)
+    await stock_repo.ajustar_stock(db, movimiento_existente.producto_id,
+                                   -delta_movimiento(movimiento_existente.tipo_movimiento, movimiento_existente.cantidad))
+    await stock_repo.ajustar_stock(db, datos_actualizados.producto_id,
+                                   delta_movimiento(datos_actualizados.tipo_movimiento, datos_actualizados.cantidad))
+    try:
+        return await repo.actualizar_movimiento(db, movimiento_existente, datos_actualizados.dict())
+    except IntegrityError as exc:
+        await db.rollback()
+        raise error_integridad(exc, datos_actualizados)
+
+async def eliminar_movimiento(movement_id: int, db: AsyncSession):
+    """
+    Elimina un movimiento de inventario.
+    Lanza una excepción si no se encuentra.
+    """
+    movimiento_existente = await obtener_movimiento_por_id(movement_id, db)
+    await stock_repo.ajustar_stock(db, movimiento_existente.producto_id,
+                                   -delta_movimiento(movimiento_existente.tipo_movimiento, movimiento_existente.cantidad))
+    await repo.eliminar_movimiento(movimiento_existente, db)
+    return {"detail": "Movimiento eliminado correctamente"}
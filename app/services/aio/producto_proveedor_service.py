@@ -0,0 +1,43 @@
+"""
+Servicio ProductoProveedor (asíncrono):
+Gestiona la lógica de negocio para productos de proveedor sobre AsyncSession,
+coordinando las operaciones con el repositorio asíncrono.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+from app.schemas.producto_proveedor_schema import CrearProductoProveedor
+from app.models.producto_proveedor_model import ProveedorProducto
+from app.repositories.aio import producto_proveedor_repository as repo
+from app.core.cache import invalidar_entidad
+
+async def obtener_productos_proveedor(skip: int, limit: int, db: AsyncSession, cursor: str = None, incluir: tuple = ()):
+    return await repo.obtener_productos_proveedor(skip, limit, db, cursor, incluir)
+
+async def obtener_producto_proveedor_por_id(producto_proveedor_id: int, db: AsyncSession, incluir: tuple = ()):
+    producto_proveedor = await repo.obtener_producto_proveedor_por_id(producto_proveedor_id, db, incluir)
+    if producto_proveedor is None:
+        raise HTTPException(status_code=404, detail="Producto de proveedor no encontrado")
+    return producto_proveedor
+
+async def obtener_productos_proveedor_por_ids(ids: list, db: AsyncSession):
+    return await repo.obtener_productos_proveedor_por_ids(ids, db)
+
+async def crear_producto_proveedor(producto_proveedor: CrearProductoProveedor, db: AsyncSession):
+    nuevo_producto_proveedor = ProveedorProducto(**producto_proveedor.dict())
+    creado = await repo.crear_producto_proveedor(nuevo_producto_proveedor, db)
+    # Las respuestas cacheadas de /productos con include=proveedores dependen de esta tabla
+    invalidar_entidad("proveedor_productos")
+    return creado
+
+async def actualizar_producto_proveedor(producto_proveedor_id: int, datos_actualizados: CrearProductoProveedor, db: AsyncSession):
+    producto_proveedor_existente = await obtener_producto_proveedor_por_id(producto_proveedor_id, db)
+    actualizado = await repo.actualizar_producto_proveedor(db, producto_proveedor_existente, datos_actualizados.dict())
+    invalidar_entidad("proveedor_productos")
+    return actualizado
+
+async def eliminar_producto_proveedor(producto_proveedor_id: int, db: AsyncSession):
+    producto_proveedor_existente = await obtener_producto_proveedor_por_id(producto_proveedor_id, db)
+    await repo.eliminar_producto_proveedor(producto_proveedor_existente, db)
+    invalidar_entidad("proveedor_productos")
+    return {"detail": "Producto de proveedor eliminado correctamente"}
@@ -0,0 +1,68 @@
+"""
+Lógica de negocio asíncrona para gestionar productos.
+
+Incluye funciones para:
+- Obtener todos los productos.
+- Obtener un producto por ID.
+- Crear un nuevo producto.
+- Actualizar un producto existente.
+- Eliminar un producto.
+"""
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.producto_schemas import ActualizarProducto, CrearProducto
+from app.core.cache import invalidar_entidad
+from app.services.home import ajustar_contador
+from app.repositories.aio.producto import (
+    buscar_productos as buscar,
+    get_productos,
+    get_producto_by_id,
+    get_productos_by_ids,
+    create_producto,
+    update_producto,
+    delete_producto
+)
+
+async def obtener_todos_los_productos(db: AsyncSession, skip: int, limit: int, categoria_id: int, tipo_perecedero, activo: bool,
+                                      cursor: str = None, incluir: tuple = (), campos: tuple = None):
+    return await get_productos(db, skip, limit, categoria_id, tipo_perecedero, activo, cursor, incluir, campos)
+
+async def buscar_productos(db: AsyncSession, texto: str, limit: int, activo: bool = None):
+    return await buscar(db, texto, limit, activo)
+
+async def obtener_producto_por_id(db: AsyncSession, producto_id: int, incluir: tuple = ()):
+    producto = await get_producto_by_id(db, producto_id, incluir)
+    if producto is None:
+        raise HTTPException(status_code=404, detail="Producto no encontrado")
+    return producto
+
+async def obtener_productos_por_ids(db: AsyncSession, ids: list):
+    return await get_productos_by_ids(db, ids)
+
+async def crear_nuevo_producto(db: AsyncSession, producto: CrearProducto):
+    nuevo = await create_producto(db, producto)
+    ajustar_contador("productos", 1)
+    invalidar_entidad("productos")
+    return nuevo
+
+async def actualizar_producto_existente(db: AsyncSession, producto_id: int, producto: CrearProducto):
+    return await _actualizar(db, producto_id, producto, parcial=False)
+
+async def modificar_producto(db: AsyncSession, producto_id: int, cambios: ActualizarProducto):
+    return await _actualizar(db, producto_id, cambios, parcial=True)
+
+async def _actualizar(db: AsyncSession, producto_id: int, datos, parcial: bool):
+    actualizado = await update_producto(db, producto_id, datos, parcial)
+    if actualizado is None:
+        raise HTTPException(status_code=404, detail="Producto no encontrado")
+    invalidar_entidad("productos")
+    return actualizado
+
+async def eliminar_producto(db: AsyncSession, producto_id: int):
+    eliminado = await delete_producto(db, producto_id)
+    if eliminado is None:
+        raise HTTPException(status_code=404, detail="Producto no encontrado")
+    ajustar_contador("productos", -1)
+    invalidar_entidad("productos")
+    return eliminado
@@ -0,0 +1,82 @@
+"""
+Servicio Proveedor (asíncrono):
+Gestiona la lógica de negocio para los proveedores sobre AsyncSession,
+coordinando las operaciones con el repositorio asíncrono.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+from app.schemas.proveedor_schema import ActualizarProveedor, CrearProveedor
+from app.models.proveedor_model import Proveedor as ProveedorModel
+from app.repositories.aio import proveedor_repository as repo
+from app.core.cache import invalidar_entidad
+from app.services.home import ajustar_contador
+
+async def obtener_proveedores(skip: int, limit: int, db: AsyncSession, cursor: str = None):
+    """
+    Obtiene una lista de proveedores con paginación.
+    """
+    return await repo.obtener_proveedores(skip, limit, db, cursor)
+
+async def buscar_proveedores(texto: str, limit: int, db: AsyncSession):
+    """
+    Busca proveedores por texto (nombre o persona de contacto), por relevancia.
+    """
+    return await repo.buscar_proveedores(texto, limit, db)
+
+async def obtener_proveedor_por_id(proveedor_id: int, db: AsyncSession):
+    """
+    Obtiene un proveedor por su ID.
+    Lanza una excepción si no se encuentra.
+    """
+    proveedor = await repo.obtener_proveedor_por_id(proveedor_id, db)
+    if proveedor is None:
+        raise HTTPException(status_code=404, detail="Proveedor no encontrado")
+    return proveedor
+
+async def obtener_proveedores_por_ids(ids: list, db: AsyncSession):
+    """
+    Obtiene los proveedores de una lista de ids, en el orden pedido, e informa los que no existen.
+    """
+    return await repo.obtener_proveedores_por_ids(ids, db)
+
+async def crear_proveedor(proveedor: CrearProveedor, db: AsyncSession):
+    """
+    Crea un nuevo proveedor.
+    """
+    nuevo_proveedor = await repo.crear_proveedor(ProveedorModel(**proveedor.dict()), db)
+    ajustar_contador("proveedores", 1)
+    invalidar_entidad("proveedores")
+    return nuevo_proveedor
+
+async def actualizar_proveedor(proveedor_id: int, datos_actualizados: CrearProveedor, db: AsyncSession):
+    """
+    Actualiza (reemplaza) un proveedor existente.
+    Lanza una excepción si no se encuentra.
+    """
+    return await _actualizar(proveedor_id, datos_actualizados.dict(), db)
+
+async def modificar_proveedor(proveedor_id: int, cambios: ActualizarProveedor, db: AsyncSession):
+    """
+    Modifica solo los campos enviados de un proveedor (PATCH).
+    Lanza una excepción si no se encuentra.
+    """
+    return await _actualizar(proveedor_id, cambios.dict(exclude_unset=True), db)
+
+async def _actualizar(proveedor_id: int, valores: dict, db: AsyncSession):
+    actualizado = await repo.actualizar_proveedor(db, proveedor_id, valores)
+    if actualizado is None:
+        raise HTTPException(status_code=404, detail="Proveedor no encontrado")
+    invalidar_entidad("proveedores")
+    return actualizado
+
+async def eliminar_proveedor(proveedor_id: int, db: AsyncSession):
+    """
+    Elimina un proveedor.
+    Lanza una excepción si no se encuentra (409 si tiene productos asociados).
+    """
+    if await repo.eliminar_proveedor(proveedor_id, db) is None:
+        raise HTTPException(status_code=404, detail="Proveedor no encontrado")
+    ajustar_contador("proveedores", -1)
+    invalidar_entidad("proveedores")
+    return {"detail": "Proveedor eliminado correctamente"}
@@ -0,0 +1,96 @@
+"""
+Servicio Usuario (asíncrono):
+Gestiona la lógica de negocio para los usuarios sobre AsyncSession.
+El hashing bcrypt se ejecuta fuera del event loop, en el pool acotado de app.core.hashing.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+from datetime import timedelta
+from app.schemas.user_schemas import UserCreate, UserUpdate, LoginUser
+from app.models.user_model import UserModel
+from app.repositories.aio import user_repository as repo
+from app.core.security import (
+    create_access_token,
+    ACCESS_TOKEN_EXPIRE_MINUTES
+)
+from app.core.hashing import hashear_password_async, verificar_password_async
+
+async def obtener_usuario_por_username(username: str, db: AsyncSession):
+    """
+    Obtiene un usuario por su nombre de usuario.
+    Lanza una excepción si no se encuentra.
+    """
+    usuario = await repo.obtener_usuario_por_username(username, db)
+    if usuario is None:
+        raise HTTPException(status_code=404, detail="Usuario no encontrado")
+    return usuario
+
+async def obtener_usuario_por_id(user_id: int, db: AsyncSession):
+    """
+    Obtiene un usuario por su ID.
+    Lanza una excepción si no se encuentra.
+    """
+    usuario = await repo.obtener_usuario_por_id(user_id, db)
+    if usuario is None:
+        raise HTTPException(status_code=404, detail="Usuario no encontrado")
+    return usuario
+
+async def crear_usuario(user: UserCreate, db: AsyncSession):
+    """
+    Crea un nuevo usuario.
+    """
+    hashed_password = await hashear_password_async(user.password)
+    nuevo_usuario = UserModel(username=user.username, email=user.email, password=hashed_password)
+    return await repo.crear_usuario(nuevo_usuario, db)
+
+async def actualizar_usuario(user_id: int, user_update: UserUpdate, db: AsyncSession):
+    """
+    Actualiza un usuario existente.
+    Lanza una excepción si no se encuentra.
+    """
+    datos_actualizados = user_update.dict(exclude_unset=True)
+    if user_update.password:
+        datos_actualizados['password'] = await hashear_password_async(user_update.password)
+
+    actualizado = await repo.actualizar_usuario(db, user_id, datos_actualizados)
+    if actualizado is None:
+        raise HTTPException(status_code=404, detail="Usuario no encontrado")
+    return actualizado
+
+async def eliminar_usuario(user_id: int, db: AsyncSession):
+    """
+    Elimina un usuario.
+    Lanza una excepción si no se encuentra.
+    """
+    if await repo.eliminar_usuario(user_id, db) is None:
+        raise HTTPException(status_code=404, detail="Usuario no encontrado")
+    return {"detail": "Usuario eliminado correctamente"}
+
+async def autenticar_usuario(user: LoginUser, db: AsyncSession):
+    """
+    Autentica a un usuario y genera tokens de acceso y refresco.
+    """
+    db_user = await repo.obtener_usuario_por_username(user.username, db)
+    valido, nuevo_hash = await verificar_password_async(user.password, db_user.password) if db_user else (False, None)
+    if not valido:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
+                            detail="Nombre de usuario o contraseña incorrectos")
+
+    # El hash se generó con otro costo de bcrypt: se reemplaza ahora que se conoce la contraseña
+    if nuevo_hash:
+        await repo.actualizar_usuario(db, db_user.id_user, {"password": nuevo_hash})
+
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(data={"sub": db_user.username},
+                                       expires_delta=access_token_expires)
+
+    refresh_token_expires = timedelta(days=7)
+    refresh_token = create_access_token(data={"sub": db_user.username, "type": "refresh"},
+                                        expires_delta=refresh_token_expires)
+
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token
+    }
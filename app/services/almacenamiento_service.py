@@ -9,6 +9,8 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from app.schemas import almacenamiento_schema as schemas
 from app.repositories.almacenamiento_repository import AlmacenamientoRepository
+from app.core.cache import invalidar_entidad
+from app.services.home import ajustar_contador
 
 
 class AlmacenamientoService:
@@ -26,11 +28,11 @@ class AlmacenamientoService:
         self.db = db
         self.repo = AlmacenamientoRepository(db)
 
-    def obtener_todos(self, skip: int = 0, limit: int = 100):
+    def obtener_todos(self, skip: int = 0, limit: int = 100, cursor: str = None):
         """
-        Obtener todos los almacenes con paginación.
+        Obtener una página de almacenes.
         """
-        return self.repo.obtener_todos(skip, limit)
+        return self.repo.obtener_todos(skip, limit, cursor)
 
     def obtener_por_id(self, storage_id: int):
         """
@@ -41,24 +43,45 @@ class AlmacenamientoService:
             raise HTTPException(status_code=404, detail="Almacén no encontrado")
         return almacen
 
+    def obtener_por_ids(self, ids: list):
+        """
+        Obtener los almacenes de una lista de ids (en orden) y los ids que no existen.
+        """
+        return self.repo.obtener_por_ids(ids)
+
     def crear(self, almacen: schemas.CrearAlmacen):
         """
         Crear un nuevo almacén.
         """
-        return self.repo.crear(almacen)
+        nuevo = self.repo.crear(almacen)
+        ajustar_contador("almacenes", 1)
+        invalidar_entidad("almacenes")
+        return nuevo
 
     def actualizar(self, storage_id: int, almacen: schemas.CrearAlmacen):
         """
-        Actualizar un almacén existente.
+        Actualizar (reemplazar) un almacén existente.
         """
-        db_almacen = self.obtener_por_id(storage_id)
-        for key, value in almacen.model_dump().productos():
-            setattr(db_almacen, key, value)
-        return self.repo.actualizar(db_almacen)
+        return self._actualizar(storage_id, almacen.model_dump())
+
+    def modificar(self, storage_id: int, cambios: schemas.ActualizarAlmacen):
+        """
+        Modificar solo los campos enviados de un almacén (PATCH).
+        """
+        return self._actualizar(storage_id, cambios.model_dump(exclude_unset=True))
+
+    def _actualizar(self, storage_id: int, valores: dict):
+        actualizado = self.repo.actualizar(storage_id, valores)
+        if actualizado is None:
+            raise HTTPException(status_code=404, detail="Almacén no encontrado")
+        invalidar_entidad("almacenes")
+        return actualizado
 
     def eliminar(self, storage_id: int):
         """
-        Eliminar un almacén por su ID.
+        Eliminar un almacén por su ID (409 si tiene conteos asociados).
         """
-        almacen = self.obtener_por_id(storage_id)
-        self.repo.eliminar(almacen)
+        if self.repo.eliminar(storage_id) is None:
+            raise HTTPException(status_code=404, detail="Almacén no encontrado")
+        ajustar_contador("almacenes", -1)
+        invalidar_entidad("almacenes")
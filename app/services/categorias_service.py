@@ -7,8 +7,9 @@ de CRUD utilizando el repositorio correspondiente y aplicando reglas de negocio.
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from app.schemas.categorias_schema import CrearCategoria
+from app.schemas.categorias_schema import ActualizarCategoria, CrearCategoria
 from app.repositories.categorias_repository import CategoriaRepository
+from app.core.cache import invalidar_entidad
 
 
 class CategoriaService:
@@ -26,9 +27,9 @@ class CategoriaService:
         self.db = db
         self.repo = CategoriaRepository(db)
 
-    def obtener_todas(self, skip: int = 0, limit: int = 100, tipo=None):
-        """Obtener todas las categorías con paginación y filtro opcional."""
-        return self.repo.obtener_todas(skip, limit, tipo)
+    def obtener_todas(self, skip: int = 0, limit: int = 100, tipo=None, cursor: str = None):
+        """Obtener una página de categorías con filtro opcional."""
+        return self.repo.obtener_todas(skip, limit, tipo, cursor)
 
     def obtener_por_id(self, categoria_id: int):
         """Obtener una categoría por su ID."""
@@ -37,18 +38,33 @@ class CategoriaService:
             raise HTTPException(status_code=404, detail="Categoría no encontrada")
         return categoria
 
+    def obtener_por_ids(self, ids: list):
+        """Obtener las categorías de una lista de ids (en orden) y los ids que no existen."""
+        return self.repo.obtener_por_ids(ids)
+
     def crear(self, categoria: CrearCategoria):
         """Crear una nueva categoría."""
-        return self.repo.crear(categoria)
+        nueva = self.repo.crear(categoria)
+        invalidar_entidad("categorias")
+        return nueva
 
     def actualizar(self, categoria_id: int, categoria: CrearCategoria):
-        """Actualizar una categoría existente."""
-        db_categoria = self.obtener_por_id(categoria_id)
-        for key, value in categoria.model_dump().productos():
-            setattr(db_categoria, key, value)
-        return self.repo.actualizar(db_categoria)
+        """Actualizar (reemplazar) una categoría existente."""
+        return self._actualizar(categoria_id, categoria.model_dump())
+
+    def modificar(self, categoria_id: int, cambios: ActualizarCategoria):
+        """Modificar solo los campos enviados de una categoría (PATCH)."""
+        return self._actualizar(categoria_id, cambios.model_dump(exclude_unset=True))
+
+    def _actualizar(self, categoria_id: int, valores: dict):
+        actualizada = self.repo.actualizar(categoria_id, valores)
+        if actualizada is None:
+            raise HTTPException(status_code=404, detail="Categoría no encontrada")
+        invalidar_entidad("categorias")
+        return actualizada
 
     def eliminar(self, categoria_id: int):
-        """Eliminar una categoría por su ID."""
-        categoria = self.obtener_por_id(categoria_id)
-        self.repo.eliminar(categoria)
+        """Eliminar una categoría por su ID (409 si tiene productos)."""
+        if self.repo.eliminar(categoria_id) is None:
+            raise HTTPException(status_code=404, detail="Categoría no encontrada")
+        invalidar_entidad("categorias")
@@ -9,21 +9,28 @@ Incluye funciones para:
 - Eliminar un conteo.
 """
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.schemas import conteo_schema as schemas
+from app.models.conteo_model import ConteoInventario
+from app.services.home import ajustar_contador
+from app.core import idempotencia
+from app.core.escritor import ESCRITURA_AGRUPADA, escritor
+from app.core.exportacion import FormatoExportacion, exportar, lotes_de_filas
 from app.repositories.conteos_inventario import (
+    consulta_exportacion,
     get_conteos,
     get_conteo_by_id,
-    create_conteo,
+    add_conteo,
     update_conteo,
     delete_conteo
 )
 
 
-def obtener_conteos(db: Session, skip: int, limit: int):
-    """ Obtener todos los conteos de inventario """
-    return get_conteos(db, skip, limit)
+def obtener_conteos(db: Session, skip: int, limit: int, cursor: str = None, campos: tuple = None):
+    """ Obtener una página de conteos de inventario """
+    return get_conteos(db, skip, limit, cursor, campos)
 
 
 def obtener_conteo_por_id(db: Session, count_id: int):
@@ -31,9 +38,46 @@ def obtener_conteo_por_id(db: Session, count_id: int):
     return get_conteo_by_id(db, count_id)
 
 
-def crear_conteo(db: Session, conteo: schemas.CrearConteoInventario):
-    """ Crear un nuevo conteo de inventario """
-    return create_conteo(db, conteo)
+AMBITO_IDEMPOTENCIA = "conteos_inventario"
+
+
+def operacion_alta_conteo(conteo: schemas.CrearConteoInventario, peticion: idempotencia.Peticion = None):
+    """ Alta de un conteo (con su clave de idempotencia) sin commit; la usan crear_conteo y el escritor agrupado """
+    def operacion(sesion: Session):
+        nuevo = add_conteo(sesion, ConteoInventario(**conteo.dict()))
+        if peticion is not None:
+            idempotencia.registrar(sesion, peticion, schemas.ConteoInventario.model_validate(nuevo).model_dump_json())
+        return nuevo
+    return operacion
+
+
+def crear_conteo(db: Session, conteo: schemas.CrearConteoInventario, clave_idempotencia: str = None):
+    """
+    Crear un nuevo conteo de inventario (en lote con ESCRITURA_AGRUPADA=true).
+    Con `clave_idempotencia`, un reintento con la misma clave devuelve la respuesta original.
+    """
+    peticion = idempotencia.peticion_idempotente(AMBITO_IDEMPOTENCIA, clave_idempotencia, conteo)
+    repetida = idempotencia.repeticion(db, peticion)
+    if repetida is not None:
+        return repetida
+
+    operacion = operacion_alta_conteo(conteo, peticion)
+    try:
+        if ESCRITURA_AGRUPADA:
+            nuevo = escritor.ejecutar(operacion)
+        else:
+            nuevo = operacion(db)
+            db.commit()
+    except IntegrityError:
+        db.rollback()
+        # Un reintento concurrente puede chocar con la clave o con otra restricción del alta
+        repetida = idempotencia.repeticion(db, peticion)
+        if repetida is not None:
+            return repetida
+        raise
+    idempotencia.recordar(peticion)
+    ajustar_contador("inventario", 1)
+    return nuevo
 
 
 def actualizar_conteo(db: Session, count_id: int, conteo: schemas.CrearConteoInventario):
@@ -42,7 +86,7 @@ def actualizar_conteo(db: Session, count_id: int, conteo: schemas.CrearConteoInv
     if db_conteo is None:
         raise HTTPException(status_code=404, detail="Conteo de inventario no encontrado")
 
-    for key, value in conteo.dict().productos():
+    for key, value in conteo.dict().items():
         setattr(db_conteo, key, value)
     return update_conteo(db, db_conteo)
 
@@ -52,4 +96,12 @@ def eliminar_conteo(db: Session, count_id: int):
     conteo = get_conteo_by_id(db, count_id)
     if conteo is None:
         raise HTTPException(status_code=404, detail="Conteo de inventario no encontrado")
-    return delete_conteo(db, conteo)
+    resultado = delete_conteo(db, conteo)
+    ajustar_contador("inventario", -1)
+    return resultado
+
+
+def exportar_conteos(formato: FormatoExportacion, producto_id: int = None, almacen_id: int = None, desde=None, hasta=None):
+    """ Generador de bytes con los conteos filtrados en CSV o NDJSON (se consulta al recorrerlo, por lotes) """
+    consulta = consulta_exportacion(producto_id, almacen_id, desde, hasta)
+    return exportar(schemas.ConteoInventario, lotes_de_filas(consulta), formato)
@@ -1,21 +1,83 @@
 """
 Este módulo contiene la lógica de negocio para obtener estadísticas de la página de inicio.
 
-Incluye funciones para:
-- Obtener el conteo de productos.
-- Obtener el conteo de proveedores.
-- Obtener el conteo de almacenes.
-- Obtener el conteo de inventario.
+Incluye:
+- ContadoresHome: Caché en memoria de los totales de la página de inicio.
+- contadores_home: Instancia compartida por las rutas síncronas y asíncronas.
+- ajustar_contador: Actualización incremental usada por las altas y bajas de los servicios.
+- obtener_estadisticas_home: Estadísticas servidas desde la caché (recuento exacto periódico).
+
+Los totales se cargan con una sola consulta y después se mantienen en memoria: las altas y
+bajas confirmadas suman o restan sobre la caché. Como otros procesos (u otras herramientas)
+pueden escribir en la misma base de datos, cada `HOME_RECUENTO_SEGUNDOS` segundos se
+vuelve a contar de forma exacta para corregir la deriva.
 """
 
+import os
+import threading
+import time
+from typing import Optional
+
 from sqlalchemy.orm import Session
 from app.schemas.home import HomeInfo
-from app.repositories.home import (
-    get_count_productos,
-    get_count_proveedores,
-    get_count_almacenes,
-    get_count_inventario
-)
+from app.repositories.home import get_totales
+
+# Segundos entre recuentos exactos; 0 desactiva la caché (se cuenta en cada petición)
+INTERVALO_RECUENTO = float(os.getenv("HOME_RECUENTO_SEGUNDOS", "60"))
+
+
+class ContadoresHome:
+    """
+    Totales de productos, proveedores, almacenes e inventario mantenidos en memoria.
+
+    Mientras no se haya cargado un recuento, `ajustar` no hace nada: el primer
+    `obtener_estadisticas_home` cuenta de forma exacta.
+    """
+
+    def __init__(self, intervalo: float):
+        self.intervalo = intervalo
+        self._lock = threading.Lock()
+        self._valores: Optional[dict] = None
+        self._sincronizado_en = 0.0
+
+    def vigentes(self) -> Optional[dict]:
+        """Copia de los totales si el último recuento no ha vencido; None en caso contrario."""
+        with self._lock:
+            if self._valores is None or time.monotonic() - self._sincronizado_en >= self.intervalo:
+                return None
+            return dict(self._valores)
+
+    def cargar(self, valores: dict):
+        """Reemplaza los totales con un recuento exacto."""
+        with self._lock:
+            self._valores = dict(valores)
+            self._sincronizado_en = time.monotonic()
+
+    def ajustar(self, clave: str, delta: int):
+        """Suma `delta` al total `clave` si hay un recuento cargado."""
+        with self._lock:
+            if self._valores is not None:
+                self._valores[clave] += delta
+
+    def invalidar(self):
+        """Descarta los totales; el próximo acceso vuelve a contar."""
+        with self._lock:
+            self._valores = None
+
+
+contadores_home = ContadoresHome(INTERVALO_RECUENTO)
+
+
+def ajustar_contador(clave: str, delta: int):
+    """
+    Ajustar un total de la página de inicio tras un alta (+1) o una baja (-1) confirmada.
+
+    Parámetros:
+    - clave (str): "productos", "proveedores", "almacenes" o "inventario".
+    - delta (int): Cantidad a sumar.
+    """
+    contadores_home.ajustar(clave, delta)
+
 
 def obtener_estadisticas_home(db: Session) -> HomeInfo:
     """
@@ -28,19 +90,13 @@ def obtener_estadisticas_home(db: Session) -> HomeInfo:
     - Total de registros en inventario.
 
     Parámetros:
-    - db (Session): Sesión de base de datos.
+    - db (Session): Sesión de base de datos (solo se usa al recontar).
 
     Retorna:
     - HomeInfo: Objeto con las estadísticas generales.
     """
-    productos_count = get_count_productos(db)
-    proveedores_count = get_count_proveedores(db)
-    almacenes_count = get_count_almacenes(db)
-    inventario_count = get_count_inventario(db)
-
-    return HomeInfo(
-        productos=productos_count,
-        proveedores=proveedores_count,
-        almacenes=almacenes_count,
-        inventario=inventario_count
-    )
+    valores = contadores_home.vigentes()
+    if valores is None:
+        valores = get_totales(db)
+        contadores_home.cargar(valores)
+    return HomeInfo(**valores)
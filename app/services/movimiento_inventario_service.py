@@ -2,19 +2,38 @@
 Servicio MovimientoInventario:
 Gestiona la lógica de negocio para los movimientos de inventario,
 coordinando las operaciones con el repositorio.
+
+Cada alta, modificación o baja ajusta stock_actual en la misma transacción
+que el movimiento (el commit lo realiza el repositorio de movimientos). Con
+ESCRITURA_AGRUPADA=true las altas se confirman en lote desde app.core.escritor.
+Las altas admiten una clave de idempotencia (app.core.idempotencia).
 """
 
+import json
+from collections import defaultdict
+from typing import List
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from app.schemas.movimiento_schema import CrearMovimientoInventario
+from app.schemas.movimiento_schema import (
+    CrearMovimientoInventario,
+    ErrorFilaMovimiento,
+    ResultadoCargaMovimientos
+)
+from app.schemas import movimiento_schema
 from app.models.movimiento_model import MovimientoInventario
+from app.core import idempotencia
+from app.core.escritor import ESCRITURA_AGRUPADA, escritor
+from app.core.exportacion import FormatoExportacion, exportar, lotes_de_filas
 from app.repositories import movimiento_inventario_repository as repo
+from app.repositories import stock_repository as stock_repo
 
-def obtener_movimientos_inventario(skip: int, limit: int, db: Session):
+def obtener_movimientos_inventario(skip: int, limit: int, db: Session, cursor: str = None, campos: tuple = None):
     """
-    Obtiene una lista de movimientos de inventario con paginación.
+    Obtiene una página de movimientos de inventario (con `campos`, solo esas columnas).
     """
-    return repo.obtener_movimientos_inventario(skip, limit, db)
+    return repo.obtener_movimientos_inventario(skip, limit, db, cursor, campos)
 
 def obtener_movimiento_por_id(movement_id: int, db: Session):
     """
@@ -26,12 +45,61 @@ def obtener_movimiento_por_id(movement_id: int, db: Session):
         raise HTTPException(status_code=404, detail="Movimiento no encontrado")
     return movimiento
 
-def crear_movimiento(movimiento: CrearMovimientoInventario, db: Session):
+AMBITO_IDEMPOTENCIA = "movimientos_inventario"
+
+def error_integridad(exc: IntegrityError, movimiento: CrearMovimientoInventario):
+    """
+    Traduce la violación del índice único (producto_id, numero_referencia) a un 409;
+    cualquier otro error de integridad se devuelve sin cambios.
+    """
+    if "numero_referencia" in str(exc.orig):
+        return HTTPException(status_code=status.HTTP_409_CONFLICT,
+                             detail=f"Ya existe un movimiento con numero_referencia {movimiento.numero_referencia!r} "
+                                    f"para el producto {movimiento.producto_id}")
+    return exc
+
+def operacion_alta_movimiento(movimiento: CrearMovimientoInventario, peticion: idempotencia.Peticion = None):
+    """
+    Alta de un movimiento (con su ajuste de stock y su clave de idempotencia) sin commit.
+    La usan crear_movimiento y el escritor agrupado.
+    """
+    def operacion(sesion: Session):
+        stock_repo.ajustar_stock(sesion, movimiento.producto_id,
+                                 stock_repo.delta_movimiento(movimiento.tipo_movimiento, movimiento.cantidad))
+        nuevo = repo.agregar_movimiento(MovimientoInventario(**movimiento.dict()), sesion)
+        if peticion is not None:
+            idempotencia.registrar(sesion, peticion,
+                                   movimiento_schema.MovimientoInventario.model_validate(nuevo).model_dump_json())
+        return nuevo
+    return operacion
+
+def crear_movimiento(movimiento: CrearMovimientoInventario, db: Session, clave_idempotencia: str = None):
     """
     Crea un nuevo movimiento de inventario.
+    Con `clave_idempotencia`, un reintento con la misma clave devuelve la respuesta original
+    sin crear otro movimiento; un numero_referencia repetido para el producto da 409.
     """
-    nuevo_movimiento = MovimientoInventario(**movimiento.dict())
-    return repo.crear_movimiento(nuevo_movimiento, db)
+    peticion = idempotencia.peticion_idempotente(AMBITO_IDEMPOTENCIA, clave_idempotencia, movimiento)
+    repetida = idempotencia.repeticion(db, peticion)
+    if repetida is not None:
+        return repetida
+
+    operacion = operacion_alta_movimiento(movimiento, peticion)
+    try:
+        if ESCRITURA_AGRUPADA:
+            nuevo = escritor.ejecutar(operacion)
+        else:
+            nuevo = operacion(db)
+            db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        # Un reintento concurrente choca con la clave o con otra restricción (numero_referencia)
+        repetida = idempotencia.repeticion(db, peticion)
+        if repetida is not None:
+            return repetida
+        raise error_integridad(exc, movimiento)
+    idempotencia.recordar(peticion)
+    return nuevo
 
 def actualizar_movimiento(movement_id: int, datos_actualizados: CrearMovimientoInventario, db: Session):
     """
@@ -41,8 +109,17 @@ def actualizar_movimiento(movement_id: int, datos_actualizados: CrearMovimientoI
     movimiento_existente = repo.obtener_movimiento_por_id(movement_id, db)
     if movimiento_existente is None:
         raise HTTPException(status_code=404, detail="Movimiento no encontrado")
-    
-    return repo.actualizar_movimiento(db, movimiento_existente, datos_actualizados.dict())
+
+    # Revertir el efecto anterior y aplicar el nuevo (el producto puede haber cambiado)
+    stock_repo.ajustar_stock(db, movimiento_existente.producto_id,
+                             -stock_repo.delta_movimiento(movimiento_existente.tipo_movimiento, movimiento_existente.cantidad))
+    stock_repo.ajustar_stock(db, datos_actualizados.producto_id,
+                             stock_repo.delta_movimiento(datos_actualizados.tipo_movimiento, datos_actualizados.cantidad))
+    try:
+        return repo.actualizar_movimiento(db, movimiento_existente, datos_actualizados.dict())
+    except IntegrityError as exc:
+        db.rollback()
+        raise error_integridad(exc, datos_actualizados)
 
 def eliminar_movimiento(movement_id: int, db: Session):
     """
@@ -52,6 +129,139 @@ def eliminar_movimiento(movement_id: int, db: Session):
     movimiento_existente = repo.obtener_movimiento_por_id(movement_id, db)
     if movimiento_existente is None:
         raise HTTPException(status_code=404, detail="Movimiento no encontrado")
-    
+
+    stock_repo.ajustar_stock(db, movimiento_existente.producto_id,
+                             -stock_repo.delta_movimiento(movimiento_existente.tipo_movimiento, movimiento_existente.cantidad))
     repo.eliminar_movimiento(movimiento_existente, db)
     return {"detail": "Movimiento eliminado correctamente"}
+
+
+# =====================================
+# CARGA MASIVA DE MOVIMIENTOS
+# =====================================
+
+TAMANO_LOTE = 500
+
+_adaptador_lote = TypeAdapter(List[CrearMovimientoInventario])
+_adaptador_fila = TypeAdapter(CrearMovimientoInventario)
+
+
+def _decodificar_filas(cuerpo: bytes, ndjson: bool):
+    """
+    Decodifica el cuerpo como arreglo JSON o NDJSON (un objeto por línea).
+    Devuelve la lista de filas decodificadas y los errores de sintaxis por fila.
+    """
+    if not ndjson:
+        try:
+            datos = json.loads(cuerpo)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=f"JSON inválido: {exc}")
+        if not isinstance(datos, list):
+            raise HTTPException(status_code=400, detail="Se esperaba un arreglo JSON de movimientos")
+        return datos, {}
+
+    filas, errores = [], {}
+    for linea in cuerpo.splitlines():
+        if not linea.strip():
+            continue
+        try:
+            filas.append(json.loads(linea))
+        except ValueError as exc:
+            errores[len(filas)] = [f"JSON inválido: {exc}"]
+            filas.append(None)
+    return filas, errores
+
+
+def _mensajes(errores_pydantic, desde: int = 0) -> List[str]:
+    return [f"{'.'.join(str(p) for p in error['loc'][desde:]) or 'fila'}: {error['msg']}" for error in errores_pydantic]
+
+
+def _validar_filas(filas: list, errores: dict):
+    """
+    Valida las filas en lotes con un TypeAdapter. Si un lote falla, solo se
+    revalidan individualmente las filas de ese lote para separar las válidas.
+    """
+    validas = []
+    for inicio in range(0, len(filas), TAMANO_LOTE):
+        indices = [i for i in range(inicio, min(inicio + TAMANO_LOTE, len(filas))) if i not in errores]
+        try:
+            modelos = _adaptador_lote.validate_python([filas[i] for i in indices])
+            validas.extend(zip(indices, modelos))
+        except ValidationError as exc:
+            por_posicion = defaultdict(list)
+            for error in exc.errors(include_url=False):
+                por_posicion[error["loc"][0]].append(error)
+            for posicion, indice in enumerate(indices):
+                if posicion in por_posicion:
+                    errores[indice] = _mensajes(por_posicion[posicion], desde=1)
+                else:
+                    validas.append((indice, _adaptador_fila.validate_python(filas[indice])))
+    return validas
+
+
+def _insertar(validas: list, db: Session):
+    """Inserta los movimientos válidos y ajusta stock_actual con un delta agregado por producto."""
+    repo.insertar_movimientos([movimiento.dict() for _, movimiento in validas], db)
+    deltas = defaultdict(float)
+    for _, movimiento in validas:
+        deltas[movimiento.producto_id] += stock_repo.delta_movimiento(movimiento.tipo_movimiento, movimiento.cantidad)
+    for producto_id, delta in deltas.items():
+        stock_repo.ajustar_stock(db, producto_id, delta)
+
+
+def cargar_movimientos(cuerpo: bytes, ndjson: bool, atomic: bool, db: Session) -> ResultadoCargaMovimientos:
+    """
+    Inserta un lote de movimientos en una sola transacción.
+
+    Las filas inválidas (JSON, esquema o producto inexistente) se informan por posición.
+    Con atomic=True cualquier error aborta la carga completa (HTTP 422); en caso
+    contrario se insertan las filas válidas y se devuelven los errores del resto.
+    """
+    filas, errores = _decodificar_filas(cuerpo, ndjson)
+    validas = _validar_filas(filas, errores)
+
+    existentes = repo.productos_existentes({m.producto_id for _, m in validas}, db)
+    for indice, movimiento in validas:
+        if movimiento.producto_id not in existentes:
+            errores[indice] = [f"producto_id: el producto {movimiento.producto_id} no existe"]
+    validas = [(i, m) for i, m in validas if i not in errores]
+
+    def resultado(insertados: int) -> ResultadoCargaMovimientos:
+        return ResultadoCargaMovimientos(
+            recibidos=len(filas),
+            insertados=insertados,
+            errores=[ErrorFilaMovimiento(fila=i, errores=errores[i]) for i in sorted(errores)],
+        )
+
+    if atomic and errores:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=resultado(0).model_dump())
+
+    try:
+        _insertar(validas, db)
+        db.commit()
+        return resultado(len(validas))
+    except SQLAlchemyError as exc:
+        db.rollback()
+        if atomic:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                detail=f"No se pudo insertar el lote: {exc.__class__.__name__}")
+
+    # Sin atomic: aislar las filas que fallan en la base de datos con un savepoint por fila
+    insertadas = 0
+    for indice, movimiento in validas:
+        try:
+            with db.begin_nested():
+                _insertar([(indice, movimiento)], db)
+            insertadas += 1
+        except SQLAlchemyError as exc:
+            errores[indice] = [f"base de datos: {exc.__class__.__name__}"]
+    db.commit()
+    return resultado(insertadas)
+
+def exportar_movimientos(formato: FormatoExportacion, producto_id: int = None, desde=None, hasta=None):
+    """
+    Devuelve un generador de bytes con los movimientos filtrados en CSV o NDJSON.
+    La consulta se ejecuta al recorrerlo, por lotes y con su propia conexión.
+    """
+    consulta = repo.consulta_exportacion(producto_id, desde, hasta)
+    return exportar(movimiento_schema.MovimientoInventario, lotes_de_filas(consulta), formato)
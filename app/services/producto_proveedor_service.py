@@ -9,26 +9,37 @@ from fastapi import HTTPException, status
 from app.schemas.producto_proveedor_schema import CrearProductoProveedor
 from app.models.producto_proveedor_model import ProveedorProducto
 from app.repositories import producto_proveedor_repository as repo
+from app.core.cache import invalidar_entidad
+from app.core.importacion import importar_csv
+from app.schemas.importacion_schema import ResultadoImportacion
 
-def obtener_productos_proveedor(skip: int, limit: int, db: Session):
-    return repo.obtener_productos_proveedor(skip, limit, db)
+def obtener_productos_proveedor(skip: int, limit: int, db: Session, cursor: str = None, incluir: tuple = ()):
+    return repo.obtener_productos_proveedor(skip, limit, db, cursor, incluir)
 
-def obtener_producto_proveedor_por_id(producto_proveedor_id: int, db: Session):
-    producto_proveedor = repo.obtener_producto_proveedor_por_id(producto_proveedor_id, db)
+def obtener_producto_proveedor_por_id(producto_proveedor_id: int, db: Session, incluir: tuple = ()):
+    producto_proveedor = repo.obtener_producto_proveedor_por_id(producto_proveedor_id, db, incluir)
     if producto_proveedor is None:
         raise HTTPException(status_code=404, detail="Producto de proveedor no encontrado")
     return producto_proveedor
 
+def obtener_productos_proveedor_por_ids(ids: list, db: Session):
+    return repo.obtener_productos_proveedor_por_ids(ids, db)
+
 def crear_producto_proveedor(producto_proveedor: CrearProductoProveedor, db: Session):
     nuevo_producto_proveedor = ProveedorProducto(**producto_proveedor.dict())
-    return repo.crear_producto_proveedor(nuevo_producto_proveedor, db)
+    creado = repo.crear_producto_proveedor(nuevo_producto_proveedor, db)
+    # Las respuestas cacheadas de /productos con include=proveedores dependen de esta tabla
+    invalidar_entidad("proveedor_productos")
+    return creado
 
 def actualizar_producto_proveedor(producto_proveedor_id: int, datos_actualizados: CrearProductoProveedor, db: Session):
     producto_proveedor_existente = repo.obtener_producto_proveedor_por_id(producto_proveedor_id, db)
     if producto_proveedor_existente is None:
         raise HTTPException(status_code=404, detail="Producto de proveedor no encontrado")
     
-    return repo.actualizar_producto_proveedor(db, producto_proveedor_existente, datos_actualizados.dict())
+    actualizado = repo.actualizar_producto_proveedor(db, producto_proveedor_existente, datos_actualizados.dict())
+    invalidar_entidad("proveedor_productos")
+    return actualizado
 
 def eliminar_producto_proveedor(producto_proveedor_id: int, db: Session):
     producto_proveedor_existente = repo.obtener_producto_proveedor_por_id(producto_proveedor_id, db)
@@ -36,4 +47,18 @@ def eliminar_producto_proveedor(producto_proveedor_id: int, db: Session):
         raise HTTPException(status_code=404, detail="Producto de proveedor no encontrado")
     
     repo.eliminar_producto_proveedor(producto_proveedor_existente, db)
+    invalidar_entidad("proveedor_productos")
     return {"detail": "Producto de proveedor eliminado correctamente"}
+
+# Clave natural con la que la importación reconoce una relación producto-proveedor existente
+CLAVE_IMPORTACION = ("proveedor_id", "producto_id")
+
+def importar_productos_proveedor(lineas, atomic: bool, db: Session) -> ResultadoImportacion:
+    """
+    Importa una lista de precios CSV: inserta las relaciones nuevas y actualiza las existentes
+    (por proveedor y producto) que cambian, en una sola transacción.
+    """
+    resultado = importar_csv(db, lineas, ProveedorProducto, CrearProductoProveedor, CLAVE_IMPORTACION, atomic)
+    if resultado.insertados or resultado.actualizados:
+        invalidar_entidad("proveedor_productos")
+    return resultado
@@ -7,33 +7,130 @@ Incluye funciones para:
 - Crear un nuevo producto.
 - Actualizar un producto existente.
 - Eliminar un producto.
+- Exportar e importar el catálogo en CSV.
+- Actualizar precios de forma masiva (ajuste sobre un filtro o CSV de precios).
+- Autocompletar nombres desde el índice en memoria.
 """
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
-from app.schemas.producto_schemas import CrearProducto
+from app.schemas.producto_schemas import ActualizarProducto, CrearProducto, Producto, SugerenciaProducto
+from app.core.autocompletado import indice_productos
+from app.core.cache import invalidar_entidad
+from app.services.home import ajustar_contador
+from app.core.exportacion import FormatoExportacion, exportar, lotes_de_filas
+from app.core.importacion import importar_csv
+from app.core import precios
+from app.models import producto_model
+from app.schemas.importacion_schema import ResultadoImportacion
+from app.schemas.precios_schema import AjustePrecios, DestinoPrecio, ResultadoPrecios
 from app.repositories.producto import (
+    buscar_productos as buscar,
+    consulta_exportacion,
+    nombres_activos,
     get_productos,
     get_producto_by_id,
+    get_productos_by_ids,
     create_producto,
     update_producto,
     delete_producto
 )
 
-def obtener_todos_los_productos(db: Session, skip: int, limit: int, categoria_id: int, tipo_perecedero, activo: bool):
-    return get_productos(db, skip, limit, categoria_id, tipo_perecedero, activo)
+def obtener_todos_los_productos(db: Session, skip: int, limit: int, categoria_id: int, tipo_perecedero, activo: bool, cursor: str = None,
+                                incluir: tuple = (), campos: tuple = None):
+    return get_productos(db, skip, limit, categoria_id, tipo_perecedero, activo, cursor, incluir, campos)
 
-def obtener_producto_por_id(db: Session, producto_id: int):
-    producto = get_producto_by_id(db, producto_id)
+def buscar_productos(db: Session, texto: str, limit: int, activo: bool = None):
+    return buscar(db, texto, limit, activo)
+
+def obtener_producto_por_id(db: Session, producto_id: int, incluir: tuple = ()):
+    producto = get_producto_by_id(db, producto_id, incluir)
     if producto is None:
         raise HTTPException(status_code=404, detail="Producto no encontrado")
     return producto
 
+def obtener_productos_por_ids(db: Session, ids: list):
+    return get_productos_by_ids(db, ids)
+
 def crear_nuevo_producto(db: Session, producto: CrearProducto):
-    return create_producto(db, producto)
+    nuevo = create_producto(db, producto)
+    ajustar_contador("productos", 1)
+    invalidar_entidad("productos")
+    return nuevo
 
 def actualizar_producto_existente(db: Session, producto_id: int, producto: CrearProducto):
-    return update_producto(db, producto_id, producto)
+    return _actualizar(db, producto_id, producto, parcial=False)
+
+def modificar_producto(db: Session, producto_id: int, cambios: ActualizarProducto):
+    return _actualizar(db, producto_id, cambios, parcial=True)
+
+def _actualizar(db: Session, producto_id: int, datos, parcial: bool):
+    actualizado = update_producto(db, producto_id, datos, parcial)
+    if actualizado is None:
+        raise HTTPException(status_code=404, detail="Producto no encontrado")
+    invalidar_entidad("productos")
+    return actualizado
 
 def eliminar_producto(db: Session, producto_id: int):
-    return delete_producto(db, producto_id)
+    eliminado = delete_producto(db, producto_id)
+    if eliminado is None:
+        raise HTTPException(status_code=404, detail="Producto no encontrado")
+    ajustar_contador("productos", -1)
+    invalidar_entidad("productos")
+    return eliminado
+
+def exportar_productos(formato: FormatoExportacion, categoria_id: int = None, activo: bool = None):
+    """
+    Generador de bytes con el catálogo de productos en CSV o NDJSON (se consulta al recorrerlo, por lotes).
+    """
+    return exportar(Producto, lotes_de_filas(consulta_exportacion(categoria_id, activo)), formato)
+
+# Clave natural con la que la importación reconoce un producto existente
+CLAVE_IMPORTACION = ("nombre",)
+
+def importar_productos(db: Session, lineas, atomic: bool = False) -> ResultadoImportacion:
+    """
+    Importa un catálogo CSV: inserta los productos nuevos y actualiza los existentes (por nombre)
+    que cambian, en una sola transacción.
+    """
+    resultado = importar_csv(db, lineas, producto_model.Producto, CrearProducto, CLAVE_IMPORTACION, atomic)
+    if resultado.insertados:
+        ajustar_contador("productos", resultado.insertados)
+    if resultado.insertados or resultado.actualizados:
+        invalidar_entidad("productos")
+        # La importación escribe sin pasar por el repositorio: reconstruir el índice
+        cargar_indice_autocompletado(db)
+    return resultado
+
+def _invalidar_precios(destino: DestinoPrecio, resultado: ResultadoPrecios):
+    if resultado.afectados and not resultado.dry_run:
+        invalidar_entidad("productos" if destino is DestinoPrecio.PRODUCTO else "proveedor_productos")
+
+def ajustar_precios(db: Session, ajuste: AjustePrecios, dry_run: bool = False) -> ResultadoPrecios:
+    """
+    Aplica un ajuste porcentual o absoluto a los precios del filtro con un único UPDATE.
+    """
+    resultado = precios.ajustar_precios(db, ajuste, dry_run)
+    _invalidar_precios(ajuste.destino, resultado)
+    return resultado
+
+def importar_precios(db: Session, lineas, destino: DestinoPrecio, categoria_id: int = None, proveedor_id: int = None,
+                     tipo_perecible=None, dry_run: bool = False, atomic: bool = False) -> ResultadoPrecios:
+    """
+    Aplica los precios de un CSV a los productos (u ofertas de proveedor) del filtro.
+    """
+    resultado = precios.importar_precios(db, lineas, destino, categoria_id, proveedor_id, tipo_perecible, dry_run, atomic)
+    _invalidar_precios(destino, resultado)
+    return resultado
+
+def cargar_indice_autocompletado(db: Session):
+    """
+    Construye el índice de autocompletado con los productos activos (al arrancar la aplicación).
+    """
+    indice_productos.cargar(nombres_activos(db))
+
+def autocompletar_productos(texto: str, limite: int):
+    """
+    Productos activos con alguna palabra del nombre que empieza por el texto (sin consultar la base).
+    """
+    return [SugerenciaProducto(id=i, nombre=nombre) for i, nombre in indice_productos.buscar(texto, limite)]
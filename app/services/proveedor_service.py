@@ -6,15 +6,23 @@ coordinando las operaciones con el repositorio.
 
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from app.schemas.proveedor_schema import CrearProveedor
+from app.schemas.proveedor_schema import ActualizarProveedor, CrearProveedor
 from app.models.proveedor_model import Proveedor as ProveedorModel
 from app.repositories import proveedor_repository as repo
+from app.core.cache import invalidar_entidad
+from app.services.home import ajustar_contador
 
-def obtener_proveedores(skip: int, limit: int, db: Session):
+def obtener_proveedores(skip: int, limit: int, db: Session, cursor: str = None):
     """
-    Obtiene una lista de proveedores con paginación.
+    Obtiene una página de proveedores.
     """
-    return repo.obtener_proveedores(skip, limit, db)
+    return repo.obtener_proveedores(skip, limit, db, cursor)
+
+def buscar_proveedores(texto: str, limit: int, db: Session):
+    """
+    Busca proveedores por texto (nombre o persona de contacto), por relevancia.
+    """
+    return repo.buscar_proveedores(texto, limit, db)
 
 def obtener_proveedor_por_id(proveedor_id: int, db: Session):
     """
@@ -26,33 +34,50 @@ def obtener_proveedor_por_id(proveedor_id: int, db: Session):
         raise HTTPException(status_code=404, detail="Proveedor no encontrado")
     return proveedor
 
+def obtener_proveedores_por_ids(ids: list, db: Session):
+    """
+    Obtiene los proveedores de una lista de ids, en el orden pedido, e informa los que no existen.
+    """
+    return repo.obtener_proveedores_por_ids(ids, db)
+
 def crear_proveedor(proveedor: CrearProveedor, db: Session):
     """
     Crea un nuevo proveedor.
     """
-    nuevo_proveedor = ProveedorModel(**proveedor.dict())
-    return repo.crear_proveedor(nuevo_proveedor, db)
+    nuevo_proveedor = repo.crear_proveedor(ProveedorModel(**proveedor.dict()), db)
+    ajustar_contador("proveedores", 1)
+    invalidar_entidad("proveedores")
+    return nuevo_proveedor
 
 def actualizar_proveedor(proveedor_id: int, datos_actualizados: CrearProveedor, db: Session):
     """
-    Actualiza un proveedor existente.
+    Actualiza (reemplaza) un proveedor existente.
     Lanza una excepción si no se encuentra.
     """
-    proveedor_existente = repo.obtener_proveedor_por_id(proveedor_id, db)
-    if proveedor_existente is None:
+    return _actualizar(proveedor_id, datos_actualizados.dict(), db)
+
+def modificar_proveedor(proveedor_id: int, cambios: ActualizarProveedor, db: Session):
+    """
+    Modifica solo los campos enviados de un proveedor (PATCH).
+    Lanza una excepción si no se encuentra.
+    """
+    return _actualizar(proveedor_id, cambios.dict(exclude_unset=True), db)
+
+def _actualizar(proveedor_id: int, valores: dict, db: Session):
+    actualizado = repo.actualizar_proveedor(db, proveedor_id, valores)
+    if actualizado is None:
         raise HTTPException(status_code=404, detail="Proveedor no encontrado")
-    
-    return repo.actualizar_proveedor(db, proveedor_existente, datos_actualizados.dict())
+    invalidar_entidad("proveedores")
+    return actualizado
 
 def eliminar_proveedor(proveedor_id: int, db: Session):
     """
     Elimina un proveedor.
-    Lanza una excepción si no se encuentra.
+    Lanza una excepción si no se encuentra (409 si tiene productos asociados).
     """
-    proveedor_existente = repo.obtener_proveedor_por_id(proveedor_id, db)
-    if proveedor_existente is None:
+    if repo.eliminar_proveedor(proveedor_id, db) is None:
         raise HTTPException(status_code=404, detail="Proveedor no encontrado")
-    
-    repo.eliminar_proveedor(proveedor_existente, db)
+    ajustar_contador("proveedores", -1)
+    invalidar_entidad("proveedores")
     return {"detail": "Proveedor eliminado correctamente"}
 # Compare this snippet from app/api/routers/__init__.py:
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Servicio StockActual:
+Gestiona la consulta, verificación y reconstrucción del stock materializado.
+"""
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from app.repositories import stock_repository as repo
+
+def obtener_stock(skip: int, limit: int, db: Session, cursor: str = None):
+    """
+    Obtiene una página del stock actual de los productos.
+    """
+    return repo.obtener_stock(db, skip, limit, cursor)
+
+def obtener_stock_producto(producto_id: int, db: Session):
+    """
+    Obtiene el stock actual de un producto.
+    Lanza una excepción si el producto no tiene stock registrado.
+    """
+    stock = repo.obtener_stock_producto(db, producto_id)
+    if stock is None:
+        raise HTTPException(status_code=404, detail="Stock no encontrado para el producto")
+    return stock
+
+def verificar_stock(db: Session):
+    """
+    Devuelve las discrepancias entre stock_actual y el historial de movimientos.
+    """
+    return repo.verificar_stock(db)
+
+def reconstruir_stock(db: Session):
+    """
+    Recalcula stock_actual desde el historial y verifica el resultado.
+    """
+    productos = repo.reconstruir_stock(db)
+    return {"productos": productos, "diferencias": repo.verificar_stock(db)}
@@ -12,11 +12,10 @@ from app.models.user_model import UserModel
 from app.repositories import user_repository as repo
 from app.core.security import (
     decode_access_token, 
-    verify_password, 
-    get_password_hash,
     create_access_token, 
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
+from app.core.hashing import hashear_password, verificar_password
 
 def obtener_usuario_por_username(username: str, db: Session):
     """
@@ -42,7 +41,7 @@ def crear_usuario(user: UserCreate, db: Session):
     """
     Crea un nuevo usuario.
     """
-    hashed_password = get_password_hash(user.password)
+    hashed_password = hashear_password(user.password)
     nuevo_usuario = UserModel(username=user.username, email=user.email, password=hashed_password)
     return repo.crear_usuario(nuevo_usuario, db)
 
@@ -51,26 +50,22 @@ def actualizar_usuario(user_id: int, user_update: UserUpdate, db: Session):
     Actualiza un usuario existente.
     Lanza una excepción si no se encuentra.
     """
-    usuario_existente = repo.obtener_usuario_por_id(user_id, db)
-    if usuario_existente is None:
-        raise HTTPException(status_code=404, detail="Usuario no encontrado")
-
     datos_actualizados = user_update.dict(exclude_unset=True)
     if user_update.password:
-        datos_actualizados['password'] = get_password_hash(user_update.password)
+        datos_actualizados['password'] = hashear_password(user_update.password)
 
-    return repo.actualizar_usuario(db, usuario_existente, datos_actualizados)
+    actualizado = repo.actualizar_usuario(db, user_id, datos_actualizados)
+    if actualizado is None:
+        raise HTTPException(status_code=404, detail="Usuario no encontrado")
+    return actualizado
 
 def eliminar_usuario(user_id: int, db: Session):
     """
     Elimina un usuario.
     Lanza una excepción si no se encuentra.
     """
-    usuario_existente = repo.obtener_usuario_por_id(user_id, db)
-    if usuario_existente is None:
+    if repo.eliminar_usuario(user_id, db) is None:
         raise HTTPException(status_code=404, detail="Usuario no encontrado")
-    
-    repo.eliminar_usuario(usuario_existente, db)
     return {"detail": "Usuario eliminado correctamente"}
 
 def autenticar_usuario(user: LoginUser, db: Session):
@@ -78,10 +73,15 @@ def autenticar_usuario(user: LoginUser, db: Session):
     Autentica a un usuario y genera tokens de acceso y refresco.
     """
     db_user = repo.obtener_usuario_por_username(user.username, db)
-    if not db_user or not verify_password(user.password, db_user.password):
+    valido, nuevo_hash = verificar_password(user.password, db_user.password) if db_user else (False, None)
+    if not valido:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                             detail="Nombre de usuario o contraseña incorrectos")
 
+    # El hash se generó con otro costo de bcrypt: se reemplaza ahora que se conoce la contraseña
+    if nuevo_hash:
+        repo.actualizar_usuario(db, db_user.id_user, {"password": nuevo_hash})
+
     # Crear el access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(data={"sub": db_user.username},
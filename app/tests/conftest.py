@@ -0,0 +1,67 @@
+"""
+conftest.py
+
+Fixtures compartidas por las pruebas: una base SQLite en memoria por prueba y un cliente de
+FastAPI con los routers indicados. Cada archivo de pruebas solo agrega sus datos iniciales.
+
+Fixtures:
+- engine: Motor en memoria (StaticPool) con todas las tablas de Base.metadata.
+- sesiones: sessionmaker ligado a `engine`.
+- db: Sesión abierta durante la prueba.
+- crear_cliente: Crea un TestClient con los routers dados; apunta el ETag a `engine`, vacía la
+  caché de respuestas y reemplaza get_db por una sesión de `sesiones`.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.core import cache, etag
+from app.core.cache import CacheRespuestas
+from app.core.config import Base, get_db
+from app.models import (  # noqa: F401
+    almacen_model, categoria_model, conteo_model, movimiento_model, producto_model,
+    producto_proveedor_model, proveedor_model, stock_model, user_model,
+)
+
+
+@pytest.fixture
+def engine():
+    # Un motor por prueba: las tablas de las migraciones (versiones_tabla, FTS5) viven fuera de Base.metadata
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sesiones(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db(sesiones):
+    with sesiones() as session:
+        yield session
+
+
+@pytest.fixture
+def crear_cliente(engine, sesiones, monkeypatch):
+    monkeypatch.setattr(etag, "engine", engine)
+    monkeypatch.setattr(cache, "cache_respuestas", CacheRespuestas(max_entradas=16, ttl=60))
+    abiertas = []
+
+    def crear(*routers) -> TestClient:
+        app = FastAPI()
+        for router in routers:
+            app.include_router(router)
+        session = sesiones()
+        abiertas.append(session)
+        app.dependency_overrides[get_db] = lambda: session
+        return TestClient(app)
+
+    yield crear
+    for session in abiertas:
+        session.close()
@@ -0,0 +1,43 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from app.api.middelwares.auth_middelware import AuthMiddleware
+from app.core.security import ALGORITHM, SECRET_KEY, create_access_token
+
+app = FastAPI()
+app.add_middleware(AuthMiddleware, secret_key=SECRET_KEY, algorithm=ALGORITHM)
+
+
+@app.get("/yo")
+def yo(request: Request):
+    return {"user": request.state.user}
+
+
+@app.get("/docs-prueba")
+def docs():
+    return {"ok": True}
+
+
+client = TestClient(app)
+
+
+# Prueba: sin token o con token inválido se responde 401 (antes terminaba en 500)
+def test_sin_token_responde_401():
+    respuesta = client.get("/yo")
+    assert respuesta.status_code == 401
+    assert respuesta.json() == {"detail": "No autorizado"}
+    assert respuesta.headers["www-authenticate"] == "Bearer"
+
+    respuesta = client.get("/yo", headers={"Authorization": "Bearer no-es-un-jwt"})
+    assert respuesta.status_code == 401
+    assert respuesta.json() == {"detail": "Token inválido o expirado"}
+
+
+# Prueba: con token válido el usuario llega a request.state; las rutas excluidas no piden token
+def test_token_valido_y_rutas_excluidas():
+    token = create_access_token({"sub": "ana"})
+    respuesta = client.get("/yo", headers={"Authorization": f"Bearer {token}"})
+    assert respuesta.status_code == 200
+    assert respuesta.json() == {"user": "ana"}
+
+    assert client.get("/docs-prueba").status_code == 200
+    assert client.options("/yo").status_code != 401
@@ -0,0 +1,55 @@
+import pytest
+from app.core.autocompletado import IndicePrefijos, indice_productos, normalizar
+from app.schemas.producto_schemas import CrearProducto
+from app.services import productos
+
+@pytest.fixture
+def db(engine, db):
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Verduras', 'INGREDIENTE')")
+        conexion.exec_driver_sql(
+            "INSERT INTO productos (nombre, categoria_id, activo) VALUES "
+            "('Tomate perita', 1, 1), ('Tomillo', 1, 1), ('Tomate cherry', 1, 0)"
+        )
+    productos.cargar_indice_autocompletado(db)
+    yield db
+    indice_productos.cargar([])
+
+
+# Prueba: normalización y búsqueda por el comienzo de cualquier palabra, sin repetir ids
+def test_indice_prefijos():
+    assert normalizar("  Jalapeño  EN-Lata ") == "jalapeno en lata"
+    indice = IndicePrefijos()
+    indice.cargar([(1, "Harina 000"), (2, "Harina de maíz"), (3, "Maíz pisingallo"), (4, "Pan de maíz")])
+
+    assert indice.buscar("HAR") == [(1, "Harina 000"), (2, "Harina de maíz")]
+    assert [i for i, _ in indice.buscar("maiz")] == [2, 4, 3]
+    assert indice.buscar("ma", limite=1) == [(2, "Harina de maíz")]
+    assert indice.buscar("?!") == []
+
+    indice.actualizar(2, "Harina de arroz")
+    indice.actualizar(5, "Harina 000")
+    indice.eliminar(3)
+    assert [i for i, _ in indice.buscar("maiz")] == [4]
+    assert [i for i, _ in indice.buscar("harina 0")] == [1, 5]
+    indice.eliminar(1)
+    assert indice.buscar("harina 0") == [(5, "Harina 000")]
+    assert len(indice) == 3
+
+
+# Prueba: el índice se carga con los activos y los repositorios lo mantienen en altas, cambios y bajas
+def test_repositorio_mantiene_indice(db):
+    def nombres(texto):
+        return [s.nombre for s in productos.autocompletar_productos(texto, 10)]
+
+    assert nombres("tom") == ["Tomate perita", "Tomillo"]
+    nuevo = productos.crear_nuevo_producto(db, CrearProducto(nombre="Tomate de árbol", categoria_id=1))
+    assert nombres("arbol") == ["Tomate de árbol"]
+
+    productos.actualizar_producto_existente(db, nuevo.id, CrearProducto(nombre="Tamarillo", categoria_id=1))
+    assert nombres("tom") == ["Tomate perita", "Tomillo"]
+    productos.actualizar_producto_existente(db, 2, CrearProducto(nombre="Tomillo", categoria_id=1, activo=False))
+    assert nombres("tom") == ["Tomate perita"]
+
+    productos.eliminar_producto(db, nuevo.id)
+    assert nombres("tam") == []
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.api.routers.proveedores import router as proveedores_router
+from app.core.busqueda import consulta_fts
+from app.core.config import Base
+from app.core.migraciones import aplicar_migraciones
+from app.models.producto_model import Producto
+from app.repositories import producto
+from app.repositories.aio import producto as producto_aio
+
+
+@pytest.fixture
+def engine(engine):
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Abarrotes', 'INGREDIENTE')")
+        # Filas anteriores a la migración: la reconstrucción inicial las indexa
+        conexion.exec_driver_sql(
+            "INSERT INTO productos (nombre, descripcion, categoria_id, activo) VALUES "
+            "('Harina 000', 'Harina de trigo', 1, 1), ('Harina integral', NULL, 1, 1), "
+            "('Salsa lista', 'Con tomate natural', 1, 1), ('Tomate perita', NULL, 1, 1), "
+            "('Café molido', 'Tostado medio', 1, 0)"
+        )
+        conexion.exec_driver_sql(
+            "INSERT INTO proveedores (nombre, persona_contacto) VALUES ('Molinos del Sur', 'José Pérez'), ('Huerta', 'Ana')"
+        )
+    aplicar_migraciones(engine)
+    return engine
+
+
+# Prueba: la entrada del usuario se convierte en prefijos entre comillas, sin operadores de FTS5
+def test_consulta_fts():
+    assert consulta_fts('harina 000') == '"harina"* "000"*'
+    assert consulta_fts('to"mate OR -x*') == '"to"* "mate"* "OR"* "x"*'
+    assert consulta_fts(' -*" ') is None
+
+
+# Prueba: prefijos, tildes y ranking (una coincidencia en el nombre pesa más que en la descripción)
+def test_buscar_productos(db):
+    def nombres(texto, **filtros):
+        return [p.nombre for p in producto.buscar_productos(db, texto, 10, **filtros)]
+
+    assert nombres("tomate") == ["Tomate perita", "Salsa lista"]
+    assert nombres("harina 000") == ["Harina 000"]
+    assert sorted(nombres("HARIN")) == ["Harina 000", "Harina integral"]
+    assert nombres("cafe") == ["Café molido"]
+    assert nombres("cafe", activo=True) == []
+    assert nombres("***") == []
+
+
+# Prueba: los triggers mantienen el índice al insertar, actualizar y eliminar
+def test_triggers_sincronizan_indice(db):
+    arroz = Producto(nombre="Arroz largo fino", categoria_id=1)
+    db.add(arroz)
+    db.commit()
+    assert [p.nombre for p in producto.buscar_productos(db, "arroz", 10)] == ["Arroz largo fino"]
+
+    arroz.nombre = "Arroz yamaní"
+    db.commit()
+    assert producto.buscar_productos(db, "fino", 10) == []
+    assert [p.nombre for p in producto.buscar_productos(db, "yamani", 10)] == ["Arroz yamaní"]
+
+    db.delete(arroz)
+    db.commit()
+    assert producto.buscar_productos(db, "arroz", 10) == []
+
+
+# Prueba: GET /proveedores/search y la versión asíncrona del repositorio de productos
+def test_endpoint_y_async(crear_cliente, tmp_path):
+    respuesta = crear_cliente(proveedores_router).get("/proveedores/search", params={"q": "jose"})
+    assert respuesta.status_code == 200
+    assert [p["nombre"] for p in respuesta.json()] == ["Molinos del Sur"]
+
+    ruta = tmp_path / "busqueda.db"
+    sincrono = create_engine(f"sqlite:///{ruta}")
+    Base.metadata.create_all(bind=sincrono)
+    aplicar_migraciones(sincrono)
+    with sincrono.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Abarrotes', 'INGREDIENTE')")
+        conexion.exec_driver_sql("INSERT INTO productos (nombre, categoria_id, activo) VALUES ('Azúcar rubia', 1, 1)")
+    sincrono.dispose()
+
+    async def buscar():
+        motor = create_async_engine(f"sqlite+aiosqlite:///{ruta}")
+        async with AsyncSession(motor) as sesion:
+            encontrados = await producto_aio.buscar_productos(sesion, "azucar", 10)
+        await motor.dispose()
+        return encontrados
+
+    assert [p.nombre for p in asyncio.run(buscar())] == ["Azúcar rubia"]
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from app.core import cache
+from app.core.cache import CacheRespuestas, invalidar_entidad, ruta_cacheada
+
+
+# Prueba: LRU desaloja la entrada menos usada y el TTL vence entradas
+def test_lru_y_ttl():
+    almacen = CacheRespuestas(max_entradas=2, ttl=60)
+    almacen.guardar("a", 1)
+    almacen.guardar("b", 2)
+    assert almacen.obtener("a") == 1
+    almacen.guardar("c", 3)
+    assert almacen.obtener("b") is None
+    assert almacen.estadisticas()["desalojos"] == 1
+
+    vencida = CacheRespuestas(max_entradas=2, ttl=0)
+    vencida.guardar("a", 1)
+    assert vencida.obtener("a") is None
+    assert vencida.estadisticas()["expiraciones"] == 1
+
+
+# Prueba: el router cacheado no vuelve a ejecutar la ruta hasta que la entidad cambia de versión
+def test_ruta_cacheada_invalida_por_version(monkeypatch):
+    monkeypatch.setattr(cache, "cache_respuestas", CacheRespuestas(max_entradas=16, ttl=60))
+    llamadas = []
+    router = APIRouter(prefix="/items", route_class=ruta_cacheada("items_prueba"))
+
+    @router.get("/")
+    def listar(tipo: str = None):
+        llamadas.append(tipo)
+        return {"llamadas": len(llamadas)}
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    assert client.get("/items/").json() == {"llamadas": 1}
+    assert client.get("/items/").json() == {"llamadas": 1}
+    assert client.get("/items/?tipo=x").json() == {"llamadas": 2}
+
+    invalidar_entidad("items_prueba")
+    assert client.get("/items/").json() == {"llamadas": 3}
+    assert cache.cache_respuestas.estadisticas()["aciertos"] == 1
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+from app.core.escritor import EscritorAgrupado
+from app.models.categoria_model import Categoria
+from app.models.movimiento_model import MovimientoInventario
+from app.models.producto_model import Producto
+from app.models.stock_model import StockActual
+from app.schemas.movimiento_schema import CrearMovimientoInventario
+from app.services import movimiento_inventario_service as service
+from app.services.aio import movimiento_inventario_service as service_aio
+
+@pytest.fixture
+def escritor(engine, db):
+    db.add(Categoria(nombre="Verduras", tipo="INGREDIENTE"))
+    db.flush()
+    db.add(Producto(nombre="Tomate", categoria_id=1))
+    db.commit()
+    escritor = EscritorAgrupado(engine, espera_ms=50, max_lote=100)
+    yield escritor
+    escritor.detener()
+
+
+def _movimiento(cantidad, tipo="entrada"):
+    return CrearMovimientoInventario(producto_id=1, cantidad=cantidad, tipo_movimiento=tipo)
+
+
+def _totales(sesiones):
+    with sesiones() as session:
+        return (session.scalar(select(func.count()).select_from(MovimientoInventario)),
+                session.scalar(select(StockActual.cantidad)))
+
+
+# Prueba: las altas concurrentes se confirman en una sola transacción y cada una recibe su fila
+def test_agrupa_en_una_transaccion(engine, sesiones, escritor):
+    commits = []
+
+    def registrar(conexion):
+        commits.append(conexion)
+
+    event.listen(engine, "commit", registrar)
+    try:
+        futuros = [escritor.enviar(service.operacion_alta_movimiento(_movimiento(i))) for i in range(1, 21)]
+        resultados = [futuro.result(timeout=5) for futuro in futuros]
+    finally:
+        event.remove(engine, "commit", registrar)
+
+    assert len(commits) == 1
+    assert escritor.estadisticas() == {"transacciones": 1, "operaciones": 20, "reintentos": 0}
+    assert [r.cantidad for r in resultados] == list(range(1, 21))
+    assert len({r.id for r in resultados}) == 20 and all(r.fecha is not None for r in resultados)
+    assert _totales(sesiones) == (20, sum(range(1, 21)))
+
+
+# Prueba: si una operación falla, solo su llamador recibe el error y el resto se confirma
+def test_aisla_errores(sesiones, escritor):
+    def falla(sesion):
+        sesion.add(MovimientoInventario(producto_id=1, cantidad=99, tipo_movimiento="entrada"))
+        sesion.flush()
+        raise ValueError("operación inválida")
+
+    futuros = [escritor.enviar(service.operacion_alta_movimiento(_movimiento(5))),
+               escritor.enviar(falla),
+               escritor.enviar(service.operacion_alta_movimiento(_movimiento(2, "salida")))]
+
+    assert futuros[0].result(timeout=5).cantidad == 5
+    with pytest.raises(ValueError):
+        futuros[1].result(timeout=5)
+    assert futuros[2].result(timeout=5).tipo_movimiento == "salida"
+    assert escritor.reintentos == 1
+    assert _totales(sesiones) == (2, 3)
+
+
+# Prueba: con ESCRITURA_AGRUPADA los servicios síncrono y asíncrono pasan por el escritor
+def test_servicios_con_escritura_agrupada(sesiones, escritor, monkeypatch):
+    monkeypatch.setattr(service, "ESCRITURA_AGRUPADA", True)
+    monkeypatch.setattr(service, "escritor", escritor)
+    monkeypatch.setattr(service_aio, "ESCRITURA_AGRUPADA", True)
+    monkeypatch.setattr(service_aio, "escritor", escritor)
+
+    creado = service.crear_movimiento(_movimiento(4), db=None)
+    creado_aio = asyncio.run(service_aio.crear_movimiento(_movimiento(1, "salida"), db=None))
+
+    assert creado.id == 1 and creado_aio.id == 2
+    assert escritor.operaciones == 2
+    assert _totales(sesiones) == (2, 3)
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from app.core import etag
+from app.core.etag import coincide_etag, ruta_con_etag
+from app.core.migraciones import aplicar_migraciones
+
+
+# Prueba: comparación débil de If-None-Match
+def test_coincide_etag():
+    assert coincide_etag('W/"1-productos.3"', 'W/"1-productos.3"')
+    assert coincide_etag('"x", "1-productos.3"', 'W/"1-productos.3"')
+    assert not coincide_etag('W/"1-productos.2"', 'W/"1-productos.3"')
+    assert not coincide_etag(None, 'W/"1-productos.3"')
+
+
+# Prueba: 304 sin ejecutar la ruta mientras la tabla no cambia; 200 con ETag nuevo tras una escritura
+def test_get_condicional(engine, monkeypatch):
+    aplicar_migraciones(engine)
+    monkeypatch.setattr(etag, "engine", engine)
+
+    llamadas = []
+    router = APIRouter(prefix="/proveedores", route_class=ruta_con_etag("proveedores"))
+
+    @router.get("/")
+    def listar():
+        llamadas.append(1)
+        return []
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    primera = client.get("/proveedores/")
+    valor = primera.headers["etag"]
+    segunda = client.get("/proveedores/", headers={"If-None-Match": valor})
+    assert segunda.status_code == 304 and segunda.headers["etag"] == valor
+    assert len(llamadas) == 1
+
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO proveedores (nombre) VALUES ('A')")
+    tercera = client.get("/proveedores/", headers={"If-None-Match": valor})
+    assert tercera.status_code == 200 and tercera.headers["etag"] != valor
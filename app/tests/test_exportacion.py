@@ -0,0 +1,56 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert
+from app.api.routers.movimientos_inventario import router as movimientos_router
+from app.core import exportacion
+from app.core.exportacion import lotes_de_filas
+from app.models.movimiento_model import MovimientoInventario
+from app.repositories import movimiento_inventario_repository
+
+@pytest.fixture
+def client(engine, crear_cliente, monkeypatch):
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Granos', 'INGREDIENTE')")
+        conexion.exec_driver_sql("INSERT INTO productos (nombre, categoria_id, activo) VALUES ('Arroz', 1, 1), ('Maíz', 1, 1)")
+        conexion.execute(insert(MovimientoInventario), [
+            {"producto_id": 1 + i % 2, "cantidad": i, "tipo_movimiento": "entrada", "notas": "año, \"nuevo\"",
+             "fecha": datetime(2024, 1, 1 + i)}
+            for i in range(5)
+        ])
+    monkeypatch.setattr(exportacion, "engine", engine)
+    return crear_cliente(movimientos_router)
+
+
+# Prueba: CSV con encabezado, comillas escapadas y filtros por producto y fecha (hasta exclusive)
+def test_exportar_csv_con_filtros(client):
+    respuesta = client.get("/movimientos_inventario/export", params={
+        "producto_id": 1, "desde": "2024-01-02T00:00:00", "hasta": "2024-01-05T00:00:00",
+    })
+    assert respuesta.status_code == 200
+    assert respuesta.headers["content-disposition"] == 'attachment; filename="movimientos_inventario.csv"'
+    filas = list(csv.DictReader(io.StringIO(respuesta.text)))
+    assert [f["id"] for f in filas] == ["3"]
+    assert filas[0]["notas"] == "año, \"nuevo\"" and filas[0]["fecha"] == "2024-01-03T00:00:00"
+
+
+# Prueba: NDJSON comprimido con gzip, con los mismos valores que el JSON de la API
+def test_exportar_ndjson_gzip(client):
+    respuesta = client.get("/movimientos_inventario/export", params={"formato": "ndjson", "gzip": True})
+    assert respuesta.headers["content-type"] == "application/gzip"
+    lineas = gzip.decompress(respuesta.content).decode().splitlines()
+    assert len(lineas) == 5
+    assert json.loads(lineas[0]) == {
+        "producto_id": 1, "cantidad": 0.0, "tipo_movimiento": "entrada", "numero_referencia": None,
+        "notas": "año, \"nuevo\"", "id": 1, "fecha": "2024-01-01T00:00:00",
+    }
+
+
+# Prueba: las filas se leen por lotes del tamaño pedido
+def test_lotes_de_filas(client):
+    lotes = list(lotes_de_filas(movimiento_inventario_repository.consulta_exportacion(), lote=2))
+    assert [len(lote) for lote in lotes] == [2, 2, 1]
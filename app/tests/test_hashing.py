@@ -0,0 +1,45 @@
+import threading
+
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+from app.core import security
+from app.core.hashing import PoolHashing
+from app.models.user_model import UserModel
+from app.schemas.user_schemas import LoginUser
+from app.services import user_service
+
+# Prueba: un hash con otro costo de bcrypt se reemplaza al iniciar sesión, y solo esa vez
+def test_rehash_al_iniciar_sesion(db, monkeypatch):
+    monkeypatch.setattr(security, "pwd_context", CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4))
+    hash_viejo = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash("secreto")
+    db.add(UserModel(username="ana", email="ana@x.com", password=hash_viejo))
+    db.commit()
+
+    user_service.autenticar_usuario(LoginUser(username="ana", password="secreto"), db)
+    hash_nuevo = db.query(UserModel).one().password
+    assert hash_nuevo != hash_viejo and hash_nuevo.startswith("$2b$04$")
+
+    user_service.autenticar_usuario(LoginUser(username="ana", password="secreto"), db)
+    assert db.query(UserModel).one().password == hash_nuevo
+
+    with pytest.raises(HTTPException) as error:
+        user_service.autenticar_usuario(LoginUser(username="ana", password="otra"), db)
+    assert error.value.status_code == 401
+
+
+# Prueba: sin cupos libres (trabajadores + cola) el pool responde 503 en lugar de encolar
+def test_pool_rechaza_sin_cupos():
+    pool = PoolHashing(trabajadores=1, cola_max=1)
+    liberar = threading.Event()
+    futuros = [pool.enviar(liberar.wait) for _ in range(2)]
+
+    with pytest.raises(HTTPException) as error:
+        pool.enviar(liberar.wait)
+    assert error.value.status_code == 503
+
+    liberar.set()
+    for futuro in futuros:
+        futuro.result()
+    assert pool.ejecutar(lambda: "ok") == "ok"
+    assert pool.estadisticas()["rechazados"] == 1
@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import event
+from app.models.categoria_model import Categoria
+from app.models.proveedor_model import Proveedor
+from app.schemas.producto_schemas import CrearProducto
+from app.services import home, productos
+
+@pytest.fixture
+def db(db):
+    home.contadores_home.invalidar()
+    db.add(Categoria(nombre="Verduras", tipo="INGREDIENTE"))
+    db.add_all([Proveedor(nombre="A"), Proveedor(nombre="B")])
+    db.commit()
+    yield db
+    home.contadores_home.invalidar()
+
+
+@pytest.fixture
+def consultas(engine):
+    sentencias = []
+
+    def capturar(conn, cursor, sentencia, parametros, contexto, executemany):
+        sentencias.append(sentencia)
+
+    event.listen(engine, "before_cursor_execute", capturar)
+    yield sentencias
+    event.remove(engine, "before_cursor_execute", capturar)
+
+
+# Prueba: los cuatro totales salen de una sola consulta y luego se sirven desde memoria
+def test_totales_en_una_consulta_y_cacheados(db, consultas):
+    info = home.obtener_estadisticas_home(db)
+    assert (info.productos, info.proveedores, info.almacenes, info.inventario) == (0, 2, 0, 0)
+    assert len(consultas) == 1
+
+    home.obtener_estadisticas_home(db)
+    assert len(consultas) == 1
+
+
+# Prueba: altas y bajas ajustan la caché; el recuento exacto corrige la deriva
+def test_ajuste_incremental_y_recuento(db):
+    home.obtener_estadisticas_home(db)
+    producto = productos.crear_nuevo_producto(db, CrearProducto(nombre="Tomate", categoria_id=1))
+    assert home.obtener_estadisticas_home(db).productos == 1
+    productos.eliminar_producto(db, producto.id)
+    assert home.obtener_estadisticas_home(db).productos == 0
+
+    # Escritura fuera de los servicios (otro proceso): la caché no la ve hasta el recuento
+    db.add(Proveedor(nombre="C"))
+    db.commit()
+    assert home.obtener_estadisticas_home(db).proveedores == 2
+    home.contadores_home.invalidar()
+    assert home.obtener_estadisticas_home(db).proveedores == 3
@@ -0,0 +1,162 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from app.api.routers.conteos_inventario import router as conteos_router
+from app.api.routers.movimientos_inventario import router as movimientos_router
+from app.core import idempotencia
+from app.core.cache import CacheRespuestas
+from app.core.config import Base
+from app.core.migraciones import MIGRACIONES, aplicar_migraciones
+from app.models import conteo_model
+from app.schemas.conteo_schema import CrearConteoInventario
+from app.schemas.movimiento_schema import CrearMovimientoInventario
+from app.services import movimiento_inventario_service as movimientos
+from app.services.aio import conteos_inventario as conteos_aio
+
+MOVIMIENTO = {"producto_id": 1, "cantidad": 5, "tipo_movimiento": "entrada", "numero_referencia": "F-1"}
+
+
+@pytest.fixture
+def engine(engine):
+    # claves_idempotencia la crea la migración 4
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Verduras', 'INGREDIENTE')")
+        conexion.exec_driver_sql("INSERT INTO productos (nombre, categoria_id, activo) VALUES ('Tomate', 1, 1), ('Papa', 1, 1)")
+        conexion.exec_driver_sql("INSERT INTO almacenes (nombre, tipo, capacidad, uso_actual) VALUES ('Central', 'seco', 100, 0)")
+    aplicar_migraciones(engine)
+    return engine
+
+
+@pytest.fixture
+def client(crear_cliente, monkeypatch):
+    monkeypatch.setattr(idempotencia, "cache_claves", CacheRespuestas(max_entradas=16, ttl=60))
+    return crear_cliente(movimientos_router, conteos_router)
+
+
+def _escalar(engine, sql):
+    with engine.connect() as conexion:
+        return conexion.exec_driver_sql(sql).scalar()
+
+
+# Prueba: un reintento con la misma clave repite la respuesta sin crear otro movimiento
+def test_reintento_repite_respuesta(client, engine):
+    clave = {"Idempotency-Key": "lector-7-0001"}
+    primera = client.post("/movimientos_inventario/", json=MOVIMIENTO, headers=clave)
+    segunda = client.post("/movimientos_inventario/", json=MOVIMIENTO, headers=clave)
+
+    assert primera.status_code == segunda.status_code == 200
+    assert segunda.json() == primera.json()
+    assert segunda.headers["idempotent-replayed"] == "true" and "idempotent-replayed" not in primera.headers
+    assert idempotencia.cache_claves.aciertos == 1
+    assert _escalar(engine, "SELECT COUNT(*) FROM movimientos_inventario") == 1
+    assert _escalar(engine, "SELECT cantidad FROM stock_actual WHERE producto_id = 1") == 5
+
+    # Sin la caché en memoria la respuesta sale de la tabla
+    idempotencia.cache_claves.limpiar()
+    assert client.post("/movimientos_inventario/", json=MOVIMIENTO, headers=clave).json() == primera.json()
+
+    # La misma clave con otro cuerpo se rechaza; la misma clave en otro ámbito es independiente
+    otra = client.post("/movimientos_inventario/", json={**MOVIMIENTO, "cantidad": 6}, headers=clave)
+    assert otra.status_code == 422
+    conteo = {"producto_id": 1, "almacen_id": 1, "cantidad": 3, "responsable": "Ana"}
+    assert client.post("/conteos_inventario/", json=conteo, headers=clave).status_code == 200
+    assert client.post("/conteos_inventario/", json=conteo, headers=clave).headers["idempotent-replayed"] == "true"
+    assert _escalar(engine, "SELECT COUNT(*) FROM conteos_inventario") == 1
+    assert client.post("/conteos_inventario/", json=conteo, headers={"Idempotency-Key": " "}).status_code == 400
+
+
+# Prueba: dos sesiones con la misma clave y la misma referencia; la que pierde la carrera repite la respuesta
+def test_reintentos_concurrentes_misma_referencia(engine, sesiones, monkeypatch):
+    monkeypatch.setattr(idempotencia, "cache_claves", CacheRespuestas(max_entradas=16, ttl=60))
+    movimiento = CrearMovimientoInventario(**MOVIMIENTO)
+    repeticion = idempotencia.repeticion
+    consultas = []
+
+    def consultar_antes_de_la_otra(db, peticion):
+        # La primera consulta de la sesión perdedora ocurre antes de que la ganadora confirme
+        consultas.append(peticion)
+        return None if len(consultas) == 1 else repeticion(db, peticion)
+
+    with sesiones() as ganadora, sesiones() as perdedora:
+        original = movimientos.crear_movimiento(movimiento, ganadora, "lector-7-0009").id
+        idempotencia.cache_claves.limpiar()
+        monkeypatch.setattr(idempotencia, "repeticion", consultar_antes_de_la_otra)
+        repetida = movimientos.crear_movimiento(movimiento, perdedora, "lector-7-0009")
+
+    # La perdedora choca con ux_movimientos_inventario_producto_referencia antes que con la clave
+    assert repetida.headers["idempotent-replayed"] == "true"
+    assert json.loads(repetida.body)["id"] == original
+    assert _escalar(engine, "SELECT COUNT(*) FROM movimientos_inventario") == 1
+    assert _escalar(engine, "SELECT cantidad FROM stock_actual WHERE producto_id = 1") == 5
+
+
+# Prueba: numero_referencia es único por producto (409); sin referencia no hay restricción
+def test_referencia_unica_por_producto(client):
+    assert client.post("/movimientos_inventario/", json=MOVIMIENTO).status_code == 200
+    duplicado = client.post("/movimientos_inventario/", json=MOVIMIENTO)
+    assert duplicado.status_code == 409 and "F-1" in duplicado.json()["detail"]
+    assert client.post("/movimientos_inventario/", json={**MOVIMIENTO, "producto_id": 2}).status_code == 200
+    for _ in range(2):
+        assert client.post("/movimientos_inventario/", json={**MOVIMIENTO, "numero_referencia": None}).status_code == 200
+
+    # También al actualizar otro movimiento con una referencia ya usada
+    assert client.put("/movimientos_inventario/3", json=MOVIMIENTO).status_code == 409
+
+
+# Prueba: una clave vencida se reemplaza y la petición se vuelve a ejecutar
+def test_clave_vencida(client, engine, monkeypatch):
+    monkeypatch.setattr(idempotencia, "IDEMPOTENCIA_TTL_SEGUNDOS", -1)
+    monkeypatch.setattr(idempotencia, "cache_claves", CacheRespuestas(max_entradas=16, ttl=0))
+    clave = {"Idempotency-Key": "vence"}
+    sin_referencia = {**MOVIMIENTO, "numero_referencia": None}
+
+    assert client.post("/movimientos_inventario/", json=sin_referencia, headers=clave).json()["id"] == 1
+    assert client.post("/movimientos_inventario/", json=sin_referencia, headers=clave).json()["id"] == 2
+    assert _escalar(engine, "SELECT COUNT(*) FROM claves_idempotencia") == 1
+
+
+# Prueba: la migración renombra las referencias duplicadas previas antes de crear el índice único
+def test_migracion_referencias_duplicadas():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("DROP INDEX ux_movimientos_inventario_producto_referencia")
+        conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Verduras', 'INGREDIENTE')")
+        conexion.exec_driver_sql("INSERT INTO productos (nombre, categoria_id, activo) VALUES ('Tomate', 1, 1)")
+        for referencia in ("'F-1'", "'F-1'", "'F-2'", "NULL", "NULL"):
+            conexion.exec_driver_sql(
+                "INSERT INTO movimientos_inventario (producto_id, cantidad, tipo_movimiento, numero_referencia) "
+                f"VALUES (1, 1, 'entrada', {referencia})"
+            )
+    aplicar_migraciones(engine)
+    with engine.connect() as conexion:
+        referencias = conexion.exec_driver_sql("SELECT numero_referencia FROM movimientos_inventario ORDER BY id").scalars().all()
+    assert referencias == ["F-1", "F-1#2", "F-2", None, None]
+
+
+# Prueba: el servicio asíncrono registra y repite la clave igual que el síncrono
+def test_conteo_idempotente_async(monkeypatch):
+    monkeypatch.setattr(idempotencia, "cache_claves", CacheRespuestas(max_entradas=16, ttl=60))
+    motor = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    conteo = CrearConteoInventario(producto_id=1, almacen_id=1, cantidad=3, responsable="Ana")
+
+    async def crear_dos_veces():
+        async with motor.begin() as conexion:
+            await conexion.run_sync(Base.metadata.create_all)
+            for sentencia in next(m for m in MIGRACIONES if m.version == 4).sentencias:
+                await conexion.exec_driver_sql(sentencia)
+        async with async_sessionmaker(motor, expire_on_commit=False)() as sesion:
+            primera = await conteos_aio.crear_conteo(sesion, conteo, "c-1")
+            idempotencia.cache_claves.limpiar()
+            segunda = await conteos_aio.crear_conteo(sesion, conteo, "c-1")
+            total = await sesion.scalar(select(func.count()).select_from(conteo_model.ConteoInventario))
+        await motor.dispose()
+        return primera, segunda, total
+
+    primera, segunda, total = asyncio.run(crear_dos_veces())
+    assert primera.id == 1 and total == 1
+    assert segunda.headers["idempotent-replayed"] == "true" and b'"responsable":"Ana"' in segunda.body
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException, Request
+from sqlalchemy import event
+from app.api.routers.producto_proveedor import router as productos_proveedor_router
+from app.core import importacion
+from app.core.importacion import leer_csv, recibir_csv
+from app.models.producto_model import Producto
+from app.models.producto_proveedor_model import ProveedorProducto
+from app.services import productos
+
+@pytest.fixture
+def db(engine, db):
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Granos', 'INGREDIENTE')")
+        conexion.exec_driver_sql("INSERT INTO proveedores (nombre) VALUES ('Molinos')")
+        conexion.exec_driver_sql(
+            "INSERT INTO productos (nombre, categoria_id, precio, unidad, activo) "
+            "VALUES ('Arroz', 1, 2.5, 'kg', 1), ('Maíz', 1, 1.0, 'kg', 1)"
+        )
+    return db
+
+
+# Prueba: solo se insertan las filas nuevas y se actualizan las columnas que cambian, con un executemany por tipo
+def test_importar_productos_por_diferencias(engine, db):
+    archivo = (
+        "\ufeffid,nombre,categoria_id,precio,unidad\n"
+        "99,Arroz,1,2.5,kg\n"      # igual a la existente (el id del archivo se ignora)
+        "1,Maíz,1,1.2,\n"          # cambia el precio; la unidad vacía no se toca
+        ",Trigo,1,3,kg\n"
+        ",Avena,1,4,kg\n"
+    ).encode()
+    sentencias = []
+
+    def registrar(conexion, cursor, sentencia, *args):
+        sentencias.append(sentencia.split()[0])
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    resultado = productos.importar_productos(db, leer_csv(archivo))
+    event.remove(engine, "before_cursor_execute", registrar)
+
+    assert (resultado.recibidos, resultado.insertados, resultado.actualizados, resultado.sin_cambios) == (4, 2, 1, 1)
+    assert sentencias.count("INSERT") == 1 and sentencias.count("UPDATE") == 1
+    maiz = db.query(Producto).filter(Producto.nombre == "Maíz").one()
+    assert (maiz.precio, maiz.unidad) == (1.2, "kg")
+    assert db.query(Producto).count() == 4
+
+
+# Prueba: filas inválidas, claves repetidas y foráneas inexistentes se informan por línea; atomic aborta todo
+def test_importar_errores_por_linea(db):
+    archivo = (
+        "nombre,categoria_id,precio\n"
+        "Trigo,1,abc\n"
+        "Avena,7,1\n"
+        "Cebada,1,2\n"
+        "Cebada,1,3\n"
+    ).encode()
+    with pytest.raises(HTTPException) as error:
+        productos.importar_productos(db, leer_csv(archivo), atomic=True)
+    assert error.value.status_code == 422
+    assert db.query(Producto).count() == 2
+
+    resultado = productos.importar_productos(db, leer_csv(archivo))
+    assert resultado.insertados == 1
+    assert [e.linea for e in resultado.errores] == [2, 3, 5]
+    assert resultado.errores[1].errores == ["categoria_id: 7 no existe"]
+
+
+# Prueba: el endpoint de productos de proveedor hace upsert por (proveedor_id, producto_id) y resuelve el synonym
+def test_endpoint_productos_proveedor(db, crear_cliente):
+    client = crear_cliente(productos_proveedor_router)
+
+    archivo = "proveedor_id,producto_id,precio,tiempo_entrega_dias\n1,1,2.0,3\n1,2,0.9,5\n"
+    primera = client.post("/productos_proveedor/import", content=archivo, headers={"content-type": "text/csv"})
+    segunda = client.post("/productos_proveedor/import", content=archivo.replace("0.9,5", "0.8,5"),
+                          headers={"content-type": "text/csv"})
+
+    assert primera.json()["insertados"] == 2
+    assert {k: segunda.json()[k] for k in ("insertados", "actualizados", "sin_cambios")} == {
+        "insertados": 0, "actualizados": 1, "sin_cambios": 1,
+    }
+    filas = db.query(ProveedorProducto).order_by(ProveedorProducto.producto_id).all()
+    assert [(f.precio, f.dias_entrega) for f in filas] == [(2.0, 3), (0.8, 5)]
+
+
+# Prueba: el cuerpo se copia por trozos a un archivo temporal que pasa a disco al superar IMPORT_MEMORIA_MAX
+def test_recibir_csv_por_trozos(monkeypatch):
+    monkeypatch.setattr(importacion, "IMPORT_MEMORIA_MAX", 16)
+    trozos = [b"nombre,categoria_id\n", b"Trigo,1\n", b"Avena,1\n"]
+
+    async def recibir():
+        trozo = trozos.pop(0)
+        return {"type": "http.request", "body": trozo, "more_body": bool(trozos)}
+
+    async def leer():
+        with await recibir_csv(Request({"type": "http", "method": "POST", "headers": []}, recibir)) as archivo:
+            return archivo._rolled, list(leer_csv(archivo))
+
+    en_disco, lineas = asyncio.run(leer())
+    assert en_disco
+    assert lineas == ["nombre,categoria_id\n", "Trigo,1\n", "Avena,1\n"]
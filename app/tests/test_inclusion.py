@@ -0,0 +1,100 @@
+import pytest
+from sqlalchemy import event
+from app.api.routers.producto import router as productos_router
+from app.api.routers.producto_proveedor import router as productos_proveedor_router
+from app.core.migraciones import aplicar_migraciones
+
+
+@pytest.fixture
+def engine(engine):
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql(
+            "INSERT INTO categorias (nombre, tipo) VALUES ('Verduras', 'INGREDIENTE'), ('Harinas', 'INGREDIENTE')"
+        )
+        conexion.exec_driver_sql("INSERT INTO proveedores (nombre) VALUES ('Huerta'), ('Molino'), ('Mayorista')")
+        for i in range(1, 61):
+            conexion.exec_driver_sql(
+                f"INSERT INTO productos (nombre, categoria_id, activo) VALUES ('Producto {i}', {1 + i % 2}, 1)"
+            )
+            # Dos proveedores por producto, para que las colecciones no estén vacías
+            conexion.exec_driver_sql(
+                f"INSERT INTO proveedor_productos (proveedor_id, producto_id, precio) "
+                f"VALUES ({1 + i % 3}, {i}, {i}.5), ({1 + (i + 1) % 3}, {i}, {i}.0)"
+            )
+    aplicar_migraciones(engine)
+    return engine
+
+
+@pytest.fixture
+def client(crear_cliente):
+    return crear_cliente(productos_router, productos_proveedor_router)
+
+
+def _consultas(engine, client, url) -> tuple:
+    """Respuesta y número de sentencias ejecutadas sobre la base (sin contar versiones_tabla del ETag)."""
+    sentencias = []
+
+    def contar(conn, cursor, sentencia, parametros, contexto, executemany):
+        if "versiones_tabla" not in sentencia:
+            sentencias.append(sentencia)
+
+    event.listen(engine, "before_cursor_execute", contar)
+    try:
+        respuesta = client.get(url)
+    finally:
+        event.remove(engine, "before_cursor_execute", contar)
+    return respuesta, len(sentencias)
+
+
+# Prueba: con include el número de consultas no depende del tamaño de la página (sin N+1)
+def test_consultas_acotadas(engine, client):
+    include = "include=categoria,proveedores.proveedor"
+    chica, consultas_chica = _consultas(engine, client, f"/productos/?limit=5&{include}")
+    grande, consultas_grande = _consultas(engine, client, f"/productos/?limit=50&{include}")
+
+    assert chica.status_code == grande.status_code == 200
+    assert len(chica.json()) == 5 and len(grande.json()) == 50
+    # Página (categoría por join) + una consulta IN con los proveedores de toda la página (proveedor por join)
+    assert consultas_chica == consultas_grande == 2
+
+
+# Prueba: la respuesta anidada solo trae las relaciones pedidas
+def test_respuesta_anidada(client):
+    producto = client.get("/productos/1?include=categoria,proveedores.proveedor").json()
+    assert producto["categoria"]["nombre"] == "Harinas"
+    assert [(p["proveedor_id"], p["proveedor"]["nombre"]) for p in producto["proveedores"]] == [
+        (2, "Molino"), (3, "Mayorista"),
+    ]
+    assert "producto" not in producto["proveedores"][0]
+
+    solo_categoria = client.get("/productos/?limit=2&include=categoria").json()
+    assert [p["categoria"]["id"] for p in solo_categoria] == [2, 1]
+    assert all("proveedores" not in p for p in solo_categoria)
+
+    sin_include = client.get("/productos/1").json()
+    assert "categoria" not in sin_include and sin_include["nombre"] == "Producto 1"
+
+    relacion = client.get("/productos_proveedor/1?include=proveedor,producto.categoria").json()
+    assert relacion["proveedor"]["nombre"] == "Molino"
+    assert relacion["producto"]["categoria"]["nombre"] == "Harinas"
+
+
+# Prueba: una relación desconocida es un 400 con las opciones válidas
+def test_include_desconocido(client):
+    respuesta = client.get("/productos/?include=categoria,movimientos")
+    assert respuesta.status_code == 400
+    assert "movimientos" in respuesta.json()["detail"]
+
+
+# Prueba: la caché y el ETag de una respuesta con include cambian al escribir en una tabla incluida
+def test_cache_con_include(client):
+    url = "/productos/1?include=proveedores"
+    primera = client.get(url)
+    assert client.get(url, headers={"If-None-Match": primera.headers["etag"]}).status_code == 304
+
+    cambio = client.put("/productos_proveedor/1", json={"proveedor_id": 2, "producto_id": 1, "precio": 99.0})
+    assert cambio.status_code == 200
+
+    segunda = client.get(url, headers={"If-None-Match": primera.headers["etag"]})
+    assert segunda.status_code == 200 and segunda.headers["etag"] != primera.headers["etag"]
+    assert segunda.json()["proveedores"][0]["precio"] == 99.0
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from app.api.routers.categorias import router as categorias_router
+from app.api.routers.producto import router as productos_router
+from app.core import lotes
+from app.core.config import Base
+from app.repositories.aio import proveedor_repository as proveedor_aio
+
+@pytest.fixture
+def client(engine, crear_cliente):
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Verduras', 'INGREDIENTE'), ('Harinas', 'INGREDIENTE')")
+        for i in range(1, 8):
+            conexion.exec_driver_sql(f"INSERT INTO productos (nombre, categoria_id, activo) VALUES ('Producto {i}', 1, 1)")
+    return crear_cliente(productos_router, categorias_router)
+
+
+# Prueba: los ids se validan, se deduplican conservando el orden y tienen un máximo
+def test_parsear_ids(monkeypatch):
+    assert lotes.parsear_ids("3, 1,3,2,") == [3, 1, 2]
+    for invalido in ("", " , ", "1,a", "1.5"):
+        with pytest.raises(Exception) as error:
+            lotes.parsear_ids(invalido)
+        assert error.value.status_code == 400
+    monkeypatch.setattr(lotes, "MAX_IDS_LOTE", 2)
+    with pytest.raises(Exception):
+        lotes.parsear_ids("1,2,3")
+
+
+# Prueba: orden pedido, faltantes informados y una consulta IN por trozo de ids
+def test_batch_get(engine, client, monkeypatch):
+    monkeypatch.setattr(lotes, "TROZO_IDS", 3)
+    consultas = []
+
+    def contar(conn, cursor, sentencia, parametros, contexto, executemany):
+        if "FROM productos" in sentencia:
+            consultas.append(sentencia)
+
+    event.listen(engine, "before_cursor_execute", contar)
+    try:
+        respuesta = client.get("/productos/batch?ids=5,99,1,7,2,3,42")
+    finally:
+        event.remove(engine, "before_cursor_execute", contar)
+
+    assert respuesta.status_code == 200
+    cuerpo = respuesta.json()
+    assert [p["id"] for p in cuerpo["items"]] == [5, 1, 7, 2, 3]
+    assert cuerpo["faltantes"] == [99, 42]
+    assert len(consultas) == 3 and all(" IN " in c for c in consultas)
+
+    assert client.get("/categorias/batch?ids=2,1").json() == {
+        "items": [
+            {"nombre": "Harinas", "tipo": "INGREDIENTE", "descripcion": None, "id": 2},
+            {"nombre": "Verduras", "tipo": "INGREDIENTE", "descripcion": None, "id": 1},
+        ],
+        "faltantes": [],
+    }
+    assert client.get("/productos/batch?ids=x").status_code == 400
+
+
+# Prueba: el repositorio asíncrono resuelve el lote igual que el síncrono
+def test_batch_get_async():
+    motor = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def consultar():
+        async with motor.begin() as conexion:
+            await conexion.run_sync(Base.metadata.create_all)
+            await conexion.exec_driver_sql("INSERT INTO proveedores (nombre) VALUES ('A'), ('B'), ('C')")
+        async with async_sessionmaker(motor)() as sesion:
+            lote = await proveedor_aio.obtener_proveedores_por_ids([3, 4, 1], sesion)
+        await motor.dispose()
+        return lote
+
+    lote = asyncio.run(consultar())
+    assert [p.nombre for p in lote.items] == ["C", "A"]
+    assert lote.faltantes == [4]
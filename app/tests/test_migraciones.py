@@ -0,0 +1,35 @@
+from sqlalchemy import inspect
+from app.core.migraciones import MIGRACIONES, aplicar_migraciones, migraciones_pendientes
+
+
+# Prueba: una base existente sin los índices nuevos los recibe una sola vez
+def test_migraciones_agregan_indices_a_base_existente(engine):
+    # Simula una base creada antes de declarar los índices en los modelos
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("DROP INDEX ix_movimientos_inventario_producto_fecha")
+        conexion.exec_driver_sql("DROP INDEX ix_productos_categoria_activo_tipo")
+
+    aplicadas = aplicar_migraciones(engine)
+
+    assert [m.version for m in aplicadas] == [m.version for m in MIGRACIONES]
+    indices = {i["name"] for i in inspect(engine).get_indexes("movimientos_inventario")}
+    assert "ix_movimientos_inventario_producto_fecha" in indices
+    assert "ix_productos_categoria_activo_tipo" in {i["name"] for i in inspect(engine).get_indexes("productos")}
+    assert aplicar_migraciones(engine) == []
+    with engine.connect() as conexion:
+        assert migraciones_pendientes(conexion) == []
+
+
+# Prueba: los triggers de la migración 2 incrementan la versión de la tabla en cada escritura
+def test_versiones_tabla_por_trigger(engine):
+    aplicar_migraciones(engine)
+
+    def version():
+        with engine.connect() as conexion:
+            return conexion.exec_driver_sql("SELECT version FROM versiones_tabla WHERE tabla = 'proveedores'").scalar()
+
+    assert version() == 0
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO proveedores (nombre) VALUES ('A')")
+        conexion.exec_driver_sql("UPDATE proveedores SET nombre = 'B'")
+    assert version() == 2
@@ -0,0 +1,45 @@
+import pytest
+from fastapi import HTTPException
+from app.api.routers.proveedores import router as proveedores_router
+from app.core.paginacion import LIMITE_MAXIMO, codificar_cursor, decodificar_cursor
+from app.models.proveedor_model import Proveedor
+from app.repositories import proveedor_repository
+
+
+@pytest.fixture
+def db(db):
+    db.add_all([Proveedor(nombre=f"Proveedor {i}") for i in range(7)])
+    db.commit()
+    return db
+
+
+# Prueba: recorrer todas las páginas con el cursor devuelve cada fila una sola vez y en orden
+def test_recorrido_por_cursor(db):
+    ids, cursor = [], None
+    while True:
+        pagina = proveedor_repository.obtener_proveedores(0, 3, db, cursor)
+        ids += [p.id for p in pagina.items]
+        if not pagina.siguiente:
+            break
+        cursor = pagina.siguiente
+    assert ids == list(range(1, 8))
+
+
+# Prueba: la última página no publica cursor y un cursor corrupto responde 400
+def test_cursor_fin_e_invalido(db):
+    assert proveedor_repository.obtener_proveedores(0, 7, db).siguiente is None
+    assert decodificar_cursor(codificar_cursor([5]), ["id"]) == [5]
+    with pytest.raises(HTTPException) as error:
+        proveedor_repository.obtener_proveedores(0, 3, db, "no-es-un-cursor")
+    assert error.value.status_code == 400
+
+
+# Prueba: un límite menor a 1 devuelve una página vacía y el listado lo rechaza con 422
+def test_limite_fuera_de_rango(db, crear_cliente):
+    assert proveedor_repository.obtener_proveedores(0, 0, db) == ([], None)
+    assert proveedor_repository.obtener_proveedores(0, -1, db) == ([], None)
+
+    client = crear_cliente(proveedores_router)
+    assert client.get("/proveedores/", params={"limit": 0}).status_code == 422
+    assert client.get("/proveedores/", params={"limit": LIMITE_MAXIMO + 1}).status_code == 422
+    assert len(client.get("/proveedores/", params={"limit": 3}).json()) == 3
@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import event
+from app.api.routers.producto import router as productos_router
+
+CSV = {"Content-Type": "text/csv"}
+
+
+@pytest.fixture
+def client(engine, crear_cliente):
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Verduras', 'INGREDIENTE'), ('Lácteos', 'INGREDIENTE')")
+        conexion.exec_driver_sql(
+            "INSERT INTO productos (nombre, categoria_id, activo, precio, tipo_perecible) VALUES "
+            "('Tomate', 1, 1, 10, 'PERECEDERO'), ('Papa', 1, 1, 4, 'NO_PERECEDERO'), "
+            "('Leche', 2, 1, 3, 'PERECEDERO'), ('Sin precio', 1, 1, NULL, NULL)"
+        )
+        conexion.exec_driver_sql("INSERT INTO proveedores (nombre) VALUES ('Huerta SA'), ('Tambo SA')")
+        conexion.exec_driver_sql(
+            "INSERT INTO proveedor_productos (proveedor_id, producto_id, precio) VALUES (1, 1, 8), (1, 2, 3), (2, 3, 2)"
+        )
+    return crear_cliente(productos_router)
+
+
+def _precios(engine, tabla="productos"):
+    with engine.connect() as conexion:
+        return conexion.exec_driver_sql(f"SELECT precio FROM {tabla} ORDER BY id").scalars().all()
+
+
+def _sentencias(engine, accion):
+    sentencias = []
+
+    def registrar(conexion, cursor, sql, parametros, contexto, executemany):
+        sentencias.append(sql.split()[0])
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        respuesta = accion()
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+    return respuesta, sentencias
+
+
+# Prueba: un ajuste porcentual sobre un filtro es un único UPDATE y el dry-run no escribe
+def test_ajuste_porcentual(engine, client):
+    ajuste = {"porcentaje": 12.5, "categoria_id": 1}
+    vista = client.post("/productos/precios?dry_run=true", json=ajuste).json()
+    assert vista["afectados"] == 2 and vista["dry_run"] is True
+    assert [(c["nombre"], c["precio_anterior"], c["precio_nuevo"]) for c in vista["cambios"]] == [
+        ("Tomate", 10, 11.25), ("Papa", 4, 4.5)]
+    assert _precios(engine) == [10, 4, 3, None]
+
+    respuesta, sentencias = _sentencias(engine, lambda: client.post("/productos/precios", json=ajuste))
+    assert respuesta.json() == {"afectados": 2, "dry_run": False, "cambios": [], "errores": []}
+    assert sentencias.count("UPDATE") == 1
+    assert _precios(engine) == [11.25, 4.5, 3, None]
+
+    # Los filtros se combinan y el proveedor filtra los productos que ofrece
+    filtrado = {"monto": 1, "proveedor_id": 1, "tipo_perecible": "PERECEDERO"}
+    assert client.post("/productos/precios", json=filtrado).json()["afectados"] == 1
+    assert _precios(engine) == [12.25, 4.5, 3, None]
+
+
+# Prueba: ajuste de las ofertas de proveedor filtradas por la categoría del producto
+def test_ajuste_proveedor(engine, client):
+    ajuste = {"destino": "proveedor", "monto": -0.5, "categoria_id": 1}
+    vista = client.post("/productos/precios?dry_run=true", json=ajuste).json()
+    assert [(c["producto_id"], c["proveedor_id"], c["precio_nuevo"]) for c in vista["cambios"]] == [(1, 1, 7.5), (2, 1, 2.5)]
+    assert client.post("/productos/precios", json=ajuste).json()["afectados"] == 2
+    assert _precios(engine, "proveedor_productos") == [7.5, 2.5, 2]
+    assert _precios(engine) == [10, 4, 3, None]
+
+
+# Prueba: ajustes inválidos (sin o con ambos valores, precios negativos) se rechazan sin escribir
+def test_ajuste_invalido(engine, client):
+    assert client.post("/productos/precios", json={"categoria_id": 1}).status_code == 422
+    assert client.post("/productos/precios", json={"porcentaje": 5, "monto": 1}).status_code == 422
+    negativo = client.post("/productos/precios", json={"monto": -4.5})
+    assert negativo.status_code == 422 and "2 precios negativos" in negativo.json()["detail"]
+    assert client.post("/productos/precios", json={"porcentaje": -100}).status_code == 422
+    assert _precios(engine) == [10, 4, 3, None]
+
+
+# Prueba: CSV de precios en lotes de IMPORT_LOTE filas, con errores por línea y modo atómico
+def test_importar_precios(engine, client, monkeypatch):
+    monkeypatch.setattr("app.core.precios.IMPORT_LOTE", 2)
+    cuerpo = "producto_id,precio\n1,9.99\n2,4\n3,3.5\n4,1\n2,7\n99,1\nx,2\n"
+
+    vista = client.post("/productos/precios/import?dry_run=true", content=cuerpo, headers=CSV).json()
+    assert [(c["producto_id"], c["precio_nuevo"]) for c in vista["cambios"]] == [(1, 9.99), (3, 3.5), (4, 1)]
+    assert [e["linea"] for e in vista["errores"]] == [6, 8]
+    assert client.post("/productos/precios/import?atomic=true", content=cuerpo, headers=CSV).status_code == 422
+    assert _precios(engine) == [10, 4, 3, None]
+
+    respuesta, sentencias = _sentencias(
+        engine, lambda: client.post("/productos/precios/import?categoria_id=1", content=cuerpo, headers=CSV))
+    assert respuesta.json()["afectados"] == 2
+    assert sentencias.count("UPDATE") == 3
+    assert _precios(engine) == [9.99, 4, 3, 1]
+
+    # Con destino proveedor la clave es (producto_id, proveedor_id)
+    ofertas = "producto_id,proveedor_id,precio\n1,1,7\n3,2,2\n3,1,5\n1,,4\n"
+    resultado = client.post("/productos/precios/import?destino=proveedor", content=ofertas, headers=CSV).json()
+    assert resultado["afectados"] == 1 and [e["linea"] for e in resultado["errores"]] == [5]
+    assert _precios(engine, "proveedor_productos") == [7, 3, 2]
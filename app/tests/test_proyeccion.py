@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import event
+from app.api.routers.conteos_inventario import router as conteos_router
+from app.api.routers.producto import router as productos_router
+from app.core.proyeccion import esquema_parcial, parsear_fields
+from app.models import conteo_model
+from app.schemas.producto_schemas import Producto
+
+
+@pytest.fixture
+def client(engine, db, crear_cliente):
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Verduras', 'INGREDIENTE')")
+        conexion.exec_driver_sql("INSERT INTO almacenes (nombre, tipo, capacidad, uso_actual) VALUES ('Central', 'seco', 100, 0)")
+        for i in range(1, 6):
+            conexion.exec_driver_sql(
+                f"INSERT INTO productos (nombre, descripcion, categoria_id, unidad, precio, activo) "
+                f"VALUES ('Producto {i}', '{'x' * 500}', 1, 'kg', {i}.5, 1)"
+            )
+    db.add(conteo_model.ConteoInventario(producto_id=1, almacen_id=1, cantidad=3, contado_por="Ana"))
+    db.commit()
+    # Sin versiones_tabla no se emiten ETag
+    return crear_cliente(productos_router, conteos_router)
+
+
+# Prueba: los campos se validan y se ordenan como en el esquema; el esquema reducido se reutiliza
+def test_parsear_fields():
+    assert parsear_fields(None, Producto) is None
+    assert parsear_fields(" , ", Producto) is None
+    assert parsear_fields("unidad, id,nombre,id", Producto) == ("nombre", "unidad", "id")
+    with pytest.raises(Exception) as error:
+        parsear_fields("nombre,costo", Producto)
+    assert error.value.status_code == 400 and "costo" in error.value.detail
+
+    parcial = esquema_parcial(Producto, ("nombre", "unidad"))
+    assert esquema_parcial(Producto, ("nombre", "unidad")) is parcial
+    assert list(parcial.model_fields) == ["nombre", "unidad"]
+
+
+# Prueba: el SELECT solo lee las columnas pedidas (más la clave) y la respuesta solo las trae
+def test_listado_con_fields(engine, client):
+    sentencias = []
+
+    def registrar(conn, cursor, sentencia, parametros, contexto, executemany):
+        if "FROM productos" in sentencia:
+            sentencias.append(sentencia)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        respuesta = client.get("/productos/?limit=2&fields=nombre,unidad")
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+    assert respuesta.status_code == 200
+    assert respuesta.json() == [{"nombre": "Producto 1", "unidad": "kg"}, {"nombre": "Producto 2", "unidad": "kg"}]
+    assert len(sentencias) == 1
+    assert "descripcion" not in sentencias[0] and "precio" not in sentencias[0]
+
+    # El cursor sigue funcionando aunque `id` no se haya pedido
+    siguiente = client.get(f"/productos/?limit=2&fields=id,precio&cursor={respuesta.headers['x-next-cursor']}")
+    assert siguiente.json() == [{"id": 3, "precio": 3.5}, {"id": 4, "precio": 4.5}]
+
+
+# Prueba: los synonym también se pueden pedir; campos desconocidos o combinados con include dan 400
+def test_fields_errores_y_sinonimos(client):
+    assert client.get("/conteos_inventario/?fields=responsable,cantidad").json() == [{"cantidad": 3, "responsable": "Ana"}]
+    assert client.get("/productos/?fields=nombre,costo").status_code == 400
+    assert client.get("/productos/?fields=nombre&include=categoria").status_code == 400
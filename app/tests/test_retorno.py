@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from app.api.routers.almacenes import router as almacenes_router
+from app.api.routers.producto import router as productos_router
+from app.api.routers.proveedores import router as proveedores_router
+from app.core.autocompletado import indice_productos
+from app.core.config import Base
+from app.models.producto_model import Producto
+from app.services.aio import productos as productos_aio
+from app.schemas.producto_schemas import ActualizarProducto
+
+def _preparar(conexion):
+    conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Verduras', 'INGREDIENTE')")
+    conexion.exec_driver_sql(
+        "INSERT INTO productos (nombre, categoria_id, activo, precio, unidad) VALUES "
+        "('Tomate', 1, 1, 10, 'kg'), ('Papa', 1, 1, 5, 'kg')"
+    )
+    conexion.exec_driver_sql("INSERT INTO almacenes (nombre, tipo, capacidad, uso_actual) VALUES ('Central', 'seco', 100, 0)")
+    conexion.exec_driver_sql("INSERT INTO proveedores (nombre, persona_contacto) VALUES ('Huerta SA', 'José')")
+    conexion.exec_driver_sql(
+        "INSERT INTO proveedor_productos (proveedor_id, producto_id, precio, dias_entrega) VALUES (1, 1, 9, 2)"
+    )
+
+
+@pytest.fixture
+def client(engine, crear_cliente):
+    with engine.begin() as conexion:
+        _preparar(conexion)
+    yield crear_cliente(productos_router, almacenes_router, proveedores_router)
+    indice_productos.cargar([])
+
+
+def _fila(engine, sql):
+    with engine.connect() as conexion:
+        return tuple(conexion.exec_driver_sql(sql).first())
+
+
+# Prueba: PATCH cambia solo los campos enviados con una única sentencia UPDATE ... RETURNING
+def test_patch_una_sentencia(engine, client):
+    sentencias = []
+
+    def registrar(conexion, cursor, sql, parametros, contexto, executemany):
+        sentencias.append(sql)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        respuesta = client.patch("/productos/1", json={"precio": 12.5})
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+    assert respuesta.status_code == 200
+    assert respuesta.json()["precio"] == 12.5 and respuesta.json()["unidad"] == "kg"
+    assert len(sentencias) == 1 and sentencias[0].startswith("UPDATE productos SET precio=")
+    assert "RETURNING" in sentencias[0]
+    assert _fila(engine, "SELECT nombre, precio, unidad FROM productos WHERE id = 1") == ("Tomate", 12.5, "kg")
+
+    # El índice de autocompletado sigue el nuevo nombre
+    assert client.patch("/productos/2", json={"nombre": "Papa negra"}).status_code == 200
+    assert indice_productos.buscar("negra") == [(2, "Papa negra")]
+
+    # PUT sigue reemplazando el recurso completo
+    completo = client.put("/productos/1", json={"nombre": "Tomate", "categoria_id": 1})
+    assert completo.json()["precio"] is None and completo.json()["unidad"] is None
+
+
+# Prueba: 404 si el id no existe y 422 si se envía null en un campo obligatorio
+def test_patch_errores(client):
+    assert client.patch("/productos/99", json={"precio": 1}).status_code == 404
+    assert client.patch("/almacenes/99", json={"capacidad": 1}).status_code == 404
+    assert client.patch("/productos/1", json={"nombre": None}).status_code == 422
+    assert client.patch("/almacenes/1", json={"capacidad": 250}).json()["capacidad"] == 250
+    assert client.patch("/proveedores/1", json={}).json()["nombre"] == "Huerta SA"
+
+
+# Prueba: DELETE ... RETURNING borra en una sentencia y responde 409 si hay registros asociados
+def test_delete_con_referencias(engine, client):
+    assert client.delete("/productos/1").status_code == 409
+    assert client.delete("/proveedores/1").status_code == 409
+    assert _fila(engine, "SELECT COUNT(*) FROM productos") == (2,)
+
+    assert client.delete("/productos/2").status_code == 200
+    assert client.delete("/productos/2").status_code == 404
+    assert client.delete("/almacenes/1").status_code == 200
+    assert _fila(engine, "SELECT COUNT(*) FROM productos") == (1,)
+
+
+# Prueba: el servicio asíncrono modifica con la misma sentencia y responde 404 sin fila
+def test_modificar_producto_async():
+    motor = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def modificar():
+        async with motor.begin() as conexion:
+            await conexion.run_sync(Base.metadata.create_all)
+            await conexion.run_sync(_preparar)
+        async with async_sessionmaker(motor, expire_on_commit=False)() as sesion:
+            fila = await productos_aio.modificar_producto(sesion, 1, ActualizarProducto(activo=False))
+            with pytest.raises(HTTPException) as error:
+                await productos_aio.modificar_producto(sesion, 99, ActualizarProducto(activo=False))
+            guardado = await sesion.get(Producto, 1)
+        await motor.dispose()
+        return fila, error.value, guardado
+
+    fila, error, guardado = asyncio.run(modificar())
+    assert fila.activo is False and fila.precio == 10
+    assert error.status_code == 404
+    assert guardado.activo is False and guardado.nombre == "Tomate"
+    indice_productos.cargar([])
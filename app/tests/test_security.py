@@ -0,0 +1,58 @@
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from app.core import security
+from app.core.security import CacheTokens, create_access_token, verificar_token
+
+
+# Prueba: el segundo uso del mismo token no vuelve a decodificarlo
+def test_token_verificado_se_cachea(monkeypatch):
+    monkeypatch.setattr(security, "cache_tokens", CacheTokens(max_entradas=8))
+    decodificaciones = []
+    original = security.decode_access_token
+    monkeypatch.setattr(security, "decode_access_token", lambda t: decodificaciones.append(t) or original(t))
+
+    token = create_access_token({"sub": "ana"}, timedelta(minutes=5))
+    assert verificar_token(token)["sub"] == "ana"
+    assert verificar_token(token)["sub"] == "ana"
+    assert len(decodificaciones) == 1
+    assert security.cache_tokens.estadisticas()["aciertos"] == 1
+
+
+# Prueba: una entrada vencida se descarta y el token se rechaza
+def test_token_vencido_se_rechaza():
+    cache = CacheTokens(max_entradas=8)
+    cache.guardar("t", {"sub": "ana", "exp": time.time() - 1})
+    assert cache.obtener("t") is None
+
+    token = create_access_token({"sub": "ana"}, timedelta(seconds=-1))
+    with pytest.raises(HTTPException):
+        verificar_token(token)
+
+
+# Prueba: el tamaño está acotado (LRU) y las vencidas se purgan al guardar
+def test_lru_y_purga():
+    cache = CacheTokens(max_entradas=2)
+    futuro = time.time() + 60
+    cache.guardar("a", {"exp": futuro})
+    cache.guardar("b", {"exp": futuro})
+    cache.obtener("a")
+    cache.guardar("c", {"exp": futuro})
+    assert cache.obtener("b") is None
+    assert cache.estadisticas()["desalojos"] == 1
+
+    cache.guardar("viejo", {"exp": time.time() + 0.01})
+    time.sleep(0.02)
+    cache.guardar("d", {"exp": futuro})
+    assert "viejo" not in cache._entradas
+
+
+# Prueba: create_access_token fija `exp` a partir de la hora UTC actual (antes usaba datetime.time() y fallaba)
+def test_create_access_token_expiracion():
+    ahora = time.time()
+    con_plazo = security.decode_access_token(create_access_token({"sub": "ana"}, timedelta(minutes=5)))
+    sin_plazo = security.decode_access_token(create_access_token({"sub": "ana"}))
+    assert abs(con_plazo["exp"] - (ahora + 300)) < 5
+    assert abs(sin_plazo["exp"] - (ahora + 900)) < 5
@@ -0,0 +1,75 @@
+import asyncio
+from datetime import datetime
+from typing import List
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.testclient import TestClient
+from fastapi.utils import create_model_field
+from app.core import serializacion
+from app.core.serializacion import respuesta_lista, serializar_lista
+from app.models.almacen_model import Almacen
+from app.models.categoria_model import Categoria
+from app.models.conteo_model import ConteoInventario
+from app.models.movimiento_model import MovimientoInventario
+from app.models.producto_model import Producto
+from app.schemas import conteo_schema, movimiento_schema, producto_schemas
+
+
+@pytest.fixture
+def db(db):
+    db.add(Categoria(nombre="Lácteos", tipo="INGREDIENTE"))
+    db.add(Almacen(nombre="Central", tipo="seco", capacidad=100))
+    db.flush()
+    db.add_all([
+        Producto(nombre="Leche ñandú \"entera\"", categoria_id=1, tipo_perecible="PERECEDERO", precio=5, unidad="l"),
+        Producto(nombre="Sal", categoria_id=1, precio=1e16, activo=False),
+        Producto(nombre="Azúcar", categoria_id=1, precio=0.1, stock_minimo=None),
+    ])
+    db.flush()
+    db.add_all([
+        MovimientoInventario(producto_id=1, cantidad=2, tipo_movimiento="entrada", fecha=datetime(2024, 5, 1, 8, 30, 0, 120000)),
+        MovimientoInventario(producto_id=2, cantidad=1e-7, tipo_movimiento="salida", notas="€", fecha=datetime(2024, 5, 2)),
+    ])
+    db.add(ConteoInventario(producto_id=1, almacen_id=1, cantidad=3.5, contado_por="José"))
+    db.commit()
+    return db
+
+
+def _cuerpo_fastapi(esquema, filas) -> bytes:
+    campo = create_model_field(name="Response", type_=List[esquema], mode="serialization")
+    contenido = asyncio.run(serialize_response(field=campo, response_content=filas))
+    return JSONResponse(contenido).body
+
+
+# Prueba: el camino rápido produce exactamente los mismos bytes que response_model + JSONResponse
+@pytest.mark.parametrize("modelo, esquema", [
+    (Producto, producto_schemas.Producto),
+    (MovimientoInventario, movimiento_schema.MovimientoInventario),
+    (ConteoInventario, conteo_schema.ConteoInventario),
+])
+def test_salida_identica_a_fastapi(db, modelo, esquema):
+    filas = db.query(modelo).order_by(modelo.id).all()
+    assert serializar_lista(esquema, filas) == _cuerpo_fastapi(esquema, filas)
+
+
+# Prueba: la respuesta rápida conserva las cabeceras puestas en `response` y solo se usa con JSON_RAPIDO
+def test_respuesta_lista_conserva_cabeceras(db, monkeypatch):
+    app = FastAPI()
+
+    @app.get("/productos", response_model=List[producto_schemas.Producto])
+    def listar(response: Response):
+        response.headers["X-Next-Cursor"] = "abc"
+        return respuesta_lista(producto_schemas.Producto, db.query(Producto).order_by(Producto.id).all(), response)
+
+    client = TestClient(app)
+    normal = client.get("/productos")
+    monkeypatch.setattr(serializacion, "JSON_RAPIDO", True)
+    rapida = client.get("/productos")
+
+    assert rapida.content == normal.content
+    assert rapida.headers["x-next-cursor"] == normal.headers["x-next-cursor"] == "abc"
+    assert rapida.headers["content-type"] == normal.headers["content-type"]
+    assert rapida.headers["content-length"] == normal.headers["content-length"]
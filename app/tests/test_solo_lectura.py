@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from app.core import solo_lectura
+from app.core.config import Base
+from app.core.serializacion import serializar_lista
+from app.models.almacen_model import Almacen
+from app.models.categoria_model import Categoria
+from app.models.conteo_model import ConteoInventario
+from app.models.producto_model import Producto
+from app.repositories import conteos_inventario, producto
+from app.repositories.aio import producto as producto_aio
+from app.schemas import conteo_schema, producto_schemas
+
+
+@pytest.fixture
+def db(db):
+    db.add(Categoria(nombre="Granos", tipo="INGREDIENTE"))
+    db.add(Almacen(nombre="Central", tipo="seco", capacidad=100))
+    db.flush()
+    db.add_all([
+        Producto(nombre=f"Producto {i}", categoria_id=1, tipo_perecible="NO_PERECEDERO", precio=i, activo=i % 2 == 0)
+        for i in range(5)
+    ])
+    db.flush()
+    db.add(ConteoInventario(producto_id=1, almacen_id=1, cantidad=2, contado_por="Ana"))
+    db.commit()
+    db.expunge_all()
+    return db
+
+
+# Prueba: con LECTURA_CORE el listado devuelve filas Row, no llena el identity map y serializa igual
+def test_listado_core_equivale_al_orm(db, monkeypatch):
+    orm = producto.get_productos(db, 0, 2, None, None, True, None)
+    db.expunge_all()
+    monkeypatch.setattr(solo_lectura, "LECTURA_CORE", True)
+    core = producto.get_productos(db, 0, 2, None, None, True, None)
+
+    assert all(isinstance(fila, Row) for fila in core.items)
+    assert len(db.identity_map) == 0
+    assert core.siguiente == orm.siguiente
+    esquema = producto_schemas.Producto
+    assert serializar_lista(esquema, core.items) == serializar_lista(esquema, orm.items)
+    assert [esquema.model_validate(f).model_dump() for f in core.items] == [esquema.model_validate(f).model_dump() for f in orm.items]
+
+    # Los synonym del modelo (responsable -> contado_por) también se exponen
+    conteo = conteos_inventario.get_conteos(db, 0, 10, None).items[0]
+    assert conteo_schema.ConteoInventario.model_validate(conteo).responsable == "Ana"
+
+
+# Prueba: paginar_async devuelve filas para un select de columnas y mantiene el cursor
+def test_listado_core_async(db, monkeypatch):
+    monkeypatch.setattr(solo_lectura, "LECTURA_CORE", True)
+    motor = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def consultar():
+        async with motor.begin() as conexion:
+            await conexion.run_sync(Base.metadata.create_all)
+            await conexion.exec_driver_sql("INSERT INTO categorias (nombre, tipo) VALUES ('Granos', 'INGREDIENTE')")
+            for i in range(3):
+                await conexion.exec_driver_sql(f"INSERT INTO productos (nombre, categoria_id, activo) VALUES ('P{i}', 1, 1)")
+        async with async_sessionmaker(motor)() as sesion:
+            primera = await producto_aio.get_productos(sesion, 0, 2, None, None, None, None)
+            segunda = await producto_aio.get_productos(sesion, 0, 2, None, None, None, primera.siguiente)
+        await motor.dispose()
+        return primera, segunda
+
+    primera, segunda = asyncio.run(consultar())
+    assert [f.nombre for f in primera.items] == ["P0", "P1"]
+    assert [f.nombre for f in segunda.items] == ["P2"]
+    assert isinstance(primera.items[0], Row)
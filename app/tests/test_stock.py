@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.exc import IntegrityError
+from app.core.migraciones import aplicar_migraciones
+from app.models.almacen_model import Almacen
+from app.models.categoria_model import Categoria
+from app.models.producto_model import Producto
+from app.models.stock_model import StockActual
+from app.schemas.movimiento_schema import CrearMovimientoInventario
+from app.services import movimiento_inventario_service as service
+from app.repositories import stock_repository
+
+
+@pytest.fixture
+def db(db):
+    categoria = Categoria(nombre="Verduras", tipo="INGREDIENTE")
+    db.add(categoria)
+    db.flush()
+    db.add_all([Producto(nombre="Tomate", categoria_id=categoria.id),
+                Producto(nombre="Papa", categoria_id=categoria.id)])
+    db.commit()
+    return db
+
+
+def _movimiento(producto_id, cantidad, tipo):
+    return CrearMovimientoInventario(producto_id=producto_id, cantidad=cantidad, tipo_movimiento=tipo)
+
+
+def _stock(db, producto_id):
+    return stock_repository.obtener_stock_producto(db, producto_id).cantidad
+
+
+# Prueba: altas, modificaciones y bajas mantienen stock_actual
+def test_movimientos_actualizan_stock(db):
+    entrada = service.crear_movimiento(_movimiento(1, 10, "entrada"), db)
+    salida = service.crear_movimiento(_movimiento(1, 3, "salida"), db)
+    assert _stock(db, 1) == 7
+
+    service.actualizar_movimiento(salida.id, _movimiento(2, 4, "salida"), db)
+    assert _stock(db, 1) == 10
+    assert _stock(db, 2) == -4
+
+    service.eliminar_movimiento(entrada.id, db)
+    assert _stock(db, 1) == 0
+    assert stock_repository.verificar_stock(db) == []
+
+
+# Prueba: la reconstrucción corrige un stock desviado del historial
+def test_reconstruir_stock(db):
+    service.crear_movimiento(_movimiento(1, 5, "entrada"), db)
+    db.query(StockActual).update({StockActual.cantidad: 99})
+    db.commit()
+    assert stock_repository.verificar_stock(db) == [{"producto_id": 1, "materializado": 99, "historial": 5}]
+
+    stock_repository.reconstruir_stock(db)
+    assert _stock(db, 1) == 5
+    assert stock_repository.verificar_stock(db) == []
+
+
+# Prueba: el ajuste es un único INSERT ... ON CONFLICT DO UPDATE por producto y almacén (NULL incluido)
+def test_ajuste_es_upsert(engine, db):
+    db.execute(insert(Almacen).values(nombre="Central", tipo="seco", capacidad=100, uso_actual=0))
+    sentencias = []
+
+    def registrar(conexion, cursor, sql, parametros, contexto, executemany):
+        sentencias.append(sql)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        for almacen_id in (None, None, 1, 1):
+            stock_repository.ajustar_stock(db, 1, 2.5, almacen_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+    db.commit()
+
+    assert len(sentencias) == 4 and all("ON CONFLICT" in sql for sql in sentencias)
+    assert db.query(StockActual.almacen_id, StockActual.cantidad).order_by(StockActual.id).all() == [(None, 5), (1, 5)]
+
+
+# Prueba: la migración 5 suma los registros repetidos antes de crear el índice único
+def test_migracion_stock_unico(engine):
+    with engine.begin() as conexion:
+        conexion.exec_driver_sql("DROP INDEX ux_stock_actual_producto_almacen")
+        conexion.exec_driver_sql(
+            "INSERT INTO stock_actual (producto_id, almacen_id, cantidad, actualizado_en) VALUES "
+            "(1, NULL, 3, '2024-01-01'), (1, NULL, 4, '2024-01-01'), (2, NULL, 1, '2024-01-01')"
+        )
+    aplicar_migraciones(engine)
+    with engine.connect() as conexion:
+        filas = conexion.exec_driver_sql("SELECT id, producto_id, cantidad FROM stock_actual ORDER BY id").all()
+        assert [tuple(f) for f in filas] == [(1, 1, 7), (3, 2, 1)]
+        with pytest.raises(IntegrityError):
+            conexion.exec_driver_sql(
+                "INSERT INTO stock_actual (producto_id, almacen_id, cantidad, actualizado_en) VALUES (1, NULL, 1, '2024-01-01')"
+            )
@@ -0,0 +1,129 @@
+"""
+explain_consultas.py
+
+Muestra el plan de ejecución (`EXPLAIN QUERY PLAN` en SQLite) de las consultas de lectura
+de los repositorios, para confirmar qué índices se usan.
+
+Cada consulta se obtiene ejecutando la función real del repositorio con argumentos de
+ejemplo y capturando el SQL emitido, de modo que el plan corresponde exactamente a lo que
+envía la aplicación. Todo corre dentro de una transacción que se revierte al terminar.
+
+Uso:
+    python -m app.utils.explain_consultas          # planes de todas las consultas
+    python -m app.utils.explain_consultas --sql    # incluye el SQL de cada consulta
+    python -m app.utils.explain_consultas productos stock   # solo las que contienen esos textos
+"""
+
+import argparse
+import sys
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import engine, Base
+from app.core.migraciones import migraciones_pendientes
+from app.core.paginacion import codificar_cursor
+# Registrar todos los modelos para que las relaciones se resuelvan
+from app.models import (  # noqa: F401
+    almacen_model, categoria_model, conteo_model, movimiento_model, producto_model,
+    producto_proveedor_model, proveedor_model, stock_model, user_model,
+)
+from app.models.categoria_model import TipoCategoriaEnum, TipoPerecibleEnum
+from app.repositories import (
+    conteos_inventario, home, movimiento_inventario_repository, producto,
+    producto_proveedor_repository, proveedor_repository, stock_repository, user_repository,
+)
+from app.repositories.almacenamiento_repository import AlmacenamientoRepository
+from app.repositories.categorias_repository import CategoriaRepository
+
+# (nombre, función que ejecuta la consulta del repositorio con argumentos de ejemplo)
+CONSULTAS = [
+    ("productos: listado", lambda db: producto.get_productos(db, 0, 100, None, None, None)),
+    ("productos: por categoría y activo", lambda db: producto.get_productos(db, 0, 100, 1, None, True)),
+    ("productos: por categoría, activo y tipo",
+     lambda db: producto.get_productos(db, 0, 100, 1, TipoPerecibleEnum.PERECEDERO, True)),
+    ("productos: por id", lambda db: producto.get_producto_by_id(db, 1)),
+    ("movimientos: listado", lambda db: movimiento_inventario_repository.obtener_movimientos_inventario(0, 100, db)),
+    ("movimientos: página siguiente (cursor)", lambda db: movimiento_inventario_repository.obtener_movimientos_inventario(
+        0, 100, db, codificar_cursor([100]))),
+    ("movimientos: productos existentes", lambda db: movimiento_inventario_repository.productos_existentes([1, 2, 3], db)),
+    ("conteos: listado", lambda db: conteos_inventario.get_conteos(db, 0, 100)),
+    ("proveedores: listado", lambda db: proveedor_repository.obtener_proveedores(0, 100, db)),
+    ("productos_proveedor: listado", lambda db: producto_proveedor_repository.obtener_productos_proveedor(0, 100, db)),
+    ("almacenes: listado", lambda db: AlmacenamientoRepository(db).obtener_todos()),
+    ("categorias: por tipo", lambda db: CategoriaRepository(db).obtener_todas(tipo=TipoCategoriaEnum.INGREDIENTE)),
+    ("stock: listado", lambda db: stock_repository.obtener_stock(db, 0, 100)),
+    ("stock: por producto", lambda db: stock_repository.obtener_stock_producto(db, 1)),
+    ("stock: historial agregado", lambda db: stock_repository.calcular_stock_desde_historial(db)),
+    ("home: totales", lambda db: home.get_totales(db)),
+    ("usuarios: por username", lambda db: user_repository.obtener_usuario_por_username("admin", db)),
+]
+
+
+def _prefijo_explain(dialecto: str) -> str:
+    return "EXPLAIN QUERY PLAN " if dialecto == "sqlite" else "EXPLAIN "
+
+
+def _formatear_plan(filas, dialecto: str) -> list:
+    """Indenta el árbol de EXPLAIN QUERY PLAN (id, parent, notused, detail) de SQLite."""
+    if dialecto != "sqlite":
+        return [" ".join(str(valor) for valor in fila) for fila in filas]
+    profundidad, lineas = {0: 0}, []
+    for id_nodo, padre, _, detalle in filas:
+        profundidad[id_nodo] = profundidad.get(padre, 0) + 1
+        lineas.append("  " * profundidad[id_nodo] + detalle)
+    return lineas
+
+
+def explicar(conexion, funcion) -> list:
+    """Ejecuta la consulta del repositorio y devuelve [(sql, plan)] de cada SELECT emitido."""
+    capturadas = []
+
+    def capturar(conn, cursor, sentencia, parametros, contexto, executemany):
+        if sentencia.lstrip().upper().startswith("SELECT"):
+            capturadas.append((sentencia, parametros))
+
+    event.listen(conexion, "before_cursor_execute", capturar)
+    try:
+        with Session(bind=conexion, join_transaction_mode="create_savepoint") as db:
+            funcion(db)
+    finally:
+        event.remove(conexion, "before_cursor_execute", capturar)
+
+    dialecto = conexion.dialect.name
+    resultado = []
+    for sentencia, parametros in capturadas:
+        filas = conexion.exec_driver_sql(_prefijo_explain(dialecto) + sentencia, parametros).fetchall()
+        resultado.append((sentencia, _formatear_plan(filas, dialecto)))
+    return resultado
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Muestra el plan de ejecución de las consultas de los repositorios.")
+    parser.add_argument("filtros", nargs="*", help="Solo consultas cuyo nombre contenga alguno de estos textos.")
+    parser.add_argument("--sql", action="store_true", help="Mostrar también el SQL de cada consulta.")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conexion:
+        pendientes = migraciones_pendientes(conexion)
+    if pendientes:
+        print(f"Aviso: {len(pendientes)} migraciones pendientes (python -m app.utils.migrar).\n")
+
+    with engine.connect() as conexion:
+        with conexion.begin() as transaccion:
+            for nombre, funcion in CONSULTAS:
+                if args.filtros and not any(filtro in nombre for filtro in args.filtros):
+                    continue
+                print(f"== {nombre}")
+                for sentencia, plan in explicar(conexion, funcion):
+                    if args.sql:
+                        print("  " + " ".join(sentencia.split()))
+                    print("\n".join(plan))
+                print()
+            transaccion.rollback()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+importar_csv.py
+
+Importa un catálogo de productos o una lista de precios de proveedor desde un archivo CSV
+(app/core/importacion.py): inserta las filas nuevas, actualiza solo las que cambian y
+muestra los conteos. El archivo se lee en streaming, sin cargarlo entero en memoria.
+
+Uso:
+    python -m app.utils.importar_csv productos catalogo.csv
+    python -m app.utils.importar_csv productos_proveedor precios.csv --atomic
+
+El código de salida es 1 si alguna fila tuvo errores o la importación se abortó.
+"""
+
+import argparse
+import sys
+
+from fastapi import HTTPException
+
+from app.core.config import SessionLocal
+# Registrar todos los modelos para que las relaciones se resuelvan
+from app.models import (  # noqa: F401
+    almacen_model, categoria_model, conteo_model, movimiento_model, producto_model,
+    producto_proveedor_model, proveedor_model, stock_model, user_model,
+)
+from app.services import producto_proveedor_service, productos
+
+IMPORTADORES = {
+    "productos": lambda db, lineas, atomic: productos.importar_productos(db, lineas, atomic),
+    "productos_proveedor": lambda db, lineas, atomic: producto_proveedor_service.importar_productos_proveedor(lineas, atomic, db),
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Importa un CSV con upsert por clave natural.")
+    parser.add_argument("entidad", choices=sorted(IMPORTADORES))
+    parser.add_argument("archivo", help="Ruta del CSV (UTF-8, con encabezado).")
+    parser.add_argument("--atomic", action="store_true", help="Abortar todo si alguna fila tiene errores.")
+    args = parser.parse_args()
+
+    with open(args.archivo, encoding="utf-8-sig", newline="") as lineas, SessionLocal() as db:
+        try:
+            resultado = IMPORTADORES[args.entidad](db, lineas, args.atomic)
+        except HTTPException as exc:
+            print(f"Importación abortada: {exc.detail}")
+            return 1
+
+    for error in resultado.errores:
+        print(f"Línea {error.linea}: {'; '.join(error.errores)}")
+    print(f"{resultado.recibidos} filas: {resultado.insertados} insertadas, {resultado.actualizados} actualizadas, "
+          f"{resultado.sin_cambios} sin cambios, {len(resultado.errores)} con errores.")
+    return 1 if resultado.errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
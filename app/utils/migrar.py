@@ -0,0 +1,46 @@
+"""
+migrar.py
+
+Aplica las migraciones de esquema pendientes (app/core/migraciones.py) sobre la base
+de datos configurada, o muestra su estado.
+
+Uso:
+    python -m app.utils.migrar          # crea las tablas que falten y aplica las pendientes
+    python -m app.utils.migrar --estado # lista las migraciones aplicadas y pendientes
+"""
+
+import argparse
+import sys
+
+from app.core.config import engine, Base
+from app.core.migraciones import MIGRACIONES, aplicar_migraciones, versiones_aplicadas
+# Registrar todos los modelos para que create_all conozca todas las tablas
+from app.models import (  # noqa: F401
+    almacen_model, categoria_model, conteo_model, movimiento_model, producto_model,
+    producto_proveedor_model, proveedor_model, stock_model, user_model,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Aplica las migraciones de esquema pendientes.")
+    parser.add_argument("--estado", action="store_true", help="Solo mostrar el estado, sin aplicar.")
+    args = parser.parse_args()
+
+    if args.estado:
+        with engine.begin() as conexion:
+            aplicadas = versiones_aplicadas(conexion)
+        for migracion in MIGRACIONES:
+            marca = "aplicada " if migracion.version in aplicadas else "pendiente"
+            print(f"{migracion.version:>4}  {marca}  {migracion.descripcion}")
+        return 0
+
+    Base.metadata.create_all(bind=engine)
+    aplicadas = aplicar_migraciones(engine)
+    for migracion in aplicadas:
+        print(f"Aplicada {migracion.version}: {migracion.descripcion}")
+    print("Esquema al día." if not aplicadas else f"{len(aplicadas)} migraciones aplicadas.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+reconstruir_stock.py
+
+Recalcula la tabla stock_actual a partir del historial de movimientos de inventario
+y la verifica contra ese historial.
+
+Uso:
+    python -m app.utils.reconstruir_stock              # reconstruye y verifica
+    python -m app.utils.reconstruir_stock --verificar  # solo verifica, sin escribir
+
+El código de salida es 1 si quedan diferencias entre stock_actual y el historial.
+"""
+
+import argparse
+import sys
+
+from app.core.config import SessionLocal, engine, Base
+# Registrar todos los modelos para que las relaciones se resuelvan
+from app.models import (  # noqa: F401
+    almacen_model, categoria_model, conteo_model, movimiento_model, producto_model,
+    producto_proveedor_model, proveedor_model, stock_model, user_model,
+)
+from app.services import stock_service
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reconstruye y verifica stock_actual desde el historial.")
+    parser.add_argument("--verificar", action="store_true", help="Solo verificar, sin reconstruir.")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        if args.verificar:
+            diferencias = stock_service.verificar_stock(db)
+        else:
+            resultado = stock_service.reconstruir_stock(db)
+            print(f"Stock reconstruido para {resultado['productos']} productos.")
+            diferencias = resultado["diferencias"]
+
+    for diferencia in diferencias:
+        print(f"Producto {diferencia['producto_id']}: stock_actual={diferencia['materializado']} "
+              f"historial={diferencia['historial']}")
+    print("Sin diferencias." if not diferencias else f"{len(diferencias)} productos con diferencias.")
+    return 1 if diferencias else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+bench_auth_middleware.py
+
+Microbenchmark del middleware de autenticación: compara la implementación anterior
+(BaseHTTPMiddleware) con la actual (ASGI puro) sobre una ruta mínima, para aislar
+el costo del propio middleware.
+
+Las peticiones se envían llamando directamente a la aplicación ASGI (sin servidor ni
+cliente HTTP). Ambas variantes validan el token con security.verificar_token, de modo
+que la diferencia medida es solo la del mecanismo del middleware.
+
+Uso:
+    python benchmarks/bench_auth_middleware.py --peticiones 20000 --concurrencia 32
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from fastapi import FastAPI, HTTPException, Request, status  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from app.api.middelwares.auth_middelware import AuthMiddleware  # noqa: E402
+from app.core.security import ALGORITHM, SECRET_KEY, create_access_token, verificar_token  # noqa: E402
+
+
+class AuthMiddlewareAnterior(BaseHTTPMiddleware):
+    """Copia de la implementación con BaseHTTPMiddleware, como referencia."""
+
+    def __init__(self, app, secret_key, algorithm):
+        super().__init__(app)
+
+    async def dispatch(self, request: Request, call_next):
+        rutas_excluidas = ["/users/login", "/docs", "/openapi.json"]
+        if request.method == "OPTIONS" or any(request.url.path.startswith(ruta) for ruta in rutas_excluidas):
+            return await call_next(request)
+        token = request.headers.get("Authorization")
+        if not token or not token.startswith("Bearer "):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="No autorizado")
+        request.state.user = verificar_token(token.split(" ")[1]).get("sub")
+        return await call_next(request)
+
+
+def _crear_app(middleware):
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware, secret_key=SECRET_KEY, algorithm=ALGORITHM)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def _medir(app, peticiones: int, concurrencia: int, token: str) -> float:
+    scope_base = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/ping", "raw_path": b"/ping", "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 1234), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def una():
+        estado = {}
+
+        async def send(mensaje):
+            if mensaje["type"] == "http.response.start":
+                estado["status"] = mensaje["status"]
+
+        await app(dict(scope_base), receive, send)
+        assert estado["status"] == 200
+
+    semaforo = asyncio.Semaphore(concurrencia)
+
+    async def limitada():
+        async with semaforo:
+            await una()
+
+    for _ in range(200):  # calentamiento (caché de tokens, rutas)
+        await una()
+    inicio = time.perf_counter()
+    await asyncio.gather(*(limitada() for _ in range(peticiones)))
+    return peticiones / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--peticiones", type=int, default=20000)
+    parser.add_argument("--concurrencia", type=int, default=32)
+    args = parser.parse_args()
+
+    token = create_access_token({"sub": "bench"})
+    variantes = (
+        ("sin middleware", None),
+        ("BaseHTTPMiddleware (anterior)", AuthMiddlewareAnterior),
+        ("ASGI puro (actual)", AuthMiddleware),
+    )
+    for nombre, middleware in variantes:
+        rps = asyncio.run(_medir(_crear_app(middleware), args.peticiones, args.concurrencia, token))
+        print(f"{nombre:>30}: {rps:10.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
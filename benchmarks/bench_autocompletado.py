@@ -0,0 +1,110 @@
+"""
+bench_autocompletado.py
+
+Mide el índice de prefijos en memoria de app.core.autocompletado sobre un catálogo sintético
+de --productos nombres (por defecto 100k): tiempo de construcción, memoria retenida
+(tracemalloc, en una construcción aparte), p50/p99 de las consultas top-k con prefijos de
+1 a 6 caracteres y el costo de una actualización incremental.
+
+Como referencia se mide la misma consulta con `nombre LIKE 'prefijo%'` sobre SQLite en memoria
+(solo el comienzo del nombre, sin normalizar tildes).
+
+Uso:
+    python benchmarks/bench_autocompletado.py --productos 100000 --consultas 20000 --k 10
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from app.core.autocompletado import IndicePrefijos, normalizar  # noqa: E402
+
+PALABRAS = (
+    "tomate perita cherry harina integral arroz largo fino yamaní maíz pisingallo azúcar rubia "
+    "aceite girasol oliva vinagre manzana vino salsa lista pimentón dulce ahumado café molido "
+    "tostado leche entera descremada queso rallado crema de leche manteca huevo blanco papa "
+    "cebolla morada zanahoria lechuga mantecosa ajo en polvo orégano comino pimienta negra sal "
+    "fina gruesa fideos tirabuzón mostaza mayonesa atún en lata arvejas lentejas garbanzos"
+).split()
+
+
+def _percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+def _catalogo(productos: int, rng: random.Random):
+    return [(i + 1, " ".join(rng.choice(PALABRAS) for _ in range(rng.randint(1, 4))).capitalize())
+            for i in range(productos)]
+
+
+def _prefijos(consultas: int, rng: random.Random):
+    prefijos = []
+    for _ in range(consultas):
+        palabra = normalizar(rng.choice(PALABRAS))
+        prefijos.append(palabra[:rng.randint(1, min(6, len(palabra)))])
+    return prefijos
+
+
+def _medir(consultar, prefijos) -> dict:
+    tiempos = []
+    for prefijo in prefijos:
+        inicio = time.perf_counter()
+        consultar(prefijo)
+        tiempos.append(time.perf_counter() - inicio)
+    return {"p50_us": round(_percentil(tiempos, 0.5) * 1e6, 1), "p99_us": round(_percentil(tiempos, 0.99) * 1e6, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--productos", type=int, default=100_000)
+    parser.add_argument("--consultas", type=int, default=20_000)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    catalogo = _catalogo(args.productos, rng)
+    prefijos = _prefijos(args.consultas, rng)
+
+    indice = IndicePrefijos()
+    inicio = time.perf_counter()
+    indice.cargar(catalogo)
+    construccion = time.perf_counter() - inicio
+
+    # La memoria se mide en una segunda construcción (tracemalloc distorsiona los tiempos)
+    tracemalloc.start()
+    indice = IndicePrefijos()
+    indice.cargar(catalogo)
+    retenida, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Índice: {len(indice)} productos, {len(indice._claves)} claves, construcción {construccion * 1000:.0f} ms, "
+          f"memoria retenida {retenida / 2**20:.1f} MiB (pico {pico / 2**20:.1f} MiB)")
+    print(f"  top-{args.k} índice en memoria: {_medir(lambda p: indice.buscar(p, args.k), prefijos)}")
+
+    actualizaciones = []
+    for i in range(1000):
+        identificador = rng.randint(1, args.productos)
+        inicio = time.perf_counter()
+        indice.actualizar(identificador, f"Producto renombrado {i}")
+        actualizaciones.append(time.perf_counter() - inicio)
+    print(f"  actualización incremental: p50 {_percentil(actualizaciones, 0.5) * 1e6:.0f} us, "
+          f"p99 {_percentil(actualizaciones, 0.99) * 1e6:.0f} us")
+
+    conexion = sqlite3.connect(":memory:")
+    conexion.execute("CREATE TABLE productos (id INTEGER PRIMARY KEY, nombre TEXT)")
+    conexion.execute("CREATE INDEX ix_nombre ON productos (nombre COLLATE NOCASE)")
+    conexion.executemany("INSERT INTO productos VALUES (?, ?)", catalogo)
+    consulta = "SELECT id, nombre FROM productos WHERE nombre LIKE ? ORDER BY nombre LIMIT ?"
+    print(f"  top-{args.k} SQLite LIKE:      "
+          f"{_medir(lambda p: conexion.execute(consulta, (p + '%', args.k)).fetchall(), prefijos)}")
+
+
+if __name__ == "__main__":
+    main()
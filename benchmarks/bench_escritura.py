@@ -0,0 +1,141 @@
+"""
+bench_escritura.py
+
+Compara el rendimiento de escritura de las altas de movimientos de inventario con un commit
+por petición (el camino actual) frente al escritor agrupado de app.core.escritor
+(ESCRITURA_AGRUPADA=true).
+
+Sobre una base SQLite temporal en archivo (con los PRAGMAs de la aplicación: WAL,
+synchronous configurable, busy_timeout configurable) se lanzan --hilos hilos que crean
+--altas movimientos cada uno, como harían las peticiones concurrentes en el threadpool.
+Se informa el rendimiento (altas/s), la latencia p50/p99, los errores `database is locked`
+y el número de transacciones confirmadas.
+
+Uso:
+    python benchmarks/bench_escritura.py --hilos 32 --altas 200 --synchronous FULL --busy-timeout 5000
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from sqlalchemy import create_engine, event, func, select  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core.config import Base, ConfiguracionBD  # noqa: E402
+from app.core.escritor import EscritorAgrupado  # noqa: E402
+from app.models import almacen_model, conteo_model, producto_proveedor_model, proveedor_model, stock_model  # noqa: E402,F401
+from app.models.categoria_model import Categoria  # noqa: E402
+from app.models.movimiento_model import MovimientoInventario  # noqa: E402
+from app.models.producto_model import Producto  # noqa: E402
+from app.schemas.movimiento_schema import CrearMovimientoInventario  # noqa: E402
+from app.services import movimiento_inventario_service as service  # noqa: E402
+
+
+def _percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p))] if valores else 0.0
+
+
+def _preparar(ruta_db: Path, args):
+    engine = create_engine(f"sqlite:///{ruta_db}", pool_size=args.hilos, max_overflow=0)
+    pragmas = ConfiguracionBD(sqlite_synchronous=args.synchronous, sqlite_busy_timeout=args.busy_timeout).pragmas()
+
+    @event.listens_for(engine, "connect")
+    def _aplicar_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for nombre, valor in pragmas.items():
+            cursor.execute(f"PRAGMA {nombre}={valor}")
+        cursor.close()
+
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add(Categoria(nombre="Bench", tipo="INGREDIENTE"))
+        db.flush()
+        db.add_all(Producto(nombre=f"Producto {i}", categoria_id=1) for i in range(10))
+        db.commit()
+
+    transacciones = []
+
+    @event.listens_for(engine, "commit")
+    def _contar(conexion):
+        transacciones.append(1)
+
+    return engine, transacciones
+
+
+def _ejecutar(agrupado: bool, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, transacciones = _preparar(Path(tmp) / "bench.db", args)
+        Sesiones = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        escritor = EscritorAgrupado(engine, espera_ms=args.espera_ms, max_lote=args.max_lote)
+        latencias, bloqueos = [], []
+        barrera = threading.Barrier(args.hilos)
+
+        def trabajador(numero: int):
+            barrera.wait()
+            for i in range(args.altas):
+                movimiento = CrearMovimientoInventario(producto_id=1 + (numero + i) % 10, cantidad=1,
+                                                       tipo_movimiento="entrada")
+                inicio = time.perf_counter()
+                try:
+                    if agrupado:
+                        escritor.ejecutar(service.operacion_alta_movimiento(movimiento))
+                    else:
+                        with Sesiones() as db:
+                            service.crear_movimiento(movimiento, db)
+                except OperationalError as exc:
+                    if "locked" not in str(exc):
+                        raise
+                    bloqueos.append(1)
+                    continue
+                latencias.append(time.perf_counter() - inicio)
+
+        hilos = [threading.Thread(target=trabajador, args=(n,)) for n in range(args.hilos)]
+        transacciones.clear()
+        inicio = time.perf_counter()
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        total = time.perf_counter() - inicio
+        escritor.detener()
+
+        with Sesiones() as db:
+            filas = db.scalar(select(func.count()).select_from(MovimientoInventario))
+        engine.dispose()
+
+    return {
+        "altas_s": round(filas / total, 1),
+        "p50_ms": round(_percentil(latencias, 0.50) * 1000, 2),
+        "p99_ms": round(_percentil(latencias, 0.99) * 1000, 2),
+        "bloqueos": len(bloqueos),
+        "transacciones": len(transacciones),
+        "filas": filas,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hilos", type=int, default=32)
+    parser.add_argument("--altas", type=int, default=200, help="Altas por hilo")
+    parser.add_argument("--synchronous", default="FULL", help="PRAGMA synchronous (FULL, NORMAL, OFF)")
+    parser.add_argument("--busy-timeout", type=int, default=5000, help="PRAGMA busy_timeout en milisegundos")
+    parser.add_argument("--espera-ms", type=float, default=5, help="ESCRITURA_ESPERA_MS del escritor agrupado")
+    parser.add_argument("--max-lote", type=int, default=100, help="ESCRITURA_MAX_LOTE del escritor agrupado")
+    args = parser.parse_args()
+
+    print(f"{args.hilos} hilos x {args.altas} altas, synchronous={args.synchronous}, busy_timeout={args.busy_timeout} ms")
+    for nombre, agrupado in (("commit por petición", False), ("escritor agrupado", True)):
+        print(f"{nombre:>20}: {_ejecutar(agrupado, args)}")
+
+
+if __name__ == "__main__":
+    main()
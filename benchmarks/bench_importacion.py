@@ -0,0 +1,108 @@
+"""
+bench_importacion.py
+
+Compara la carga de un catálogo fila a fila (una alta o actualización por fila, como al
+usar POST /productos/ y PUT /productos/{id}) con la importación CSV por diferencias de
+app.core.importacion.
+
+Sobre una base SQLite temporal con --existentes productos se importa un CSV de --filas
+filas, de las que --cambios modifican el precio de un producto existente, --nuevos son
+productos nuevos y el resto son idénticas a las existentes. Se informa el tiempo de cada
+estrategia y el número de sentencias SQL ejecutadas.
+
+Uso:
+    python benchmarks/bench_importacion.py --existentes 5000 --filas 5000 --cambios 500 --nuevos 500
+"""
+
+import argparse
+import csv
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from sqlalchemy import create_engine, event, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core.config import Base  # noqa: E402
+from app.core.importacion import leer_csv  # noqa: E402
+from app.models import almacen_model, conteo_model, movimiento_model, producto_proveedor_model, proveedor_model, stock_model  # noqa: E402,F401
+from app.models.categoria_model import Categoria  # noqa: E402
+from app.models.producto_model import Producto  # noqa: E402
+from app.repositories import producto  # noqa: E402
+from app.schemas.producto_schemas import CrearProducto  # noqa: E402
+from app.services import productos  # noqa: E402
+
+
+def _preparar(ruta_db: Path, existentes: int):
+    engine = create_engine(f"sqlite:///{ruta_db}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conexion:
+        conexion.execute(insert(Categoria), [{"nombre": "Bench", "tipo": "INGREDIENTE"}])
+        conexion.execute(insert(Producto), [
+            {"nombre": f"Producto {i}", "categoria_id": 1, "unidad": "kg", "precio": 1.0, "activo": True}
+            for i in range(existentes)
+        ])
+    return engine, sessionmaker(bind=engine)
+
+
+def _archivo(filas: int, cambios: int, nuevos: int, existentes: int) -> list:
+    registros = []
+    for i in range(filas):
+        if i < nuevos:
+            registros.append({"nombre": f"Nuevo {i}", "categoria_id": 1, "unidad": "kg", "precio": 2.0})
+        else:
+            indice = (i - nuevos) % existentes
+            precio = 1.5 if i - nuevos < cambios else 1.0
+            registros.append({"nombre": f"Producto {indice}", "categoria_id": 1, "unidad": "kg", "precio": precio})
+    return registros
+
+
+def _fila_a_fila(db, registros):
+    """Una consulta por fila para encontrar el producto y un commit por alta o actualización."""
+    for registro in registros:
+        datos = CrearProducto(**registro)
+        existente = db.query(Producto.id).filter(Producto.nombre == datos.nombre).first()
+        if existente is None:
+            producto.create_producto(db, datos)
+        else:
+            producto.update_producto(db, existente.id, datos)
+
+
+def _importacion(db, registros):
+    buffer = io.StringIO()
+    escritor = csv.DictWriter(buffer, fieldnames=list(registros[0]))
+    escritor.writeheader()
+    escritor.writerows(registros)
+    return productos.importar_productos(db, leer_csv(buffer.getvalue().encode("utf-8")))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--existentes", type=int, default=5000)
+    parser.add_argument("--filas", type=int, default=5000)
+    parser.add_argument("--cambios", type=int, default=500)
+    parser.add_argument("--nuevos", type=int, default=500)
+    args = parser.parse_args()
+
+    registros = _archivo(args.filas, args.cambios, args.nuevos, args.existentes)
+    for nombre, estrategia in (("fila a fila", _fila_a_fila), ("importación", _importacion)):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine, SessionLocal = _preparar(Path(tmp) / "bench.db", args.existentes)
+            sentencias = []
+            event.listen(engine, "before_cursor_execute", lambda *a: sentencias.append(1))
+            with SessionLocal() as db:
+                inicio = time.perf_counter()
+                resultado = estrategia(db, registros)
+                duracion = time.perf_counter() - inicio
+            engine.dispose()
+        detalle = f" {resultado.model_dump(exclude={'errores'})}" if resultado else ""
+        print(f"{nombre:>12}: {duracion * 1000:8.0f} ms, {len(sentencias):6} sentencias{detalle}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+bench_lectura_core.py
+
+Compara los listados con instancias ORM (por defecto) y con el modo de lectura Core
+(LECTURA_CORE, app.core.solo_lectura) para páginas de 1k y 10k filas de productos y
+movimientos de inventario.
+
+Para cada caso se informa la mediana de latencia de la consulta del repositorio, la de
+consulta + serialización (camino rápido de app.core.serializacion) y el pico de memoria
+asignada durante la consulta (tracemalloc). Cada repetición usa una sesión nueva.
+
+Uso:
+    python benchmarks/bench_lectura_core.py --tamanos 1000 10000 --repeticiones 5
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core import solo_lectura  # noqa: E402
+from app.core.config import Base  # noqa: E402
+from app.core.serializacion import serializar_lista  # noqa: E402
+from app.models import almacen_model, conteo_model, producto_proveedor_model, proveedor_model, stock_model  # noqa: E402,F401
+from app.models.categoria_model import Categoria  # noqa: E402
+from app.models.movimiento_model import MovimientoInventario  # noqa: E402
+from app.models.producto_model import Producto  # noqa: E402
+from app.repositories import movimiento_inventario_repository, producto  # noqa: E402
+from app.schemas import movimiento_schema, producto_schemas  # noqa: E402
+
+
+def _cargar(ruta_db: Path, filas: int):
+    engine = create_engine(f"sqlite:///{ruta_db}")
+    Base.metadata.create_all(bind=engine)
+    inicio = datetime(2024, 1, 1)
+    with engine.begin() as conexion:
+        conexion.execute(insert(Categoria), [{"nombre": "Bench", "tipo": "INGREDIENTE"}])
+        conexion.execute(insert(Producto), [
+            {"nombre": f"Producto {i}", "descripcion": "Descripción", "categoria_id": 1,
+             "tipo_perecible": "PERECEDERO", "unidad": "kg", "precio": i * 1.25, "activo": True}
+            for i in range(filas)
+        ])
+        conexion.execute(insert(MovimientoInventario), [
+            {"producto_id": i + 1, "cantidad": i * 0.5, "tipo_movimiento": "entrada",
+             "numero_referencia": f"R{i}", "fecha": inicio + timedelta(seconds=i)}
+            for i in range(filas)
+        ])
+    return sessionmaker(bind=engine)
+
+
+def _medir(SessionLocal, listar, esquema, repeticiones: int) -> dict:
+    consulta, total = [], []
+    for _ in range(repeticiones):
+        with SessionLocal() as db:
+            inicio = time.perf_counter()
+            pagina = listar(db)
+            medio = time.perf_counter()
+            serializar_lista(esquema, pagina.items)
+            fin = time.perf_counter()
+        consulta.append(medio - inicio)
+        total.append(fin - inicio)
+
+    with SessionLocal() as db:
+        tracemalloc.start()
+        listar(db)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "consulta_ms": round(statistics.median(consulta) * 1000, 1),
+        "con_serializacion_ms": round(statistics.median(total) * 1000, 1),
+        "pico_mem_kib": round(pico / 1024),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        SessionLocal = _cargar(Path(tmp) / "bench.db", max(args.tamanos))
+        for tamano in args.tamanos:
+            casos = (
+                ("productos", lambda db: producto.get_productos(db, 0, tamano, None, None, None), producto_schemas.Producto),
+                ("movimientos", lambda db: movimiento_inventario_repository.obtener_movimientos_inventario(0, tamano, db),
+                 movimiento_schema.MovimientoInventario),
+            )
+            for nombre, listar, esquema in casos:
+                for modo, core in (("ORM", False), ("Core", True)):
+                    solo_lectura.LECTURA_CORE = core
+                    resultado = _medir(SessionLocal, listar, esquema, args.repeticiones)
+                    print(f"{nombre:>11} {tamano:>6} filas {modo:>4}: {resultado}")
+
+
+if __name__ == "__main__":
+    main()
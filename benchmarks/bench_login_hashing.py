@@ -0,0 +1,162 @@
+"""
+bench_login_hashing.py
+
+Mide el efecto de una ráfaga de inicios de sesión sobre las demás rutas, con bcrypt
+ejecutado en línea (como antes: en el hilo de la ruta o con run_in_threadpool) y en el
+pool acotado de app.core.hashing.
+
+Cada escenario se ejecuta en un subproceso sobre una base de datos SQLite temporal. Primero
+se miden solo lecturas de --ruta (línea base) y luego las mismas lecturas mientras se lanzan
+--logins inicios de sesión concurrentes. Se informa el throughput de login, los rechazos 503
+del pool y el p50/p99 de las lecturas en ambas fases.
+
+Requisitos:
+    pip install httpx
+
+Uso:
+    python benchmarks/bench_login_hashing.py --logins 200 --lecturas 2000 --rondas 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+def _percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+def _hashing_en_linea(db_async: bool):
+    """Restaura el comportamiento anterior: bcrypt fuera del pool dedicado."""
+    from starlette.concurrency import run_in_threadpool
+    from app.core.security import verify_and_update_password
+
+    if db_async:
+        from app.services.aio import user_service
+
+        async def verificar(plain, hashed):
+            return await run_in_threadpool(verify_and_update_password, plain, hashed)
+
+        user_service.verificar_password_async = verificar
+    else:
+        from app.services import user_service
+
+        user_service.verificar_password = verify_and_update_password
+
+
+async def _ejecutar(args) -> dict:
+    import httpx
+    from main import app
+    from app.core.config import DB_ASYNC, SessionLocal, async_engine
+    from app.core.security import create_access_token, get_password_hash
+    from app.models.categoria_model import Categoria, TipoCategoriaEnum
+    from app.models.producto_model import Producto
+    from app.models.user_model import UserModel
+
+    if args.en_linea:
+        _hashing_en_linea(DB_ASYNC)
+
+    with SessionLocal() as db:
+        categoria = Categoria(nombre="Bench", tipo=TipoCategoriaEnum.INGREDIENTE)
+        db.add(categoria)
+        db.flush()
+        db.add_all(Producto(nombre=f"Producto {i}", categoria_id=categoria.id, precio=i) for i in range(50))
+        db.add(UserModel(username="bench", email="bench@bench.com", password=get_password_hash("bench")))
+        db.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench'})}"}
+    semaforo = asyncio.Semaphore(args.concurrencia)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=None) as client:
+        async def lecturas():
+            latencias = []
+
+            async def una():
+                async with semaforo:
+                    inicio = time.perf_counter()
+                    respuesta = await client.get(args.ruta, headers=headers)
+                    respuesta.raise_for_status()
+                    latencias.append(time.perf_counter() - inicio)
+
+            await asyncio.gather(*(una() for _ in range(args.lecturas)))
+            return latencias
+
+        async def logins():
+            codigos = []
+
+            async def uno():
+                respuesta = await client.post("/users/login", json={"username": "bench", "password": "bench"})
+                codigos.append(respuesta.status_code)
+
+            inicio = time.perf_counter()
+            await asyncio.gather(*(uno() for _ in range(args.logins)))
+            return codigos, time.perf_counter() - inicio
+
+        base = await lecturas()
+        con_logins, (codigos, duracion) = await asyncio.gather(lecturas(), logins())
+
+    # Sin esto los hilos de aiosqlite impiden que el subproceso termine
+    await async_engine.dispose()
+
+    exitosos = codigos.count(200)
+    return {
+        "login_ok_por_s": round(exitosos / duracion, 1),
+        "login_503": codigos.count(503),
+        "lectura_p50_ms": round(_percentil(base, 0.50) * 1000, 2),
+        "lectura_p99_ms": round(_percentil(base, 0.99) * 1000, 2),
+        "lectura_p50_ms_con_logins": round(_percentil(con_logins, 0.50) * 1000, 2),
+        "lectura_p99_ms_con_logins": round(_percentil(con_logins, 0.99) * 1000, 2),
+    }
+
+
+def _escenario(db_async: bool, en_linea: bool, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta_db = Path(tmp) / "bench.db"
+        env = dict(
+            os.environ,
+            DB_ASYNC="true" if db_async else "false",
+            DATABASE_URL=f"sqlite:///{ruta_db}",
+            ASYNC_DATABASE_URL=f"sqlite+aiosqlite:///{ruta_db}",
+            BCRYPT_ROUNDS=str(args.rondas),
+            CACHE_RESPUESTAS="false",
+        )
+        comando = [sys.executable, __file__, "--hijo", "--logins", str(args.logins), "--lecturas", str(args.lecturas),
+                   "--concurrencia", str(args.concurrencia), "--ruta", args.ruta, "--rondas", str(args.rondas)]
+        if en_linea:
+            comando.append("--en-linea")
+        salida = subprocess.run(comando, env=env, cwd=RAIZ, capture_output=True, text=True, check=True)
+        return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--lecturas", type=int, default=2000)
+    parser.add_argument("--concurrencia", type=int, default=16, help="Lecturas simultáneas")
+    parser.add_argument("--ruta", default="/productos/?limit=50")
+    parser.add_argument("--rondas", type=int, default=10, help="BCRYPT_ROUNDS del escenario")
+    parser.add_argument("--en-linea", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--hijo", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.hijo:
+        sys.path.insert(0, str(RAIZ))
+        print(json.dumps(asyncio.run(_ejecutar(args))))
+        return
+
+    for modo, db_async in (("sync", False), ("async", True)):
+        for nombre, en_linea in (("en línea", True), ("pool", False)):
+            print(f"{modo:>5} / {nombre:>8}: {_escenario(db_async, en_linea, args)}")
+
+
+if __name__ == "__main__":
+    main()
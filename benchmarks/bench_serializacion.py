@@ -0,0 +1,111 @@
+"""
+bench_serializacion.py
+
+Compara el costo de serializar una página de listado con la ruta normal de FastAPI
+(validación `from_attributes` de response_model + JSONResponse) y con el camino rápido de
+app.core.serializacion (JSON_RAPIDO), para Producto, MovimientoInventario y ConteoInventario.
+
+Las filas se cargan una vez desde una base SQLite en memoria; solo se mide la serialización.
+Antes de medir se comprueba que ambos caminos producen los mismos bytes.
+
+Uso:
+    python benchmarks/bench_serializacion.py --filas 100 --repeticiones 500
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.core.config import Base  # noqa: E402
+from app.core.serializacion import serializar_lista  # noqa: E402
+from app.models import almacen_model, producto_proveedor_model, proveedor_model, stock_model  # noqa: E402,F401
+from app.models.categoria_model import Categoria  # noqa: E402
+from app.models.conteo_model import ConteoInventario  # noqa: E402
+from app.models.movimiento_model import MovimientoInventario  # noqa: E402
+from app.models.producto_model import Producto  # noqa: E402
+from app.schemas import conteo_schema, movimiento_schema, producto_schemas  # noqa: E402
+
+
+def _cargar(filas: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Categoria(nombre="Bench", tipo="INGREDIENTE"))
+    db.add(almacen_model.Almacen(nombre="Central", tipo="seco", capacidad=1000))
+    db.flush()
+    inicio = datetime(2024, 1, 1)
+    db.add_all(
+        Producto(nombre=f"Producto {i}", descripcion="Descripción", categoria_id=1,
+                 tipo_perecible="PERECEDERO", unidad="kg", precio=i * 1.25)
+        for i in range(filas)
+    )
+    db.flush()
+    db.add_all(
+        MovimientoInventario(producto_id=i % filas + 1, cantidad=i * 0.5, tipo_movimiento="entrada",
+                             numero_referencia=f"R{i}", fecha=inicio + timedelta(seconds=i, microseconds=i))
+        for i in range(filas)
+    )
+    db.add_all(
+        ConteoInventario(producto_id=i % filas + 1, almacen_id=1, cantidad=i, contado_por="Bench",
+                         fecha_ultimo_conteo=inicio + timedelta(minutes=i))
+        for i in range(filas)
+    )
+    db.commit()
+    return db
+
+
+def _medir(funcion, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=100)
+    parser.add_argument("--repeticiones", type=int, default=500)
+    args = parser.parse_args()
+
+    db = _cargar(args.filas)
+    casos = (
+        ("Producto", Producto, producto_schemas.Producto),
+        ("MovimientoInventario", MovimientoInventario, movimiento_schema.MovimientoInventario),
+        ("ConteoInventario", ConteoInventario, conteo_schema.ConteoInventario),
+    )
+    bucle = asyncio.new_event_loop()
+
+    for nombre, modelo, esquema in casos:
+        filas = db.query(modelo).order_by(modelo.id).all()
+        campo = create_model_field(name="Response", type_=List[esquema], mode="serialization")
+
+        def fastapi_normal():
+            contenido = bucle.run_until_complete(serialize_response(field=campo, response_content=filas))
+            return JSONResponse(contenido).body
+
+        def camino_rapido():
+            return serializar_lista(esquema, filas)
+
+        assert fastapi_normal() == camino_rapido(), f"{nombre}: la salida difiere"
+        normal = _medir(fastapi_normal, args.repeticiones)
+        rapido = _medir(camino_rapido, args.repeticiones)
+        print(f"{nombre:>22} ({len(filas)} filas): response_model {normal:9.1f} µs | "
+              f"JSON_RAPIDO {rapido:9.1f} µs | x{normal / rapido:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+bench_sync_vs_async.py
+
+Compara el camino síncrono (def + Session en el threadpool de AnyIO) con el
+camino asíncrono (async def + AsyncSession) bajo concurrencia.
+
+Cada modo se ejecuta en un subproceso con DB_ASYNC=false/true sobre una base de
+datos SQLite temporal, lanzando peticiones concurrentes en proceso (httpx.ASGITransport).
+
+Requisitos:
+    pip install httpx
+
+Uso:
+    python benchmarks/bench_sync_vs_async.py --peticiones 2000 --concurrencia 64
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+def _percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+async def _ejecutar(peticiones: int, concurrencia: int, ruta: str) -> dict:
+    import httpx
+    from main import app
+    from app.core.config import SessionLocal
+    from app.core.security import create_access_token
+    from app.models.categoria_model import Categoria, TipoCategoriaEnum
+    from app.models.producto_model import Producto
+
+    with SessionLocal() as db:
+        categoria = Categoria(nombre="Bench", tipo=TipoCategoriaEnum.INGREDIENTE)
+        db.add(categoria)
+        db.flush()
+        db.add_all(Producto(nombre=f"Producto {i}", categoria_id=categoria.id, precio=i) for i in range(200))
+        db.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench'})}"}
+    latencias = []
+    semaforo = asyncio.Semaphore(concurrencia)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def una():
+            async with semaforo:
+                inicio = time.perf_counter()
+                respuesta = await client.get(ruta, headers=headers)
+                respuesta.raise_for_status()
+                latencias.append(time.perf_counter() - inicio)
+
+        inicio = time.perf_counter()
+        await asyncio.gather(*(una() for _ in range(peticiones)))
+        total = time.perf_counter() - inicio
+
+    return {
+        "rps": round(peticiones / total, 1),
+        "p50_ms": round(_percentil(latencias, 0.50) * 1000, 2),
+        "p99_ms": round(_percentil(latencias, 0.99) * 1000, 2),
+    }
+
+
+def _modo(db_async: bool, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta_db = Path(tmp) / "bench.db"
+        env = dict(
+            os.environ,
+            DB_ASYNC="true" if db_async else "false",
+            DATABASE_URL=f"sqlite:///{ruta_db}",
+            ASYNC_DATABASE_URL=f"sqlite+aiosqlite:///{ruta_db}",
+        )
+        salida = subprocess.run(
+            [sys.executable, __file__, "--hijo", "--peticiones", str(args.peticiones),
+             "--concurrencia", str(args.concurrencia), "--ruta", args.ruta],
+            env=env, cwd=RAIZ, capture_output=True, text=True, check=True,
+        )
+        return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--peticiones", type=int, default=2000)
+    parser.add_argument("--concurrencia", type=int, default=64)
+    parser.add_argument("--ruta", default="/productos/?limit=100")
+    parser.add_argument("--hijo", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.hijo:
+        sys.path.insert(0, str(RAIZ))
+        print(json.dumps(asyncio.run(_ejecutar(args.peticiones, args.concurrencia, args.ruta))))
+        return
+
+    for nombre, db_async in (("sync", False), ("async", True)):
+        print(f"{nombre:>5}: {_modo(db_async, args)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,15 @@ import signal
 import sys
 
 from app.api.routers.router import router as main_router
-from app.core.config import engine, Base
+from app.api.routers.aio.router import router as async_router
+from app.api.routers.admin import router as admin_router
+from app.api.routers.stock import router as stock_router
+from app.core.config import engine, Base, DB_ASYNC, SessionLocal
+from app.core.escritor import escritor
+from app.core.migraciones import aplicar_migraciones
 from app.core.security import ALGORITHM, SECRET_KEY
 from app.api.middelwares.auth_middelware import AuthMiddleware
+from app.services.productos import cargar_indice_autocompletado
 
 
 app = FastAPI()
@@ -18,13 +24,30 @@ app.add_middleware(
     allow_credentials=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Link", "X-Next-Cursor", "ETag", "Idempotent-Replayed"],
 )
 
 app.add_middleware(AuthMiddleware, secret_key=SECRET_KEY, algorithm=ALGORITHM)
 
 Base.metadata.create_all(bind=engine)
-
-app.include_router(main_router)
+# Índices y cambios de esquema sobre bases de datos existentes (tabla schema_version)
+aplicar_migraciones(engine)
+# Índice en memoria del autocompletado de productos (lo mantienen los repositorios)
+with SessionLocal() as db:
+    cargar_indice_autocompletado(db)
+
+# El escritor agrupado (ESCRITURA_AGRUPADA) confirma lo pendiente antes de salir
+app.add_event_handler("shutdown", escritor.detener)
+
+# DB_ASYNC selecciona entre las rutas síncronas (Session) y las asíncronas (AsyncSession)
+if DB_ASYNC:
+    app.include_router(async_router)
+else:
+    app.include_router(main_router)
+
+# Rutas de administración y de consulta de stock (disponibles en ambos modos)
+app.include_router(admin_router)
+app.include_router(stock_router)
 
 def receive_signal(signalNumber, frame):
     print('Received signal:', signalNumber)